@@ -18,11 +18,16 @@ __all__ = [
     "ReadOnlyRun",
 ]
 
+import importlib
 import warnings
 from importlib.metadata import (
     PackageNotFoundError,
     version,
 )
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
 
 try:
     # This will raise PackageNotFoundError if the package is not installed
@@ -40,8 +45,31 @@ except PackageNotFoundError:
     pass
 
 
-from .read_only_project import ReadOnlyProject
-from .read_only_run import ReadOnlyRun
+# ReadOnlyProject and ReadOnlyRun import pandas and the API client, so they're imported on first access,
+# and `import neptune_fetcher.alpha` doesn't pay for them
+if TYPE_CHECKING:
+    from .read_only_project import ReadOnlyProject
+    from .read_only_run import ReadOnlyRun
+
+_LAZY_ATTRIBUTES = {
+    "ReadOnlyProject": ".read_only_project",
+    "ReadOnlyRun": ".read_only_run",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 warnings.warn(
     "Package 'neptune-fetcher' is deprecated. Migrate your code to 'neptune-query'. "
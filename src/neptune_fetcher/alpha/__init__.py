@@ -14,43 +14,45 @@
 # limitations under the License.
 #
 
+from __future__ import annotations
+
 __all__ = [
     "Context",
     "get_context",
     "set_api_token",
     "set_context",
     "set_project",
+    "RunSet",
     "list_experiments",
+    "resolve_experiments",
     "list_attributes",
     "fetch_experiments_table",
     "fetch_metrics",
     "fetch_series",
     "download_files",
+    "fetch_metrics_async",
+    "fetch_experiments_table_async",
+    "fetch_series_async",
 ]
 
 from typing import (
+    TYPE_CHECKING,
     Literal,
     Optional,
     Tuple,
     Union,
 )
 
-import pandas as _pandas
-
 from neptune_fetcher.alpha import filters
 from neptune_fetcher.alpha._internal import (
     get_default_project_identifier,
     resolve_attributes_filter,
     resolve_destination_path,
     resolve_experiments_filter,
+    resolve_projects,
+    resolve_run_set,
     resolve_sort_by,
 )
-from neptune_fetcher.internal.composition import download_files as _download_files
-from neptune_fetcher.internal.composition import fetch_metrics as _fetch_metrics
-from neptune_fetcher.internal.composition import fetch_series as _fetch_series
-from neptune_fetcher.internal.composition import fetch_table as _fetch_table
-from neptune_fetcher.internal.composition import list_attributes as _list_attributes
-from neptune_fetcher.internal.composition import list_containers as _list_containers
 from neptune_fetcher.internal.context import (
     Context,
     get_context,
@@ -58,7 +60,28 @@ from neptune_fetcher.internal.context import (
     set_context,
     set_project,
 )
-from neptune_fetcher.internal.retrieval import search as _search
+from neptune_fetcher.internal.lazy import lazy_import
+from neptune_fetcher.internal.run_set import RunSet
+
+# The fetching modules import pandas and the generated API models, so they're imported on first use
+if TYPE_CHECKING:
+    import pandas as _pandas
+
+    from neptune_fetcher.internal.composition import download_files as _download_files
+    from neptune_fetcher.internal.composition import fetch_metrics as _fetch_metrics
+    from neptune_fetcher.internal.composition import fetch_series as _fetch_series
+    from neptune_fetcher.internal.composition import fetch_table as _fetch_table
+    from neptune_fetcher.internal.composition import list_attributes as _list_attributes
+    from neptune_fetcher.internal.composition import list_containers as _list_containers
+    from neptune_fetcher.internal.retrieval import search as _search
+else:
+    _download_files = lazy_import("neptune_fetcher.internal.composition.download_files")
+    _fetch_metrics = lazy_import("neptune_fetcher.internal.composition.fetch_metrics")
+    _fetch_series = lazy_import("neptune_fetcher.internal.composition.fetch_series")
+    _fetch_table = lazy_import("neptune_fetcher.internal.composition.fetch_table")
+    _list_attributes = lazy_import("neptune_fetcher.internal.composition.list_attributes")
+    _list_containers = lazy_import("neptune_fetcher.internal.composition.list_containers")
+    _search = lazy_import("neptune_fetcher.internal.retrieval.search")
 
 
 def list_experiments(
@@ -84,6 +107,43 @@ def list_experiments(
     )
 
 
+def resolve_experiments(
+    experiments: Optional[Union[str, list[str], filters.Filter]] = None,
+    sort_by: Union[str, filters.Attribute] = filters.Attribute("sys/creation_time", type="datetime"),
+    sort_direction: Literal["asc", "desc"] = "desc",
+    limit: Optional[int] = None,
+    context: Optional[Context] = None,
+) -> RunSet:
+    """
+    Searches for experiments once, and returns them as a RunSet.
+
+    The fetching functions accept the RunSet in place of an experiments filter. They then fetch from its experiments
+    directly, without inferring the types in the filter and searching for the experiments again. Tables fetched for
+    a RunSet keep its order and size, regardless of their `sort_by`, `sort_direction` and `limit`.
+
+    `experiments` - a filter specifying which experiments to include
+        - a list of specific experiment names, or
+        - a regex that the experiment name must match, or
+        - a Filter object
+    `sort_by` - an attribute name or an Attribute object specifying type and, optionally, aggregation
+    `sort_direction` - 'asc' or 'desc'
+    `limit` - maximum number of experiments to include; by default all experiments are included.
+    `context` - a Context object to be used; primarily useful for switching projects
+    """
+    _experiments = resolve_experiments_filter(experiments)
+    _sort_by = resolve_sort_by(sort_by)
+
+    return _list_containers.resolve_containers(
+        project_identifier=get_default_project_identifier(context),
+        filter_=_experiments,
+        sort_by=_sort_by,
+        sort_direction=sort_direction,
+        limit=limit,
+        context=context,
+        container_type=_search.ContainerType.EXPERIMENT,
+    )
+
+
 def list_attributes(
     experiments: Optional[Union[str, list[str], filters.Filter]] = None,
     attributes: Optional[Union[str, list[str], filters.AttributeFilter]] = None,
@@ -121,7 +181,7 @@ def list_attributes(
 
 
 def fetch_metrics(
-    experiments: Union[str, list[str], filters.Filter],
+    experiments: Union[str, list[str], filters.Filter, RunSet],
     attributes: Union[str, list[str], filters.AttributeFilter],
     include_time: Optional[Literal["absolute"]] = None,
     step_range: Tuple[Optional[float], Optional[float]] = (None, None),
@@ -137,7 +197,8 @@ def fetch_metrics(
     `experiments` - a filter specifying which experiments to include
         - a list of specific experiment names, or
         - a regex that the experiment name must match, or
-        - a Filter object
+        - a Filter object, or
+        - a RunSet returned by `resolve_experiments`, to skip searching for the experiments again
     `attributes` - a filter specifying which attributes to include in the table
         - a list of specific attribute names, or
         - a regex that attribute name must match, or
@@ -158,10 +219,11 @@ def fetch_metrics(
 
     If `include_time` is set, each metric column has an additional sub-column with requested timestamp values.
     """
+    run_set = resolve_run_set(experiments, "experiment")
     _experiments = resolve_experiments_filter(experiments)
-    assert _experiments is not None
+    assert _experiments is not None or run_set is not None
     _attributes = resolve_attributes_filter(attributes)
-    project_identifier = get_default_project_identifier(context)
+    project_identifier = run_set.project_identifier if run_set is not None else get_default_project_identifier(context)
 
     return _fetch_metrics.fetch_metrics(
         project_identifier=project_identifier,
@@ -175,23 +237,26 @@ def fetch_metrics(
         include_point_previews=include_point_previews,
         context=context,
         container_type=_search.ContainerType.EXPERIMENT,
+        run_set=run_set,
     )
 
 
 def fetch_experiments_table(
-    experiments: Optional[Union[str, list[str], filters.Filter]] = None,
+    experiments: Optional[Union[str, list[str], filters.Filter, RunSet]] = None,
     attributes: Union[str, list[str], filters.AttributeFilter] = "^sys/name$",
     sort_by: Union[str, filters.Attribute] = filters.Attribute("sys/creation_time", type="datetime"),
     sort_direction: Literal["asc", "desc"] = "desc",
     limit: Optional[int] = None,
     type_suffix_in_column_names: bool = False,
     context: Optional[Context] = None,
+    projects: Optional[list[str]] = None,
 ) -> _pandas.DataFrame:
     """
     `experiments` - a filter specifying which experiments to include in the table
         - a list of specific experiment names, or
         - a regex that the experiment name must match, or
-        - a Filter object
+        - a Filter object, or
+        - a RunSet returned by `resolve_experiments`, to skip searching for the experiments again
     `attributes` - a filter specifying which attributes to include in the table
         - a list of specific attribute names, or
         - a regex that attribute name must match, or
@@ -203,16 +268,39 @@ def fetch_experiments_table(
         will be suffixed with ":<type>", e.g. "attribute1:float_series", "attribute1:string", etc.
         If set to False, the method throws an exception if there are multiple types under one path.
     `context` - a Context object to be used; primarily useful for switching projects
+    `projects` - a list of projects to fetch the experiments from, instead of the project of the context. Each item is
+        'workspace/project', or 'workspace' for all projects of a workspace. The experiments are then sorted together,
+        and the returned DataFrame is indexed with a MultiIndex on (project, experiment).
+        The search goes through the experiments of all projects available to you, skipping those of other projects,
+        so it's slow if `experiments` matches many experiments outside of the given projects.
 
     Returns a DataFrame similar to the Experiments Table in the UI, with an important difference:
     aggregates of metrics (min, max, avg, last, ...) are returned as sub-columns of a metric column. In other words,
     the returned DataFrame is indexed with a MultiIndex on (attribute name, attribute property).
     In case the user doesn't specify metrics' aggregates to be returned, only the `last` aggregate is returned.
     """
+    run_set = resolve_run_set(experiments, "experiment")
     _experiments = resolve_experiments_filter(experiments)
     _attributes = resolve_attributes_filter(attributes)
     _sort_by = resolve_sort_by(sort_by)
-    project_identifier = get_default_project_identifier(context)
+
+    if projects is not None:
+        if run_set is not None:
+            raise ValueError("Invalid value for `projects`. A RunSet belongs to a single project.")
+        return _fetch_table.fetch_table_across_projects(
+            projects=resolve_projects(projects),
+            filter_=_experiments,
+            attributes=_attributes,
+            sort_by=_sort_by,
+            sort_direction=sort_direction,
+            limit=limit,
+            type_suffix_in_column_names=type_suffix_in_column_names,
+            context=context,
+            container_type=_search.ContainerType.EXPERIMENT,
+            flatten_file_properties=True,
+        )
+
+    project_identifier = run_set.project_identifier if run_set is not None else get_default_project_identifier(context)
 
     return _fetch_table.fetch_table(
         project_identifier=project_identifier,
@@ -224,12 +312,13 @@ def fetch_experiments_table(
         type_suffix_in_column_names=type_suffix_in_column_names,
         context=context,
         container_type=_search.ContainerType.EXPERIMENT,
+        run_set=run_set,
         flatten_file_properties=True,
     )
 
 
 def fetch_series(
-    experiments: Union[str, list[str], filters.Filter],
+    experiments: Union[str, list[str], filters.Filter, RunSet],
     attributes: Union[str, list[str], filters.AttributeFilter],
     *,
     include_time: Optional[Literal["absolute"]] = None,
@@ -246,7 +335,8 @@ def fetch_series(
     `experiments` - a filter specifying which experiments to include
         - a list of specific experiment names, or
         - a regex that the experiment name must match, or
-        - a Filter object for more complex filtering
+        - a Filter object for more complex filtering, or
+        - a RunSet returned by `resolve_experiments`, to skip searching for the experiments again
     `attributes` - a filter specifying which attributes to include
         - a list of specific attribute names, or
         - a regex that attribute name must match, or
@@ -261,10 +351,11 @@ def fetch_series(
     Returns a DataFrame containing string series for the specified experiments and attributes.
     If include_time is set, each series column will have an additional sub-column with the requested timestamp values.
     """
+    run_set = resolve_run_set(experiments, "experiment")
     _experiments = resolve_experiments_filter(experiments)
-    assert _experiments is not None
+    assert _experiments is not None or run_set is not None
     _attributes = resolve_attributes_filter(attributes)
-    project_identifier = get_default_project_identifier(context)
+    project_identifier = run_set.project_identifier if run_set is not None else get_default_project_identifier(context)
 
     return _fetch_series.fetch_series(
         project_identifier=project_identifier,
@@ -276,11 +367,141 @@ def fetch_series(
         tail_limit=tail_limit,
         context=context,
         container_type=_search.ContainerType.EXPERIMENT,
+        run_set=run_set,
+    )
+
+
+async def fetch_metrics_async(
+    experiments: Union[str, list[str], filters.Filter, RunSet],
+    attributes: Union[str, list[str], filters.AttributeFilter],
+    include_time: Optional[Literal["absolute"]] = None,
+    step_range: Tuple[Optional[float], Optional[float]] = (None, None),
+    lineage_to_the_root: bool = True,
+    tail_limit: Optional[int] = None,
+    type_suffix_in_column_names: bool = False,
+    include_point_previews: bool = False,
+    context: Optional[Context] = None,
+) -> _pandas.DataFrame:
+    """
+    Asynchronous version of `fetch_metrics`. Accepts the same arguments and returns the same DataFrame.
+
+    The requests are sent from the running event loop, instead of a pool of threads.
+    The number of concurrent requests is limited by `NEPTUNE_FETCHER_ASYNC_MAX_CONCURRENCY`.
+    """
+    run_set = resolve_run_set(experiments, "experiment")
+    _experiments = resolve_experiments_filter(experiments)
+    assert _experiments is not None or run_set is not None
+    _attributes = resolve_attributes_filter(attributes)
+    project_identifier = run_set.project_identifier if run_set is not None else get_default_project_identifier(context)
+
+    return await _fetch_metrics.fetch_metrics_async(
+        project_identifier=project_identifier,
+        filter_=_experiments,
+        attributes=_attributes,
+        include_time=include_time,
+        step_range=step_range,
+        lineage_to_the_root=lineage_to_the_root,
+        tail_limit=tail_limit,
+        type_suffix_in_column_names=type_suffix_in_column_names,
+        include_point_previews=include_point_previews,
+        context=context,
+        container_type=_search.ContainerType.EXPERIMENT,
+        run_set=run_set,
+    )
+
+
+async def fetch_experiments_table_async(
+    experiments: Optional[Union[str, list[str], filters.Filter, RunSet]] = None,
+    attributes: Union[str, list[str], filters.AttributeFilter] = "^sys/name$",
+    sort_by: Union[str, filters.Attribute] = filters.Attribute("sys/creation_time", type="datetime"),
+    sort_direction: Literal["asc", "desc"] = "desc",
+    limit: Optional[int] = None,
+    type_suffix_in_column_names: bool = False,
+    context: Optional[Context] = None,
+    projects: Optional[list[str]] = None,
+) -> _pandas.DataFrame:
+    """
+    Asynchronous version of `fetch_experiments_table`. Accepts the same arguments and returns the same DataFrame.
+
+    The requests are sent from the running event loop, instead of a pool of threads.
+    The number of concurrent requests is limited by `NEPTUNE_FETCHER_ASYNC_MAX_CONCURRENCY`.
+    """
+    run_set = resolve_run_set(experiments, "experiment")
+    _experiments = resolve_experiments_filter(experiments)
+    _attributes = resolve_attributes_filter(attributes)
+    _sort_by = resolve_sort_by(sort_by)
+
+    if projects is not None:
+        if run_set is not None:
+            raise ValueError("Invalid value for `projects`. A RunSet belongs to a single project.")
+        return await _fetch_table.fetch_table_across_projects_async(
+            projects=resolve_projects(projects),
+            filter_=_experiments,
+            attributes=_attributes,
+            sort_by=_sort_by,
+            sort_direction=sort_direction,
+            limit=limit,
+            type_suffix_in_column_names=type_suffix_in_column_names,
+            context=context,
+            container_type=_search.ContainerType.EXPERIMENT,
+            flatten_file_properties=True,
+        )
+
+    project_identifier = run_set.project_identifier if run_set is not None else get_default_project_identifier(context)
+
+    return await _fetch_table.fetch_table_async(
+        project_identifier=project_identifier,
+        filter_=_experiments,
+        attributes=_attributes,
+        sort_by=_sort_by,
+        sort_direction=sort_direction,
+        limit=limit,
+        type_suffix_in_column_names=type_suffix_in_column_names,
+        context=context,
+        container_type=_search.ContainerType.EXPERIMENT,
+        run_set=run_set,
+        flatten_file_properties=True,
+    )
+
+
+async def fetch_series_async(
+    experiments: Union[str, list[str], filters.Filter, RunSet],
+    attributes: Union[str, list[str], filters.AttributeFilter],
+    *,
+    include_time: Optional[Literal["absolute"]] = None,
+    step_range: Tuple[Optional[float], Optional[float]] = (None, None),
+    lineage_to_the_root: bool = True,
+    tail_limit: Optional[int] = None,
+    context: Optional[Context] = None,
+) -> _pandas.DataFrame:
+    """
+    Asynchronous version of `fetch_series`. Accepts the same arguments and returns the same DataFrame.
+
+    The requests are sent from the running event loop, instead of a pool of threads.
+    The number of concurrent requests is limited by `NEPTUNE_FETCHER_ASYNC_MAX_CONCURRENCY`.
+    """
+    run_set = resolve_run_set(experiments, "experiment")
+    _experiments = resolve_experiments_filter(experiments)
+    assert _experiments is not None or run_set is not None
+    _attributes = resolve_attributes_filter(attributes)
+    project_identifier = run_set.project_identifier if run_set is not None else get_default_project_identifier(context)
+
+    return await _fetch_series.fetch_series_async(
+        project_identifier=project_identifier,
+        filter_=_experiments,
+        attributes=_attributes,
+        include_time=include_time,
+        step_range=step_range,
+        lineage_to_the_root=lineage_to_the_root,
+        tail_limit=tail_limit,
+        context=context,
+        container_type=_search.ContainerType.EXPERIMENT,
+        run_set=run_set,
     )
 
 
 def download_files(
-    experiments: Optional[Union[str, list[str], filters.Filter]] = None,
+    experiments: Optional[Union[str, list[str], filters.Filter, RunSet]] = None,
     attributes: Optional[Union[str, list[str], filters.AttributeFilter]] = None,
     *,
     destination: Optional[str] = None,
@@ -292,7 +513,8 @@ def download_files(
     `experiments` - a filter specifying which experiments to include in the table
         - a list of specific experiment names, or
         - a regex that the experiment name must match, or
-        - a Filter object
+        - a Filter object, or
+        - a RunSet returned by `resolve_experiments`, to skip searching for the experiments again
     `attributes` - a filter specifying which attributes to include in the table
         - a list of specific attribute names, or
         - a regex that the attribute name must match, or
@@ -304,10 +526,11 @@ def download_files(
 
     Returns a DataFrame mapping experiments and attributes to the paths of downloaded files.
     """
+    run_set = resolve_run_set(experiments, "experiment")
     _experiments = resolve_experiments_filter(experiments)
     _attributes = resolve_attributes_filter(attributes)
     destination_path = resolve_destination_path(destination)
-    project_identifier = get_default_project_identifier(context)
+    project_identifier = run_set.project_identifier if run_set is not None else get_default_project_identifier(context)
 
     return _download_files.download_files(
         project_identifier=project_identifier,
@@ -316,4 +539,5 @@ def download_files(
         destination=destination_path,
         context=context,
         container_type=_search.ContainerType.EXPERIMENT,
+        run_set=run_set,
     )
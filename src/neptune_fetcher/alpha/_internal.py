@@ -19,6 +19,7 @@
 
 import pathlib
 from typing import (
+    Literal,
     Optional,
     Union,
 )
@@ -32,10 +33,11 @@ from neptune_fetcher.internal.context import (
     validate_context,
 )
 from neptune_fetcher.internal.identifiers import ProjectIdentifier
+from neptune_fetcher.internal.run_set import RunSet
 
 
 def resolve_experiments_filter(
-    experiments: Optional[Union[str, list[str], filters.Filter]],
+    experiments: Optional[Union[str, list[str], filters.Filter, RunSet]],
 ) -> Optional[_filters._Filter]:
     if isinstance(experiments, str):
         return filters.Filter.matches_all(filters.Attribute("sys/name", type="string"), experiments)._to_internal()
@@ -47,7 +49,8 @@ def resolve_experiments_filter(
         return filters.Filter.name_in(*experiments)._to_internal()
     if isinstance(experiments, filters.Filter):
         return experiments._to_internal()
-    if experiments is None:
+    if experiments is None or isinstance(experiments, RunSet):
+        # A RunSet replaces the filter, see resolve_run_set
         return None
     raise ValueError(
         "Invalid type for experiments filter. Expected str, list of str, or Filter object, but got "
@@ -93,7 +96,9 @@ def resolve_destination_path(destination: Optional[str]) -> pathlib.Path:
         return pathlib.Path(destination).resolve()
 
 
-def resolve_runs_filter(runs: Optional[Union[str, list[str], filters.Filter]]) -> Optional[_filters._Filter]:
+def resolve_runs_filter(
+    runs: Optional[Union[str, list[str], filters.Filter, RunSet]],
+) -> Optional[_filters._Filter]:
     if isinstance(runs, str):
         return filters.Filter.matches_all(
             filters.Attribute("sys/custom_run_id", type="string"), regex=runs
@@ -108,13 +113,34 @@ def resolve_runs_filter(runs: Optional[Union[str, list[str], filters.Filter]]) -
         )._to_internal()
     if isinstance(runs, filters.Filter):
         return runs._to_internal()
-    if runs is None:
+    if runs is None or isinstance(runs, RunSet):
+        # A RunSet replaces the filter, see resolve_run_set
         return None
     raise ValueError(
         f"Invalid type for `runs` filter. Expected str, list of str, or Filter object, but got {type(runs)}."
     )
 
 
+def resolve_run_set(containers: object, container_type: Literal["experiment", "run"]) -> Optional[RunSet]:
+    if not isinstance(containers, RunSet):
+        return None
+    if containers.container_type.value != container_type:
+        raise ValueError(
+            f"Invalid RunSet. Expected a RunSet of {container_type}s, but got one of "
+            f"{containers.container_type.value}s."
+        )
+    return containers
+
+
+def resolve_projects(projects: list[str]) -> list[ProjectIdentifier]:
+    if not isinstance(projects, list) or not projects:
+        raise ValueError("Invalid value for `projects`. Expected a non-empty list of str.")
+    for project in projects:
+        if not isinstance(project, str) or not 1 <= len(project.split("/")) <= 2 or not all(project.split("/")):
+            raise ValueError(f"Invalid project {project!r} in `projects`. Expected 'workspace/project' or 'workspace'.")
+    return [ProjectIdentifier(project) for project in projects]
+
+
 def get_default_project_identifier(context: Optional[Context] = None) -> ProjectIdentifier:
     """
     Returns the default project name from the current context.
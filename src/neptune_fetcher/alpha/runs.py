@@ -14,8 +14,11 @@
 # limitations under the License.
 #
 
+from __future__ import annotations
+
 __all__ = [
     "list_runs",
+    "resolve_runs",
     "list_attributes",
     "fetch_runs_table",
     "fetch_metrics",
@@ -23,30 +26,46 @@ __all__ = [
 ]
 
 from typing import (
+    TYPE_CHECKING,
     Literal,
     Optional,
     Tuple,
     Union,
 )
 
-import pandas as _pandas
-
 from neptune_fetcher.alpha import filters
 from neptune_fetcher.alpha._internal import (
     get_default_project_identifier,
     resolve_attributes_filter,
     resolve_destination_path,
+    resolve_projects,
+    resolve_run_set,
     resolve_runs_filter,
     resolve_sort_by,
 )
 from neptune_fetcher.internal import context as _context
-from neptune_fetcher.internal.composition import download_files as _download_files
-from neptune_fetcher.internal.composition import fetch_metrics as _fetch_metrics
-from neptune_fetcher.internal.composition import fetch_series as _fetch_series
-from neptune_fetcher.internal.composition import fetch_table as _fetch_table
-from neptune_fetcher.internal.composition import list_attributes as _list_attributes
-from neptune_fetcher.internal.composition import list_containers as _list_containers
-from neptune_fetcher.internal.retrieval import search as _search
+from neptune_fetcher.internal.lazy import lazy_import
+from neptune_fetcher.internal.run_set import RunSet
+
+# The fetching modules import pandas and the generated API models, so they're imported on first use
+if TYPE_CHECKING:
+    import pandas as _pandas
+
+    from neptune_fetcher.internal.composition import download_files as _download_files
+    from neptune_fetcher.internal.composition import fetch_metrics as _fetch_metrics
+    from neptune_fetcher.internal.composition import fetch_series as _fetch_series
+    from neptune_fetcher.internal.composition import fetch_table as _fetch_table
+    from neptune_fetcher.internal.composition import list_attributes as _list_attributes
+    from neptune_fetcher.internal.composition import list_containers as _list_containers
+    from neptune_fetcher.internal.retrieval import search as _search
+else:
+    _download_files = lazy_import("neptune_fetcher.internal.composition.download_files")
+    _fetch_metrics = lazy_import("neptune_fetcher.internal.composition.fetch_metrics")
+    _fetch_series = lazy_import("neptune_fetcher.internal.composition.fetch_series")
+    _fetch_table = lazy_import("neptune_fetcher.internal.composition.fetch_table")
+    _list_attributes = lazy_import("neptune_fetcher.internal.composition.list_attributes")
+    _list_containers = lazy_import("neptune_fetcher.internal.composition.list_containers")
+    _search = lazy_import("neptune_fetcher.internal.retrieval.search")
 
 
 def list_runs(
@@ -73,6 +92,43 @@ def list_runs(
     )
 
 
+def resolve_runs(
+    runs: Optional[Union[str, list[str], filters.Filter]] = None,
+    sort_by: Union[str, filters.Attribute] = filters.Attribute("sys/creation_time", type="datetime"),
+    sort_direction: Literal["asc", "desc"] = "desc",
+    limit: Optional[int] = None,
+    context: Optional[_context.Context] = None,
+) -> RunSet:
+    """
+    Searches for runs once, and returns them as a RunSet.
+
+    The fetching functions accept the RunSet in place of a runs filter. They then fetch from its runs directly,
+    without inferring the types in the filter and searching for the runs again. Tables fetched for a RunSet keep its
+    order and size, regardless of their `sort_by`, `sort_direction` and `limit`.
+
+    `runs` - a filter specifying which runs to include
+        - a list of specific run IDs, or
+        - a regex that the run ID must match, or
+        - a Filter object
+    `sort_by` - an attribute name or an Attribute object specifying type and, optionally, aggregation
+    `sort_direction` - 'asc' or 'desc'
+    `limit` - maximum number of runs to include; by default all runs are included.
+    `context` - a Context object to be used; primarily useful for switching projects
+    """
+    _runs = resolve_runs_filter(runs)
+    _sort_by = resolve_sort_by(sort_by)
+
+    return _list_containers.resolve_containers(
+        project_identifier=get_default_project_identifier(context),
+        filter_=_runs,
+        sort_by=_sort_by,
+        sort_direction=sort_direction,
+        limit=limit,
+        context=context,
+        container_type=_search.ContainerType.RUN,
+    )
+
+
 def list_attributes(
     runs: Optional[Union[str, list[str], filters.Filter]] = None,
     attributes: Optional[Union[str, list[str], filters.AttributeFilter]] = None,
@@ -109,7 +165,7 @@ def list_attributes(
 
 
 def fetch_metrics(
-    runs: Union[str, list[str], filters.Filter],
+    runs: Union[str, list[str], filters.Filter, RunSet],
     attributes: Union[str, list[str], filters.AttributeFilter],
     include_time: Optional[Literal["absolute"]] = None,
     step_range: Tuple[Optional[float], Optional[float]] = (None, None),
@@ -125,7 +181,8 @@ def fetch_metrics(
     `runs` - a filter specifying which runs to include
         - a list of specific run IDs, or
         - a regex that the run ID must match, or
-        - a Filter object
+        - a Filter object, or
+        - a RunSet returned by `resolve_runs`, to skip searching for the runs again
     `attributes` - a filter specifying which attributes to include in the table
         - a list of specific attribute names, or
         - a regex that the attribute name must match, or
@@ -146,10 +203,11 @@ def fetch_metrics(
 
     If `include_time` is set, each metric column has an additional sub-column with requested timestamp values.
     """
+    run_set = resolve_run_set(runs, "run")
     _runs = resolve_runs_filter(runs)
-    assert _runs is not None
+    assert _runs is not None or run_set is not None
     _attributes = resolve_attributes_filter(attributes)
-    project_identifier = get_default_project_identifier(context)
+    project_identifier = run_set.project_identifier if run_set is not None else get_default_project_identifier(context)
 
     return _fetch_metrics.fetch_metrics(
         project_identifier=project_identifier,
@@ -163,23 +221,26 @@ def fetch_metrics(
         include_point_previews=include_point_previews,
         context=context,
         container_type=_search.ContainerType.RUN,
+        run_set=run_set,
     )
 
 
 def fetch_runs_table(
-    runs: Optional[Union[str, list[str], filters.Filter]] = None,
+    runs: Optional[Union[str, list[str], filters.Filter, RunSet]] = None,
     attributes: Union[str, list[str], filters.AttributeFilter] = "^sys/name$",
     sort_by: Union[str, filters.Attribute] = filters.Attribute("sys/creation_time", type="datetime"),
     sort_direction: Literal["asc", "desc"] = "desc",
     limit: Optional[int] = None,
     type_suffix_in_column_names: bool = False,
     context: Optional[_context.Context] = None,
+    projects: Optional[list[str]] = None,
 ) -> _pandas.DataFrame:
     """
     `runs` - a filter specifying which runs to include in the table
         - a list of specific run IDs, or
         - a regex that the run ID must match, or
-        - a Filter object
+        - a Filter object, or
+        - a RunSet returned by `resolve_runs`, to skip searching for the runs again
     `attributes` - a filter specifying which attributes to include in the table
         - a list of specific attribute names, or
         - a regex that the attribute name must match, or
@@ -191,16 +252,39 @@ def fetch_runs_table(
         are suffixed with ":<type>", e.g. "attribute1:float_series", "attribute1:string".
         If False, an exception is raised if there are multiple types under one attribute path.
     `context` - a Context object to be used; primarily useful for switching projects
+    `projects` - a list of projects to fetch the runs from, instead of the project of the context. Each item is
+        'workspace/project', or 'workspace' for all projects of a workspace. The runs are then sorted together,
+        and the returned DataFrame is indexed with a MultiIndex on (project, run).
+        The search goes through the runs of all projects available to you, skipping those of other projects,
+        so it's slow if `runs` matches many runs outside of the given projects.
 
     Returns a DataFrame similar to the runs table in the web app, with an important difference:
     aggregates of metrics (min, max, avg, last, ...) are returned as sub-columns of a metric column. In other words,
     the returned DataFrame is indexed with a MultiIndex on (attribute name, attribute property).
     If you don't specify aggregates to return, only the last logged value of each metric is returned.
     """
+    run_set = resolve_run_set(runs, "run")
     _runs = resolve_runs_filter(runs)
     _attributes = resolve_attributes_filter(attributes)
     _sort_by = resolve_sort_by(sort_by)
-    project_identifier = get_default_project_identifier(context)
+
+    if projects is not None:
+        if run_set is not None:
+            raise ValueError("Invalid value for `projects`. A RunSet belongs to a single project.")
+        return _fetch_table.fetch_table_across_projects(
+            projects=resolve_projects(projects),
+            filter_=_runs,
+            attributes=_attributes,
+            sort_by=_sort_by,
+            sort_direction=sort_direction,
+            limit=limit,
+            type_suffix_in_column_names=type_suffix_in_column_names,
+            context=context,
+            container_type=_search.ContainerType.RUN,
+            flatten_file_properties=True,
+        )
+
+    project_identifier = run_set.project_identifier if run_set is not None else get_default_project_identifier(context)
 
     return _fetch_table.fetch_table(
         project_identifier=project_identifier,
@@ -212,12 +296,13 @@ def fetch_runs_table(
         type_suffix_in_column_names=type_suffix_in_column_names,
         context=context,
         container_type=_search.ContainerType.RUN,
+        run_set=run_set,
         flatten_file_properties=True,
     )
 
 
 def fetch_series(
-    runs: Union[str, list[str], filters.Filter],
+    runs: Union[str, list[str], filters.Filter, RunSet],
     attributes: Union[str, list[str], filters.AttributeFilter],
     *,
     include_time: Optional[Literal["absolute"]] = None,
@@ -234,7 +319,8 @@ def fetch_series(
     `runs` - a filter specifying which runs to include
         - a list of specific run IDs, or
         - a regex that experiment name must match, or
-        - a Filter object for more complex filtering
+        - a Filter object for more complex filtering, or
+        - a RunSet returned by `resolve_runs`, to skip searching for the runs again
     `attributes` - a filter specifying which attributes to include
         - a list of specific attribute names, or
         - a regex that attribute name must match, or
@@ -249,10 +335,11 @@ def fetch_series(
     Returns a DataFrame containing string series for the specified runs and attributes.
     If include_time is set, each series column will have an additional sub-column with the requested timestamp values.
     """
+    run_set = resolve_run_set(runs, "run")
     _runs = resolve_runs_filter(runs)
-    assert _runs is not None
+    assert _runs is not None or run_set is not None
     _attributes = resolve_attributes_filter(attributes)
-    project_identifier = get_default_project_identifier(context)
+    project_identifier = run_set.project_identifier if run_set is not None else get_default_project_identifier(context)
 
     return _fetch_series.fetch_series(
         project_identifier=project_identifier,
@@ -264,11 +351,12 @@ def fetch_series(
         tail_limit=tail_limit,
         context=context,
         container_type=_search.ContainerType.RUN,
+        run_set=run_set,
     )
 
 
 def download_files(
-    runs: Optional[Union[str, list[str], filters.Filter]] = None,
+    runs: Optional[Union[str, list[str], filters.Filter, RunSet]] = None,
     attributes: Optional[Union[str, list[str], filters.AttributeFilter]] = None,
     *,
     destination: Optional[str] = None,
@@ -280,7 +368,8 @@ def download_files(
     `runs` - a filter specifying which runs to include in the table
         - a list of specific run IDs, or
         - a regex that the run ID must match, or
-        - a Filter object
+        - a Filter object, or
+        - a RunSet returned by `resolve_runs`, to skip searching for the runs again
     `attributes` - a filter specifying which attributes to include in the table
         - a list of specific attribute names, or
         - a regex that the attribute name must match, or
@@ -292,10 +381,11 @@ def download_files(
 
     Returns a DataFrame mapping runs and attributes to the paths of downloaded files.
     """
+    run_set = resolve_run_set(runs, "run")
     _runs = resolve_runs_filter(runs)
     _attributes = resolve_attributes_filter(attributes)
     destination_path = resolve_destination_path(destination)
-    project_identifier = get_default_project_identifier(context)
+    project_identifier = run_set.project_identifier if run_set is not None else get_default_project_identifier(context)
 
     return _download_files.download_files(
         project_identifier=project_identifier,
@@ -304,4 +394,5 @@ def download_files(
         destination=destination_path,
         context=context,
         container_type=_search.ContainerType.RUN,
+        run_set=run_set,
     )
@@ -218,6 +218,23 @@ class NeptuneRetryError(NeptuneError):
         )
 
 
+class NeptuneServiceUnavailableError(NeptuneError):
+    def __init__(self, consecutive_failures: int, reset_timeout: float) -> None:
+        super().__init__(
+            """
+{h1}NeptuneServiceUnavailableError: The Neptune server seems to be unavailable.{end}
+
+The last {consecutive_failures} requests to the server failed, so no requests are sent for {reset_timeout:.0f} seconds.
+
+Make sure that you have a stable internet connection and that your Neptune instance is running and accessible.
+To keep retrying instead, set the {bash}{env_name}{end} environment variable to an empty string.
+""",
+            consecutive_failures=consecutive_failures,
+            reset_timeout=reset_timeout,
+            env_name=env.NEPTUNE_FETCHER_CIRCUIT_BREAKER_THRESHOLD.name,
+        )
+
+
 def _decode_content(content: bytes, content_max_length: int = 1000) -> str:
     try:
         return content.decode("utf-8")[:content_max_length]
@@ -13,15 +13,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import threading
+import weakref
 from dataclasses import dataclass
 from http import HTTPStatus
 from typing import (
+    Any,
+    AsyncGenerator,
     Callable,
     Dict,
     Optional,
+    TypeVar,
+    Union,
 )
 
 import httpx
+from attrs import (
+    define,
+    field,
+)
+from httpx._utils import get_environment_proxies
 
 from neptune_fetcher.generated.neptune_api import (
     AuthenticatedClient,
@@ -29,16 +41,29 @@ from neptune_fetcher.generated.neptune_api import (
 )
 from neptune_fetcher.generated.neptune_api.api.backend import get_client_config
 from neptune_fetcher.generated.neptune_api.auth_helpers import exchange_api_key
+from neptune_fetcher.generated.neptune_api.client import NeptuneAuthenticator
 from neptune_fetcher.generated.neptune_api.credentials import Credentials
 from neptune_fetcher.generated.neptune_api.models import ClientConfig
-from neptune_fetcher.generated.neptune_api.types import Response
+from neptune_fetcher.generated.neptune_api.types import (
+    OAuthToken,
+    Response,
+)
 
 from ..exceptions import NeptuneFailedToFetchClientConfig
+from . import config_cache
 from .env import (
     NEPTUNE_HTTP_REQUEST_TIMEOUT_SECONDS,
     NEPTUNE_VERIFY_SSL,
 )
 from .retrieval.retry import handle_errors_default
+from .transport import (
+    AsyncInstrumentedTransport,
+    InstrumentedTransport,
+    TransportSettings,
+    TransportStats,
+)
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -52,6 +77,9 @@ class TokenRefreshingURLs:
             authorization_endpoint=data["authorization_endpoint"], token_endpoint=data["token_endpoint"]
         )
 
+    def to_dict(self) -> dict:
+        return {"authorization_endpoint": self.authorization_endpoint, "token_endpoint": self.token_endpoint}
+
 
 def _wrap_httpx_json_response(httpx_response: httpx.Response) -> Response:
     """Wrap a httpx.Response into an neptune-api Response object that is compatible
@@ -67,6 +95,30 @@ def _wrap_httpx_json_response(httpx_response: httpx.Response) -> Response:
 
 def get_config_and_token_urls(
     *, credentials: Credentials, proxies: Optional[Dict[str, str]] = None
+) -> tuple[ClientConfig, TokenRefreshingURLs]:
+    if (cached := _load_cached_config_and_token_urls(credentials.base_url)) is not None:
+        return cached
+
+    config, token_urls = _fetch_config_and_token_urls(credentials=credentials, proxies=proxies)
+    config_cache.store(credentials.base_url, config.to_dict(), token_urls.to_dict())
+    return config, token_urls
+
+
+def _load_cached_config_and_token_urls(base_url: str) -> Optional[tuple[ClientConfig, TokenRefreshingURLs]]:
+    cached = config_cache.load(base_url)
+    if cached is None:
+        return None
+
+    try:
+        config_dict, token_urls_dict = cached
+        return ClientConfig.from_dict(config_dict), TokenRefreshingURLs.from_dict(token_urls_dict)
+    except Exception:
+        config_cache.invalidate(base_url)
+        return None
+
+
+def _fetch_config_and_token_urls(
+    *, credentials: Credentials, proxies: Optional[Dict[str, str]]
 ) -> tuple[ClientConfig, TokenRefreshingURLs]:
     timeout = httpx.Timeout(NEPTUNE_HTTP_REQUEST_TIMEOUT_SECONDS.get())
     with Client(
@@ -95,26 +147,234 @@ def get_config_and_token_urls(
             raise NeptuneFailedToFetchClientConfig(exception=e) from e
 
 
+class _AsyncNeptuneAuthenticator(NeptuneAuthenticator):
+    async def async_auth_flow(self, request: httpx.Request) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        if self._token is None or self._token.is_expired:
+            # Exchanging and refreshing the token is rare, so it reuses the synchronous implementation
+            await asyncio.to_thread(self._refresh_token_if_expired)
+
+        if self._token is not None:
+            request.headers["Authorization"] = f"Bearer {self._token.access_token}"
+
+        yield request
+
+
+# How long each of the timers of the task waiting to close an async client lasts
+_CLOSER_SLEEP_SECONDS = 3600
+
+
+@define
+class AsyncCapableAuthenticatedClient(AuthenticatedClient):
+    """
+    AuthenticatedClient that can also be used with the `asyncio_detailed` variants of the generated endpoints.
+
+    httpx.AsyncClient is bound to the event loop it's first used in, so a separate one is created for each event loop.
+    It's closed when the client is exited, or when the event loop shuts down with `asyncio.run`, which cancels the
+    remaining tasks of the loop, including the one waiting to close the client. That task is referenced only by the
+    loop, so an event loop that's closed without cancelling its tasks is still released once it's no longer used.
+    Requests to Neptune are sent with a transport created from `transport_settings`, if provided.
+    """
+
+    _transport_settings: Optional[TransportSettings] = field(default=None, kw_only=True, alias="transport_settings")
+    _transports: list[InstrumentedTransport] = field(factory=list, init=False)
+    _async_transports: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, list[AsyncInstrumentedTransport]] = field(
+        factory=weakref.WeakKeyDictionary, init=False
+    )
+    _async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = field(
+        factory=weakref.WeakKeyDictionary, init=False
+    )
+    # Weak references, as a task references its loop, which would then never be dropped from the dictionary
+    _async_closers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, weakref.ref[asyncio.Task]] = field(
+        factory=weakref.WeakKeyDictionary, init=False
+    )
+    _async_authenticator: Optional[_AsyncNeptuneAuthenticator] = field(default=None, init=False)
+    # Held while the httpx clients and their transports are created, so that concurrent first requests share them
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def get_httpx_client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None and self._transport_settings is not None:
+                settings = self._transport_settings
+                transport, mounts = self._create_transports(
+                    lambda proxy: settings.create_transport(verify_ssl=bool(self._verify_ssl), proxy=proxy)
+                )
+                self._transports = [transport, *(mount for mount in mounts.values() if mount is not None)]
+                self._client = httpx.Client(
+                    auth=NeptuneAuthenticator(
+                        credentials=self.credentials,
+                        client_id=self.client_id,
+                        token_refreshing_endpoint=self.token_refreshing_endpoint,
+                        api_key_exchange_factory=self.api_key_exchange_callback,
+                        client=self.get_token_refreshing_client(),
+                    ),
+                    base_url=self._base_url,
+                    cookies=self._cookies,
+                    headers=self._headers,
+                    timeout=self._timeout,
+                    verify=self._verify_ssl,
+                    follow_redirects=self._follow_redirects,
+                    transport=transport,
+                    **self._httpx_args_with_mounts(mounts),
+                )
+            return super().get_httpx_client()
+
+    def set_async_httpx_client(self, async_client: httpx.AsyncClient) -> "AsyncCapableAuthenticatedClient":
+        self._async_clients[asyncio.get_running_loop()] = async_client
+        return self
+
+    def get_async_httpx_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._async_authenticator is None:
+                self._async_authenticator = _AsyncNeptuneAuthenticator(
+                    credentials=self.credentials,
+                    client_id=self.client_id,
+                    token_refreshing_endpoint=self.token_refreshing_endpoint,
+                    api_key_exchange_factory=self.api_key_exchange_callback,
+                    client=self.get_token_refreshing_client(),
+                )
+
+            async_client = self._async_clients.get(loop)
+            if async_client is None:
+                transport_args: dict[str, Any] = {}
+                httpx_args = self._httpx_args
+                if self._transport_settings is not None:
+                    settings = self._transport_settings
+                    transport, mounts = self._create_transports(
+                        lambda proxy: settings.create_async_transport(verify_ssl=bool(self._verify_ssl), proxy=proxy)
+                    )
+                    self._async_transports[loop] = [
+                        transport,
+                        *(mount for mount in mounts.values() if mount is not None),
+                    ]
+                    transport_args["transport"] = transport
+                    httpx_args = self._httpx_args_with_mounts(mounts)
+                async_client = httpx.AsyncClient(
+                    auth=self._async_authenticator,
+                    base_url=self._base_url,
+                    cookies=self._cookies,
+                    headers=self._headers,
+                    timeout=self._timeout,
+                    verify=self._verify_ssl,
+                    follow_redirects=self._follow_redirects,
+                    **transport_args,
+                    **httpx_args,
+                )
+                self._async_clients[loop] = async_client
+                closer = loop.create_task(self._close_at_loop_shutdown(loop, async_client))
+                # Dropped together with a loop closed without cancelling it, which is expected, so it's not logged.
+                # asyncio does the same for the futures of `run_until_complete`
+                closer._log_destroy_pending = False  # type: ignore
+                self._async_closers[loop] = weakref.ref(closer)
+            return async_client
+
+    async def _close_at_loop_shutdown(self, loop: asyncio.AbstractEventLoop, async_client: httpx.AsyncClient) -> None:
+        # Waiting on timers of the loop, rather than on a future of our own, keeps the task referenced by the loop alone
+        try:
+            while True:
+                await asyncio.sleep(_CLOSER_SLEEP_SECONDS)
+        except asyncio.CancelledError:
+            with self._lock:
+                if self._async_clients.get(loop) is async_client:
+                    del self._async_clients[loop]
+                    self._async_transports.pop(loop, None)
+                    self._async_closers.pop(loop, None)
+            await async_client.aclose()
+            raise
+
+    def _create_transports(self, create: Callable[[Optional[str]], T]) -> tuple[T, dict[str, Optional[T]]]:
+        """
+        Create the transport of the requests to Neptune, and a transport for each proxy set in the environment.
+
+        httpx reads the proxies from the environment only when no transport is given, so with a custom transport
+        they're mounted here, with transports created from the same settings. A None mount sends the matching
+        requests without a proxy, through the main transport.
+        """
+        mounts: dict[str, Optional[T]] = {}
+        if self._httpx_args.get("trust_env", True):
+            for pattern, proxy in get_environment_proxies().items():
+                mounts[pattern] = create(proxy) if proxy is not None else None
+        return create(None), mounts
+
+    def _httpx_args_with_mounts(self, mounts: dict[str, Any]) -> dict[str, Any]:
+        # Mounts passed explicitly take precedence over the proxies from the environment, as they do in httpx
+        return {**self._httpx_args, "mounts": {**mounts, **(self._httpx_args.get("mounts") or {})}}
+
+    def exchange_api_token(self) -> None:
+        """
+        Exchange the API token for an access token now, instead of before the first request.
+        """
+        authenticator = self.get_httpx_client().auth
+        if isinstance(authenticator, NeptuneAuthenticator):
+            authenticator._refresh_token_if_expired()
+
+    def get_transport_stats(self) -> Optional[TransportStats]:
+        """
+        Return the utilization of the connection pools of the client, summed over the sync and all async transports,
+        or None if the client doesn't use transports created from TransportSettings.
+        """
+        with self._lock:
+            transports: list[Union[InstrumentedTransport, AsyncInstrumentedTransport]] = [
+                transport for loop_transports in self._async_transports.values() for transport in loop_transports
+            ]
+            transports.extend(self._transports)
+        if not transports:
+            return None
+
+        stats = transports[0].stats()
+        for transport in transports[1:]:
+            stats += transport.stats()
+        return stats
+
+    async def __aenter__(self) -> "AsyncCapableAuthenticatedClient":
+        await self.get_async_httpx_client().__aenter__()
+        return self
+
+    async def __aexit__(self, *args: Any, **kwargs: Any) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            async_client = self._async_clients.pop(loop, None)
+            self._async_transports.pop(loop, None)
+            closer_ref = self._async_closers.pop(loop, None)
+        closer = closer_ref() if closer_ref is not None else None
+        if closer is not None:
+            closer.cancel()
+        if async_client is not None:
+            await async_client.__aexit__(*args, **kwargs)
+
+
 def create_auth_api_client(
     *,
     credentials: Credentials,
     config: ClientConfig,
     token_refreshing_urls: TokenRefreshingURLs,
     proxies: Optional[Dict[str, str]] = None,
+    transport_settings: Optional[TransportSettings] = None,
 ) -> AuthenticatedClient:
-    return AuthenticatedClient(
+    transport_settings = transport_settings or TransportSettings.from_env()
+    return AsyncCapableAuthenticatedClient(
         base_url=credentials.base_url,
         credentials=credentials,
         client_id=config.security.client_id,
         token_refreshing_endpoint=token_refreshing_urls.token_endpoint,
-        api_key_exchange_callback=exchange_api_key,
+        api_key_exchange_callback=_exchange_api_key,
         verify_ssl=NEPTUNE_VERIFY_SSL.get(),
-        httpx_args={"mounts": proxies, "http2": False},
+        httpx_args={"mounts": proxies},
+        transport_settings=transport_settings,
         timeout=httpx.Timeout(NEPTUNE_HTTP_REQUEST_TIMEOUT_SECONDS.get()),
         headers={"User-Agent": _generate_user_agent()},
     )
 
 
+def _exchange_api_key(client: Client, credentials: Credentials) -> OAuthToken:
+    try:
+        return exchange_api_key(client, credentials)
+    except Exception:
+        # The client config may have been read from a stale cache entry, so the next process fetches it again
+        config_cache.invalidate(credentials.base_url)
+        raise
+
+
 _ILLEGAL_CHARS = str.maketrans({c: "_" for c in " ();/"})
 
 
@@ -0,0 +1,123 @@
+#
+# Copyright (c) 2025, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+import weakref
+from typing import (
+    Generator,
+    Optional,
+)
+
+__all__ = (
+    "CancellationToken",
+    "FetchCancelledError",
+    "current_token",
+    "use_token",
+    "raise_if_cancelled",
+    "sleep",
+)
+
+
+class FetchCancelledError(Exception):
+    """
+    Raised in the workers of a fetching function once it has been cancelled, to stop them at the next checkpoint.
+    Never reaches the caller of the fetching function, which gets the error that caused the cancellation.
+    """
+
+
+class CancellationToken:
+    """
+    Shared by all work of a single fetching function. Once cancelled, the work stops at the next checkpoint:
+    before a request is sent, between pages, while sleeping before a retry, or between chunks of a downloaded file.
+
+    A token created with a parent is cancelled together with the parent, but can also be cancelled alone, to stop
+    a part of the work without stopping the rest of it.
+    """
+
+    def __init__(self, parent: Optional[CancellationToken] = None) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._children: weakref.WeakSet[CancellationToken] = weakref.WeakSet()
+        if parent is not None:
+            parent._add_child(self)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._event.set()
+            children = list(self._children)
+            self._children.clear()
+        for child in children:
+            child.cancel()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise FetchCancelledError()
+
+    def sleep(self, seconds: float) -> None:
+        if self._event.wait(seconds):
+            raise FetchCancelledError()
+
+    def _add_child(self, child: CancellationToken) -> None:
+        with self._lock:
+            if not self._event.is_set():
+                self._children.add(child)
+                return
+        child.cancel()
+
+
+_local = threading.local()
+
+
+def current_token() -> Optional[CancellationToken]:
+    """
+    Return the token of the work running in the current thread, if any.
+    """
+    token: Optional[CancellationToken] = getattr(_local, "token", None)
+    return token
+
+
+@contextlib.contextmanager
+def use_token(token: Optional[CancellationToken]) -> Generator[None, None, None]:
+    previous = current_token()
+    _local.token = token
+    try:
+        yield
+    finally:
+        _local.token = previous
+
+
+def raise_if_cancelled() -> None:
+    token = current_token()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def sleep(seconds: float) -> None:
+    """
+    Sleep, waking up as soon as the work running in the current thread is cancelled.
+    """
+    token = current_token()
+    if token is None:
+        time.sleep(seconds)
+    else:
+        token.sleep(seconds)
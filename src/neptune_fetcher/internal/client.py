@@ -15,12 +15,14 @@
 
 from __future__ import annotations
 
-__all__ = ("get_client", "clear_cache")
+__all__ = ("get_client", "prewarm_clients", "get_transport_stats", "clear_cache")
 
 import logging
 import threading
+from concurrent.futures import Future
 from typing import (
     Dict,
+    Iterable,
     Optional,
     Tuple,
 )
@@ -29,50 +31,123 @@ from neptune_fetcher.generated.neptune_api import AuthenticatedClient
 from neptune_fetcher.generated.neptune_api.credentials import Credentials
 
 from .api_utils import (
+    AsyncCapableAuthenticatedClient,
     create_auth_api_client,
     get_config_and_token_urls,
 )
 from .context import Context
+from .transport import TransportStats
 
 # Disable httpx logging, httpx logs requests at INFO level
 logging.getLogger("httpx").setLevel(logging.WARN)
 
 _cache: dict[int, AuthenticatedClient] = {}
-_lock: threading.RLock = threading.RLock()
+# Held only to access `_cache` and `_creation_locks`, never during networking
+_lock: threading.Lock = threading.Lock()
+# Held while a client is being created, so that only one client is created for a given hash_key at any given time,
+# while clients for other keys are created in parallel
+_creation_locks: dict[int, threading.Lock] = {}
 
 
 def get_client(context: Context, proxies: Optional[Dict[str, str]] = None) -> AuthenticatedClient:
-    hash_key = hash((context.api_token, _dict_to_hashable(proxies)))
-
-    # We hold the lock during the entire client creation process, including networking.
-    # This is a deliberate decision to make sure that only one client is created for a given hash_key,
-    # at any given time.
-    # The process can be optimized later by more granular locking (per hash_key), but for the time being
-    # the decision is to keep it dead simple.
+    hash_key = _hash_key(context, proxies)
 
     with _lock:
         if (client := _cache.get(hash_key)) is not None:
             return client
-
-        if not context.api_token:
-            raise ValueError("API token is not set")
-
-        credentials = Credentials.from_api_key(api_key=context.api_token)
-        config, token_urls = get_config_and_token_urls(credentials=credentials, proxies=proxies)
-        client = create_auth_api_client(
-            credentials=credentials,
-            config=config,
-            token_refreshing_urls=token_urls,
-            proxies=proxies,
-        )
-
-        _cache[hash_key] = client
-        return client
+        creation_lock = _creation_locks.setdefault(hash_key, threading.Lock())
+
+    with creation_lock:
+        with _lock:
+            # Another thread might have created the client while we were waiting for the lock
+            if (client := _cache.get(hash_key)) is not None:
+                return client
+
+        try:
+            if not context.api_token:
+                raise ValueError("API token is not set")
+
+            credentials = Credentials.from_api_key(api_key=context.api_token)
+            config, token_urls = get_config_and_token_urls(credentials=credentials, proxies=proxies)
+            client = create_auth_api_client(
+                credentials=credentials,
+                config=config,
+                token_refreshing_urls=token_urls,
+                proxies=proxies,
+            )
+
+            with _lock:
+                _cache[hash_key] = client
+            return client
+        finally:
+            # Also after a failure, so that retries with failing tokens don't pile up locks
+            with _lock:
+                if _creation_locks.get(hash_key) is creation_lock:
+                    del _creation_locks[hash_key]
+
+
+def prewarm_clients(
+    contexts: Iterable[Context], proxies: Optional[Dict[str, str]] = None
+) -> list[Future[AuthenticatedClient]]:
+    """
+    Start creating the clients for the given contexts in background threads, one thread per distinct API token,
+    including the exchange of the API token for an access token.
+
+    Returns a future per distinct API token, which holds the client or the error that prevented its creation.
+    Clients that are already created are returned as completed futures.
+    """
+    futures: dict[int, Future[AuthenticatedClient]] = {}
+    for context in contexts:
+        hash_key = _hash_key(context, proxies)
+        if hash_key in futures:
+            continue
+
+        future: Future[AuthenticatedClient] = Future()
+        futures[hash_key] = future
+        with _lock:
+            client = _cache.get(hash_key)
+        if client is not None:
+            future.set_result(client)
+        else:
+            threading.Thread(
+                target=_prewarm_client, args=(future, context, proxies), name="neptune-prewarm-client", daemon=True
+            ).start()
+
+    return list(futures.values())
+
+
+def _prewarm_client(future: Future[AuthenticatedClient], context: Context, proxies: Optional[Dict[str, str]]) -> None:
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        client = get_client(context, proxies)
+        if isinstance(client, AsyncCapableAuthenticatedClient):
+            client.exchange_api_token()
+    except BaseException as e:
+        future.set_exception(e)
+    else:
+        future.set_result(client)
+
+
+def get_transport_stats(context: Context, proxies: Optional[Dict[str, str]] = None) -> Optional[TransportStats]:
+    """
+    Return the utilization of the connection pools of the client for the given context, if it has been created.
+    """
+    with _lock:
+        client = _cache.get(_hash_key(context, proxies))
+    if isinstance(client, AsyncCapableAuthenticatedClient):
+        return client.get_transport_stats()
+    return None
 
 
 def clear_cache() -> None:
     with _lock:
         _cache.clear()
+        _creation_locks.clear()
+
+
+def _hash_key(context: Context, proxies: Optional[Dict[str, str]]) -> int:
+    return hash((context.api_token, _dict_to_hashable(proxies)))
 
 
 def _dict_to_hashable(d: Optional[Dict[str, str]]) -> frozenset[Tuple[str, str]]:
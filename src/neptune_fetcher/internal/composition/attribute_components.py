@@ -15,6 +15,7 @@
 
 from concurrent.futures import Executor
 from typing import (
+    AsyncGenerator,
     Callable,
     Optional,
 )
@@ -25,11 +26,16 @@ from .. import (
     filters,
     identifiers,
 )
-from ..composition import concurrency
+from ..composition import (
+    concurrency,
+    concurrency_async,
+)
 from ..composition.attributes import (
     AttributeDefinitionAggregation,
-    fetch_attribute_definition_aggregations,
-    fetch_attribute_definitions,
+    fetch_attribute_definition_aggregations_async,
+    fetch_attribute_definition_aggregations_concurrently,
+    fetch_attribute_definitions_async,
+    fetch_attribute_definitions_concurrently,
 )
 from ..retrieval import attribute_values as att_vals
 from ..retrieval import (
@@ -51,20 +57,44 @@ def fetch_attribute_definitions_split(
     return concurrency.generate_concurrently(
         items=split.split_sys_ids(sys_ids),
         executor=executor,
-        downstream=lambda sys_ids_split: concurrency.generate_concurrently(
-            fetch_attribute_definitions(
-                client=client,
-                project_identifiers=[project_identifier],
-                run_identifiers=[identifiers.RunIdentifier(project_identifier, sys_id) for sys_id in sys_ids_split],
-                attribute_filter=attribute_filter,
-                executor=fetch_attribute_definitions_executor,
+        priority=concurrency.Priority.DEFINITIONS,
+        downstream=lambda sys_ids_split: fetch_attribute_definitions_concurrently(
+            client=client,
+            project_identifiers=[project_identifier],
+            run_identifiers=[identifiers.RunIdentifier(project_identifier, sys_id) for sys_id in sys_ids_split],
+            attribute_filter=attribute_filter,
+            executor=fetch_attribute_definitions_executor,
+            downstream=lambda definitions: concurrency.fork_concurrently(
+                executor=executor,
+                downstreams=[lambda: downstream(sys_ids_split, definitions)],
             ),
-            executor=executor,
-            downstream=lambda definitions: downstream(sys_ids_split, definitions),
         ),
     )
 
 
+async def fetch_attribute_definitions_split_async(
+    client: AuthenticatedClient,
+    project_identifier: identifiers.ProjectIdentifier,
+    attribute_filter: filters._BaseAttributeFilter,
+    sys_ids: list[identifiers.SysId],
+) -> AsyncGenerator[tuple[list[identifiers.SysId], util.Page[identifiers.AttributeDefinition]], None]:
+    async def go_fetch_definitions(
+        sys_ids_split: list[identifiers.SysId],
+    ) -> AsyncGenerator[tuple[list[identifiers.SysId], util.Page[identifiers.AttributeDefinition]], None]:
+        async for definitions in fetch_attribute_definitions_async(
+            client=client,
+            project_identifiers=[project_identifier],
+            run_identifiers=[identifiers.RunIdentifier(project_identifier, sys_id) for sys_id in sys_ids_split],
+            attribute_filter=attribute_filter,
+        ):
+            yield sys_ids_split, definitions
+
+    async for item in concurrency_async.merge(
+        go_fetch_definitions(sys_ids_split) for sys_ids_split in split.split_sys_ids(sys_ids)
+    ):
+        yield item
+
+
 def fetch_attribute_definition_aggregations_split(
     client: AuthenticatedClient,
     project_identifier: identifiers.ProjectIdentifier,
@@ -84,20 +114,58 @@ def fetch_attribute_definition_aggregations_split(
     return concurrency.generate_concurrently(
         items=split.split_sys_ids(sys_ids),
         executor=executor,
-        downstream=lambda sys_ids_split: concurrency.generate_concurrently(
-            fetch_attribute_definition_aggregations(
-                client=client,
-                project_identifiers=[project_identifier],
-                run_identifiers=[identifiers.RunIdentifier(project_identifier, sys_id) for sys_id in sys_ids_split],
-                attribute_filter=attribute_filter,
-                executor=fetch_attribute_definitions_executor,
+        priority=concurrency.Priority.DEFINITIONS,
+        downstream=lambda sys_ids_split: fetch_attribute_definition_aggregations_concurrently(
+            client=client,
+            project_identifiers=[project_identifier],
+            run_identifiers=[identifiers.RunIdentifier(project_identifier, sys_id) for sys_id in sys_ids_split],
+            attribute_filter=attribute_filter,
+            executor=fetch_attribute_definitions_executor,
+            downstream=lambda definitions, aggregations: concurrency.fork_concurrently(
+                executor=executor,
+                downstreams=[lambda: downstream(sys_ids_split, definitions, aggregations)],
             ),
-            executor=executor,
-            downstream=lambda page_pair: downstream(sys_ids_split, page_pair[0], page_pair[1]),
         ),
     )
 
 
+async def fetch_attribute_definition_aggregations_split_async(
+    client: AuthenticatedClient,
+    project_identifier: identifiers.ProjectIdentifier,
+    attribute_filter: filters._BaseAttributeFilter,
+    sys_ids: list[identifiers.SysId],
+) -> AsyncGenerator[
+    tuple[
+        list[identifiers.SysId],
+        util.Page[identifiers.AttributeDefinition],
+        util.Page[AttributeDefinitionAggregation],
+    ],
+    None,
+]:
+    async def go_fetch_definition_aggregations(
+        sys_ids_split: list[identifiers.SysId],
+    ) -> AsyncGenerator[
+        tuple[
+            list[identifiers.SysId],
+            util.Page[identifiers.AttributeDefinition],
+            util.Page[AttributeDefinitionAggregation],
+        ],
+        None,
+    ]:
+        async for definitions, aggregations in fetch_attribute_definition_aggregations_async(
+            client=client,
+            project_identifiers=[project_identifier],
+            run_identifiers=[identifiers.RunIdentifier(project_identifier, sys_id) for sys_id in sys_ids_split],
+            attribute_filter=attribute_filter,
+        ):
+            yield sys_ids_split, definitions, aggregations
+
+    async for item in concurrency_async.merge(
+        go_fetch_definition_aggregations(sys_ids_split) for sys_ids_split in split.split_sys_ids(sys_ids)
+    ):
+        yield item
+
+
 def fetch_attribute_definitions_complete(
     client: AuthenticatedClient,
     project_identifier: identifiers.ProjectIdentifier,
@@ -109,16 +177,16 @@ def fetch_attribute_definitions_complete(
     downstream: Callable[[util.Page[identifiers.AttributeDefinition]], concurrency.OUT],
 ) -> concurrency.OUT:
     if container_type == search.ContainerType.RUN and filter_ is None:
-        return concurrency.generate_concurrently(
-            fetch_attribute_definitions(
-                client=client,
-                project_identifiers=[project_identifier],
-                run_identifiers=None,
-                attribute_filter=attribute_filter,
-                executor=fetch_attribute_definitions_executor,
+        return fetch_attribute_definitions_concurrently(
+            client=client,
+            project_identifiers=[project_identifier],
+            run_identifiers=None,
+            attribute_filter=attribute_filter,
+            executor=fetch_attribute_definitions_executor,
+            downstream=lambda definitions: concurrency.fork_concurrently(
+                executor=executor,
+                downstreams=[lambda: downstream(definitions)],
             ),
-            executor=executor,
-            downstream=downstream,
         )
     else:
         return concurrency.generate_concurrently(
@@ -129,6 +197,7 @@ def fetch_attribute_definitions_complete(
                 container_type=container_type,
             ),
             executor=executor,
+            priority=concurrency.Priority.DISCOVERY,
             downstream=lambda sys_ids_page: fetch_attribute_definitions_split(
                 client=client,
                 project_identifier=project_identifier,
@@ -163,3 +232,21 @@ def fetch_attribute_values_split(
             downstream=downstream,
         ),
     )
+
+
+async def fetch_attribute_values_split_async(
+    client: AuthenticatedClient,
+    project_identifier: identifiers.ProjectIdentifier,
+    sys_ids: list[identifiers.SysId],
+    attribute_definitions: list[identifiers.AttributeDefinition],
+) -> AsyncGenerator[util.Page[att_vals.AttributeValue], None]:
+    async for page in concurrency_async.merge(
+        att_vals.fetch_attribute_values_async(
+            client=client,
+            project_identifier=project_identifier,
+            run_identifiers=[identifiers.RunIdentifier(project_identifier, s) for s in sys_ids_split],
+            attribute_definitions=attribute_definitions_split,
+        )
+        for sys_ids_split, attribute_definitions_split in split.split_sys_ids_attributes(sys_ids, attribute_definitions)
+    ):
+        yield page
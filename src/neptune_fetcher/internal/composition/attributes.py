@@ -13,9 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 from concurrent.futures import Executor
 from dataclasses import dataclass
 from typing import (
+    AsyncGenerator,
+    Callable,
     Generator,
     Iterable,
     Literal,
@@ -29,7 +32,10 @@ from .. import (
     filters,
     identifiers,
 )
-from ..composition import concurrency
+from ..composition import (
+    concurrency,
+    concurrency_async,
+)
 from ..retrieval import attribute_definitions as att_defs
 from ..retrieval import util
 from ..retrieval.attribute_types import TYPE_AGGREGATIONS
@@ -49,15 +55,42 @@ def fetch_attribute_definitions(
     executor: Executor,
     batch_size: int = env.NEPTUNE_FETCHER_ATTRIBUTE_DEFINITIONS_BATCH_SIZE.get(),
 ) -> Generator[util.Page[identifiers.AttributeDefinition], None, None]:
-    pages_filters = _fetch_attribute_definitions(
-        client, project_identifiers, run_identifiers, attribute_filter, batch_size, executor
+    output = fetch_attribute_definitions_concurrently(
+        client=client,
+        project_identifiers=project_identifiers,
+        run_identifiers=run_identifiers,
+        attribute_filter=attribute_filter,
+        executor=executor,
+        downstream=concurrency.return_value,
+        batch_size=batch_size,
     )
+    yield from concurrency.gather_results(output)
 
-    seen_items: set[identifiers.AttributeDefinition] = set()
-    for page, filter_ in pages_filters:
-        new_items = [item for item in page.items if item not in seen_items]
-        seen_items.update(new_items)
-        yield util.Page(items=new_items)
+
+def fetch_attribute_definitions_concurrently(
+    client: AuthenticatedClient,
+    project_identifiers: Iterable[identifiers.ProjectIdentifier],
+    run_identifiers: Optional[Iterable[identifiers.RunIdentifier]],
+    attribute_filter: filters._BaseAttributeFilter,
+    executor: Executor,
+    downstream: Callable[[util.Page[identifiers.AttributeDefinition]], concurrency.OUT],
+    batch_size: int = env.NEPTUNE_FETCHER_ATTRIBUTE_DEFINITIONS_BATCH_SIZE.get(),
+) -> concurrency.OUT:
+    """
+    Each attribute definition is passed downstream once, when it's first encountered.
+    The pages are fetched in the executor and passed downstream without waiting for the remaining pages.
+    """
+    deduplicator = _DefinitionDeduplicator()
+
+    return _fetch_attribute_definitions_concurrently(
+        client,
+        project_identifiers,
+        run_identifiers,
+        attribute_filter,
+        batch_size,
+        executor,
+        downstream=lambda page, filter_: downstream(util.Page(items=deduplicator.new_definitions(page.items))),
+    )
 
 
 def fetch_attribute_definition_aggregations(
@@ -70,51 +103,139 @@ def fetch_attribute_definition_aggregations(
 ) -> Generator[
     tuple[util.Page[identifiers.AttributeDefinition], util.Page[AttributeDefinitionAggregation]], None, None
 ]:
+    output = fetch_attribute_definition_aggregations_concurrently(
+        client=client,
+        project_identifiers=project_identifiers,
+        run_identifiers=run_identifiers,
+        attribute_filter=attribute_filter,
+        executor=executor,
+        downstream=lambda definitions, aggregations: concurrency.return_value((definitions, aggregations)),
+        batch_size=batch_size,
+    )
+    yield from concurrency.gather_results(output)
+
+
+def fetch_attribute_definition_aggregations_concurrently(
+    client: AuthenticatedClient,
+    project_identifiers: Iterable[identifiers.ProjectIdentifier],
+    run_identifiers: Iterable[identifiers.RunIdentifier],
+    attribute_filter: filters._BaseAttributeFilter,
+    executor: Executor,
+    downstream: Callable[
+        [util.Page[identifiers.AttributeDefinition], util.Page[AttributeDefinitionAggregation]], concurrency.OUT
+    ],
+    batch_size: int = env.NEPTUNE_FETCHER_ATTRIBUTE_DEFINITIONS_BATCH_SIZE.get(),
+) -> concurrency.OUT:
     """
-    Each attribute definition is yielded once when it's first encountered.
+    Each attribute definition is passed downstream once when it's first encountered.
     If the attribute definition is of a type that supports aggregations (for now only float_series),
-    it's then yielded once for each aggregation in the filter that returned it.
+    it's then passed once for each aggregation in the filter that returned it.
     """
+    deduplicator = _DefinitionDeduplicator()
 
-    pages_filters = _fetch_attribute_definitions(
-        client, project_identifiers, run_identifiers, attribute_filter, batch_size, executor
+    def go_downstream(
+        page: util.Page[identifiers.AttributeDefinition], filter_: filters._AttributeFilter
+    ) -> concurrency.OUT:
+        new_definitions, new_definition_aggregations = deduplicator.new_definitions_and_aggregations(
+            page.items, filter_
+        )
+        return downstream(util.Page(items=new_definitions), util.Page(items=new_definition_aggregations))
+
+    return _fetch_attribute_definitions_concurrently(
+        client, project_identifiers, run_identifiers, attribute_filter, batch_size, executor, downstream=go_downstream
     )
 
-    seen_definitions: set[identifiers.AttributeDefinition] = set()
-    seen_definition_aggregations: set[AttributeDefinitionAggregation] = set()
 
-    for page, filter_ in pages_filters:
-        new_definitions = []
-        new_definition_aggregations = []
+async def fetch_attribute_definitions_async(
+    client: AuthenticatedClient,
+    project_identifiers: Iterable[identifiers.ProjectIdentifier],
+    run_identifiers: Optional[Iterable[identifiers.RunIdentifier]],
+    attribute_filter: filters._BaseAttributeFilter,
+    batch_size: int = env.NEPTUNE_FETCHER_ATTRIBUTE_DEFINITIONS_BATCH_SIZE.get(),
+) -> AsyncGenerator[util.Page[identifiers.AttributeDefinition], None]:
+    deduplicator = _DefinitionDeduplicator()
 
-        for definition in page.items:
-            if definition not in seen_definitions:
-                new_definitions.append(definition)
-                seen_definitions.add(definition)
+    async for page, _ in _fetch_attribute_definitions_async(
+        client, project_identifiers, run_identifiers, attribute_filter, batch_size
+    ):
+        yield util.Page(items=deduplicator.new_definitions(page.items))
 
-            if definition.type in TYPE_AGGREGATIONS.keys():
-                for aggregation in filter_.aggregations:
-                    if aggregation not in TYPE_AGGREGATIONS[definition.type]:
-                        continue
 
-                    definition_aggregation = AttributeDefinitionAggregation(
-                        attribute_definition=definition, aggregation=aggregation
-                    )
-                    if definition_aggregation not in seen_definition_aggregations:
-                        new_definition_aggregations.append(definition_aggregation)
-                        seen_definition_aggregations.add(definition_aggregation)
+async def fetch_attribute_definition_aggregations_async(
+    client: AuthenticatedClient,
+    project_identifiers: Iterable[identifiers.ProjectIdentifier],
+    run_identifiers: Iterable[identifiers.RunIdentifier],
+    attribute_filter: filters._BaseAttributeFilter,
+    batch_size: int = env.NEPTUNE_FETCHER_ATTRIBUTE_DEFINITIONS_BATCH_SIZE.get(),
+) -> AsyncGenerator[tuple[util.Page[identifiers.AttributeDefinition], util.Page[AttributeDefinitionAggregation]], None]:
+    deduplicator = _DefinitionDeduplicator()
 
+    async for page, filter_ in _fetch_attribute_definitions_async(
+        client, project_identifiers, run_identifiers, attribute_filter, batch_size
+    ):
+        new_definitions, new_definition_aggregations = deduplicator.new_definitions_and_aggregations(
+            page.items, filter_
+        )
         yield util.Page(items=new_definitions), util.Page(items=new_definition_aggregations)
 
 
-def _fetch_attribute_definitions(
+class _DefinitionDeduplicator:
+    """
+    Thread-safe record of the attribute definitions (and definition aggregations) already passed downstream.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._seen_definitions: set[identifiers.AttributeDefinition] = set()
+        self._seen_definition_aggregations: set[AttributeDefinitionAggregation] = set()
+
+    def new_definitions(
+        self, definitions: list[identifiers.AttributeDefinition]
+    ) -> list[identifiers.AttributeDefinition]:
+        with self._lock:
+            new_definitions = []
+            for definition in definitions:
+                if definition not in self._seen_definitions:
+                    new_definitions.append(definition)
+                    self._seen_definitions.add(definition)
+            return new_definitions
+
+    def new_definitions_and_aggregations(
+        self, definitions: list[identifiers.AttributeDefinition], filter_: filters._AttributeFilter
+    ) -> tuple[list[identifiers.AttributeDefinition], list[AttributeDefinitionAggregation]]:
+        with self._lock:
+            new_definitions = []
+            new_definition_aggregations = []
+
+            for definition in definitions:
+                if definition not in self._seen_definitions:
+                    new_definitions.append(definition)
+                    self._seen_definitions.add(definition)
+
+                if definition.type in TYPE_AGGREGATIONS.keys():
+                    for aggregation in filter_.aggregations:
+                        if aggregation not in TYPE_AGGREGATIONS[definition.type]:
+                            continue
+
+                        definition_aggregation = AttributeDefinitionAggregation(
+                            attribute_definition=definition, aggregation=aggregation
+                        )
+                        if definition_aggregation not in self._seen_definition_aggregations:
+                            new_definition_aggregations.append(definition_aggregation)
+                            self._seen_definition_aggregations.add(definition_aggregation)
+
+            return new_definitions, new_definition_aggregations
+
+
+def _fetch_attribute_definitions_concurrently(
     client: AuthenticatedClient,
     project_identifiers: Iterable[identifiers.ProjectIdentifier],
     run_identifiers: Optional[Iterable[identifiers.RunIdentifier]],
     attribute_filter: filters._BaseAttributeFilter,
     batch_size: int,
     executor: Executor,
-) -> Generator[tuple[util.Page[identifiers.AttributeDefinition], filters._AttributeFilter], None, None]:
+    downstream: Callable[[util.Page[identifiers.AttributeDefinition], filters._AttributeFilter], concurrency.OUT],
+) -> concurrency.OUT:
     def go_fetch_single(
         filter_: filters._AttributeFilter,
     ) -> Generator[util.Page[identifiers.AttributeDefinition], None, None]:
@@ -126,15 +247,40 @@ def _fetch_attribute_definitions(
             batch_size=batch_size,
         )
 
-    filters_ = att_defs.split_attribute_filters(attribute_filter)
+    filters_ = att_defs.merge_attribute_filters(att_defs.split_attribute_filters(attribute_filter))
 
-    output = concurrency.generate_concurrently(
+    return concurrency.generate_concurrently(
         items=(filter_ for filter_ in filters_),
         executor=executor,
+        priority=concurrency.Priority.DEFINITIONS,
         downstream=lambda filter_: concurrency.generate_concurrently(
             items=go_fetch_single(filter_),
             executor=executor,
-            downstream=lambda _page: concurrency.return_value((_page, filter_)),
+            priority=concurrency.Priority.DEFINITIONS,
+            downstream=lambda _page: downstream(_page, filter_),
         ),
     )
-    yield from concurrency.gather_results(output)
+
+
+def _fetch_attribute_definitions_async(
+    client: AuthenticatedClient,
+    project_identifiers: Iterable[identifiers.ProjectIdentifier],
+    run_identifiers: Optional[Iterable[identifiers.RunIdentifier]],
+    attribute_filter: filters._BaseAttributeFilter,
+    batch_size: int,
+) -> AsyncGenerator[tuple[util.Page[identifiers.AttributeDefinition], filters._AttributeFilter], None]:
+    async def go_fetch_single(
+        filter_: filters._AttributeFilter,
+    ) -> AsyncGenerator[tuple[util.Page[identifiers.AttributeDefinition], filters._AttributeFilter], None]:
+        async for page in att_defs.fetch_attribute_definitions_single_filter_async(
+            client=client,
+            project_identifiers=project_identifiers,
+            run_identifiers=run_identifiers,
+            attribute_filter=filter_,
+            batch_size=batch_size,
+        ):
+            yield page, filter_
+
+    filters_ = att_defs.merge_attribute_filters(att_defs.split_attribute_filters(attribute_filter))
+
+    return concurrency_async.merge(go_fetch_single(filter_) for filter_ in filters_)
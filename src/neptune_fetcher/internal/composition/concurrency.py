@@ -15,52 +15,428 @@
 
 from __future__ import annotations
 
+import atexit
 import concurrent
+import enum
+import heapq
+import itertools
+import os
+import queue
+import threading
+import time
 from concurrent.futures import (
     Executor,
     Future,
-    ThreadPoolExecutor,
+)
+from dataclasses import (
+    dataclass,
+    field,
 )
 from typing import (
     Any,
     Callable,
     Generator,
+    Generic,
     Iterable,
+    Literal,
     Optional,
     TypeVar,
+    Union,
 )
 
-from .. import env
+from .. import (
+    cancellation,
+    env,
+)
+from ..retrieval import util
 
 T = TypeVar("T")
 R = TypeVar("R")
-OUT = tuple[set[Future], Optional[R]]
+_Task = Union[Future, "_DeferredPull"]
+OUT = tuple[set[_Task], Optional[R]]
 _Params = dict[str, Any]
 
+# Logical queues of the shared worker pool. Fetching attribute definitions has its own queue, so that discovering
+# definitions of the next batches of runs does not wait behind fetching values of the previous ones.
+QueueName = Literal["general", "definitions"]
+_QUEUE_NAMES: tuple[QueueName, ...] = ("general", "definitions")
+
+
+class Priority(enum.IntEnum):
+    """
+    Priority classes of the work in a fetching pipeline, from the most urgent.
+
+    Upstream stages are served first, so that they stay ahead of the downstream ones: discovering the next runs
+    is never delayed by fetching values of the runs discovered so far, and the total time of a pipeline approaches
+    the time of its longest chain of requests.
+    """
+
+    DISCOVERY = 0
+    DEFINITIONS = 1
+    VALUES = 2
+    DOWNLOADS = 3
+
+
+# Workers that stay idle for this long exit; the pool starts new ones when work arrives again.
+_IDLE_WORKER_TIMEOUT_SECONDS = 300.0
+
+
+class _WorkItem:
+    __slots__ = ("future", "fn", "args", "kwargs")
+
+    def __init__(self, future: Future, fn: Callable[..., Any], args: tuple, kwargs: dict[str, Any]):
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self) -> None:
+        if not self.future.set_running_or_notify_cancel():
+            return
+
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except BaseException as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(result)
+
+
+@dataclass
+class _QueueState:
+    not_empty: threading.Condition
+    # A heap of (priority, sequence number, item): the most urgent work first, FIFO within a priority
+    items: list[tuple[Priority, int, _WorkItem]] = field(default_factory=list)
+    workers: int = 0
+    idle_workers: int = 0
+
+
+class WorkerPool:
+    """
+    A long-lived pool of worker threads shared by all fetching functions in the process.
+
+    Work is submitted to one of the logical queues. Each queue is served by its own workers, started lazily
+    up to `max_workers`, so that work waiting on one queue can never starve the work it waits for.
+    Within a queue, work of a more urgent Priority is started first.
+    """
+
+    def __init__(self, max_workers: int, idle_timeout: float = _IDLE_WORKER_TIMEOUT_SECONDS):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self._lock = threading.Lock()
+        self._queues: dict[QueueName, _QueueState] = {
+            name: _QueueState(not_empty=threading.Condition(self._lock)) for name in _QUEUE_NAMES
+        }
+        self._max_workers = max_workers
+        self._idle_timeout = idle_timeout
+        self._shutdown = False
+        self._sequence = itertools.count()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def submit(self, queue_name: QueueName, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        return self.submit_with_priority(queue_name, Priority.VALUES, fn, *args, **kwargs)
+
+    def submit_with_priority(
+        self, queue_name: QueueName, priority: Priority, fn: Callable[..., T], /, *args: Any, **kwargs: Any
+    ) -> Future[T]:
+        future: Future[T] = Future()
+        item = _WorkItem(future, fn, args, kwargs)
+
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot schedule new work after the worker pool has been shut down")
+
+            state = self._queues[queue_name]
+            heapq.heappush(state.items, (priority, next(self._sequence), item))
+            if len(state.items) > state.idle_workers and state.workers < self._max_workers:
+                self._start_worker(queue_name, state)
+            state.not_empty.notify()
+
+        return future
+
+    def resize(self, max_workers: int) -> None:
+        """
+        Change the number of workers per queue. Surplus workers exit after finishing their current work.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        with self._lock:
+            self._max_workers = max_workers
+            for queue_name, state in self._queues.items():
+                while state.items and len(state.items) > state.idle_workers and state.workers < max_workers:
+                    self._start_worker(queue_name, state)
+                state.not_empty.notify_all()
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        with self._lock:
+            self._shutdown = True
+            for state in self._queues.values():
+                if cancel_pending:
+                    while state.items:
+                        _, _, item = state.items.pop()
+                        item.future.cancel()
+                state.not_empty.notify_all()
+
+    def _start_worker(self, queue_name: QueueName, state: _QueueState) -> None:
+        state.workers += 1
+        thread = threading.Thread(
+            target=self._work,
+            args=(state,),
+            name=f"neptune-fetcher-{queue_name}-{state.workers}",
+            daemon=True,
+        )
+        thread.start()
+
+    def _work(self, state: _QueueState) -> None:
+        while True:
+            with self._lock:
+                state.idle_workers += 1
+                deadline = time.monotonic() + self._idle_timeout
+                while not state.items and not self._shutdown and state.workers <= self._max_workers:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    state.not_empty.wait(remaining)
+                state.idle_workers -= 1
+
+                if not state.items or state.workers > self._max_workers:
+                    state.workers -= 1
+                    if state.items:
+                        state.not_empty.notify()
+                    return
+
+                _, _, item = heapq.heappop(state.items)
+
+            item.run()
+            del item
+
+
+class _QueueExecutor(Executor):
+    """
+    Executor submitting work to a logical queue of the shared WorkerPool.
+
+    Shutting it down waits for the work submitted through it, but leaves the shared pool running.
+    The work runs with the cancellation token of the executor. When the executor is exited with an error,
+    the token is cancelled and the pending work is dropped without waiting for the work already running,
+    which stops at its next cancellation checkpoint.
+    """
+
+    def __init__(self, pool: WorkerPool, queue_name: QueueName):
+        self._pool = pool
+        self._queue_name = queue_name
+        self._lock = threading.Lock()
+        self._futures: set[Future] = set()
+        self.cancellation_token = cancellation.CancellationToken()
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        return self.submit_with_priority(Priority.VALUES, fn, *args, **kwargs)
+
+    def submit_with_priority(self, priority: Priority, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        future = self._pool.submit_with_priority(
+            self._queue_name, priority, _call_with_token, self.cancellation_token, fn, *args, **kwargs
+        )
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> Literal[False]:
+        if exc_type is None:
+            self.shutdown(wait=True)
+        else:
+            self.shutdown(wait=False, cancel_futures=True)
+        return False
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        if cancel_futures:
+            self.cancellation_token.cancel()
+
+        while True:
+            with self._lock:
+                futures = list(self._futures)
+            if not futures:
+                return
+            if cancel_futures:
+                for future in futures:
+                    future.cancel()
+            if not wait:
+                return
+            concurrent.futures.wait(futures)
+
+    def _discard(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+
+def _call_with_token(token: cancellation.CancellationToken, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    with cancellation.use_token(token):
+        return fn(*args, **kwargs)
+
+
+_pool: Optional[WorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> WorkerPool:
+    """
+    Return the process-wide WorkerPool, creating it on first use with `NEPTUNE_FETCHER_MAX_WORKERS` workers per queue.
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = WorkerPool(max_workers=env.NEPTUNE_FETCHER_MAX_WORKERS.get())
+        return _pool
 
-def create_thread_pool_executor() -> Executor:
-    max_workers = env.NEPTUNE_FETCHER_MAX_WORKERS.get()
-    return ThreadPoolExecutor(max_workers=max_workers)
+
+def set_max_workers(max_workers: int) -> None:
+    """
+    Resize the process-wide WorkerPool.
+    """
+    get_worker_pool().resize(max_workers)
+
+
+def shutdown_worker_pool() -> None:
+    """
+    Shut down the process-wide WorkerPool, cancelling work that has not started yet.
+    A new pool is created the next time one is needed.
+    """
+    global _pool
+
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def _reset_worker_pool_after_fork() -> None:
+    # Worker threads are not copied to the child process, so the pool inherited from the parent is unusable
+    global _pool, _pool_lock
+
+    _pool = None
+    _pool_lock = threading.Lock()
+
+
+atexit.register(shutdown_worker_pool)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_worker_pool_after_fork)
+
+
+def create_executor(queue_name: QueueName = "general") -> Executor:
+    return _QueueExecutor(get_worker_pool(), queue_name)
+
+
+def _submit(executor: Executor, priority: Priority, fn: Callable[..., T], /, *args: Any) -> Future[T]:
+    if isinstance(executor, _QueueExecutor):
+        return executor.submit_with_priority(priority, fn, *args)
+    return executor.submit(fn, *args)
 
 
 def generate_concurrently(
     items: Generator[T, None, None],
     executor: Executor,
     downstream: Callable[[T], OUT],
+    priority: Priority = Priority.VALUES,
 ) -> OUT:
-    try:
-        head = next(items)
-        futures = {
-            executor.submit(downstream, head),
-            executor.submit(generate_concurrently, items, executor, downstream),
-        }
-        return futures, None
-    except StopIteration:
-        return set(), None
+    """
+    Pull items from the generator one at a time and pass each of them downstream in the executor.
+    The pulls are started by the consumer gathering the results, so that producers don't outpace it.
+    Both the pulls and the downstream calls are scheduled with the given priority.
+    """
+    max_pending = env.NEPTUNE_FETCHER_STAGE_QUEUE_SIZE.get()
+    if max_pending is None:
+        max_pending = 2 * get_worker_pool().max_workers
+
+    stage = _GeneratorStage(
+        items=items, executor=executor, downstream=downstream, max_pending=max_pending, priority=priority
+    )
+    return {_DeferredPull(stage)}, None
+
+
+class _GeneratorStage(Generic[T]):
+    """
+    A producer stage of a pipeline: a generator whose items are passed to the downstream stage.
+
+    The stage is a bounded queue: at most `max_pending` items may be passed downstream and not yet processed.
+    When the limit is reached, the stage stops pulling items instead of waiting for the downstream, and the pull is
+    resumed by the downstream task that frees a slot. No worker is ever blocked waiting for another stage.
+    """
+
+    def __init__(
+        self,
+        items: Generator[T, None, None],
+        executor: Executor,
+        downstream: Callable[[T], OUT],
+        max_pending: int,
+        priority: Priority,
+    ):
+        self._items = items
+        self._executor = executor
+        self.priority = priority
+        self._downstream = downstream
+        self._max_pending = max(max_pending, 1)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._paused = False
+
+    def start_pull(self) -> Future[OUT]:
+        return _submit(self._executor, self.priority, self._pull)
+
+    def _pull(self) -> OUT:
+        cancellation.raise_if_cancelled()
+        try:
+            item = next(self._items)
+        except StopIteration:
+            return set(), None
+
+        tasks: set[_Task] = {_submit(self._executor, self.priority, self._run_downstream, item)}
+        with self._lock:
+            self._pending += 1
+            self._paused = self._pending >= self._max_pending
+            if not self._paused:
+                tasks.add(_DeferredPull(self))
+        return tasks, None
+
+    def _run_downstream(self, item: T) -> OUT:
+        tasks, value = self._downstream(item)
+
+        with self._lock:
+            self._pending -= 1
+            resume = self._paused
+            self._paused = False
+        if resume:
+            tasks = tasks | {_DeferredPull(self)}
+
+        return tasks, value
 
 
-def fork_concurrently(executor: Executor, downstreams: Iterable[Callable[[], OUT]]) -> OUT:
-    futures = {executor.submit(downstream) for downstream in downstreams}
+class _DeferredPull:
+    """
+    The next pull of a generator stage. It's started by the consumer gathering the results, once there is room for it.
+    """
+
+    __slots__ = ("_stage",)
+
+    def __init__(self, stage: _GeneratorStage):
+        self._stage = stage
+
+    @property
+    def priority(self) -> Priority:
+        return self._stage.priority
+
+    def start(self) -> Future[OUT]:
+        return self._stage.start_pull()
+
+
+def fork_concurrently(
+    executor: Executor, downstreams: Iterable[Callable[[], OUT]], priority: Priority = Priority.VALUES
+) -> OUT:
+    futures: set[_Task] = {_submit(executor, priority, downstream) for downstream in downstreams}
     return futures, None
 
 
@@ -69,14 +445,108 @@ def return_value(item: R) -> OUT:
 
 
 def gather_results(output: OUT) -> Generator[R, None, None]:
-    futures, value = output
-    if value is not None:
-        yield value
-    while futures:
-        done, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
-        futures = not_done
-        for future in done:
-            new_futures, value = future.result()
-            futures.update(new_futures)
+    """
+    Yield the values produced by the pipeline in the order they become ready.
+
+    The consumer sets the pace of the pipeline: deferred pulls are started only while the estimated size of the values
+    produced but not yet taken by the consumer is below `NEPTUNE_FETCHER_MAX_INFLIGHT_BYTES`, the most urgent first.
+
+    If the pipeline fails, or the consumer stops before taking all the values, the work that hasn't started yet
+    is cancelled and no more pulls are started.
+    """
+    budget = _InflightBudget(max_bytes=env.NEPTUNE_FETCHER_MAX_INFLIGHT_BYTES.get())
+    # Futures are collected in the order of completion, so that a wait does not depend on the number of futures
+    completed: queue.SimpleQueue[tuple[Future, int]] = queue.SimpleQueue()
+    # A heap of (priority, sequence number, pull)
+    deferred: list[tuple[Priority, int, _DeferredPull]] = []
+    sequence = itertools.count()
+    pending: set[Future] = set()
+
+    def on_done(future: Future) -> None:
+        size = 0
+        if not future.cancelled() and future.exception() is None:
+            _, value = future.result()
             if value is not None:
-                yield value
+                size = _estimate_size_bytes(value)
+        budget.charge(size)
+        completed.put((future, size))
+
+    def track(tasks: set[_Task]) -> None:
+        for task in tasks:
+            if isinstance(task, _DeferredPull):
+                heapq.heappush(deferred, (task.priority, next(sequence), task))
+            else:
+                pending.add(task)
+                task.add_done_callback(on_done)
+
+    finished = False
+    try:
+        tasks, value = output
+        track(tasks)
+        if value is not None:
+            yield value
+
+        while True:
+            while deferred and budget.has_room():
+                _, _, pull = heapq.heappop(deferred)
+                track({pull.start()})
+            if not pending:
+                finished = True
+                return
+
+            future, size = completed.get()
+            pending.discard(future)
+            try:
+                tasks, value = future.result()
+                track(tasks)
+                if value is not None:
+                    yield value
+            finally:
+                budget.release(size)
+    finally:
+        if not finished:
+            deferred.clear()
+            for future in list(pending):
+                future.cancel()
+
+
+class _InflightBudget:
+    """
+    Tracks the estimated size of the values produced by a pipeline and not yet taken by its consumer.
+    """
+
+    def __init__(self, max_bytes: Optional[int]):
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._used_bytes = 0
+
+    def charge(self, size_bytes: int) -> None:
+        with self._lock:
+            self._used_bytes += size_bytes
+
+    def release(self, size_bytes: int) -> None:
+        with self._lock:
+            self._used_bytes -= size_bytes
+
+    def has_room(self) -> bool:
+        with self._lock:
+            # Always allow progress when nothing is waiting for the consumer, even if a single value exceeds the limit
+            return self._max_bytes is None or self._used_bytes == 0 or self._used_bytes < self._max_bytes
+
+
+# A rough estimate of the memory taken by a single fetched item, such as a metric point or an attribute value
+_ESTIMATED_ITEM_SIZE_BYTES = 200
+
+
+def _estimate_size_bytes(value: Any) -> int:
+    if isinstance(value, util.Page):
+        return sum(_estimate_size_bytes(item) for item in value.items)
+    if isinstance(value, dict):
+        return sum(_estimate_size_bytes(item) for item in value.values())
+    if isinstance(value, tuple):
+        return sum(_estimate_size_bytes(item) for item in value)
+    if isinstance(value, (list, set)):
+        return _ESTIMATED_ITEM_SIZE_BYTES * len(value)
+    if hasattr(value, "nbytes"):  # numpy arrays of points, checked without importing numpy here
+        return int(value.nbytes)
+    return _ESTIMATED_ITEM_SIZE_BYTES
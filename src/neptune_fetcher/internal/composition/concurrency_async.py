@@ -0,0 +1,134 @@
+#
+# Copyright (c) 2025, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Coroutine,
+    Iterable,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+# The number of items each of the merged iterables may produce ahead of the consumer
+_MERGE_BUFFER_SIZE = 1
+
+
+class TaskGroup:
+    """
+    Runs tasks concurrently and waits for all of them on exit. When any of the tasks fails, the remaining ones are
+    cancelled and the error is raised. A minimal replacement for asyncio.TaskGroup, which requires Python 3.11.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: set[asyncio.Future] = set()
+
+    def create_task(self, coroutine: Coroutine[Any, Any, T]) -> asyncio.Future[T]:
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        return task
+
+    async def create_task_in_slot(
+        self, coroutine: Coroutine[Any, Any, T], slots: asyncio.Semaphore
+    ) -> asyncio.Future[T]:
+        """
+        Wait for one of the slots, and create a task that holds it until it's done. With a semaphore per kind of task,
+        a producer of tasks waits for earlier ones to finish, instead of creating all of them up front.
+        """
+        try:
+            await slots.acquire()
+        except BaseException:
+            coroutine.close()
+            raise
+        task = self.create_task(coroutine)
+        task.add_done_callback(lambda _: slots.release())
+        return task
+
+    async def __aenter__(self) -> TaskGroup:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        try:
+            if exc_type is None:
+                # Tasks may create more tasks in the group while we wait
+                while self._tasks:
+                    done, _ = await asyncio.wait(self._tasks, return_when=asyncio.FIRST_EXCEPTION)
+                    self._tasks -= done
+                    for task in done:
+                        task.result()
+        finally:
+            await self._cancel_pending()
+
+    async def _cancel_pending(self) -> None:
+        tasks, self._tasks = self._tasks, set()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _Finished:
+    __slots__ = ("error",)
+
+    def __init__(self, error: Optional[BaseException]):
+        self.error = error
+
+
+async def merge(iterables: Iterable[AsyncIterable[T]]) -> AsyncGenerator[T, None]:
+    """
+    Iterate over the async iterables concurrently, yielding the items in the order they arrive.
+    An iterable is resumed only once the consumer takes its previous items, so that producers don't outpace it.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=_MERGE_BUFFER_SIZE)
+
+    async def drain(iterable: AsyncIterable[T]) -> None:
+        try:
+            async for item in iterable:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(_Finished(error=e))
+        else:
+            await queue.put(_Finished(error=None))
+
+    async with TaskGroup() as group:
+        remaining = 0
+        for iterable in iterables:
+            group.create_task(drain(iterable))
+            remaining += 1
+
+        while remaining:
+            item = await queue.get()
+            if isinstance(item, _Finished):
+                remaining -= 1
+                if item.error is not None:
+                    raise item.error
+            else:
+                yield item
+
+
+async def collect(iterable: AsyncIterable[T]) -> list[T]:
+    return [item async for item in iterable]
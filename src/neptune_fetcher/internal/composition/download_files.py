@@ -45,6 +45,7 @@ from ..retrieval import (
     search,
 )
 from ..retrieval.search import ContainerType
+from ..run_set import RunSet
 
 
 def download_files(
@@ -55,6 +56,7 @@ def download_files(
     destination: pathlib.Path,
     context: Optional[Context],
     container_type: ContainerType,
+    run_set: Optional[RunSet] = None,
 ) -> pd.DataFrame:
     valid_context = validate_context(context or get_context())
     client = _client.get_client(context=valid_context)
@@ -63,8 +65,8 @@ def download_files(
     validation.ensure_write_access(destination)
 
     with (
-        concurrency.create_thread_pool_executor() as executor,
-        concurrency.create_thread_pool_executor() as fetch_attribute_definitions_executor,
+        concurrency.create_executor() as executor,
+        concurrency.create_executor("definitions") as fetch_attribute_definitions_executor,
     ):
         inference_result = type_inference.infer_attribute_types_in_filter(
             client=client,
@@ -85,11 +87,16 @@ def download_files(
         sys_id_label_mapping: dict[identifiers.SysId, str] = {}
 
         def go_fetch_sys_attrs() -> Generator[list[identifiers.SysId], None, None]:
-            for page in search.fetch_sys_id_labels(container_type)(
-                client=client,
-                project_identifier=project_identifier,
-                filter_=filter_,
-            ):
+            pages = (
+                search.fetch_run_set_sys_id_labels(run_set)
+                if run_set is not None
+                else search.fetch_sys_id_labels(container_type)(
+                    client=client,
+                    project_identifier=project_identifier,
+                    filter_=filter_,
+                )
+            )
+            for page in pages:
                 sys_ids = []
                 for item in page.items:
                     sys_id_label_mapping[item.sys_id] = item.label
@@ -99,6 +106,7 @@ def download_files(
         output = concurrency.generate_concurrently(
             items=go_fetch_sys_attrs(),
             executor=executor,
+            priority=concurrency.Priority.DISCOVERY,
             downstream=lambda sys_ids: _components.fetch_attribute_definition_aggregations_split(
                 client=client,
                 project_identifier=project_identifier,
@@ -125,6 +133,7 @@ def download_files(
                             )
                         ),
                         executor=executor,
+                        priority=concurrency.Priority.DOWNLOADS,
                         downstream=lambda run_file_tuple: concurrency.return_value(
                             (
                                 run_file_tuple[0].run_identifier,
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from concurrent.futures import Executor
 from typing import (
     Generator,
@@ -24,14 +25,21 @@ import pandas as pd
 
 from neptune_fetcher.generated.neptune_api.client import AuthenticatedClient
 
-from .. import identifiers
+from .. import (
+    env,
+    identifiers,
+)
 from ..client import get_client
 from ..composition import (
     concurrency,
+    concurrency_async,
     type_inference,
     validation,
 )
-from ..composition.attribute_components import fetch_attribute_definitions_split
+from ..composition.attribute_components import (
+    fetch_attribute_definitions_split,
+    fetch_attribute_definitions_split_async,
+)
 from ..context import (
     Context,
     get_context,
@@ -47,12 +55,15 @@ from ..retrieval import (
     split,
 )
 from ..retrieval.metrics import (
-    FloatPointValue,
+    FloatPoints,
     fetch_multiple_series_values,
+    fetch_multiple_series_values_async,
+    join_points,
 )
 from ..retrieval.search import ContainerType
+from ..run_set import RunSet
 
-__all__ = ("fetch_metrics",)
+__all__ = ("fetch_metrics", "fetch_metrics_async")
 
 
 def fetch_metrics(
@@ -68,6 +79,7 @@ def fetch_metrics(
     include_point_previews: bool,
     context: Optional[Context] = None,
     container_type: ContainerType,
+    run_set: Optional[RunSet] = None,
 ) -> pd.DataFrame:
     validation.validate_step_range(step_range)
     validation.validate_tail_limit(tail_limit)
@@ -78,8 +90,8 @@ def fetch_metrics(
     client = get_client(context=valid_context)
 
     with (
-        concurrency.create_thread_pool_executor() as executor,
-        concurrency.create_thread_pool_executor() as fetch_attribute_definitions_executor,
+        concurrency.create_executor() as executor,
+        concurrency.create_executor("definitions") as fetch_attribute_definitions_executor,
     ):
         inference_result = type_inference.infer_attribute_types_in_filter(
             client=client,
@@ -112,6 +124,7 @@ def fetch_metrics(
             executor=executor,
             fetch_attribute_definitions_executor=fetch_attribute_definitions_executor,
             container_type=container_type,
+            run_set=run_set,
         )
 
         df = create_metrics_dataframe(
@@ -126,6 +139,63 @@ def fetch_metrics(
     return df
 
 
+async def fetch_metrics_async(
+    *,
+    project_identifier: identifiers.ProjectIdentifier,
+    filter_: Optional[_Filter],
+    attributes: _BaseAttributeFilter,
+    include_time: Optional[Literal["absolute"]],
+    step_range: tuple[Optional[float], Optional[float]],
+    lineage_to_the_root: bool,
+    tail_limit: Optional[int],
+    type_suffix_in_column_names: bool,
+    include_point_previews: bool,
+    context: Optional[Context] = None,
+    container_type: ContainerType,
+    run_set: Optional[RunSet] = None,
+) -> pd.DataFrame:
+    validation.validate_step_range(step_range)
+    validation.validate_tail_limit(tail_limit)
+    validation.validate_include_time(include_time)
+    restricted_attributes = validation.restrict_attribute_filter_type(attributes, type_in={"float_series"})
+
+    valid_context = validate_context(context or get_context())
+    # Creating a client fetches the client config synchronously, so it's done in a thread
+    client = await asyncio.to_thread(get_client, context=valid_context)
+
+    inference_result = await type_inference.infer_attribute_types_in_filter_async(
+        client=client,
+        project_identifier=project_identifier,
+        filter_=filter_,
+        container_type=container_type,
+    )
+    if inference_result.is_run_domain_empty():
+        metrics_data: dict[identifiers.RunAttributeDefinition, FloatPoints] = {}
+        sys_id_to_label_mapping: dict[identifiers.SysId, str] = {}
+    else:
+        metrics_data, sys_id_to_label_mapping = await _fetch_metrics_async(
+            filter_=inference_result.get_result_or_raise(),
+            attributes=restricted_attributes,
+            client=client,
+            project_identifier=project_identifier,
+            step_range=step_range,
+            lineage_to_the_root=lineage_to_the_root,
+            include_point_previews=include_point_previews,
+            tail_limit=tail_limit,
+            container_type=container_type,
+            run_set=run_set,
+        )
+
+    return create_metrics_dataframe(
+        metrics_data=metrics_data,
+        sys_id_label_mapping=sys_id_to_label_mapping,
+        index_column_name="experiment" if container_type == ContainerType.EXPERIMENT else "run",
+        timestamp_column_name="absolute_time" if include_time == "absolute" else None,
+        include_point_previews=include_point_previews,
+        type_suffix_in_column_names=type_suffix_in_column_names,
+    )
+
+
 def _fetch_metrics(
     filter_: Optional[_Filter],
     attributes: _BaseAttributeFilter,
@@ -138,15 +208,21 @@ def _fetch_metrics(
     include_point_previews: bool,
     tail_limit: Optional[int],
     container_type: ContainerType,
-) -> tuple[dict[identifiers.RunAttributeDefinition, list[FloatPointValue]], dict[identifiers.SysId, str]]:
+    run_set: Optional[RunSet] = None,
+) -> tuple[dict[identifiers.RunAttributeDefinition, FloatPoints], dict[identifiers.SysId, str]]:
     sys_id_label_mapping: dict[identifiers.SysId, str] = {}
 
     def go_fetch_sys_attrs() -> Generator[list[identifiers.SysId], None, None]:
-        for page in search.fetch_sys_id_labels(container_type)(
-            client=client,
-            project_identifier=project_identifier,
-            filter_=filter_,
-        ):
+        pages = (
+            search.fetch_run_set_sys_id_labels(run_set)
+            if run_set is not None
+            else search.fetch_sys_id_labels(container_type)(
+                client=client,
+                project_identifier=project_identifier,
+                filter_=filter_,
+            )
+        )
+        for page in pages:
             sys_ids = []
             for item in page.items:
                 sys_id_label_mapping[item.sys_id] = item.label
@@ -156,6 +232,7 @@ def _fetch_metrics(
     output = concurrency.generate_concurrently(
         items=go_fetch_sys_attrs(),
         executor=executor,
+        priority=concurrency.Priority.DISCOVERY,
         downstream=lambda sys_ids: fetch_attribute_definitions_split(
             client=client,
             project_identifier=project_identifier,
@@ -190,13 +267,87 @@ def _fetch_metrics(
         ),
     )
 
-    results: Generator[
-        dict[identifiers.RunAttributeDefinition, list[FloatPointValue]], None, None
-    ] = concurrency.gather_results(output)
+    results: Generator[dict[identifiers.RunAttributeDefinition, FloatPoints], None, None] = concurrency.gather_results(
+        output
+    )
 
-    metrics_data: dict[identifiers.RunAttributeDefinition, list[FloatPointValue]] = {}
+    metrics_chunks: dict[identifiers.RunAttributeDefinition, list[FloatPoints]] = {}
     for result in results:
         for run_attribute_definition, metric_points in result.items():
-            metrics_data.setdefault(run_attribute_definition, []).extend(metric_points)
+            metrics_chunks.setdefault(run_attribute_definition, []).append(metric_points)
+
+    metrics_data = {attribute: join_points(chunks) for attribute, chunks in metrics_chunks.items()}
+    return metrics_data, sys_id_label_mapping
+
+
+async def _fetch_metrics_async(
+    filter_: Optional[_Filter],
+    attributes: _BaseAttributeFilter,
+    client: AuthenticatedClient,
+    project_identifier: identifiers.ProjectIdentifier,
+    step_range: tuple[Optional[float], Optional[float]],
+    lineage_to_the_root: bool,
+    include_point_previews: bool,
+    tail_limit: Optional[int],
+    container_type: ContainerType,
+    run_set: Optional[RunSet] = None,
+) -> tuple[dict[identifiers.RunAttributeDefinition, FloatPoints], dict[identifiers.SysId, str]]:
+    sys_id_label_mapping: dict[identifiers.SysId, str] = {}
+    metrics_chunks: dict[identifiers.RunAttributeDefinition, list[FloatPoints]] = {}
+
+    async def go_fetch_values(run_attribute_definitions_split: list[identifiers.RunAttributeDefinition]) -> None:
+        result = await fetch_multiple_series_values_async(
+            client=client,
+            run_attribute_definitions=run_attribute_definitions_split,
+            include_inherited=lineage_to_the_root,
+            include_preview=include_point_previews,
+            step_range=step_range,
+            tail_limit=tail_limit,
+        )
+        for run_attribute_definition, metric_points in result.items():
+            metrics_chunks.setdefault(run_attribute_definition, []).append(metric_points)
+
+    # Tasks fetching values beyond the number of request slots would only wait for a slot, holding their definitions.
+    # The request slots themselves can't bound them, as the tasks take a request slot for each of their requests.
+    value_slots = asyncio.Semaphore(env.NEPTUNE_FETCHER_ASYNC_MAX_CONCURRENCY.get())
+
+    async with concurrency_async.TaskGroup() as group:
+
+        async def go_fetch_definitions(sys_ids: list[identifiers.SysId]) -> None:
+            async for sys_ids_split, definitions_page in fetch_attribute_definitions_split_async(
+                client=client,
+                project_identifier=project_identifier,
+                attribute_filter=attributes,
+                sys_ids=sys_ids,
+            ):
+                for run_attribute_definitions_split in split.split_series_attributes(
+                    items=(
+                        identifiers.RunAttributeDefinition(
+                            run_identifier=identifiers.RunIdentifier(project_identifier, sys_id),
+                            attribute_definition=definition,
+                        )
+                        for sys_id in sys_ids_split
+                        for definition in definitions_page.items
+                        if definition.type == "float_series"
+                    )
+                ):
+                    await group.create_task_in_slot(go_fetch_values(run_attribute_definitions_split), value_slots)
+
+        pages = (
+            search.fetch_run_set_sys_id_labels_async(run_set)
+            if run_set is not None
+            else search.fetch_sys_id_labels_async(container_type)(
+                client=client,
+                project_identifier=project_identifier,
+                filter_=filter_,
+            )
+        )
+        async for page in pages:
+            sys_ids = []
+            for item in page.items:
+                sys_id_label_mapping[item.sys_id] = item.label
+                sys_ids.append(item.sys_id)
+            group.create_task(go_fetch_definitions(sys_ids))
 
+    metrics_data = {attribute: join_points(chunks) for attribute, chunks in metrics_chunks.items()}
     return metrics_data, sys_id_label_mapping
@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 from typing import (
     Generator,
     Literal,
@@ -26,6 +27,7 @@ from ..client import get_client
 from ..composition import attribute_components as _components
 from ..composition import (
     concurrency,
+    concurrency_async,
     type_inference,
     validation,
 )
@@ -47,8 +49,9 @@ from ..retrieval import (
     util,
 )
 from ..retrieval.search import ContainerType
+from ..run_set import RunSet
 
-__all__ = ("fetch_series",)
+__all__ = ("fetch_series", "fetch_series_async")
 
 
 def fetch_series(
@@ -62,6 +65,7 @@ def fetch_series(
     tail_limit: Optional[int],
     context: Optional[Context] = None,
     container_type: ContainerType,
+    run_set: Optional[RunSet] = None,
 ) -> pd.DataFrame:
     validation.validate_step_range(step_range)
     validation.validate_tail_limit(tail_limit)
@@ -74,8 +78,8 @@ def fetch_series(
     client = get_client(context=valid_context)
 
     with (
-        concurrency.create_thread_pool_executor() as executor,
-        concurrency.create_thread_pool_executor() as fetch_attribute_definitions_executor,
+        concurrency.create_executor() as executor,
+        concurrency.create_executor("definitions") as fetch_attribute_definitions_executor,
     ):
         inference_result = type_inference.infer_attribute_types_in_filter(
             client=client,
@@ -97,11 +101,16 @@ def fetch_series(
         sys_id_label_mapping: dict[identifiers.SysId, str] = {}
 
         def go_fetch_sys_attrs() -> Generator[list[identifiers.SysId], None, None]:
-            for page in search.fetch_sys_id_labels(container_type)(
-                client=client,
-                project_identifier=project_identifier,
-                filter_=inferred_filter,
-            ):
+            pages = (
+                search.fetch_run_set_sys_id_labels(run_set)
+                if run_set is not None
+                else search.fetch_sys_id_labels(container_type)(
+                    client=client,
+                    project_identifier=project_identifier,
+                    filter_=inferred_filter,
+                )
+            )
+            for page in pages:
                 sys_ids = []
                 for item in page.items:
                     sys_id_label_mapping[item.sys_id] = item.label
@@ -111,6 +120,7 @@ def fetch_series(
         output = concurrency.generate_concurrently(
             items=go_fetch_sys_attrs(),
             executor=executor,
+            priority=concurrency.Priority.DISCOVERY,
             downstream=lambda sys_ids: _components.fetch_attribute_definitions_split(
                 client=client,
                 project_identifier=project_identifier,
@@ -159,3 +169,101 @@ def fetch_series(
             index_column_name="experiment" if container_type == ContainerType.EXPERIMENT else "run",
             timestamp_column_name="absolute_time" if include_time == "absolute" else None,
         )
+
+
+async def fetch_series_async(
+    *,
+    project_identifier: ProjectIdentifier,
+    filter_: Optional[_Filter],
+    attributes: _BaseAttributeFilter,
+    include_time: Optional[Literal["absolute"]],
+    step_range: Tuple[Optional[float], Optional[float]],
+    lineage_to_the_root: bool,
+    tail_limit: Optional[int],
+    context: Optional[Context] = None,
+    container_type: ContainerType,
+    run_set: Optional[RunSet] = None,
+) -> pd.DataFrame:
+    validation.validate_step_range(step_range)
+    validation.validate_tail_limit(tail_limit)
+    validation.validate_include_time(include_time)
+    attributes_restricted = validation.restrict_attribute_filter_type(
+        attributes, type_in={"string_series", "histogram_series", "file_series"}
+    )
+
+    valid_context = validate_context(context or get_context())
+    # Creating a client fetches the client config synchronously, so it's done in a thread
+    client = await asyncio.to_thread(get_client, context=valid_context)
+
+    inference_result = await type_inference.infer_attribute_types_in_filter_async(
+        client=client,
+        project_identifier=project_identifier,
+        filter_=filter_,
+        container_type=container_type,
+    )
+    if inference_result.is_run_domain_empty():
+        return create_series_dataframe(
+            series_data={},
+            sys_id_label_mapping={},
+            index_column_name="experiment" if container_type == ContainerType.EXPERIMENT else "run",
+            timestamp_column_name="absolute_time" if include_time == "absolute" else None,
+        )
+    inferred_filter = inference_result.get_result_or_raise()
+
+    sys_id_label_mapping: dict[identifiers.SysId, str] = {}
+    series_data: dict[identifiers.RunAttributeDefinition, list[series.SeriesValue]] = {}
+
+    async def go_fetch_values(run_attribute_definitions_split: list[identifiers.RunAttributeDefinition]) -> None:
+        async for page in series.fetch_series_values_async(
+            client=client,
+            run_attribute_definitions=run_attribute_definitions_split,
+            include_inherited=lineage_to_the_root,
+            step_range=step_range,
+            tail_limit=tail_limit,
+        ):
+            for run_attribute_definition, series_values in page.items:
+                series_data.setdefault(run_attribute_definition, []).extend(series_values)
+
+    async with concurrency_async.TaskGroup() as group:
+
+        async def go_fetch_definitions(sys_ids: list[identifiers.SysId]) -> None:
+            async for sys_ids_split, definitions_page in _components.fetch_attribute_definitions_split_async(
+                client=client,
+                project_identifier=project_identifier,
+                attribute_filter=attributes_restricted,
+                sys_ids=sys_ids,
+            ):
+                for run_attribute_definitions_split in split.split_series_attributes(
+                    items=(
+                        identifiers.RunAttributeDefinition(
+                            run_identifier=identifiers.RunIdentifier(project_identifier, sys_id),
+                            attribute_definition=definition,
+                        )
+                        for sys_id in sys_ids_split
+                        for definition in definitions_page.items
+                    ),
+                ):
+                    group.create_task(go_fetch_values(run_attribute_definitions_split))
+
+        pages = (
+            search.fetch_run_set_sys_id_labels_async(run_set)
+            if run_set is not None
+            else search.fetch_sys_id_labels_async(container_type)(
+                client=client,
+                project_identifier=project_identifier,
+                filter_=inferred_filter,
+            )
+        )
+        async for page in pages:
+            sys_ids = []
+            for item in page.items:
+                sys_id_label_mapping[item.sys_id] = item.label
+                sys_ids.append(item.sys_id)
+            group.create_task(go_fetch_definitions(sys_ids))
+
+    return create_series_dataframe(
+        series_data,
+        sys_id_label_mapping,
+        index_column_name="experiment" if container_type == ContainerType.EXPERIMENT else "run",
+        timestamp_column_name="absolute_time" if include_time == "absolute" else None,
+    )
@@ -12,6 +12,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import functools as ft
 from collections import defaultdict
 from typing import (
     Generator,
@@ -31,6 +33,7 @@ from .. import (
 from ..composition import attribute_components as _components
 from ..composition import (
     concurrency,
+    concurrency_async,
     type_inference,
     validation,
 )
@@ -46,8 +49,14 @@ from ..retrieval import (
     search,
     util,
 )
+from ..run_set import RunSet
 
-__all__ = ("fetch_table",)
+__all__ = (
+    "fetch_table",
+    "fetch_table_async",
+    "fetch_table_across_projects",
+    "fetch_table_across_projects_async",
+)
 
 
 def fetch_table(
@@ -61,6 +70,8 @@ def fetch_table(
     type_suffix_in_column_names: bool,
     context: Optional[_context.Context] = None,
     container_type: search.ContainerType,
+    # run_set: fetch from these runs instead of searching for the ones matching filter_
+    run_set: Optional[RunSet] = None,
     # flatten_aggregations: Only allow "last" aggregation and skip the aggregation sub-column in the output
     flatten_aggregations: bool = False,
     # flatten_file_properties: for file attributes, return 3 sub-columns: path, size_bytes, mime_type
@@ -73,8 +84,8 @@ def fetch_table(
     client = _client.get_client(context=valid_context)
 
     with (
-        concurrency.create_thread_pool_executor() as executor,
-        concurrency.create_thread_pool_executor() as fetch_attribute_definitions_executor,
+        concurrency.create_executor() as executor,
+        concurrency.create_executor("definitions") as fetch_attribute_definitions_executor,
     ):
 
         inference_result = type_inference.infer_attribute_types_in_filter(
@@ -95,38 +106,44 @@ def fetch_table(
             )
         filter_ = inference_result.get_result_or_raise()
 
-        sort_by_inference_result = type_inference.infer_attribute_types_in_sort_by(
-            client=client,
-            project_identifier=project_identifier,
-            filter_=filter_,
-            sort_by=sort_by,
-            executor=executor,
-            fetch_attribute_definitions_executor=fetch_attribute_definitions_executor,
-            container_type=container_type,
-        )
-        if sort_by_inference_result.is_run_domain_empty():
-            return output_format.convert_table_to_dataframe(
-                table_data={},
-                selected_aggregations={},
-                type_suffix_in_column_names=type_suffix_in_column_names,
-                index_column_name="experiment" if container_type == search.ContainerType.EXPERIMENT else "run",
-                flatten_file_properties=flatten_file_properties,
+        if run_set is None:
+            sort_by_inference_result = type_inference.infer_attribute_types_in_sort_by(
+                client=client,
+                project_identifier=project_identifier,
+                filter_=filter_,
+                sort_by=sort_by,
+                executor=executor,
+                fetch_attribute_definitions_executor=fetch_attribute_definitions_executor,
+                container_type=container_type,
             )
-        sort_by = sort_by_inference_result.get_result_or_raise()
+            if sort_by_inference_result.is_run_domain_empty():
+                return output_format.convert_table_to_dataframe(
+                    table_data={},
+                    selected_aggregations={},
+                    type_suffix_in_column_names=type_suffix_in_column_names,
+                    index_column_name="experiment" if container_type == search.ContainerType.EXPERIMENT else "run",
+                    flatten_file_properties=flatten_file_properties,
+                )
+            sort_by = sort_by_inference_result.get_result_or_raise()
 
         sys_id_label_mapping: dict[identifiers.SysId, str] = {}
         result_by_id: dict[identifiers.SysId, list[att_vals.AttributeValue]] = {}
         selected_aggregations: dict[identifiers.AttributeDefinition, set[str]] = defaultdict(set)
 
         def go_fetch_sys_attrs() -> Generator[list[identifiers.SysId], None, None]:
-            for page in search.fetch_sys_id_labels(container_type)(
-                client=client,
-                project_identifier=project_identifier,
-                filter_=filter_,
-                sort_by=sort_by,
-                sort_direction=_sort_direction,
-                limit=limit,
-            ):
+            pages = (
+                search.fetch_run_set_sys_id_labels(run_set)
+                if run_set is not None
+                else search.fetch_sys_id_labels(container_type)(
+                    client=client,
+                    project_identifier=project_identifier,
+                    filter_=filter_,
+                    sort_by=sort_by,
+                    sort_direction=_sort_direction,
+                    limit=limit,
+                )
+            )
+            for page in pages:
                 sys_ids = []
                 for item in page.items:
                     result_by_id[item.sys_id] = []  # I assume that dict preserves the order set here
@@ -137,6 +154,7 @@ def fetch_table(
         output = concurrency.generate_concurrently(
             items=go_fetch_sys_attrs(),
             executor=executor,
+            priority=concurrency.Priority.DISCOVERY,
             downstream=lambda sys_ids: _components.fetch_attribute_definition_aggregations_split(
                 client=client,
                 project_identifier=project_identifier,
@@ -189,6 +207,395 @@ def fetch_table(
     return dataframe
 
 
+async def fetch_table_async(
+    *,
+    project_identifier: ProjectIdentifier,
+    filter_: Optional[_Filter],
+    attributes: _BaseAttributeFilter,
+    sort_by: _Attribute,
+    sort_direction: Literal["asc", "desc"],
+    limit: Optional[int],
+    type_suffix_in_column_names: bool,
+    context: Optional[_context.Context] = None,
+    container_type: search.ContainerType,
+    # run_set: fetch from these runs instead of searching for the ones matching filter_
+    run_set: Optional[RunSet] = None,
+    flatten_aggregations: bool = False,
+    flatten_file_properties: bool = False,
+) -> pd.DataFrame:
+    validation.validate_limit(limit)
+    _sort_direction = validation.validate_sort_direction(sort_direction)
+
+    valid_context = _context.validate_context(context or _context.get_context())
+    # Creating a client fetches the client config synchronously, so it's done in a thread
+    client = await asyncio.to_thread(_client.get_client, context=valid_context)
+
+    inference_result = await type_inference.infer_attribute_types_in_filter_async(
+        client=client,
+        project_identifier=project_identifier,
+        filter_=filter_,
+        container_type=container_type,
+    )
+    if inference_result.is_run_domain_empty():
+        return output_format.convert_table_to_dataframe(
+            table_data={},
+            selected_aggregations={},
+            type_suffix_in_column_names=type_suffix_in_column_names,
+            index_column_name="experiment" if container_type == search.ContainerType.EXPERIMENT else "run",
+            flatten_file_properties=flatten_file_properties,
+        )
+    filter_ = inference_result.get_result_or_raise()
+
+    if run_set is None:
+        sort_by_inference_result = await type_inference.infer_attribute_types_in_sort_by_async(
+            client=client,
+            project_identifier=project_identifier,
+            filter_=filter_,
+            sort_by=sort_by,
+            container_type=container_type,
+        )
+        if sort_by_inference_result.is_run_domain_empty():
+            return output_format.convert_table_to_dataframe(
+                table_data={},
+                selected_aggregations={},
+                type_suffix_in_column_names=type_suffix_in_column_names,
+                index_column_name="experiment" if container_type == search.ContainerType.EXPERIMENT else "run",
+                flatten_file_properties=flatten_file_properties,
+            )
+        sort_by = sort_by_inference_result.get_result_or_raise()
+
+    sys_id_label_mapping: dict[identifiers.SysId, str] = {}
+    result_by_id: dict[identifiers.SysId, list[att_vals.AttributeValue]] = {}
+    selected_aggregations: dict[identifiers.AttributeDefinition, set[str]] = defaultdict(set)
+
+    async def go_fetch_values(
+        sys_ids_split: list[identifiers.SysId], definitions_page: util.Page[identifiers.AttributeDefinition]
+    ) -> None:
+        async for attribute_values_page in _components.fetch_attribute_values_split_async(
+            client=client,
+            project_identifier=project_identifier,
+            sys_ids=sys_ids_split,
+            attribute_definitions=definitions_page.items,
+        ):
+            for attribute_value in attribute_values_page.items:
+                result_by_id[attribute_value.run_identifier.sys_id].append(attribute_value)
+
+    async with concurrency_async.TaskGroup() as group:
+
+        async def go_fetch_definitions(sys_ids: list[identifiers.SysId]) -> None:
+            async for (
+                sys_ids_split,
+                definitions_page,
+                aggregations_page,
+            ) in _components.fetch_attribute_definition_aggregations_split_async(
+                client=client,
+                project_identifier=project_identifier,
+                attribute_filter=attributes,
+                sys_ids=sys_ids,
+            ):
+                for aggregation in aggregations_page.items:
+                    selected_aggregations[aggregation.attribute_definition].add(aggregation.aggregation)
+                group.create_task(go_fetch_values(sys_ids_split, definitions_page))
+
+        pages = (
+            search.fetch_run_set_sys_id_labels_async(run_set)
+            if run_set is not None
+            else search.fetch_sys_id_labels_async(container_type)(
+                client=client,
+                project_identifier=project_identifier,
+                filter_=filter_,
+                sort_by=sort_by,
+                sort_direction=_sort_direction,
+                limit=limit,
+            )
+        )
+        async for page in pages:
+            sys_ids = []
+            for item in page.items:
+                result_by_id[item.sys_id] = []  # I assume that dict preserves the order set here
+                sys_id_label_mapping[item.sys_id] = item.label
+                sys_ids.append(item.sys_id)
+            group.create_task(go_fetch_definitions(sys_ids))
+
+    result_by_name = _map_keys_preserving_order(result_by_id, sys_id_label_mapping)
+    return output_format.convert_table_to_dataframe(
+        table_data=result_by_name,
+        selected_aggregations=selected_aggregations,
+        type_suffix_in_column_names=type_suffix_in_column_names,
+        index_column_name="experiment" if container_type == search.ContainerType.EXPERIMENT else "run",
+        flatten_aggregations=flatten_aggregations,
+        flatten_file_properties=flatten_file_properties,
+    )
+
+
+def fetch_table_across_projects(
+    *,
+    projects: list[ProjectIdentifier],
+    filter_: Optional[_Filter],
+    attributes: _BaseAttributeFilter,
+    sort_by: _Attribute,
+    sort_direction: Literal["asc", "desc"],
+    limit: Optional[int],
+    type_suffix_in_column_names: bool,
+    context: Optional[_context.Context] = None,
+    container_type: search.ContainerType,
+    flatten_file_properties: bool = False,
+) -> pd.DataFrame:
+    """
+    Like `fetch_table`, but for all the given projects at once, in a single sort order.
+
+    The containers are found with a single search across the projects, and the definitions and values are fetched
+    for each page of the search per project, all in one pipeline. The index of the returned DataFrame has a "project"
+    level before the container label.
+    """
+    validation.validate_limit(limit)
+    _sort_direction = validation.validate_sort_direction(sort_direction)
+    index_column_name = "experiment" if container_type == search.ContainerType.EXPERIMENT else "run"
+
+    valid_context = _context.validate_context(context or _context.get_context())
+    client = _client.get_client(context=valid_context)
+
+    with (
+        concurrency.create_executor() as executor,
+        concurrency.create_executor("definitions") as fetch_attribute_definitions_executor,
+    ):
+        inference_result = type_inference.infer_attribute_types_in_filter_across_projects(
+            client=client,
+            projects=projects,
+            filter_=filter_,
+            executor=executor,
+            fetch_attribute_definitions_executor=fetch_attribute_definitions_executor,
+            container_type=container_type,
+        )
+        if inference_result.is_run_domain_empty():
+            return output_format.convert_table_to_dataframe(
+                table_data={},
+                selected_aggregations={},
+                type_suffix_in_column_names=type_suffix_in_column_names,
+                index_column_name=index_column_name,
+                flatten_file_properties=flatten_file_properties,
+                project_column_name="project",
+            )
+        filter_ = inference_result.get_result_or_raise()
+
+        sort_by_inference_result = type_inference.infer_attribute_types_in_sort_by_across_projects(
+            client=client,
+            projects=projects,
+            filter_=filter_,
+            sort_by=sort_by,
+            executor=executor,
+            fetch_attribute_definitions_executor=fetch_attribute_definitions_executor,
+            container_type=container_type,
+        )
+        if sort_by_inference_result.is_run_domain_empty():
+            return output_format.convert_table_to_dataframe(
+                table_data={},
+                selected_aggregations={},
+                type_suffix_in_column_names=type_suffix_in_column_names,
+                index_column_name=index_column_name,
+                flatten_file_properties=flatten_file_properties,
+                project_column_name="project",
+            )
+        sort_by = sort_by_inference_result.get_result_or_raise()
+
+        run_label_mapping: dict[identifiers.RunIdentifier, str] = {}
+        result_by_run: dict[identifiers.RunIdentifier, list[att_vals.AttributeValue]] = {}
+        selected_aggregations: dict[identifiers.AttributeDefinition, set[str]] = defaultdict(set)
+
+        def go_fetch_sys_attrs() -> Generator[list[search.ProjectSysIdLabel], None, None]:
+            for page in search.fetch_sys_id_labels_across_projects(
+                client=client,
+                projects=projects,
+                filter_=filter_,
+                sort_by=sort_by,
+                sort_direction=_sort_direction,
+                limit=limit,
+                container_type=container_type,
+            ):
+                for item in page.items:
+                    result_by_run[item.run_identifier] = []
+                    run_label_mapping[item.run_identifier] = item.label
+                yield page.items
+
+        def go_fetch_project(
+            project_identifier: ProjectIdentifier, sys_ids: list[identifiers.SysId]
+        ) -> concurrency.OUT:
+            return _components.fetch_attribute_definition_aggregations_split(
+                client=client,
+                project_identifier=project_identifier,
+                attribute_filter=attributes,
+                executor=executor,
+                fetch_attribute_definitions_executor=fetch_attribute_definitions_executor,
+                sys_ids=sys_ids,
+                downstream=lambda sys_ids_split, definitions_page, aggregations_page: concurrency.fork_concurrently(
+                    executor=executor,
+                    downstreams=[
+                        lambda: _components.fetch_attribute_values_split(
+                            client=client,
+                            project_identifier=project_identifier,
+                            executor=executor,
+                            sys_ids=sys_ids_split,
+                            attribute_definitions=definitions_page.items,
+                            downstream=concurrency.return_value,
+                        ),
+                        lambda: concurrency.return_value(aggregations_page.items),
+                    ],
+                ),
+            )
+
+        output = concurrency.generate_concurrently(
+            items=go_fetch_sys_attrs(),
+            executor=executor,
+            priority=concurrency.Priority.DISCOVERY,
+            downstream=lambda items: concurrency.fork_concurrently(
+                executor=executor,
+                priority=concurrency.Priority.DEFINITIONS,
+                downstreams=[
+                    ft.partial(go_fetch_project, project_identifier, sys_ids)
+                    for project_identifier, sys_ids in search.group_sys_ids_by_project(items).items()
+                ],
+            ),
+        )
+        results: Generator[
+            Union[util.Page[att_vals.AttributeValue], list[AttributeDefinitionAggregation]], None, None
+        ] = concurrency.gather_results(output)
+
+        for result in results:
+            if isinstance(result, util.Page):
+                for attribute_value in result.items:
+                    result_by_run[attribute_value.run_identifier].append(attribute_value)
+            elif isinstance(result, list):
+                for aggregation in result:
+                    selected_aggregations[aggregation.attribute_definition].add(aggregation.aggregation)
+            else:
+                raise RuntimeError(f"Unexpected result type: {type(result)}")
+
+    return output_format.convert_table_to_dataframe(
+        table_data=_map_run_keys_preserving_order(result_by_run, run_label_mapping),
+        selected_aggregations=selected_aggregations,
+        type_suffix_in_column_names=type_suffix_in_column_names,
+        index_column_name=index_column_name,
+        flatten_file_properties=flatten_file_properties,
+        project_column_name="project",
+    )
+
+
+async def fetch_table_across_projects_async(
+    *,
+    projects: list[ProjectIdentifier],
+    filter_: Optional[_Filter],
+    attributes: _BaseAttributeFilter,
+    sort_by: _Attribute,
+    sort_direction: Literal["asc", "desc"],
+    limit: Optional[int],
+    type_suffix_in_column_names: bool,
+    context: Optional[_context.Context] = None,
+    container_type: search.ContainerType,
+    flatten_file_properties: bool = False,
+) -> pd.DataFrame:
+    validation.validate_limit(limit)
+    _sort_direction = validation.validate_sort_direction(sort_direction)
+    index_column_name = "experiment" if container_type == search.ContainerType.EXPERIMENT else "run"
+
+    valid_context = _context.validate_context(context or _context.get_context())
+    # Creating a client fetches the client config synchronously, so it's done in a thread
+    client = await asyncio.to_thread(_client.get_client, context=valid_context)
+
+    inference_result = await type_inference.infer_attribute_types_in_filter_across_projects_async(
+        client=client,
+        projects=projects,
+        filter_=filter_,
+        container_type=container_type,
+    )
+    if inference_result.is_run_domain_empty():
+        return output_format.convert_table_to_dataframe(
+            table_data={},
+            selected_aggregations={},
+            type_suffix_in_column_names=type_suffix_in_column_names,
+            index_column_name=index_column_name,
+            flatten_file_properties=flatten_file_properties,
+            project_column_name="project",
+        )
+    filter_ = inference_result.get_result_or_raise()
+
+    sort_by_inference_result = await type_inference.infer_attribute_types_in_sort_by_across_projects_async(
+        client=client,
+        projects=projects,
+        filter_=filter_,
+        sort_by=sort_by,
+        container_type=container_type,
+    )
+    if sort_by_inference_result.is_run_domain_empty():
+        return output_format.convert_table_to_dataframe(
+            table_data={},
+            selected_aggregations={},
+            type_suffix_in_column_names=type_suffix_in_column_names,
+            index_column_name=index_column_name,
+            flatten_file_properties=flatten_file_properties,
+            project_column_name="project",
+        )
+    sort_by = sort_by_inference_result.get_result_or_raise()
+
+    run_label_mapping: dict[identifiers.RunIdentifier, str] = {}
+    result_by_run: dict[identifiers.RunIdentifier, list[att_vals.AttributeValue]] = {}
+    selected_aggregations: dict[identifiers.AttributeDefinition, set[str]] = defaultdict(set)
+
+    async def go_fetch_values(
+        project_identifier: ProjectIdentifier,
+        sys_ids_split: list[identifiers.SysId],
+        definitions_page: util.Page[identifiers.AttributeDefinition],
+    ) -> None:
+        async for attribute_values_page in _components.fetch_attribute_values_split_async(
+            client=client,
+            project_identifier=project_identifier,
+            sys_ids=sys_ids_split,
+            attribute_definitions=definitions_page.items,
+        ):
+            for attribute_value in attribute_values_page.items:
+                result_by_run[attribute_value.run_identifier].append(attribute_value)
+
+    async with concurrency_async.TaskGroup() as group:
+
+        async def go_fetch_definitions(project_identifier: ProjectIdentifier, sys_ids: list[identifiers.SysId]) -> None:
+            async for (
+                sys_ids_split,
+                definitions_page,
+                aggregations_page,
+            ) in _components.fetch_attribute_definition_aggregations_split_async(
+                client=client,
+                project_identifier=project_identifier,
+                attribute_filter=attributes,
+                sys_ids=sys_ids,
+            ):
+                for aggregation in aggregations_page.items:
+                    selected_aggregations[aggregation.attribute_definition].add(aggregation.aggregation)
+                group.create_task(go_fetch_values(project_identifier, sys_ids_split, definitions_page))
+
+        async for page in search.fetch_sys_id_labels_across_projects_async(
+            client=client,
+            projects=projects,
+            filter_=filter_,
+            sort_by=sort_by,
+            sort_direction=_sort_direction,
+            limit=limit,
+            container_type=container_type,
+        ):
+            for item in page.items:
+                result_by_run[item.run_identifier] = []
+                run_label_mapping[item.run_identifier] = item.label
+            for project_identifier, sys_ids in search.group_sys_ids_by_project(page.items).items():
+                group.create_task(go_fetch_definitions(project_identifier, sys_ids))
+
+    return output_format.convert_table_to_dataframe(
+        table_data=_map_run_keys_preserving_order(result_by_run, run_label_mapping),
+        selected_aggregations=selected_aggregations,
+        type_suffix_in_column_names=type_suffix_in_column_names,
+        index_column_name=index_column_name,
+        flatten_file_properties=flatten_file_properties,
+        project_column_name="project",
+    )
+
+
 def _map_keys_preserving_order(
     result_by_id: dict[identifiers.SysId, list[att_vals.AttributeValue]],
     sys_id_label_mapping: dict[identifiers.SysId, str],
@@ -198,3 +605,13 @@ def _map_keys_preserving_order(
         label = sys_id_label_mapping[sys_id]
         result_by_name[label] = values
     return result_by_name
+
+
+def _map_run_keys_preserving_order(
+    result_by_run: dict[identifiers.RunIdentifier, list[att_vals.AttributeValue]],
+    run_label_mapping: dict[identifiers.RunIdentifier, str],
+) -> dict[tuple[str, str], list[att_vals.AttributeValue]]:
+    return {
+        (run_identifier.project_identifier, run_label_mapping[run_identifier]): values
+        for run_identifier, values in result_by_run.items()
+    }
@@ -55,8 +55,8 @@ def list_attributes(
     client = _client.get_client(context=valid_context)
 
     with (
-        concurrency.create_thread_pool_executor() as executor,
-        concurrency.create_thread_pool_executor() as fetch_attribute_definitions_executor,
+        concurrency.create_executor() as executor,
+        concurrency.create_executor("definitions") as fetch_attribute_definitions_executor,
     ):
         inference_result = type_inference.infer_attribute_types_in_filter(
             client,
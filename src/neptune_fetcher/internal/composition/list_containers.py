@@ -12,19 +12,27 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Optional
+from typing import (
+    Literal,
+    Optional,
+)
 
 from .. import client as _client
 from .. import context as _context
 from ..composition import (
     concurrency,
     type_inference,
+    validation,
+)
+from ..filters import (
+    _Attribute,
+    _Filter,
 )
-from ..filters import _Filter
 from ..identifiers import ProjectIdentifier
 from ..retrieval import search
+from ..run_set import RunSet
 
-__all__ = ("list_containers",)
+__all__ = ("list_containers", "resolve_containers")
 
 
 def list_containers(
@@ -38,8 +46,8 @@ def list_containers(
     client = _client.get_client(context=validated_context)
 
     with (
-        concurrency.create_thread_pool_executor() as executor,
-        concurrency.create_thread_pool_executor() as fetch_attribute_definitions_executor,
+        concurrency.create_executor() as executor,
+        concurrency.create_executor("definitions") as fetch_attribute_definitions_executor,
     ):
         inference_result = type_inference.infer_attribute_types_in_filter(
             client=client,
@@ -54,3 +62,67 @@ def list_containers(
 
         sys_attr_pages = search.fetch_sys_id_labels(container_type)(client, project_identifier, filter_)
         return list(sorted(attrs.label for page in sys_attr_pages for attrs in page.items))
+
+
+def resolve_containers(
+    *,
+    project_identifier: ProjectIdentifier,
+    filter_: Optional[_Filter],
+    sort_by: _Attribute,
+    sort_direction: Literal["asc", "desc"],
+    limit: Optional[int],
+    context: Optional[_context.Context] = None,
+    container_type: search.ContainerType,
+) -> RunSet:
+    validation.validate_limit(limit)
+    _sort_direction = validation.validate_sort_direction(sort_direction)
+
+    validated_context = _context.validate_context(context or _context.get_context())
+    client = _client.get_client(context=validated_context)
+
+    def run_set(items: list[search.SysIdLabel]) -> RunSet:
+        return RunSet(
+            project_identifier=project_identifier,
+            container_type=container_type,
+            sys_ids=tuple(item.sys_id for item in items),
+            labels=tuple(item.label for item in items),
+        )
+
+    with (
+        concurrency.create_executor() as executor,
+        concurrency.create_executor("definitions") as fetch_attribute_definitions_executor,
+    ):
+        inference_result = type_inference.infer_attribute_types_in_filter(
+            client=client,
+            project_identifier=project_identifier,
+            filter_=filter_,
+            executor=executor,
+            fetch_attribute_definitions_executor=fetch_attribute_definitions_executor,
+            container_type=container_type,
+        )
+        if inference_result.is_run_domain_empty():
+            return run_set([])
+        filter_ = inference_result.get_result_or_raise()
+
+        sort_by_inference_result = type_inference.infer_attribute_types_in_sort_by(
+            client=client,
+            project_identifier=project_identifier,
+            filter_=filter_,
+            sort_by=sort_by,
+            executor=executor,
+            fetch_attribute_definitions_executor=fetch_attribute_definitions_executor,
+            container_type=container_type,
+        )
+        if sort_by_inference_result.is_run_domain_empty():
+            return run_set([])
+        sort_by = sort_by_inference_result.get_result_or_raise()
+
+        sys_attr_pages = search.fetch_sys_id_labels(container_type)(
+            client=client,
+            project_identifier=project_identifier,
+            filter_=filter_,
+            sort_by=sort_by,
+            sort_direction=_sort_direction,
+            limit=limit,
+        )
+        return run_set([item for page in sys_attr_pages for item in page.items])
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import copy
+import functools as ft
 from collections import defaultdict
 from concurrent.futures import Executor
 from dataclasses import dataclass
@@ -33,7 +34,10 @@ from .. import (
     identifiers,
 )
 from ..composition import attribute_components as _components
-from ..composition import concurrency
+from ..composition import (
+    concurrency,
+    concurrency_async,
+)
 from ..retrieval import (
     search,
     util,
@@ -214,6 +218,158 @@ def infer_attribute_types_in_sort_by(
     return state
 
 
+async def infer_attribute_types_in_filter_async(
+    client: AuthenticatedClient,
+    project_identifier: identifiers.ProjectIdentifier,
+    filter_: Optional[filters._Filter],
+    container_type: search.ContainerType,
+) -> InferenceState[Optional[filters._Filter]]:
+    if filter_ is None:
+        return InferenceState.empty()
+
+    state = InferenceState.from_filter(filter_)
+    if state.is_complete():
+        return state
+
+    _infer_attribute_types_locally(inference_state=state)
+    if state.is_complete():
+        return state
+
+    await _infer_attribute_types_from_api_async(
+        client=client,
+        project_identifier=project_identifier,
+        filter_=None,
+        container_type=container_type,
+        inference_state=state,
+    )
+    return state
+
+
+async def infer_attribute_types_in_sort_by_async(
+    client: AuthenticatedClient,
+    project_identifier: identifiers.ProjectIdentifier,
+    filter_: Optional[filters._Filter],
+    sort_by: filters._Attribute,
+    container_type: search.ContainerType,
+) -> InferenceState[filters._Attribute]:
+    state = InferenceState.from_attribute(sort_by)
+    if state.is_complete():
+        return state
+
+    _infer_attribute_types_locally(inference_state=state)
+    if state.is_complete():
+        return state
+
+    await _infer_attribute_types_from_api_async(
+        client=client,
+        project_identifier=project_identifier,
+        filter_=filter_,
+        container_type=container_type,
+        inference_state=state,
+    )
+    return state
+
+
+def infer_attribute_types_in_filter_across_projects(
+    client: AuthenticatedClient,
+    projects: list[identifiers.ProjectIdentifier],
+    filter_: Optional[filters._Filter],
+    executor: Executor,
+    fetch_attribute_definitions_executor: Executor,
+    container_type: search.ContainerType,
+) -> InferenceState[Optional[filters._Filter]]:
+    if filter_ is None:
+        return InferenceState.empty()
+
+    state = InferenceState.from_filter(filter_)
+    _infer_attribute_types_locally(inference_state=state)
+    if state.is_complete():
+        return state
+
+    _infer_attribute_types_from_api_across_projects(
+        client=client,
+        projects=projects,
+        filter_=None,
+        executor=executor,
+        fetch_attribute_definitions_executor=fetch_attribute_definitions_executor,
+        container_type=container_type,
+        inference_state=state,
+    )
+    return state
+
+
+def infer_attribute_types_in_sort_by_across_projects(
+    client: AuthenticatedClient,
+    projects: list[identifiers.ProjectIdentifier],
+    filter_: Optional[filters._Filter],
+    sort_by: filters._Attribute,
+    executor: Executor,
+    fetch_attribute_definitions_executor: Executor,
+    container_type: search.ContainerType,
+) -> InferenceState[filters._Attribute]:
+    state = InferenceState.from_attribute(sort_by)
+    _infer_attribute_types_locally(inference_state=state)
+    if state.is_complete():
+        return state
+
+    _infer_attribute_types_from_api_across_projects(
+        client=client,
+        projects=projects,
+        filter_=filter_,
+        executor=executor,
+        fetch_attribute_definitions_executor=fetch_attribute_definitions_executor,
+        container_type=container_type,
+        inference_state=state,
+    )
+    return state
+
+
+async def infer_attribute_types_in_filter_across_projects_async(
+    client: AuthenticatedClient,
+    projects: list[identifiers.ProjectIdentifier],
+    filter_: Optional[filters._Filter],
+    container_type: search.ContainerType,
+) -> InferenceState[Optional[filters._Filter]]:
+    if filter_ is None:
+        return InferenceState.empty()
+
+    state = InferenceState.from_filter(filter_)
+    _infer_attribute_types_locally(inference_state=state)
+    if state.is_complete():
+        return state
+
+    await _infer_attribute_types_from_api_across_projects_async(
+        client=client,
+        projects=projects,
+        filter_=None,
+        container_type=container_type,
+        inference_state=state,
+    )
+    return state
+
+
+async def infer_attribute_types_in_sort_by_across_projects_async(
+    client: AuthenticatedClient,
+    projects: list[identifiers.ProjectIdentifier],
+    filter_: Optional[filters._Filter],
+    sort_by: filters._Attribute,
+    container_type: search.ContainerType,
+) -> InferenceState[filters._Attribute]:
+    state = InferenceState.from_attribute(sort_by)
+    _infer_attribute_types_locally(inference_state=state)
+    if state.is_complete():
+        return state
+
+    await _infer_attribute_types_from_api_across_projects_async(
+        client=client,
+        projects=projects,
+        filter_=filter_,
+        container_type=container_type,
+        inference_state=state,
+    )
+    return state
+
+
 _KNOWN_SYS_ATTRIBUTES: dict[str, ATTRIBUTE_LITERAL] = {
     "sys/archived": "bool",
     "sys/creation_time": "datetime",
@@ -302,6 +458,7 @@ def _infer_attribute_types_from_api(
             container_type=container_type,
         ),
         executor=executor,
+        priority=concurrency.Priority.DISCOVERY,
         downstream=lambda sys_ids_page: concurrency.fork_concurrently(
             executor=executor,
             downstreams=[
@@ -332,6 +489,152 @@ def _infer_attribute_types_from_api(
         elif isinstance(result, list):
             sys_ids.extend(result)
 
+    _apply_inferred_types(inference_state, attribute_states, attribute_name_to_definition, sys_ids, container_type)
+
+
+async def _infer_attribute_types_from_api_async(
+    client: AuthenticatedClient,
+    project_identifier: identifiers.ProjectIdentifier,
+    filter_: Optional[filters._Filter],
+    container_type: search.ContainerType,
+    inference_state: InferenceState,
+) -> None:
+    attribute_states = inference_state.incomplete_attributes()
+    attributes = [state.attribute for state in attribute_states]
+    attribute_filter_by_name = filters._AttributeFilter(name_eq=list({attr.name for attr in attributes}))
+
+    sys_ids: list[identifiers.SysId] = []
+    attribute_name_to_definition: dict[str, set[str]] = defaultdict(set)
+
+    async def go_fetch_definitions(sys_ids_page: util.Page[identifiers.SysId]) -> None:
+        async for _, definitions in _components.fetch_attribute_definitions_split_async(
+            client=client,
+            project_identifier=project_identifier,
+            attribute_filter=attribute_filter_by_name,
+            sys_ids=sys_ids_page.items,
+        ):
+            for attr_def in definitions.items:
+                attribute_name_to_definition[attr_def.name].add(attr_def.type)
+
+    async with concurrency_async.TaskGroup() as group:
+        async for sys_ids_page in search.fetch_sys_ids_async(
+            client=client,
+            project_identifier=project_identifier,
+            filter_=filter_,
+            container_type=container_type,
+        ):
+            sys_ids.extend(sys_ids_page.items)
+            group.create_task(go_fetch_definitions(sys_ids_page))
+
+    _apply_inferred_types(inference_state, attribute_states, attribute_name_to_definition, sys_ids, container_type)
+
+
+def _infer_attribute_types_from_api_across_projects(
+    client: AuthenticatedClient,
+    projects: list[identifiers.ProjectIdentifier],
+    filter_: Optional[filters._Filter],
+    executor: Executor,
+    fetch_attribute_definitions_executor: Executor,
+    container_type: search.ContainerType,
+    inference_state: InferenceState,
+) -> None:
+    attribute_states = inference_state.incomplete_attributes()
+    attributes = [state.attribute for state in attribute_states]
+    attribute_filter_by_name = filters._AttributeFilter(name_eq=list({attr.name for attr in attributes}))
+
+    output = concurrency.generate_concurrently(
+        items=search.fetch_sys_id_labels_across_projects(
+            client=client,
+            projects=projects,
+            filter_=filter_,
+            container_type=container_type,
+        ),
+        executor=executor,
+        priority=concurrency.Priority.DISCOVERY,
+        downstream=lambda page: concurrency.fork_concurrently(
+            executor=executor,
+            downstreams=[
+                *(
+                    ft.partial(
+                        _components.fetch_attribute_definitions_split,
+                        client=client,
+                        project_identifier=project_identifier,
+                        attribute_filter=attribute_filter_by_name,
+                        executor=executor,
+                        fetch_attribute_definitions_executor=fetch_attribute_definitions_executor,
+                        sys_ids=sys_ids,
+                        downstream=lambda _, definitions: concurrency.return_value(definitions),
+                    )
+                    for project_identifier, sys_ids in search.group_sys_ids_by_project(page.items).items()
+                ),
+                lambda: concurrency.return_value([item.sys_id for item in page.items]),
+            ],
+        ),
+    )
+
+    results: Generator[
+        Union[list[identifiers.SysId], util.Page[identifiers.AttributeDefinition]], None, None
+    ] = concurrency.gather_results(output)
+
+    sys_ids: list[identifiers.SysId] = []
+    attribute_name_to_definition: dict[str, set[str]] = defaultdict(set)
+    for result in results:
+        if isinstance(result, util.Page):
+            for attr_def in result.items:
+                attribute_name_to_definition[attr_def.name].add(attr_def.type)
+        elif isinstance(result, list):
+            sys_ids.extend(result)
+
+    _apply_inferred_types(inference_state, attribute_states, attribute_name_to_definition, sys_ids, container_type)
+
+
+async def _infer_attribute_types_from_api_across_projects_async(
+    client: AuthenticatedClient,
+    projects: list[identifiers.ProjectIdentifier],
+    filter_: Optional[filters._Filter],
+    container_type: search.ContainerType,
+    inference_state: InferenceState,
+) -> None:
+    attribute_states = inference_state.incomplete_attributes()
+    attributes = [state.attribute for state in attribute_states]
+    attribute_filter_by_name = filters._AttributeFilter(name_eq=list({attr.name for attr in attributes}))
+
+    sys_ids: list[identifiers.SysId] = []
+    attribute_name_to_definition: dict[str, set[str]] = defaultdict(set)
+
+    async def go_fetch_definitions(
+        project_identifier: identifiers.ProjectIdentifier, sys_ids_in_project: list[identifiers.SysId]
+    ) -> None:
+        async for _, definitions in _components.fetch_attribute_definitions_split_async(
+            client=client,
+            project_identifier=project_identifier,
+            attribute_filter=attribute_filter_by_name,
+            sys_ids=sys_ids_in_project,
+        ):
+            for attr_def in definitions.items:
+                attribute_name_to_definition[attr_def.name].add(attr_def.type)
+
+    async with concurrency_async.TaskGroup() as group:
+        async for page in search.fetch_sys_id_labels_across_projects_async(
+            client=client,
+            projects=projects,
+            filter_=filter_,
+            container_type=container_type,
+        ):
+            for project_identifier, sys_ids_in_project in search.group_sys_ids_by_project(page.items).items():
+                sys_ids.extend(sys_ids_in_project)
+                group.create_task(go_fetch_definitions(project_identifier, sys_ids_in_project))
+
+    _apply_inferred_types(inference_state, attribute_states, attribute_name_to_definition, sys_ids, container_type)
+
+
+def _apply_inferred_types(
+    inference_state: InferenceState,
+    attribute_states: list[AttributeInferenceState],
+    attribute_name_to_definition: dict[str, set[str]],
+    sys_ids: list[identifiers.SysId],
+    container_type: search.ContainerType,
+) -> None:
     for state in attribute_states:
         attribute = state.attribute
         if attribute.name in attribute_name_to_definition:
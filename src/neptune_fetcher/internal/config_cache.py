@@ -0,0 +1,120 @@
+#
+# Copyright (c) 2025, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+On-disk cache of the client config and the token refreshing URLs of a Neptune instance.
+
+Fetching them takes two requests before the first request for data, which every fresh process pays.
+The cache is enabled by setting `NEPTUNE_FETCHER_CONFIG_CACHE_DIR`. Entries are keyed by the base URL,
+expire after `NEPTUNE_FETCHER_CONFIG_CACHE_TTL` seconds, and are written atomically, so that processes
+sharing the directory never read a partially written entry. Entries that can't be read are treated as missing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Optional,
+)
+
+from . import env
+
+__all__ = ("load", "store", "invalidate")
+
+logger = logging.getLogger(__name__)
+
+# Bump when the format of the entries changes, so that entries written by other versions are ignored
+_FORMAT_VERSION = 1
+
+
+def load(base_url: str) -> Optional[tuple[dict[str, Any], dict[str, Any]]]:
+    """
+    Return the cached client config and token refreshing URLs for the base URL, as dicts,
+    or None if the cache is disabled or has no valid entry.
+    """
+    path = _entry_path(base_url)
+    if path is None:
+        return None
+
+    try:
+        with open(path, encoding="utf-8") as file:
+            entry = json.load(file)
+        if entry["version"] != _FORMAT_VERSION or entry["base_url"] != base_url:
+            return None
+        if time.time() - entry["created_at"] > env.NEPTUNE_FETCHER_CONFIG_CACHE_TTL.get():
+            return None
+        config, token_urls = entry["config"], entry["token_urls"]
+        if not isinstance(config, dict) or not isinstance(token_urls, dict):
+            return None
+        return config, token_urls
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable client config cache entry %s: %s", path, e)
+        return None
+
+
+def store(base_url: str, config: dict[str, Any], token_urls: dict[str, Any]) -> None:
+    path = _entry_path(base_url)
+    if path is None:
+        return
+
+    entry = {
+        "version": _FORMAT_VERSION,
+        "base_url": base_url,
+        "created_at": time.time(),
+        "config": config,
+        "token_urls": token_urls,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(entry, file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.debug("Failed to write client config cache entry %s: %s", path, e)
+
+
+def invalidate(base_url: str) -> None:
+    path = _entry_path(base_url)
+    if path is None:
+        return
+
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug("Failed to remove client config cache entry %s: %s", path, e)
+
+
+def _entry_path(base_url: str) -> Optional[Path]:
+    directory = env.NEPTUNE_FETCHER_CONFIG_CACHE_DIR.get()
+    if directory is None:
+        return None
+    digest = hashlib.sha256(base_url.encode("utf-8")).hexdigest()
+    return Path(directory).expanduser() / f"client-config-{digest[:32]}.json"
@@ -25,11 +25,37 @@ __all__ = (
     "NEPTUNE_HTTP_REQUEST_TIMEOUT_SECONDS",
     "NEPTUNE_API_TOKEN",
     "NEPTUNE_FETCHER_MAX_WORKERS",
+    "NEPTUNE_FETCHER_STAGE_QUEUE_SIZE",
+    "NEPTUNE_FETCHER_PREFETCH_PAGES",
+    "NEPTUNE_FETCHER_MAX_INFLIGHT_BYTES",
+    "NEPTUNE_FETCHER_ASYNC_MAX_CONCURRENCY",
+    "NEPTUNE_FETCHER_ADAPTIVE_CONCURRENCY",
+    "NEPTUNE_FETCHER_MAX_CONCURRENT_REQUESTS",
+    "NEPTUNE_FETCHER_MAX_REQUESTS_PER_SECOND",
+    "NEPTUNE_FETCHER_MAX_BYTES_PER_SECOND",
+    "NEPTUNE_FETCHER_DECODING_PROCESSES",
+    "NEPTUNE_FETCHER_MAX_CONNECTIONS",
+    "NEPTUNE_FETCHER_KEEPALIVE_EXPIRY",
+    "NEPTUNE_FETCHER_COALESCE_REQUESTS",
+    "NEPTUNE_FETCHER_HEDGE_REQUESTS",
+    "NEPTUNE_FETCHER_HEDGE_PERCENTILE",
+    "NEPTUNE_FETCHER_HTTP2",
+    "NEPTUNE_FETCHER_HTTP2_MAX_CONNECTIONS",
+    "NEPTUNE_FETCHER_HTTP2_MAX_CONCURRENT_STREAMS",
+    "NEPTUNE_FETCHER_CONFIG_CACHE_DIR",
+    "NEPTUNE_FETCHER_CONFIG_CACHE_TTL",
+    "NEPTUNE_FETCHER_DEFINITIONS_CACHE_SIZE",
+    "NEPTUNE_FETCHER_DEFINITIONS_CACHE_DIR",
     "NEPTUNE_PROJECT",
     "NEPTUNE_VERIFY_SSL",
     "NEPTUNE_FETCHER_RETRY_SOFT_TIMEOUT",
     "NEPTUNE_FETCHER_RETRY_HARD_TIMEOUT",
+    "NEPTUNE_FETCHER_RETRY_BUDGET_RATIO",
+    "NEPTUNE_FETCHER_CIRCUIT_BREAKER_THRESHOLD",
+    "NEPTUNE_FETCHER_CIRCUIT_BREAKER_RESET_TIMEOUT",
     "NEPTUNE_FETCHER_SYS_ATTRS_BATCH_SIZE",
+    "NEPTUNE_FETCHER_SYS_ATTRS_MAX_PARALLEL_PAGES",
+    "NEPTUNE_FETCHER_KEYSET_PAGINATION",
     "NEPTUNE_FETCHER_ATTRIBUTE_DEFINITIONS_BATCH_SIZE",
     "NEPTUNE_FETCHER_ATTRIBUTE_VALUES_BATCH_SIZE",
     "NEPTUNE_FETCHER_SERIES_BATCH_SIZE",
@@ -89,8 +115,62 @@ NEPTUNE_FETCHER_RETRY_SOFT_TIMEOUT = EnvVariable[Optional[int]](
 NEPTUNE_FETCHER_RETRY_HARD_TIMEOUT = EnvVariable[Optional[int]](
     "NEPTUNE_FETCHER_RETRY_HARD_TIMEOUT", _lift_optional(int), 3600
 )
+NEPTUNE_FETCHER_RETRY_BUDGET_RATIO = EnvVariable[Optional[float]](
+    "NEPTUNE_FETCHER_RETRY_BUDGET_RATIO", _lift_optional(float), 0.2
+)
+NEPTUNE_FETCHER_CIRCUIT_BREAKER_THRESHOLD = EnvVariable[Optional[int]](
+    "NEPTUNE_FETCHER_CIRCUIT_BREAKER_THRESHOLD", _lift_optional(int), 50
+)
+NEPTUNE_FETCHER_CIRCUIT_BREAKER_RESET_TIMEOUT = EnvVariable[float](
+    "NEPTUNE_FETCHER_CIRCUIT_BREAKER_RESET_TIMEOUT", float, 30.0
+)
 NEPTUNE_FETCHER_MAX_WORKERS = EnvVariable[int]("NEPTUNE_FETCHER_MAX_WORKERS", int, 10)
+NEPTUNE_FETCHER_STAGE_QUEUE_SIZE = EnvVariable[Optional[int]](
+    "NEPTUNE_FETCHER_STAGE_QUEUE_SIZE", _lift_optional(int), None
+)
+NEPTUNE_FETCHER_PREFETCH_PAGES = EnvVariable[bool]("NEPTUNE_FETCHER_PREFETCH_PAGES", _map_bool, True)
+NEPTUNE_FETCHER_MAX_INFLIGHT_BYTES = EnvVariable[Optional[int]](
+    "NEPTUNE_FETCHER_MAX_INFLIGHT_BYTES", _lift_optional(int), 512 * 2**20
+)
+NEPTUNE_FETCHER_ASYNC_MAX_CONCURRENCY = EnvVariable[int]("NEPTUNE_FETCHER_ASYNC_MAX_CONCURRENCY", int, 64)
+NEPTUNE_FETCHER_ADAPTIVE_CONCURRENCY = EnvVariable[bool]("NEPTUNE_FETCHER_ADAPTIVE_CONCURRENCY", _map_bool, True)
+NEPTUNE_FETCHER_MAX_CONCURRENT_REQUESTS = EnvVariable[int]("NEPTUNE_FETCHER_MAX_CONCURRENT_REQUESTS", int, 100)
+NEPTUNE_FETCHER_MAX_REQUESTS_PER_SECOND = EnvVariable[Optional[float]](
+    "NEPTUNE_FETCHER_MAX_REQUESTS_PER_SECOND", _lift_optional(float), None
+)
+NEPTUNE_FETCHER_MAX_BYTES_PER_SECOND = EnvVariable[Optional[float]](
+    "NEPTUNE_FETCHER_MAX_BYTES_PER_SECOND", _lift_optional(float), None
+)
+NEPTUNE_FETCHER_DECODING_PROCESSES = EnvVariable[Optional[int]](
+    "NEPTUNE_FETCHER_DECODING_PROCESSES", _lift_optional(int), None
+)
+NEPTUNE_FETCHER_MAX_CONNECTIONS = EnvVariable[Optional[int]](
+    "NEPTUNE_FETCHER_MAX_CONNECTIONS", _lift_optional(int), None
+)
+NEPTUNE_FETCHER_KEEPALIVE_EXPIRY = EnvVariable[Optional[float]](
+    "NEPTUNE_FETCHER_KEEPALIVE_EXPIRY", _lift_optional(float), 30.0
+)
+NEPTUNE_FETCHER_COALESCE_REQUESTS = EnvVariable[bool]("NEPTUNE_FETCHER_COALESCE_REQUESTS", _map_bool, True)
+NEPTUNE_FETCHER_HEDGE_REQUESTS = EnvVariable[bool]("NEPTUNE_FETCHER_HEDGE_REQUESTS", _map_bool, False)
+NEPTUNE_FETCHER_HEDGE_PERCENTILE = EnvVariable[float]("NEPTUNE_FETCHER_HEDGE_PERCENTILE", float, 95.0)
+NEPTUNE_FETCHER_HTTP2 = EnvVariable[bool]("NEPTUNE_FETCHER_HTTP2", _map_bool, False)
+NEPTUNE_FETCHER_HTTP2_MAX_CONNECTIONS = EnvVariable[int]("NEPTUNE_FETCHER_HTTP2_MAX_CONNECTIONS", int, 2)
+NEPTUNE_FETCHER_HTTP2_MAX_CONCURRENT_STREAMS = EnvVariable[Optional[int]](
+    "NEPTUNE_FETCHER_HTTP2_MAX_CONCURRENT_STREAMS", _lift_optional(int), 64
+)
+NEPTUNE_FETCHER_CONFIG_CACHE_DIR = EnvVariable[Optional[str]](
+    "NEPTUNE_FETCHER_CONFIG_CACHE_DIR", _lift_optional(_map_str), None
+)
+NEPTUNE_FETCHER_CONFIG_CACHE_TTL = EnvVariable[int]("NEPTUNE_FETCHER_CONFIG_CACHE_TTL", int, 3600)
+NEPTUNE_FETCHER_DEFINITIONS_CACHE_SIZE = EnvVariable[Optional[int]](
+    "NEPTUNE_FETCHER_DEFINITIONS_CACHE_SIZE", _lift_optional(int), None
+)
+NEPTUNE_FETCHER_DEFINITIONS_CACHE_DIR = EnvVariable[Optional[str]](
+    "NEPTUNE_FETCHER_DEFINITIONS_CACHE_DIR", _lift_optional(_map_str), None
+)
 NEPTUNE_FETCHER_SYS_ATTRS_BATCH_SIZE = EnvVariable[int]("NEPTUNE_FETCHER_EXPERIMENT_SYS_ATTRS_BATCH_SIZE", int, 10_000)
+NEPTUNE_FETCHER_SYS_ATTRS_MAX_PARALLEL_PAGES = EnvVariable[int]("NEPTUNE_FETCHER_SYS_ATTRS_MAX_PARALLEL_PAGES", int, 4)
+NEPTUNE_FETCHER_KEYSET_PAGINATION = EnvVariable[bool]("NEPTUNE_FETCHER_KEYSET_PAGINATION", _map_bool, False)
 NEPTUNE_FETCHER_ATTRIBUTE_DEFINITIONS_BATCH_SIZE = EnvVariable[int](
     "NEPTUNE_FETCHER_ATTRIBUTE_DEFINITIONS_BATCH_SIZE", int, 10_000
 )
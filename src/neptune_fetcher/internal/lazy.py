@@ -0,0 +1,58 @@
+#
+# Copyright (c) 2025, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+from typing import Any
+
+__all__ = ("lazy_import",)
+
+
+class _LazyModule:
+    """
+    Stands in for a module until one of its attributes is accessed, which imports it.
+
+    Modules are imported with `importlib.import_module`, which is safe to call from many threads at once,
+    and then looked up in `sys.modules`, so each access after the first costs a dict lookup.
+    """
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._module(), name)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._module())
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self._name!r}>"
+
+    def _module(self) -> ModuleType:
+        return importlib.import_module(self._name)
+
+
+def lazy_import(name: str) -> Any:
+    """
+    Return a stand-in for the module `name` that imports it on first attribute access.
+
+    Use it for modules that are expensive to import and needed only by some code paths, and import the module
+    under `typing.TYPE_CHECKING` as well, so that type checkers see the real module.
+    """
+    return _LazyModule(name)
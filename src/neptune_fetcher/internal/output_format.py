@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import itertools
 import pathlib
 from collections.abc import Collection
 from typing import (
@@ -19,6 +20,7 @@ from typing import (
     Generator,
     Optional,
     Tuple,
+    Union,
 )
 
 import numpy as np
@@ -52,13 +54,16 @@ __all__ = (
 
 
 def convert_table_to_dataframe(
-    table_data: dict[str, list[AttributeValue]],
+    table_data: Union[dict[str, list[AttributeValue]], dict[tuple[str, str], list[AttributeValue]]],
     selected_aggregations: dict[identifiers.AttributeDefinition, set[str]],
     type_suffix_in_column_names: bool,
     index_column_name: str = "experiment",
     flatten_aggregations: bool = False,
     flatten_file_properties: bool = False,
+    # project_column_name: if set, `table_data` is keyed by (project, label), and the index has a project level
+    project_column_name: Optional[str] = None,
 ) -> pd.DataFrame:
+    index_names = [index_column_name] if project_column_name is None else [project_column_name, index_column_name]
 
     if flatten_aggregations:
         has_non_last_aggregations = any(aggregations != {"last"} for aggregations in selected_aggregations.values())
@@ -70,12 +75,12 @@ def convert_table_to_dataframe(
 
     if not table_data and not flatten_aggregations:
         return pd.DataFrame(
-            index=pd.Index([], name=index_column_name),
+            index=_empty_index(index_names),
             columns=pd.MultiIndex.from_tuples([], names=["attribute", "aggregation"]),
         )
     if not table_data and flatten_aggregations:
         return pd.DataFrame(
-            index=pd.Index([], name=index_column_name),
+            index=_empty_index(index_names),
             columns=[],
         )
 
@@ -158,19 +163,22 @@ def convert_table_to_dataframe(
         return df
 
     rows = []
-    for label, values in table_data.items():
+    for key, values in table_data.items():
         row: Any = convert_row(values)
         if flatten_aggregations:
             # Note for future optimization:
             # flatten_aggregations is always True in v1
             # flatten_aggregations is always False in alpha
             row = flatten_row(row)
-        row[index_column_name] = label
+        if project_column_name is None:
+            row[index_column_name] = key
+        else:
+            row[project_column_name], row[index_column_name] = key  # type: ignore[misc]
         rows.append(row)
 
     dataframe = pd.DataFrame(rows)
     dataframe = transform_column_names(dataframe)
-    dataframe.set_index(index_column_name, drop=True, inplace=True)
+    dataframe.set_index(index_names, drop=True, inplace=True)
 
     if not flatten_aggregations:
         dataframe.columns = pd.MultiIndex.from_tuples(dataframe.columns, names=["attribute", "aggregation"])
@@ -181,8 +189,14 @@ def convert_table_to_dataframe(
     return dataframe
 
 
+def _empty_index(names: list[str]) -> pd.Index:
+    if len(names) == 1:
+        return pd.Index([], name=names[0])
+    return pd.MultiIndex.from_tuples([], names=names)
+
+
 def create_metrics_dataframe(
-    metrics_data: dict[identifiers.RunAttributeDefinition, list[metrics.FloatPointValue]],
+    metrics_data: dict[identifiers.RunAttributeDefinition, metrics.FloatPoints],
     sys_id_label_mapping: dict[identifiers.SysId, str],
     *,
     type_suffix_in_column_names: bool,
@@ -191,7 +205,7 @@ def create_metrics_dataframe(
     timestamp_column_name: Optional[str] = None,
 ) -> pd.DataFrame:
     """
-    Creates a memory-efficient DataFrame directly from FloatPointValue tuples.
+    Creates a memory-efficient DataFrame directly from FloatPointValue tuples, or from structured arrays of points.
 
     Note that `data_points` must be sorted by (experiment name, path) to ensure correct
     categorical codes.
@@ -231,34 +245,32 @@ def create_metrics_dataframe(
         if run_attr_definition.attribute_definition.name not in path_mapping:
             path_mapping[run_attr_definition.attribute_definition.name] = len(path_mapping)
 
-    def generate_categorized_rows() -> Generator[Tuple, None, None]:
-        for attribute, points in metrics_data.items():
-            exp_category = sys_id_mapping[attribute.run_identifier.sys_id]
-            path_category = path_mapping[attribute.attribute_definition.name]
-
-            for point in points:
-                # Only include columns that we know we need. Note that the list of columns must match the
-                # the list of `types` below.
-                head = (
-                    exp_category,
-                    path_category,
-                    point[StepIndex],
-                    point[ValueIndex],
+    def generate_categorized_rows(
+        points: list[metrics.FloatPointValue], exp_category: int, path_category: int
+    ) -> Generator[Tuple, None, None]:
+        for point in points:
+            # Only include columns that we know we need. Note that the list of columns must match the
+            # the list of `types` below.
+            head = (
+                exp_category,
+                path_category,
+                point[StepIndex],
+                point[ValueIndex],
+            )
+            if include_point_previews and timestamp_column_name:
+                tail: Tuple[Any, ...] = (
+                    point[TimestampIndex],
+                    point[IsPreviewIndex],
+                    point[PreviewCompletionIndex],
                 )
-                if include_point_previews and timestamp_column_name:
-                    tail: Tuple[Any, ...] = (
-                        point[TimestampIndex],
-                        point[IsPreviewIndex],
-                        point[PreviewCompletionIndex],
-                    )
-                elif timestamp_column_name:
-                    tail = (point[TimestampIndex],)
-                elif include_point_previews:
-                    tail = (point[IsPreviewIndex], point[PreviewCompletionIndex])
-                else:
-                    tail = ()
-
-                yield head + tail
+            elif timestamp_column_name:
+                tail = (point[TimestampIndex],)
+            elif include_point_previews:
+                tail = (point[IsPreviewIndex], point[PreviewCompletionIndex])
+            else:
+                tail = ()
+
+            yield head + tail
 
     types = [
         (index_column_name, "uint32"),
@@ -274,9 +286,46 @@ def create_metrics_dataframe(
         types.append(("is_preview", "bool"))
         types.append(("preview_completion", "float64"))
 
-    df = pd.DataFrame(
-        np.fromiter(generate_categorized_rows(), dtype=types),
-    )
+    def categorize_array(rows: np.ndarray, points: np.ndarray, exp_category: int, path_category: int) -> None:
+        # Points decoded in the process pool are copied column by column, without a Python object per point
+        rows[index_column_name] = exp_category
+        rows["path"] = path_category
+        rows["step"] = points["step"]
+        rows["value"] = points["value"]
+        if timestamp_column_name:
+            rows[timestamp_column_name] = points["timestamp"]
+        if include_point_previews:
+            rows["is_preview"] = points["is_preview"]
+            rows["preview_completion"] = points["completion_ratio"]
+
+    def categories(attribute: identifiers.RunAttributeDefinition) -> tuple[int, int]:
+        return sys_id_mapping[attribute.run_identifier.sys_id], path_mapping[attribute.attribute_definition.name]
+
+    row_count = sum(len(points) for points in metrics_data.values())
+    point_lists = [(attribute, points) for attribute, points in metrics_data.items() if isinstance(points, list)]
+    if len(point_lists) == len(metrics_data):
+        rows = np.fromiter(
+            itertools.chain.from_iterable(
+                generate_categorized_rows(points, *categories(attribute)) for attribute, points in point_lists
+            ),
+            dtype=types,
+            count=row_count,
+        )
+    else:
+        # Each series is written into its slice of the rows, so the rows are never held twice
+        rows = np.empty(row_count, dtype=types)
+        start = 0
+        for attribute, points in metrics_data.items():
+            end = start + len(points)
+            if isinstance(points, np.ndarray):
+                categorize_array(rows[start:end], points, *categories(attribute))
+            else:
+                rows[start:end] = np.fromiter(
+                    generate_categorized_rows(points, *categories(attribute)), dtype=types, count=len(points)
+                )
+            start = end
+
+    df = pd.DataFrame(rows)
 
     experiment_dtype = pd.CategoricalDtype(categories=label_mapping)
     df[index_column_name] = pd.Categorical.from_codes(df[index_column_name], dtype=experiment_dtype)
@@ -0,0 +1,189 @@
+#
+# Copyright (c) 2025, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Optional,
+)
+
+from .. import (
+    cancellation,
+    env,
+)
+from .client_registry import ClientRegistry
+
+_DECREASE_FACTOR = 0.5
+# How often a thread waiting for a slot checks whether its work was cancelled
+_CANCELLATION_POLL_SECONDS = 0.1
+
+
+class _Waiter:
+    __slots__ = ("wake", "granted", "abandoned")
+
+    def __init__(self, wake: Callable[[], None]):
+        self.wake = wake
+        self.granted = False
+        self.abandoned = False
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits the number of concurrent requests sent with a single client, adjusting the limit with AIMD.
+
+    The limit is halved when the backend signals overload: 429 and 5xx responses, and transport errors, such as
+    timeouts. Slow responses alone don't count, since the size of the pages, and so their latency, varies widely.
+    It's decreased at most once per round trip: only requests started after the last decrease can decrease it again.
+    While the backend is healthy, the limit grows by one request per round trip.
+
+    Requests wait for a slot in FIFO order. Both threads and coroutines can wait for a slot.
+    """
+
+    def __init__(self, initial_limit: int, min_limit: int = 1, max_limit: Optional[int] = None):
+        if min_limit < 1:
+            raise ValueError("min_limit must be at least 1")
+
+        self._min_limit = min_limit
+        self._max_limit = max(max_limit if max_limit is not None else initial_limit, min_limit)
+        self._limit = float(min(max(initial_limit, min_limit), self._max_limit))
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: collections.deque[_Waiter] = collections.deque()
+        self._last_decrease_time = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> None:
+        event = threading.Event()
+        waiter = self._acquire_or_enqueue(_Waiter(event.set))
+        if waiter is None:
+            return
+
+        try:
+            while not event.wait(_CANCELLATION_POLL_SECONDS):
+                cancellation.raise_if_cancelled()
+        except cancellation.FetchCancelledError:
+            self._abandon(waiter)
+            raise
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(_set_result_if_pending, future)
+
+        waiter = self._acquire_or_enqueue(_Waiter(wake))
+        if waiter is None:
+            return
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+    def release(self, started_at: float, overloaded: Optional[bool]) -> None:
+        """
+        Free the slot taken by a request started at `started_at` and adjust the limit based on its outcome.
+        `overloaded` is None if the outcome says nothing about the load of the backend.
+        """
+        with self._lock:
+            if overloaded:
+                if started_at >= self._last_decrease_time:
+                    self._limit = max(self._min_limit, self._limit * _DECREASE_FACTOR)
+                    self._last_decrease_time = time.monotonic()
+            elif overloaded is not None:
+                self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+
+        self._release_slot()
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        with self._lock:
+            granted = waiter.granted
+            waiter.abandoned = True
+        if granted:
+            self._release_slot()
+
+    def _acquire_or_enqueue(self, waiter: _Waiter) -> Optional[_Waiter]:
+        with self._lock:
+            if not self._waiters and self._in_flight < self.limit:
+                self._in_flight += 1
+                return None
+            self._waiters.append(waiter)
+            return waiter
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            granted = []
+            while self._waiters and self._in_flight < self.limit:
+                waiter = self._waiters.popleft()
+                if waiter.abandoned:
+                    continue
+                waiter.granted = True
+                self._in_flight += 1
+                granted.append(waiter)
+
+        for waiter in granted:
+            waiter.wake()
+
+
+def _set_result_if_pending(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def max_concurrent_requests() -> int:
+    """
+    Return how many requests may be in flight with a single client: as many as the adaptive limit can grow to,
+    or a request per worker of the general and the definitions queues if adaptive concurrency is disabled.
+    The connection pools of the clients are sized from it, so that requests let through never wait for a connection.
+    """
+    if env.NEPTUNE_FETCHER_ADAPTIVE_CONCURRENCY.get():
+        return env.NEPTUNE_FETCHER_MAX_CONCURRENT_REQUESTS.get()
+    return 2 * env.NEPTUNE_FETCHER_MAX_WORKERS.get()
+
+
+_limiters: ClientRegistry[AdaptiveConcurrencyLimiter] = ClientRegistry()
+
+
+def get_concurrency_limiter(client: Any) -> Optional[AdaptiveConcurrencyLimiter]:
+    """
+    Return the limiter shared by all requests sent with the client, or None if adaptive concurrency is disabled.
+    """
+    if client is None or not env.NEPTUNE_FETCHER_ADAPTIVE_CONCURRENCY.get():
+        return None
+
+    return _limiters.get(
+        client,
+        lambda: AdaptiveConcurrencyLimiter(
+            initial_limit=env.NEPTUNE_FETCHER_MAX_WORKERS.get(),
+            max_limit=max_concurrent_requests(),
+        ),
+    )
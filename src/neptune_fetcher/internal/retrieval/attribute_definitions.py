@@ -17,6 +17,7 @@ import itertools as it
 import re
 from typing import (
     Any,
+    AsyncGenerator,
     Generator,
     Iterable,
     Optional,
@@ -38,7 +39,11 @@ from .. import (  # noqa: E402
 )
 from ..retrieval import attribute_types as types  # noqa: E402
 from ..retrieval import util  # noqa: E402
-from ..retrieval import retry
+from ..retrieval import (
+    attribute_values,
+    definitions_cache,
+    retry,
+)
 
 
 def split_attribute_filters(
@@ -52,6 +57,111 @@ def split_attribute_filters(
         raise RuntimeError(f"Unexpected filter type: {type(_attribute_filter)}")
 
 
+def merge_attribute_filters(
+    attribute_filters: list[filters._AttributeFilter],
+) -> list[filters._AttributeFilter]:
+    """
+    Merge the filters that differ only in the attribute names they match, so that the definitions matching any of them
+    are fetched with a single request. The merged filter matches the name alternatives of all of its filters.
+
+    Only filters with the same types and aggregations, in any order, are merged, because a request has a single type
+    filter, and the aggregations of a definition are taken from the filter that returned it. The regexes of a merged
+    filter add up to at most `NEPTUNE_FETCHER_QUERY_SIZE_LIMIT` characters, unless a single filter exceeds it on its
+    own.
+    """
+    groups: dict[tuple[frozenset[str], frozenset[str]], list[filters._AttributeFilter]] = {}
+    for attribute_filter in attribute_filters:
+        key = (frozenset(attribute_filter.type_in), frozenset(attribute_filter.aggregations))
+        groups.setdefault(key, []).append(attribute_filter)
+
+    return list(it.chain.from_iterable(_merge_filter_group(group) for group in groups.values()))
+
+
+def _merge_filter_group(group: list[filters._AttributeFilter]) -> list[filters._AttributeFilter]:
+    if len(group) == 1:
+        return group
+
+    name_alternatives = [_name_alternatives(attribute_filter) for attribute_filter in group]
+    if any(alternatives is None for alternatives in name_alternatives):
+        # One of the filters matches all names, so their alternative does too
+        return [_with_name_alternatives(group[0], None)]
+
+    query_size_limit = env.NEPTUNE_FETCHER_QUERY_SIZE_LIMIT.get()
+    merged: list[filters._AttributeFilter] = []
+    batch: list[filters._AttributeFilter] = []
+    batch_alternatives: list[filters._AttributeNameFilter] = []
+    batch_size = 0
+
+    def flush() -> None:
+        if len(batch) == 1:
+            merged.append(batch[0])
+        elif batch:
+            merged.append(_with_name_alternatives(group[0], list(batch_alternatives)))
+        batch.clear()
+        batch_alternatives.clear()
+
+    for attribute_filter, alternatives in zip(group, name_alternatives):
+        assert alternatives is not None
+        if not alternatives:
+            # An empty list of name alternatives is sent as is, since merging it would change its meaning
+            merged.append(attribute_filter)
+            continue
+
+        size = sum(len(regex) for alternative in alternatives for regex in _regexes(alternative))
+        if batch and batch_size + size > query_size_limit:
+            flush()
+            batch_size = 0
+        batch.append(attribute_filter)
+        batch_alternatives.extend(alternatives)
+        batch_size += size
+    flush()
+
+    return merged
+
+
+def _name_alternatives(attribute_filter: filters._AttributeFilter) -> Optional[list[filters._AttributeNameFilter]]:
+    """
+    Return the name alternatives sent for the filter, with `name_eq` folded into each of them,
+    or None if the filter matches all names.
+    """
+    name_regexes = None
+    if attribute_filter.name_eq is not None:
+        name_regexes = _escape_name_eq(_variants_to_list(attribute_filter.name_eq))
+
+    if attribute_filter.must_match_any is not None:
+        alternatives = []
+        for alternative in attribute_filter.must_match_any:
+            must_match_regexes = _union_options([name_regexes, alternative.must_match_regexes])
+            if must_match_regexes is None and alternative.must_not_match_regexes is None:
+                continue
+            alternatives.append(
+                filters._AttributeNameFilter(
+                    must_match_regexes=must_match_regexes,
+                    must_not_match_regexes=alternative.must_not_match_regexes,
+                )
+            )
+        return alternatives
+
+    if name_regexes is not None:
+        return [filters._AttributeNameFilter(must_match_regexes=name_regexes)]
+
+    return None
+
+
+def _with_name_alternatives(
+    attribute_filter: filters._AttributeFilter, must_match_any: Optional[list[filters._AttributeNameFilter]]
+) -> filters._AttributeFilter:
+    return filters._AttributeFilter(
+        type_in=list(attribute_filter.type_in),
+        must_match_any=must_match_any,
+        aggregations=list(attribute_filter.aggregations),
+    )
+
+
+def _regexes(alternative: filters._AttributeNameFilter) -> list[str]:
+    return (alternative.must_match_regexes or []) + (alternative.must_not_match_regexes or [])
+
+
 def fetch_attribute_definitions_single_filter(
     client: AuthenticatedClient,
     project_identifiers: Iterable[identifiers.ProjectIdentifier],
@@ -59,6 +169,167 @@ def fetch_attribute_definitions_single_filter(
     attribute_filter: filters._AttributeFilter,
     batch_size: int = env.NEPTUNE_FETCHER_ATTRIBUTE_DEFINITIONS_BATCH_SIZE.get(),
 ) -> Generator[util.Page[identifiers.AttributeDefinition], None, None]:
+    project_identifiers = list(project_identifiers)
+    run_identifiers = list(run_identifiers) if run_identifiers is not None else None
+    params = _make_attribute_definitions_params(project_identifiers, run_identifiers, attribute_filter, batch_size)
+
+    cached_project = _cached_project(project_identifiers, run_identifiers)
+    if cached_project is not None and run_identifiers:
+        return _fetch_attribute_definitions_cached(
+            client, cached_project, run_identifiers, attribute_filter, params, batch_size
+        )
+
+    return _fetch_attribute_definitions_pages(client, params, batch_size)
+
+
+def fetch_attribute_definitions_single_filter_async(
+    client: AuthenticatedClient,
+    project_identifiers: Iterable[identifiers.ProjectIdentifier],
+    run_identifiers: Optional[Iterable[identifiers.RunIdentifier]],
+    attribute_filter: filters._AttributeFilter,
+    batch_size: int = env.NEPTUNE_FETCHER_ATTRIBUTE_DEFINITIONS_BATCH_SIZE.get(),
+) -> AsyncGenerator[util.Page[identifiers.AttributeDefinition], None]:
+    project_identifiers = list(project_identifiers)
+    run_identifiers = list(run_identifiers) if run_identifiers is not None else None
+    params = _make_attribute_definitions_params(project_identifiers, run_identifiers, attribute_filter, batch_size)
+
+    cached_project = _cached_project(project_identifiers, run_identifiers)
+    if cached_project is not None and run_identifiers:
+        return _fetch_attribute_definitions_cached_async(
+            client, cached_project, run_identifiers, attribute_filter, params, batch_size
+        )
+
+    return _fetch_attribute_definitions_pages_async(client, params, batch_size)
+
+
+def _fetch_attribute_definitions_pages(
+    client: AuthenticatedClient,
+    params: dict[str, Any],
+    batch_size: int,
+) -> Generator[util.Page[identifiers.AttributeDefinition], None, None]:
+    return util.fetch_pages(
+        client=client,
+        fetch_page=_fetch_attribute_definitions_page,
+        process_page=_process_attribute_definitions_page,
+        make_new_page_params=ft.partial(_make_new_attribute_definitions_page_params, batch_size=batch_size),
+        params=params,
+    )
+
+
+def _fetch_attribute_definitions_pages_async(
+    client: AuthenticatedClient,
+    params: dict[str, Any],
+    batch_size: int,
+) -> AsyncGenerator[util.Page[identifiers.AttributeDefinition], None]:
+    return util.fetch_pages_async(
+        client=client,
+        fetch_page=_fetch_attribute_definitions_page_async,
+        process_page=_process_attribute_definitions_page,
+        make_new_page_params=ft.partial(_make_new_attribute_definitions_page_params, batch_size=batch_size),
+        params=params,
+    )
+
+
+def _cached_project(
+    project_identifiers: list[identifiers.ProjectIdentifier],
+    run_identifiers: Optional[list[identifiers.RunIdentifier]],
+) -> Optional[identifiers.ProjectIdentifier]:
+    """
+    Return the project of the runs if their definitions can be cached, which needs the modification times of the runs.
+    Those are fetched from a single project, so definitions of all runs of a project, or across projects, aren't cached.
+    """
+    if not definitions_cache.is_enabled() or run_identifiers is None or len(project_identifiers) != 1:
+        return None
+    (project_identifier,) = project_identifiers
+    if any(run_identifier.project_identifier != project_identifier for run_identifier in run_identifiers):
+        return None
+    return project_identifier
+
+
+def _fetch_attribute_definitions_cached(
+    client: AuthenticatedClient,
+    project_identifier: identifiers.ProjectIdentifier,
+    run_identifiers: list[identifiers.RunIdentifier],
+    attribute_filter: filters._AttributeFilter,
+    params: dict[str, Any],
+    batch_size: int,
+) -> Generator[util.Page[identifiers.AttributeDefinition], None, None]:
+    key = definitions_cache.make_key(client._base_url, run_identifiers, params)
+    modification_times: dict[str, str] = {}
+    for page in attribute_values.fetch_attribute_values(
+        client, project_identifier, run_identifiers, [definitions_cache.MODIFICATION_TIME]
+    ):
+        modification_times.update(_modification_times(page))
+
+    cached = definitions_cache.load(key, modification_times)
+    if cached is not None:
+        definitions = cached.definitions
+        if cached.modified_runs:
+            modified_runs = [run for run in run_identifiers if str(run) in cached.modified_runs]
+            modified_params = _make_attribute_definitions_params(
+                [project_identifier], modified_runs, attribute_filter, batch_size
+            )
+            for definitions_page in _fetch_attribute_definitions_pages(client, modified_params, batch_size):
+                definitions.extend(definitions_page.items)
+            definitions = list(dict.fromkeys(definitions))
+            definitions_cache.store(key, modification_times, definitions)
+        yield util.Page(items=definitions)
+        return
+
+    definitions = []
+    for definitions_page in _fetch_attribute_definitions_pages(client, params, batch_size):
+        definitions.extend(definitions_page.items)
+        yield definitions_page
+    definitions_cache.store(key, modification_times, definitions)
+
+
+async def _fetch_attribute_definitions_cached_async(
+    client: AuthenticatedClient,
+    project_identifier: identifiers.ProjectIdentifier,
+    run_identifiers: list[identifiers.RunIdentifier],
+    attribute_filter: filters._AttributeFilter,
+    params: dict[str, Any],
+    batch_size: int,
+) -> AsyncGenerator[util.Page[identifiers.AttributeDefinition], None]:
+    key = definitions_cache.make_key(client._base_url, run_identifiers, params)
+    modification_times: dict[str, str] = {}
+    async for page in attribute_values.fetch_attribute_values_async(
+        client, project_identifier, run_identifiers, [definitions_cache.MODIFICATION_TIME]
+    ):
+        modification_times.update(_modification_times(page))
+
+    cached = definitions_cache.load(key, modification_times)
+    if cached is not None:
+        definitions = cached.definitions
+        if cached.modified_runs:
+            modified_runs = [run for run in run_identifiers if str(run) in cached.modified_runs]
+            modified_params = _make_attribute_definitions_params(
+                [project_identifier], modified_runs, attribute_filter, batch_size
+            )
+            async for definitions_page in _fetch_attribute_definitions_pages_async(client, modified_params, batch_size):
+                definitions.extend(definitions_page.items)
+            definitions = list(dict.fromkeys(definitions))
+            definitions_cache.store(key, modification_times, definitions)
+        yield util.Page(items=definitions)
+        return
+
+    definitions = []
+    async for definitions_page in _fetch_attribute_definitions_pages_async(client, params, batch_size):
+        definitions.extend(definitions_page.items)
+        yield definitions_page
+    definitions_cache.store(key, modification_times, definitions)
+
+
+def _modification_times(page: util.Page[attribute_values.AttributeValue]) -> dict[str, str]:
+    return {str(value.run_identifier): value.value.isoformat() for value in page.items}
+
+
+def _make_attribute_definitions_params(
+    project_identifiers: Iterable[identifiers.ProjectIdentifier],
+    run_identifiers: Optional[Iterable[identifiers.RunIdentifier]],
+    attribute_filter: filters._AttributeFilter,
+    batch_size: int,
+) -> dict[str, Any]:
     params: dict[str, Any] = {
         "projectIdentifiers": list(project_identifiers),
         "attributeNameFilter": dict(),
@@ -97,13 +368,7 @@ def fetch_attribute_definitions_single_filter(
 
     # note: attribute_filter.aggregations is intentionally ignored
 
-    return util.fetch_pages(
-        client=client,
-        fetch_page=_fetch_attribute_definitions_page,
-        process_page=_process_attribute_definitions_page,
-        make_new_page_params=ft.partial(_make_new_attribute_definitions_page_params, batch_size=batch_size),
-        params=params,
-    )
+    return params
 
 
 def _fetch_attribute_definitions_page(
@@ -125,6 +390,25 @@ def _fetch_attribute_definitions_page(
     return response.parsed
 
 
+async def _fetch_attribute_definitions_page_async(
+    client: AuthenticatedClient,
+    params: dict[str, Any],
+) -> QueryAttributeDefinitionsResultDTO:
+    body = QueryAttributeDefinitionsBodyDTO.from_dict(params)
+
+    response: Response[QueryAttributeDefinitionsResultDTO] = await retry.handle_errors_default_async(
+        query_attribute_definitions_within_project.asyncio_detailed
+    )(
+        client=client,
+        body=body,
+    )
+
+    if response.parsed is None:
+        raise RuntimeError("query_attribute_definitions_within_project returned no data")
+
+    return response.parsed
+
+
 def _process_attribute_definitions_page(
     data: QueryAttributeDefinitionsResultDTO,
 ) -> util.Page[identifiers.AttributeDefinition]:
@@ -12,26 +12,32 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from __future__ import annotations
+
 import datetime
 from dataclasses import dataclass
 from typing import (
+    TYPE_CHECKING,
     Any,
     Literal,
     Optional,
     Sequence,
 )
 
-from neptune_fetcher.generated.neptune_api.proto.neptune_pb.api.v1.model.leaderboard_entries_pb2 import (
-    ProtoAttributeDTO,
-    ProtoFileRefAttributeDTO,
-    ProtoFileRefSeriesAttributeDTO,
-    ProtoFloatSeriesAttributeDTO,
-    ProtoHistogramSeriesAttributeDTO,
-    ProtoStringSeriesAttributeDTO,
-)
-
 from ...exceptions import warn_unsupported_value_type
 
+# The protobuf messages are only used in annotations, so that the attribute types, which are also used by filters,
+# don't load the generated API package
+if TYPE_CHECKING:
+    from neptune_fetcher.generated.neptune_api.proto.neptune_pb.api.v1.model.leaderboard_entries_pb2 import (
+        ProtoAttributeDTO,
+        ProtoFileRefAttributeDTO,
+        ProtoFileRefSeriesAttributeDTO,
+        ProtoFloatSeriesAttributeDTO,
+        ProtoHistogramSeriesAttributeDTO,
+        ProtoStringSeriesAttributeDTO,
+    )
+
 ATTRIBUTE_LITERAL = Literal[
     "float",
     "int",
@@ -16,6 +16,7 @@ import functools as ft
 from dataclasses import dataclass
 from typing import (
     Any,
+    AsyncGenerator,
     Generator,
     Iterable,
     Optional,
@@ -63,12 +64,6 @@ def fetch_attribute_values(
         yield from []
         return
 
-    params: dict[str, Any] = {
-        "experimentIdsFilter": experiments,
-        "attributeNamesFilter": [ad.name for ad in attribute_definitions],
-        "nextPage": {"limit": batch_size},
-    }
-
     yield from util.fetch_pages(
         client=client,
         fetch_page=ft.partial(_fetch_attribute_values_page, project_identifier=project_identifier),
@@ -78,10 +73,49 @@ def fetch_attribute_values(
             project_identifier=project_identifier,
         ),
         make_new_page_params=_make_new_attribute_values_page_params,
-        params=params,
+        params=_make_attribute_values_params(experiments, attribute_definitions_set, batch_size),
     )
 
 
+async def fetch_attribute_values_async(
+    client: AuthenticatedClient,
+    project_identifier: identifiers.ProjectIdentifier,
+    run_identifiers: Iterable[identifiers.RunIdentifier],
+    attribute_definitions: Iterable[identifiers.AttributeDefinition],
+    batch_size: int = env.NEPTUNE_FETCHER_ATTRIBUTE_VALUES_BATCH_SIZE.get(),
+) -> AsyncGenerator[util.Page[AttributeValue], None]:
+    attribute_definitions_set: set[identifiers.AttributeDefinition] = set(attribute_definitions)
+    experiments = [str(e) for e in run_identifiers]
+
+    if not attribute_definitions_set or not run_identifiers:
+        return
+
+    async for page in util.fetch_pages_async(
+        client=client,
+        fetch_page=ft.partial(_fetch_attribute_values_page_async, project_identifier=project_identifier),
+        process_page=ft.partial(
+            _process_attribute_values_page,
+            attribute_definitions_set=attribute_definitions_set,
+            project_identifier=project_identifier,
+        ),
+        make_new_page_params=_make_new_attribute_values_page_params,
+        params=_make_attribute_values_params(experiments, attribute_definitions_set, batch_size),
+    ):
+        yield page
+
+
+def _make_attribute_values_params(
+    experiments: list[str],
+    attribute_definitions: Iterable[identifiers.AttributeDefinition],
+    batch_size: int,
+) -> dict[str, Any]:
+    return {
+        "experimentIdsFilter": experiments,
+        "attributeNamesFilter": [ad.name for ad in attribute_definitions],
+        "nextPage": {"limit": batch_size},
+    }
+
+
 def _fetch_attribute_values_page(
     client: AuthenticatedClient,
     params: dict[str, Any],
@@ -99,6 +133,23 @@ def _fetch_attribute_values_page(
     return dto
 
 
+async def _fetch_attribute_values_page_async(
+    client: AuthenticatedClient,
+    params: dict[str, Any],
+    project_identifier: identifiers.ProjectIdentifier,
+) -> ProtoQueryAttributesResultDTO:
+    body = QueryAttributesBodyDTO.from_dict(params)
+
+    response = await retry.handle_errors_default_async(query_attributes_within_project_proto.asyncio_detailed)(
+        client=client,
+        body=body,
+        project_identifier=project_identifier,
+    )
+
+    dto: ProtoQueryAttributesResultDTO = ProtoQueryAttributesResultDTO.FromString(response.content)
+    return dto
+
+
 def _process_attribute_values_page(
     data: ProtoQueryAttributesResultDTO,
     attribute_definitions_set: set[identifiers.AttributeDefinition],
@@ -0,0 +1,166 @@
+#
+# Copyright (c) 2025, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import (
+    Any,
+    Optional,
+)
+
+from .. import env
+from .client_registry import ClientRegistry
+
+__all__ = ("CircuitBreaker", "RetryBudget", "get_circuit_breaker", "get_retry_budget")
+
+# Retries that are allowed regardless of the number of requests, so that clients sending few requests can still retry
+_MIN_RETRIES_PER_SECOND = 1.0
+# The maximum number of retries that can be saved up while requests succeed
+_MAX_RETRY_TOKENS = 100.0
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests with a single client once the backend seems to be down.
+
+    The breaker opens after `failure_threshold` consecutive failed requests, and rejects all requests for
+    `reset_timeout` seconds. Then it lets a single probe request through: if it succeeds, the breaker closes,
+    otherwise it opens again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self._consecutive_failures
+
+    @property
+    def reset_timeout(self) -> float:
+        return self._reset_timeout
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def acquire(self) -> Optional[bool]:
+        """
+        Return None if the request must not be sent, otherwise whether it's the probe of a half-open breaker.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if self._probe_in_flight or time.monotonic() < self._opened_at + self._reset_timeout:
+                return None
+            self._probe_in_flight = True
+            return True
+
+    def release(self, probe: bool, failed: Optional[bool]) -> None:
+        """
+        Report the outcome of a request that was let through. `failed` is None if the request was abandoned before
+        its outcome was known, which doesn't change the state of the breaker.
+        """
+        with self._lock:
+            if probe:
+                self._probe_in_flight = False
+
+            if failed is None:
+                return
+            if not failed:
+                self._consecutive_failures = 0
+                self._opened_at = None
+            else:
+                self._consecutive_failures += 1
+                if probe or self._consecutive_failures >= self._failure_threshold:
+                    self._opened_at = time.monotonic()
+
+
+class RetryBudget:
+    """
+    Caps the retries of the requests sent with a single client at a fraction of the requests, so that retries don't
+    multiply the load on a struggling backend.
+
+    Each request deposits `ratio` of a retry into the budget, and each retry withdraws a whole one. On top of that,
+    the budget grows by `min_retries_per_second` every second.
+    """
+
+    def __init__(self, ratio: float, min_retries_per_second: float = _MIN_RETRIES_PER_SECOND):
+        self._ratio = ratio
+        self._min_retries_per_second = min_retries_per_second
+
+        self._lock = threading.Lock()
+        self._tokens = _MAX_RETRY_TOKENS
+        self._updated_at = time.monotonic()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._refill(self._ratio)
+
+    def try_acquire_retry(self) -> bool:
+        with self._lock:
+            self._refill(0.0)
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def _refill(self, tokens: float) -> None:
+        now = time.monotonic()
+        tokens += (now - self._updated_at) * self._min_retries_per_second
+        self._tokens = min(_MAX_RETRY_TOKENS, self._tokens + tokens)
+        self._updated_at = now
+
+
+_breakers: ClientRegistry[CircuitBreaker] = ClientRegistry()
+_budgets: ClientRegistry[RetryBudget] = ClientRegistry()
+
+
+def get_circuit_breaker(client: Any) -> Optional[CircuitBreaker]:
+    """
+    Return the circuit breaker shared by all requests sent with the client, or None if it's disabled.
+    """
+    threshold = env.NEPTUNE_FETCHER_CIRCUIT_BREAKER_THRESHOLD.get()
+    if client is None or threshold is None:
+        return None
+
+    return _breakers.get(
+        client,
+        lambda: CircuitBreaker(
+            failure_threshold=threshold,
+            reset_timeout=env.NEPTUNE_FETCHER_CIRCUIT_BREAKER_RESET_TIMEOUT.get(),
+        ),
+    )
+
+
+def get_retry_budget(client: Any) -> Optional[RetryBudget]:
+    """
+    Return the retry budget shared by all requests sent with the client, or None if it's disabled.
+    """
+    ratio = env.NEPTUNE_FETCHER_RETRY_BUDGET_RATIO.get()
+    if client is None or ratio is None:
+        return None
+
+    return _budgets.get(client, lambda: RetryBudget(ratio))
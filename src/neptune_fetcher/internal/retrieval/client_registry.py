@@ -0,0 +1,56 @@
+#
+# Copyright (c) 2025, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    TypeVar,
+)
+
+__all__ = ("ClientRegistry",)
+
+T = TypeVar("T")
+
+
+class ClientRegistry(Generic[T]):
+    """
+    Objects shared by all requests sent with a single client, kept for as long as the client is alive.
+
+    The generated clients are attrs classes compared by value, which makes them unhashable, so they're told apart by
+    their id. An entry is removed when its client is garbage collected, before the id can be reused.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._items: dict[int, T] = {}
+
+    def get(self, client: Any, create: Callable[[], T]) -> T:
+        key = id(client)
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                item = self._items[key] = create()
+                weakref.finalize(client, self._discard, key)
+            return item
+
+    def _discard(self, key: int) -> None:
+        with self._lock:
+            self._items.pop(key, None)
@@ -0,0 +1,197 @@
+#
+# Copyright (c) 2025, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import io
+import json
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Hashable,
+    Optional,
+    TypeVar,
+)
+
+from neptune_fetcher.generated.neptune_api.types import (
+    File,
+    Response,
+    Unset,
+)
+
+from .. import (
+    cancellation,
+    env,
+)
+
+__all__ = ("UNCOALESCED_ENDPOINTS", "coalesce_requests", "coalesce_requests_async")
+
+T = TypeVar("T")
+
+# How often a call waiting for the response of an identical call checks whether its own work was cancelled
+_CANCELLATION_POLL_SECONDS = 0.1
+
+# The endpoints fetching series values. Their bodies list up to thousands of series, so serializing them to compare
+# costs about as much as sending them, and identical ones are rare, since each page continues where the last one ended
+UNCOALESCED_ENDPOINTS = frozenset(
+    f"neptune_fetcher.generated.neptune_api.api.retrieval.{endpoint}"
+    for endpoint in (
+        "get_multiple_float_series_values_proto",
+        "get_series_values_proto",
+    )
+)
+
+_in_flight: dict[Hashable, Future] = {}
+_in_flight_lock = threading.Lock()
+
+_in_flight_async: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[Hashable, asyncio.Future]
+] = weakref.WeakKeyDictionary()
+
+
+def coalesce_requests(
+    endpoint: Callable[..., Any]
+) -> Callable[[Callable[..., Response[T]]], Callable[..., Response[T]]]:
+    """
+    Let concurrent calls of `endpoint` with identical arguments share the response of a single call.
+
+    The first call sends the request, identical calls made while it's in flight wait for its response or error.
+    Calls are identical if they use the same `client` and their other keyword arguments, including the request body,
+    serialize to the same bytes. Calls with arguments that can't be serialized are never coalesced, and neither are
+    calls of the endpoints in `UNCOALESCED_ENDPOINTS`, for which `func` is returned unchanged.
+    """
+
+    def decorator(func: Callable[..., Response[T]]) -> Callable[..., Response[T]]:
+        if endpoint.__module__ in UNCOALESCED_ENDPOINTS:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = _request_key(endpoint, args, kwargs)
+            if key is None:
+                return func(*args, **kwargs)
+
+            while True:
+                with _in_flight_lock:
+                    future = _in_flight.get(key)
+                    is_leader = future is None
+                    if future is None:
+                        future = _in_flight[key] = Future()
+
+                if is_leader:
+                    return _lead(key, future, func, args, kwargs)
+
+                try:
+                    return _follow(future)
+                except cancellation.FetchCancelledError:
+                    # The call we waited for was cancelled together with the work that made it, but ours wasn't
+                    cancellation.raise_if_cancelled()
+
+        return wrapper
+
+    return decorator
+
+
+def _lead(key: Hashable, future: Future, func: Callable[..., Any], args: tuple, kwargs: dict[str, Any]) -> Any:
+    try:
+        response = func(*args, **kwargs)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(response)
+        return response
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+
+
+def _follow(future: Future) -> Any:
+    while True:
+        cancellation.raise_if_cancelled()
+        try:
+            return future.result(timeout=_CANCELLATION_POLL_SECONDS)
+        except concurrent.futures.TimeoutError:
+            continue
+
+
+def coalesce_requests_async(
+    endpoint: Callable[..., Any]
+) -> Callable[[Callable[..., Awaitable[Response[T]]]], Callable[..., Awaitable[Response[T]]]]:
+    """
+    Let concurrent calls of `endpoint` with identical arguments within an event loop share the response of a single
+    call. See `coalesce_requests`.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Response[T]]]) -> Callable[..., Awaitable[Response[T]]]:
+        if endpoint.__module__ in UNCOALESCED_ENDPOINTS:
+            return func
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = _request_key(endpoint, args, kwargs)
+            if key is None:
+                return await func(*args, **kwargs)
+
+            loop = asyncio.get_running_loop()
+            in_flight = _in_flight_async.setdefault(loop, {})
+            if (future := in_flight.get(key)) is not None:
+                # Shielded, so that cancelling one of the waiting calls doesn't cancel the shared one
+                return await asyncio.shield(future)
+
+            future = in_flight[key] = asyncio.ensure_future(func(*args, **kwargs))
+            future.add_done_callback(lambda _: in_flight.pop(key, None))
+            return await asyncio.shield(future)
+
+        return wrapper
+
+    return decorator
+
+
+def _request_key(endpoint: Callable[..., Any], args: tuple, kwargs: dict[str, Any]) -> Optional[Hashable]:
+    if args or "client" not in kwargs or not env.NEPTUNE_FETCHER_COALESCE_REQUESTS.get():
+        return None
+
+    digest = hashlib.sha256()
+    try:
+        for name, value in sorted(kwargs.items()):
+            if name == "client":
+                continue
+            digest.update(name.encode("utf-8"))
+            digest.update(_serialize(value))
+    except (TypeError, ValueError):
+        return None
+
+    return endpoint, id(kwargs["client"]), digest.digest()
+
+
+def _serialize(value: Any) -> bytes:
+    if isinstance(value, File):
+        if not isinstance(value.payload, io.BytesIO):
+            raise TypeError("Only in-memory files can be compared")
+        return b"file:" + value.payload.getvalue()
+    if isinstance(value, Unset):
+        return b"unset"
+    if hasattr(value, "to_dict"):
+        value = value.to_dict()
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,205 @@
+#
+# Copyright (c) 2025, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Cache of the attribute definitions of runs, revalidated with the modification times of the runs.
+
+The definitions of a run only change when the run is modified, so an entry stays valid for as long as the
+`sys/modification_time` of each of its runs is unchanged. Checking that takes a single request for the values of one
+attribute, instead of the pages of definitions. If only some of the runs were modified, only their definitions are
+fetched again, and added to those of the entry.
+
+An entry holds the definitions of all its runs together, so removing an attribute from a run is not detected:
+its definition stays in the entry, and fetching its values returns nothing for that run.
+
+The cache is enabled by setting `NEPTUNE_FETCHER_DEFINITIONS_CACHE_SIZE`, which keeps that many entries in memory,
+or `NEPTUNE_FETCHER_DEFINITIONS_CACHE_DIR`, which keeps all entries on disk, shared by processes.
+Entries on disk are written atomically, and entries that can't be read are treated as missing.
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Iterable,
+    Optional,
+)
+
+from .. import (
+    env,
+    identifiers,
+)
+
+__all__ = ("MODIFICATION_TIME", "CachedDefinitions", "is_enabled", "make_key", "load", "store", "clear")
+
+logger = logging.getLogger(__name__)
+
+MODIFICATION_TIME = identifiers.AttributeDefinition("sys/modification_time", "datetime")
+
+# Bump when the format of the entries changes, so that entries written by other versions are ignored
+_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class _Entry:
+    modification_times: dict[str, str]
+    definitions: list[identifiers.AttributeDefinition]
+
+
+@dataclass(frozen=True)
+class CachedDefinitions:
+    definitions: list[identifiers.AttributeDefinition]
+    # The runs modified since the definitions were stored, named as in the modification times
+    modified_runs: list[str]
+
+
+_memory: collections.OrderedDict[str, _Entry] = collections.OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return (
+        env.NEPTUNE_FETCHER_DEFINITIONS_CACHE_SIZE.get() is not None
+        or env.NEPTUNE_FETCHER_DEFINITIONS_CACHE_DIR.get() is not None
+    )
+
+
+def make_key(base_url: str, run_identifiers: Iterable[identifiers.RunIdentifier], params: dict[str, Any]) -> str:
+    """
+    Return the key of the definitions of the runs matching the params of a definitions request, regardless of its page.
+    """
+    key = {
+        "base_url": base_url,
+        "runs": sorted(str(run_identifier) for run_identifier in run_identifiers),
+        "params": {name: value for name, value in params.items() if name != "nextPage"},
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def load(key: str, modification_times: dict[str, str]) -> Optional[CachedDefinitions]:
+    """
+    Return the cached definitions, together with the runs modified since they were stored, whose definitions need to be
+    fetched again. Return None if there's no entry, or one of its runs no longer has a modification time.
+    """
+    entry = _load_from_memory(key)
+    if entry is None:
+        entry = _load_from_disk(key)
+        if entry is not None:
+            _store_in_memory(key, entry)
+
+    if entry is None or not entry.modification_times.keys() <= modification_times.keys():
+        return None
+    modified_runs = [
+        run for run, modified_at in modification_times.items() if entry.modification_times.get(run) != modified_at
+    ]
+    return CachedDefinitions(definitions=list(entry.definitions), modified_runs=modified_runs)
+
+
+def store(key: str, modification_times: dict[str, str], definitions: Iterable[identifiers.AttributeDefinition]) -> None:
+    """
+    Store the definitions, together with the modification times of the runs read before the definitions were fetched.
+    """
+    entry = _Entry(modification_times=dict(modification_times), definitions=list(definitions))
+    _store_in_memory(key, entry)
+    _store_on_disk(key, entry)
+
+
+def clear() -> None:
+    with _memory_lock:
+        _memory.clear()
+
+
+def _load_from_memory(key: str) -> Optional[_Entry]:
+    with _memory_lock:
+        entry = _memory.get(key)
+        if entry is not None:
+            _memory.move_to_end(key)
+        return entry
+
+
+def _store_in_memory(key: str, entry: _Entry) -> None:
+    size = env.NEPTUNE_FETCHER_DEFINITIONS_CACHE_SIZE.get()
+    if size is None:
+        return
+
+    with _memory_lock:
+        _memory[key] = entry
+        _memory.move_to_end(key)
+        while len(_memory) > size:
+            _memory.popitem(last=False)
+
+
+def _load_from_disk(key: str) -> Optional[_Entry]:
+    path = _entry_path(key)
+    if path is None:
+        return None
+
+    try:
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        if data["version"] != _FORMAT_VERSION or data["key"] != key:
+            return None
+        modification_times = data["modification_times"]
+        if not isinstance(modification_times, dict):
+            return None
+        definitions = [identifiers.AttributeDefinition(name=name, type=type_) for name, type_ in data["definitions"]]
+        return _Entry(modification_times=modification_times, definitions=definitions)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable attribute definitions cache entry %s: %s", path, e)
+        return None
+
+
+def _store_on_disk(key: str, entry: _Entry) -> None:
+    path = _entry_path(key)
+    if path is None:
+        return
+
+    data = {
+        "version": _FORMAT_VERSION,
+        "key": key,
+        "modification_times": entry.modification_times,
+        "definitions": [[definition.name, definition.type] for definition in entry.definitions],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.debug("Failed to write attribute definitions cache entry %s: %s", path, e)
+
+
+def _entry_path(key: str) -> Optional[Path]:
+    directory = env.NEPTUNE_FETCHER_DEFINITIONS_CACHE_DIR.get()
+    if directory is None:
+        return None
+    return Path(directory).expanduser() / f"attribute-definitions-{key[:32]}.json"
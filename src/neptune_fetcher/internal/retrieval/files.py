@@ -12,17 +12,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import hashlib
 import pathlib
 from dataclasses import dataclass
 from typing import (
+    TYPE_CHECKING,
     Literal,
     Optional,
 )
 
-import azure.core.exceptions
-from azure.storage.blob import BlobClient
-
 from neptune_fetcher.generated.neptune_api.api.storage import signed_url
 from neptune_fetcher.generated.neptune_api.client import AuthenticatedClient
 from neptune_fetcher.generated.neptune_api.models import (
@@ -33,10 +32,23 @@ from neptune_fetcher.generated.neptune_api.models import (
 )
 
 from .. import (
+    cancellation,
     env,
     identifiers,
 )
-from ..retrieval import retry
+from ..lazy import lazy_import
+from ..retrieval import (
+    retry,
+    util,
+)
+
+# azure-storage-blob is only needed to download files
+if TYPE_CHECKING:
+    import azure.core.exceptions as azure_exceptions
+    import azure.storage.blob as azure_blob
+else:
+    azure_exceptions = lazy_import("azure.core.exceptions")
+    azure_blob = lazy_import("azure.storage.blob")
 
 
 @dataclass(frozen=True)
@@ -51,16 +63,41 @@ def fetch_signed_urls(
     file_paths: list[str],
     permission: Literal["read", "write"] = "read",
 ) -> list[SignedFile]:
-    body = CreateSignedUrlsRequest(
+    body = _make_signed_urls_request(project_identifier, file_paths, permission)
+
+    response = retry.handle_errors_default(signed_url.sync_detailed)(client=client, body=body)
+
+    return _process_signed_urls_response(response.parsed)
+
+
+async def fetch_signed_urls_async(
+    client: AuthenticatedClient,
+    project_identifier: identifiers.ProjectIdentifier,
+    file_paths: list[str],
+    permission: Literal["read", "write"] = "read",
+) -> list[SignedFile]:
+    body = _make_signed_urls_request(project_identifier, file_paths, permission)
+
+    async with util.request_slots():
+        response = await retry.handle_errors_default_async(signed_url.asyncio_detailed)(client=client, body=body)
+
+    return _process_signed_urls_response(response.parsed)
+
+
+def _make_signed_urls_request(
+    project_identifier: identifiers.ProjectIdentifier,
+    file_paths: list[str],
+    permission: Literal["read", "write"],
+) -> CreateSignedUrlsRequest:
+    return CreateSignedUrlsRequest(
         files=[
             FileToSign(project_identifier=project_identifier, path=file_path, permission=Permission(permission))
             for file_path in file_paths
         ]
     )
 
-    response = retry.handle_errors_default(signed_url.sync_detailed)(client=client, body=body)
 
-    data: Optional[CreateSignedUrlsResponse] = response.parsed
+def _process_signed_urls_response(data: Optional[CreateSignedUrlsResponse]) -> list[SignedFile]:
     if data is None:
         raise RuntimeError("Failed to fetch signed URLs: response parsed content is None")
 
@@ -75,9 +112,10 @@ def download_file(
 ) -> pathlib.Path:
     target_path.parent.mkdir(parents=True, exist_ok=True)
     with open(target_path, mode="wb") as opened:
-        blob_client = BlobClient.from_blob_url(signed_url)
+        blob_client = azure_blob.BlobClient.from_blob_url(signed_url)
         download_stream = blob_client.download_blob(max_concurrency=max_concurrency, timeout=timeout)
         for chunk in download_stream.chunks():
+            cancellation.raise_if_cancelled()
             opened.write(chunk)
     return target_path
 
@@ -96,9 +134,9 @@ def download_file_retry(
                 signed_url=signed_file.url,
                 target_path=target_path,
             )
-        except azure.core.exceptions.ResourceNotFoundError:
+        except azure_exceptions.ResourceNotFoundError:
             return None
-        except azure.core.exceptions.ClientAuthenticationError:
+        except azure_exceptions.ClientAuthenticationError:
             if attempt >= retries:
                 raise
             attempt += 1
@@ -109,6 +147,34 @@ def download_file_retry(
             )[0]
 
 
+async def download_file_retry_async(
+    client: AuthenticatedClient,
+    project_identifier: identifiers.ProjectIdentifier,
+    signed_file: SignedFile,
+    target_path: pathlib.Path,
+    retries: int = 3,
+) -> Optional[pathlib.Path]:
+    # The async Azure SDK requires aiohttp, which is not a dependency of neptune-fetcher, so the blob itself is
+    # downloaded in a thread. Only the requests to Neptune are sent from the event loop.
+    attempt = 0
+    while True:
+        try:
+            return await asyncio.to_thread(download_file, signed_url=signed_file.url, target_path=target_path)
+        except azure_exceptions.ResourceNotFoundError:
+            return None
+        except azure_exceptions.ClientAuthenticationError:
+            if attempt >= retries:
+                raise
+            attempt += 1
+            signed_file = (
+                await fetch_signed_urls_async(
+                    client=client,
+                    project_identifier=project_identifier,
+                    file_paths=[signed_file.path],
+                )
+            )[0]
+
+
 def create_target_path(destination: pathlib.Path, experiment_name: str, attribute_path: str) -> pathlib.Path:
     relative_target_path = pathlib.Path(".") / experiment_name / attribute_path
 
@@ -0,0 +1,295 @@
+#
+# Copyright (c) 2025, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+import math
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Optional,
+    TypeVar,
+)
+
+from neptune_fetcher.generated.neptune_api.types import Response
+
+from .. import (
+    cancellation,
+    env,
+)
+from . import util
+from .adaptive_concurrency import max_concurrent_requests
+
+__all__ = ("HEDGED_ENDPOINTS", "LatencyHistogram", "get_latency_histogram", "hedge_requests", "hedge_requests_async")
+
+T = TypeVar("T")
+
+# Upper bound of the first bucket of the latency histograms, and the ratio of the bounds of consecutive buckets
+_MIN_LATENCY_SECONDS = 0.001
+_BUCKET_GROWTH = 1.2
+_BUCKETS = 80
+# The number of samples needed before the percentiles of an endpoint are trusted
+_MIN_SAMPLES = 20
+# All counts are halved after this many samples, so that the histogram follows changes of the backend latency
+_DECAY_SAMPLES = 1000
+# At most this fraction of the requests to an endpoint is hedged, which bounds the extra load on the backend
+_MAX_HEDGE_RATIO = 0.1
+# The idempotent endpoints that only read data, so that sending a request twice is safe
+HEDGED_ENDPOINTS = frozenset(
+    f"neptune_fetcher.generated.neptune_api.api.retrieval.{endpoint}"
+    for endpoint in (
+        "get_attributes_with_paths_filter_proto",
+        "get_multiple_float_series_values_proto",
+        "get_series_values_proto",
+        "query_attribute_definitions_proto",
+        "query_attribute_definitions_within_project",
+        "query_attributes_within_project_proto",
+        "search_global_leaderboard_entries_proto",
+        "search_leaderboard_entries_proto",
+    )
+)
+# How often a call waiting for its attempts checks whether its work was cancelled
+_CANCELLATION_POLL_SECONDS = 0.1
+
+
+class LatencyHistogram:
+    """
+    Latencies of the recent successful requests to an endpoint, in log-spaced buckets.
+
+    Also counts the hedged requests, so that the fraction of hedged requests stays bounded.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = [0] * _BUCKETS
+        self._samples = 0
+        self._requests = 0
+        self._hedges = 0
+
+    @property
+    def samples(self) -> int:
+        return self._samples
+
+    def record(self, latency: float) -> None:
+        index = 0
+        if latency > _MIN_LATENCY_SECONDS:
+            index = min(_BUCKETS - 1, math.ceil(math.log(latency / _MIN_LATENCY_SECONDS, _BUCKET_GROWTH)))
+
+        with self._lock:
+            self._counts[index] += 1
+            self._samples += 1
+            if self._samples >= _DECAY_SAMPLES:
+                self._counts = [count // 2 for count in self._counts]
+                self._samples = sum(self._counts)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Return the upper bound of the bucket holding the given percentile of the latencies, or None if there are too
+        few samples.
+        """
+        with self._lock:
+            if self._samples < _MIN_SAMPLES:
+                return None
+            rank = self._samples * percentile / 100
+            seen = 0
+            for index, count in enumerate(self._counts):
+                seen += count
+                if seen >= rank:
+                    return _MIN_LATENCY_SECONDS * _BUCKET_GROWTH**index
+            return _MIN_LATENCY_SECONDS * _BUCKET_GROWTH ** (_BUCKETS - 1)
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._requests += 1
+            if self._requests >= _DECAY_SAMPLES:
+                self._requests //= 2
+                self._hedges //= 2
+
+    def acquire_hedge(self) -> bool:
+        """
+        Count a hedged request, unless it would push the fraction of hedged requests over the limit.
+        """
+        with self._lock:
+            if self._hedges + 1 > _MAX_HEDGE_RATIO * self._requests:
+                return False
+            self._hedges += 1
+            return True
+
+
+_histograms: dict[str, LatencyHistogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def get_latency_histogram(endpoint: str) -> LatencyHistogram:
+    with _histograms_lock:
+        histogram = _histograms.get(endpoint)
+        if histogram is None:
+            histogram = _histograms[endpoint] = LatencyHistogram()
+        return histogram
+
+
+def _hedge_delay(histogram: LatencyHistogram) -> Optional[float]:
+    if not env.NEPTUNE_FETCHER_HEDGE_REQUESTS.get():
+        return None
+    histogram.record_request()
+    return histogram.percentile(env.NEPTUNE_FETCHER_HEDGE_PERCENTILE.get())
+
+
+def _is_success(response: Response) -> bool:
+    return 200 <= response.status_code.value < 300
+
+
+def hedge_requests(func: Callable[..., Response[T]]) -> Callable[..., Response[T]]:
+    """
+    If a request takes longer than the configured percentile of the latencies of its endpoint, send an identical
+    request, and return the response of whichever succeeds first. Only applied to the endpoints in `HEDGED_ENDPOINTS`,
+    other functions are returned unchanged.
+
+    Applied below the rate and concurrency limiters, so that the latencies are those of the requests alone, without
+    the time spent waiting for the limiters, and a hedge is sent within the slot already taken by its request instead
+    of queueing for another one.
+
+    Until the latencies of the endpoint are known, the request is sent in the calling thread. Otherwise, the attempts
+    run in the shared pool of hedged request threads, so that the call can return as soon as either succeeds.
+    Each attempt has its own cancellation token, and the one that lost the race is cancelled: the response it is
+    waiting for is discarded. If neither succeeds, the outcome of the first attempt is returned.
+    """
+    if func.__module__ not in HEDGED_ENDPOINTS:
+        return func
+
+    histogram = get_latency_histogram(func.__module__)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        delay = _hedge_delay(histogram)
+        if delay is None:
+            return _timed(histogram, func, args, kwargs)
+
+        attempts = [_start_attempt(histogram, func, args, kwargs)]
+        try:
+            _wait([attempt.future for attempt in attempts], timeout=delay)
+            if not attempts[0].future.done() and histogram.acquire_hedge():
+                attempts.append(_start_attempt(histogram, func, args, kwargs))
+
+            pending = {attempt.future for attempt in attempts}
+            while pending:
+                done, pending = _wait(pending, timeout=None)
+                for future in done:
+                    if future.exception() is None and _is_success(future.result()):
+                        return future.result()
+            return attempts[0].future.result()
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    return wrapper
+
+
+def _timed(histogram: LatencyHistogram, func: Callable[..., Response[T]], args: tuple, kwargs: dict) -> Response[T]:
+    started_at = time.monotonic()
+    response = func(*args, **kwargs)
+    if _is_success(response):
+        histogram.record(time.monotonic() - started_at)
+    return response
+
+
+@dataclass
+class _Attempt(Generic[T]):
+    future: Future[Response[T]]
+    token: cancellation.CancellationToken
+
+    def cancel(self) -> None:
+        if not self.future.cancel():
+            self.token.cancel()
+
+
+def _start_attempt(
+    histogram: LatencyHistogram, func: Callable[..., Response[T]], args: tuple, kwargs: dict
+) -> _Attempt[T]:
+    token = cancellation.CancellationToken(parent=cancellation.current_token())
+    return _Attempt(future=_executor.submit(token, _timed, histogram, func, args, kwargs), token=token)
+
+
+# The primary attempts and the hedges of all requests that may be in flight at once
+_executor = util.SharedExecutor("neptune-hedged-request", lambda: 2 * max_concurrent_requests())
+
+
+def _wait(attempts: Any, timeout: Optional[float]) -> tuple[set[Future], set[Future]]:
+    """
+    Wait until one of the attempts is done or the timeout passes, checking for cancellation in the meantime.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        cancellation.raise_if_cancelled()
+        poll = _CANCELLATION_POLL_SECONDS
+        if deadline is not None:
+            poll = min(poll, deadline - time.monotonic())
+        done, pending = concurrent.futures.wait(
+            attempts, timeout=max(poll, 0), return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        if done or (deadline is not None and time.monotonic() >= deadline):
+            return done, pending
+
+
+def hedge_requests_async(func: Callable[..., Awaitable[Response[T]]]) -> Callable[..., Awaitable[Response[T]]]:
+    """
+    See `hedge_requests`. The attempts run as tasks of the running event loop.
+    """
+    if func.__module__ not in HEDGED_ENDPOINTS:
+        return func
+
+    histogram = get_latency_histogram(func.__module__)
+
+    async def timed(*args: Any, **kwargs: Any) -> Response[T]:
+        started_at = time.monotonic()
+        response = await func(*args, **kwargs)
+        if _is_success(response):
+            histogram.record(time.monotonic() - started_at)
+        return response
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        delay = _hedge_delay(histogram)
+        if delay is None:
+            return await timed(*args, **kwargs)
+
+        attempts = [asyncio.ensure_future(timed(*args, **kwargs))]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done and histogram.acquire_hedge():
+                attempts.append(asyncio.ensure_future(timed(*args, **kwargs)))
+
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None and _is_success(attempt.result()):
+                        return attempt.result()
+            return attempts[0].result()
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+
+    return wrapper
@@ -13,23 +13,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import functools as ft
+import itertools
 import logging
 from typing import (
     Any,
     Optional,
+    Sequence,
     Union,
 )
 
+import numpy as np
+
 from neptune_fetcher.generated.neptune_api.api.retrieval import get_multiple_float_series_values_proto
 from neptune_fetcher.generated.neptune_api.client import AuthenticatedClient
-from neptune_fetcher.generated.neptune_api.models import FloatTimeSeriesValuesRequest
 from neptune_fetcher.generated.neptune_api.proto.neptune_pb.api.v1.model.series_values_pb2 import (
     ProtoFloatSeriesValuesResponseDTO,
 )
 
 from .. import identifiers
 from ..retrieval import (
+    metrics_decoding,
     retry,
     util,
 )
@@ -48,6 +53,31 @@ FloatPointValue = tuple[float, float, float, bool, float]
 
 TOTAL_POINT_LIMIT: int = 1_000_000
 
+# The points of a series: a list of tuples, or a structured array of metrics_decoding.POINT_DTYPE, with fields in the
+# same order, if the response was decoded in the process pool
+FloatPoints = Union[list[FloatPointValue], np.ndarray]
+
+# The request id and the points of each series in a response
+_DecodedMetricsPage = Sequence[tuple[str, FloatPoints]]
+
+
+def join_points(chunks: Sequence[FloatPoints]) -> FloatPoints:
+    """
+    Return the points of all `chunks` in order: a list if all of them are lists, or a structured array otherwise.
+    The chunks are joined in a single pass, so they should be collected first rather than joined page by page.
+    """
+    if all(isinstance(chunk, list) for chunk in chunks):
+        if len(chunks) == 1:
+            return chunks[0]
+        return list(itertools.chain.from_iterable(chunks))
+    return np.concatenate([_as_array(chunk) for chunk in chunks])
+
+
+def _as_array(points: FloatPoints) -> np.ndarray:
+    if isinstance(points, np.ndarray):
+        return points
+    return np.array(points, dtype=metrics_decoding.POINT_DTYPE)
+
 
 def fetch_multiple_series_values(
     client: AuthenticatedClient,
@@ -56,10 +86,66 @@ def fetch_multiple_series_values(
     include_preview: bool,
     step_range: tuple[Union[float, None], Union[float, None]] = (None, None),
     tail_limit: Optional[int] = None,
-) -> dict[identifiers.RunAttributeDefinition, list[FloatPointValue]]:
+) -> dict[identifiers.RunAttributeDefinition, FloatPoints]:
     if not run_attribute_definitions:
         return {}
 
+    request_id_to_attribute, params = _make_metrics_params(
+        run_attribute_definitions, include_inherited, include_preview, step_range, tail_limit
+    )
+    results: dict[identifiers.RunAttributeDefinition, list[FloatPoints]] = {
+        run_attribute: [] for run_attribute in run_attribute_definitions
+    }
+
+    for page_result in util.fetch_pages(
+        client=client,
+        fetch_page=_fetch_metrics_page,
+        process_page=ft.partial(_process_metrics_page, request_id_to_attribute=request_id_to_attribute),
+        make_new_page_params=ft.partial(_make_new_metrics_page_params, tail_limit=tail_limit, fetched_points={}),
+        params=params,
+    ):
+        _add_page_to_results(results, page_result, tail_limit)
+
+    return {attribute: join_points(chunks) for attribute, chunks in results.items()}
+
+
+async def fetch_multiple_series_values_async(
+    client: AuthenticatedClient,
+    run_attribute_definitions: list[identifiers.RunAttributeDefinition],
+    include_inherited: bool,
+    include_preview: bool,
+    step_range: tuple[Union[float, None], Union[float, None]] = (None, None),
+    tail_limit: Optional[int] = None,
+) -> dict[identifiers.RunAttributeDefinition, FloatPoints]:
+    if not run_attribute_definitions:
+        return {}
+
+    request_id_to_attribute, params = _make_metrics_params(
+        run_attribute_definitions, include_inherited, include_preview, step_range, tail_limit
+    )
+    results: dict[identifiers.RunAttributeDefinition, list[FloatPoints]] = {
+        run_attribute: [] for run_attribute in run_attribute_definitions
+    }
+
+    async for page_result in util.fetch_pages_async(
+        client=client,
+        fetch_page=_fetch_metrics_page_async,
+        process_page=ft.partial(_process_metrics_page, request_id_to_attribute=request_id_to_attribute),
+        make_new_page_params=ft.partial(_make_new_metrics_page_params, tail_limit=tail_limit, fetched_points={}),
+        params=params,
+    ):
+        _add_page_to_results(results, page_result, tail_limit)
+
+    return {attribute: join_points(chunks) for attribute, chunks in results.items()}
+
+
+def _make_metrics_params(
+    run_attribute_definitions: list[identifiers.RunAttributeDefinition],
+    include_inherited: bool,
+    include_preview: bool,
+    step_range: tuple[Union[float, None], Union[float, None]],
+    tail_limit: Optional[int],
+) -> tuple[dict[str, identifiers.RunAttributeDefinition], dict[str, Any]]:
     assert len(run_attribute_definitions) <= TOTAL_POINT_LIMIT, (
         f"The number of requested attributes {len(run_attribute_definitions)} exceeds the maximum limit of "
         f"{TOTAL_POINT_LIMIT}. Please reduce the number of attributes."
@@ -89,75 +175,89 @@ def fetch_multiple_series_values(
         "stepRange": {"from": step_range[0], "to": step_range[1]},
         "order": "ascending" if not tail_limit else "descending",
     }
+    return request_id_to_attribute, params
 
-    results: dict[identifiers.RunAttributeDefinition, list[FloatPointValue]] = {
-        run_attribute: [] for run_attribute in run_attribute_definitions
-    }
-
-    for page_result in util.fetch_pages(
-        client=client,
-        fetch_page=_fetch_metrics_page,
-        process_page=ft.partial(_process_metrics_page, request_id_to_attribute=request_id_to_attribute),
-        make_new_page_params=ft.partial(
-            _make_new_metrics_page_params,
-            request_id_to_attribute=request_id_to_attribute,
-            tail_limit=tail_limit,
-            partial_results=results,
-        ),
-        params=params,
-    ):
-        for attribute, values in page_result.items:
-            sorted_values = values if tail_limit else reversed(values)
-            results[attribute].extend(sorted_values)
 
-    return results
+def _add_page_to_results(
+    results: dict[identifiers.RunAttributeDefinition, list[FloatPoints]],
+    page_result: util.Page[tuple[identifiers.RunAttributeDefinition, FloatPoints]],
+    tail_limit: Optional[int],
+) -> None:
+    for attribute, values in page_result.items:
+        sorted_values = values if tail_limit else values[::-1]
+        results[attribute].append(sorted_values)
 
 
 def _fetch_metrics_page(
     client: AuthenticatedClient,
     params: dict[str, Any],
-) -> ProtoFloatSeriesValuesResponseDTO:
-    body = FloatTimeSeriesValuesRequest.from_dict(params)
+) -> _DecodedMetricsPage:
+    fetch = util.accepting_json_body(retry.handle_errors_default(get_multiple_float_series_values_proto.sync_detailed))
+    response = fetch(client=client, body=util.JsonBody(params))
 
-    response = retry.handle_errors_default(get_multiple_float_series_values_proto.sync_detailed)(
-        client=client, body=body
+    if metrics_decoding.should_offload(response.content):
+        return metrics_decoding.decode_float_series(response.content)
+    return _decode_metrics_page(response.content)
+
+
+async def _fetch_metrics_page_async(
+    client: AuthenticatedClient,
+    params: dict[str, Any],
+) -> _DecodedMetricsPage:
+    fetch = util.accepting_json_body(
+        retry.handle_errors_default_async(get_multiple_float_series_values_proto.asyncio_detailed)
     )
+    response = await fetch(client=client, body=util.JsonBody(params))
 
-    dto: ProtoFloatSeriesValuesResponseDTO = ProtoFloatSeriesValuesResponseDTO.FromString(response.content)
-    return dto
+    if metrics_decoding.should_offload(response.content):
+        return await asyncio.to_thread(metrics_decoding.decode_float_series, response.content)
+    return _decode_metrics_page(response.content)
+
+
+def _decode_metrics_page(content: bytes) -> _DecodedMetricsPage:
+    dto: ProtoFloatSeriesValuesResponseDTO = ProtoFloatSeriesValuesResponseDTO.FromString(content)
+    return [
+        (
+            series.requestId,
+            [
+                (
+                    point.timestamp_millis,
+                    point.step,
+                    point.value,
+                    point.is_preview,
+                    point.completion_ratio,
+                )
+                for point in series.series.values
+            ],
+        )
+        for series in dto.series
+    ]
 
 
 def _process_metrics_page(
-    data: ProtoFloatSeriesValuesResponseDTO,
+    data: _DecodedMetricsPage,
     request_id_to_attribute: dict[str, identifiers.RunAttributeDefinition],
-) -> util.Page[tuple[identifiers.RunAttributeDefinition, list[FloatPointValue]]]:
-    result = {}
-    for series in data.series:
-        run_attribute = request_id_to_attribute[series.requestId]
-        result[run_attribute] = [
-            (
-                point.timestamp_millis,
-                point.step,
-                point.value,
-                point.is_preview,
-                point.completion_ratio,
-            )
-            for point in series.series.values
-        ]
+) -> util.Page[tuple[identifiers.RunAttributeDefinition, FloatPoints]]:
+    result = {request_id_to_attribute[request_id]: points for request_id, points in data}
     return util.Page(items=list(result.items()))
 
 
 def _make_new_metrics_page_params(
     params: dict[str, Any],
-    data: Optional[ProtoFloatSeriesValuesResponseDTO],
-    request_id_to_attribute: dict[str, identifiers.RunAttributeDefinition],
+    data: Optional[_DecodedMetricsPage],
     tail_limit: Optional[int],
-    partial_results: dict[identifiers.RunAttributeDefinition, list[FloatPointValue]],
+    fetched_points: dict[str, int],
 ) -> Optional[dict[str, Any]]:
+    """
+    `fetched_points` counts the points fetched so far for each request id. It's updated here from each page, rather
+    than read from the results of the caller, since with prefetching the params of the next page are made before the
+    caller has added the current one to its results.
+    """
     if data is None:  # no past data, we are fetching the first page
         for request in params["requests"]:
             if "afterStep" in request:
                 del request["afterStep"]
+        fetched_points.clear()
         per_series_points_limit = max(1, TOTAL_POINT_LIMIT // len(params["requests"]))
         if tail_limit is not None:
             per_series_points_limit = min(per_series_points_limit, tail_limit)
@@ -167,16 +267,15 @@ def _make_new_metrics_page_params(
     prev_per_series_points_limit = params["perSeriesPointsLimit"]
 
     new_request_after_steps = {}
-    for series in data.series:
-        request_id = series.requestId
-        value_size = len(series.series.values)
+    for request_id, points in data:
+        value_size = len(points)
         is_page_full = value_size == prev_per_series_points_limit
 
-        attribute = request_id_to_attribute[request_id]
-        need_more_points = len(partial_results[attribute]) < tail_limit if tail_limit is not None else True
+        fetched_points[request_id] = fetched_points.get(request_id, 0) + value_size
+        need_more_points = fetched_points[request_id] < tail_limit if tail_limit is not None else True
 
         if is_page_full and need_more_points:
-            new_request_after_steps[request_id] = series.series.values[-1].step
+            new_request_after_steps[request_id] = float(points[-1][StepIndex])
 
     if not new_request_after_steps:  # no data left to fetch, return None to stop
         return None
@@ -193,7 +292,7 @@ def _make_new_metrics_page_params(
     per_series_points_limit = max(1, TOTAL_POINT_LIMIT // len(params["requests"]))
     if tail_limit is not None:
         already_fetched = next(
-            len(partial_results[request_id_to_attribute[request_id]]) for request_id in new_request_after_steps.keys()
+            fetched_points[request_id] for request_id in new_request_after_steps.keys()
         )  # assumes the results for all unfinished series have the same length
         per_series_points_limit = min(per_series_points_limit, tail_limit - already_fetched)
     params["perSeriesPointsLimit"] = per_series_points_limit
@@ -0,0 +1,168 @@
+#
+# Copyright (c) 2025, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Decoding of metric values responses in a pool of processes.
+
+Decoding a protobuf response and building a Python object per point holds the GIL, so with many workers
+fetching metrics a single core becomes the bottleneck. When `NEPTUNE_FETCHER_DECODING_PROCESSES` is set, large
+responses are decoded in a process pool instead. A worker process writes the points into a compact numeric buffer
+in shared memory, and the fetching thread only copies that buffer into a structured array. The points stay in arrays
+until the DataFrame is built, so no Python object is created per point.
+"""
+
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+from neptune_fetcher.generated.neptune_api.proto.neptune_pb.api.v1.model.series_values_pb2 import (
+    ProtoFloatSeriesValuesResponseDTO,
+)
+
+from .. import env
+
+__all__ = (
+    "is_enabled",
+    "should_offload",
+    "decode_float_series",
+    "shutdown_decoding_pool",
+)
+
+# The layout of a point in the shared buffer. The fields follow the order of metrics.FloatPointValue
+POINT_DTYPE = np.dtype(
+    [
+        ("timestamp", "int64"),
+        ("step", "float64"),
+        ("value", "float64"),
+        ("is_preview", "bool"),
+        ("completion_ratio", "float64"),
+    ]
+)
+
+# Smaller responses are decoded in the fetching thread, as sending them to another process would cost more
+_MIN_OFFLOADED_RESPONSE_BYTES = 256 * 2**10
+
+# (request id, the offset of the first point of the series in the buffer, the number of points)
+_SeriesIndex = list[tuple[str, int, int]]
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return env.NEPTUNE_FETCHER_DECODING_PROCESSES.get() is not None
+
+
+def should_offload(content: bytes) -> bool:
+    return len(content) >= _MIN_OFFLOADED_RESPONSE_BYTES and is_enabled()
+
+
+def decode_float_series(content: bytes) -> list[tuple[str, np.ndarray]]:
+    """
+    Decode a serialized ProtoFloatSeriesValuesResponseDTO in the process pool.
+    Returns the request id and the structured array of POINT_DTYPE points of each series in the response.
+    """
+    buffer_name, index = _get_decoding_pool().submit(_decode_to_shared_memory, content).result()
+    if buffer_name is None:
+        return [(request_id, np.empty((0,), dtype=POINT_DTYPE)) for request_id, _, _ in index]
+
+    buffer = shared_memory.SharedMemory(name=buffer_name)
+    try:
+        total = sum(count for _, _, count in index)
+        shared_points = np.ndarray((total,), dtype=POINT_DTYPE, buffer=buffer.buf)
+        points = shared_points.copy()
+        del shared_points  # the buffer can't be closed while an array refers to it
+    finally:
+        buffer.close()
+        buffer.unlink()
+
+    return [(request_id, points[offset : offset + count]) for request_id, offset, count in index]
+
+
+def _decode_to_shared_memory(content: bytes) -> tuple[Optional[str], _SeriesIndex]:
+    # Runs in a worker process
+    dto = ProtoFloatSeriesValuesResponseDTO.FromString(content)
+
+    index: _SeriesIndex = []
+    offset = 0
+    for series in dto.series:
+        count = len(series.series.values)
+        index.append((series.requestId, offset, count))
+        offset += count
+
+    if offset == 0:
+        return None, index
+
+    buffer = shared_memory.SharedMemory(create=True, size=offset * POINT_DTYPE.itemsize)
+    try:
+        points = np.ndarray((offset,), dtype=POINT_DTYPE, buffer=buffer.buf)
+        for series, (_, start, count) in zip(dto.series, index):
+            points[start : start + count] = np.array(
+                [
+                    (point.timestamp_millis, point.step, point.value, point.is_preview, point.completion_ratio)
+                    for point in series.series.values
+                ],
+                dtype=POINT_DTYPE,
+            )
+        del points
+    except BaseException:
+        buffer.close()
+        buffer.unlink()
+        raise
+
+    buffer.close()
+    return buffer.name, index
+
+
+def _get_decoding_pool() -> ProcessPoolExecutor:
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            # Forking a process with running worker threads is unsafe, so the workers are always spawned
+            _pool = ProcessPoolExecutor(
+                max_workers=env.NEPTUNE_FETCHER_DECODING_PROCESSES.get() or os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def shutdown_decoding_pool() -> None:
+    global _pool
+
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
+
+def _reset_decoding_pool_after_fork() -> None:
+    global _pool, _pool_lock
+
+    _pool = None
+    _pool_lock = threading.Lock()
+
+
+atexit.register(shutdown_decoding_pool)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_decoding_pool_after_fork)
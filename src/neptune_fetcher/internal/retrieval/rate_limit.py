@@ -0,0 +1,131 @@
+#
+# Copyright (c) 2025, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from typing import (
+    Any,
+    Optional,
+)
+
+from .. import env
+from .client_registry import ClientRegistry
+
+# Requests that may be sent at once after an idle period, in seconds of the rate
+_BURST_SECONDS = 1.0
+# How long all requests are paused after a 429 response without a retry-after header
+_DEFAULT_PAUSE_SECONDS = 1.0
+_DECREASE_FACTOR = 0.5
+_MIN_REQUESTS_PER_SECOND = 1.0
+# The number of recent requests used to estimate the request rate when no rate is set
+_RATE_SAMPLES = 100
+
+
+class RateLimiter:
+    """
+    Spaces out the requests sent with a single client to stay under the rate limits of the backend.
+
+    Each request reserves the earliest time it may be sent at and waits until then, so requests are sent in the order
+    in which they were reserved. The budgets are:
+    - requests per second, with bursts of up to a second worth of requests after an idle period,
+    - bytes of responses per second, charged once a response is received, which delays the following requests,
+    - a pause of all requests for the duration given by the `retry-after` header of a 429 response.
+
+    A 429 response also halves the request rate, starting from the rate observed before it if no rate is set.
+    While requests succeed, the rate grows back by about one request per second every second, up to the configured
+    rate, if any.
+    """
+
+    def __init__(self, requests_per_second: Optional[float] = None, bytes_per_second: Optional[float] = None):
+        self._max_rate = requests_per_second
+        self._rate = requests_per_second
+        self._bytes_rate = bytes_per_second
+
+        self._lock = threading.Lock()
+        # The theoretical arrival time of the next request and byte, as in the generic cell rate algorithm
+        self._next_request_time = float("-inf")
+        self._next_byte_time = float("-inf")
+        self._paused_until = float("-inf")
+        self._recent_requests: collections.deque[float] = collections.deque(maxlen=_RATE_SAMPLES)
+
+    @property
+    def requests_per_second(self) -> Optional[float]:
+        return self._rate
+
+    def reserve(self) -> float:
+        """
+        Reserve the earliest time a request may be sent at, and return how many seconds to wait until then.
+        """
+        with self._lock:
+            now = time.monotonic()
+            send_at = max(now, self._paused_until, self._next_byte_time - _BURST_SECONDS)
+
+            if self._rate is not None:
+                send_at = max(send_at, self._next_request_time - _BURST_SECONDS)
+                self._next_request_time = max(self._next_request_time, send_at) + 1 / self._rate
+
+            self._recent_requests.append(send_at)
+            return send_at - now
+
+    def record_response(self, status_code: int, retry_after: Optional[float], size_bytes: int) -> None:
+        with self._lock:
+            now = time.monotonic()
+
+            if self._bytes_rate is not None and size_bytes > 0:
+                self._next_byte_time = max(self._next_byte_time, now) + size_bytes / self._bytes_rate
+
+            if status_code == 429:
+                # Requests in flight during a pause get 429 as well, but only the first one tightens the rate
+                if now >= self._paused_until:
+                    rate = self._rate if self._rate is not None else self._observed_rate()
+                    if rate is not None:
+                        self._rate = max(_MIN_REQUESTS_PER_SECOND, rate * _DECREASE_FACTOR)
+                pause = retry_after if retry_after is not None else _DEFAULT_PAUSE_SECONDS
+                self._paused_until = max(self._paused_until, now + pause)
+            elif 200 <= status_code < 300 and self._rate is not None:
+                if self._max_rate is None or self._rate < self._max_rate:
+                    self._rate += 1 / self._rate
+                    if self._max_rate is not None:
+                        self._rate = min(self._rate, self._max_rate)
+
+    def _observed_rate(self) -> Optional[float]:
+        if len(self._recent_requests) < 2:
+            return None
+        span = self._recent_requests[-1] - self._recent_requests[0]
+        if span <= 0:
+            return None
+        return (len(self._recent_requests) - 1) / span
+
+
+_limiters: ClientRegistry[RateLimiter] = ClientRegistry()
+
+
+def get_rate_limiter(client: Any) -> Optional[RateLimiter]:
+    """
+    Return the rate limiter shared by all requests sent with the client.
+    """
+    if client is None:
+        return None
+
+    return _limiters.get(
+        client,
+        lambda: RateLimiter(
+            requests_per_second=env.NEPTUNE_FETCHER_MAX_REQUESTS_PER_SECOND.get(),
+            bytes_per_second=env.NEPTUNE_FETCHER_MAX_BYTES_PER_SECOND.get(),
+        ),
+    )
@@ -15,6 +15,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import functools
 import json
 import logging
@@ -22,8 +24,11 @@ import random
 import time
 from typing import (
     Any,
+    Awaitable,
     Callable,
+    Generator,
     Literal,
+    NoReturn,
     Optional,
     TypeVar,
 )
@@ -34,7 +39,25 @@ import neptune_fetcher.generated.neptune_api.errors
 from neptune_fetcher.generated.neptune_api.types import Response
 
 from ... import exceptions
-from .. import env
+from .. import (
+    cancellation,
+    env,
+)
+from .adaptive_concurrency import get_concurrency_limiter
+from .circuit_breaker import (
+    RetryBudget,
+    get_circuit_breaker,
+    get_retry_budget,
+)
+from .coalescing import (
+    coalesce_requests,
+    coalesce_requests_async,
+)
+from .hedging import (
+    hedge_requests,
+    hedge_requests_async,
+)
+from .rate_limit import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -42,12 +65,29 @@ T = TypeVar("T")
 
 
 def handle_errors_default(func: Callable[..., Response[T]]) -> Callable[..., Response[T]]:
-    return retry_backoff(
-        max_tries=None,
-        soft_max_time=env.NEPTUNE_FETCHER_RETRY_SOFT_TIMEOUT.get(),
-        hard_max_time=env.NEPTUNE_FETCHER_RETRY_HARD_TIMEOUT.get(),
-        backoff_strategy=exponential_backoff(jitter="full"),
-    )(handle_api_errors(func))
+    return coalesce_requests(func)(
+        retry_backoff(
+            max_tries=None,
+            soft_max_time=env.NEPTUNE_FETCHER_RETRY_SOFT_TIMEOUT.get(),
+            hard_max_time=env.NEPTUNE_FETCHER_RETRY_HARD_TIMEOUT.get(),
+            backoff_strategy=exponential_backoff(jitter="full"),
+        )(break_circuit(limit_rate(limit_concurrency(hedge_requests(handle_api_errors(func))))))
+    )
+
+
+def handle_errors_default_async(func: Callable[..., Awaitable[Response[T]]]) -> Callable[..., Awaitable[Response[T]]]:
+    return coalesce_requests_async(func)(
+        retry_backoff_async(
+            max_tries=None,
+            soft_max_time=env.NEPTUNE_FETCHER_RETRY_SOFT_TIMEOUT.get(),
+            hard_max_time=env.NEPTUNE_FETCHER_RETRY_HARD_TIMEOUT.get(),
+            backoff_strategy=exponential_backoff(jitter="full"),
+        )(
+            break_circuit_async(
+                limit_rate_async(limit_concurrency_async(hedge_requests_async(handle_api_errors_async(func))))
+            )
+        )
+    )
 
 
 def exponential_backoff(
@@ -76,14 +116,11 @@ def retry_backoff(
     def decorator(func: Callable[..., Response[T]]) -> Callable[..., Response[T]]:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            total_tries = 0
-            backoff_tries = 0
-            start_time = time.monotonic()
-            last_exc = None
-            last_response = None
-            rate_limit_time_extension = 0.0
+            budget = get_retry_budget(kwargs.get("client"))
+            state = _RetryState(max_tries, soft_max_time, hard_max_time, backoff_strategy, budget)
 
             while True:
+                cancellation.raise_if_cancelled()
                 response = None
                 try:
                     response = func(*args, **kwargs)
@@ -93,91 +130,355 @@ def retry_backoff(
                 except exceptions.NeptuneError:
                     raise  # give up immediately on NeptuneError
                 except Exception as e:
-                    last_exc = e
-
-                if response is not None:
-                    last_response = response
-
-                total_tries += 1
-                backoff_tries += 1
-                if max_tries is not None and total_tries >= max_tries:
-                    break
-
-                if response is not None and "retry-after" in response.headers:
-                    sleep_time = float(response.headers["retry-after"])
-                    rate_limit_time_extension += sleep_time
-                    backoff_tries = 0  # reset backoff tries counter when using a different strategy
-                else:
-                    sleep_time = backoff_strategy(backoff_tries)
-
-                elapsed_time = time.monotonic() - start_time
-
-                remaining_time = float("inf")
-                if hard_max_time is not None:
-                    remaining_time = min(remaining_time, hard_max_time - elapsed_time)
-                if soft_max_time is not None:
-                    remaining_time = min(remaining_time, soft_max_time + rate_limit_time_extension - elapsed_time)
-                if remaining_time <= 0:
-                    break
-                sleep_time = min(remaining_time, sleep_time)
-                time.sleep(sleep_time)
-
-            # No more retries left
-            elapsed_time = time.monotonic() - start_time
-            if last_response:
-                error = exceptions.NeptuneRetryError(
-                    total_tries, elapsed_time, last_response.status_code.value, last_response.content
-                )
-            else:
-                error = exceptions.NeptuneRetryError(total_tries, elapsed_time)
-            if last_exc:
-                raise error from last_exc
-            else:
-                raise error
+                    state.last_exc = e
+
+                sleep_time = state.next_sleep_time(response)
+                if sleep_time is None:
+                    state.raise_retry_error()
+                cancellation.sleep(sleep_time)
 
         return wrapper
 
     return decorator
 
 
-def handle_api_errors(func: Callable[..., Response[T]]) -> Callable[..., Response[T]]:
+def retry_backoff_async(
+    max_tries: Optional[int] = None,
+    soft_max_time: Optional[float] = None,
+    hard_max_time: Optional[float] = None,
+    backoff_strategy: Callable[[int], float] = exponential_backoff(),
+) -> Callable[[Callable[..., Awaitable[Response[T]]]], Callable[..., Awaitable[Response[T]]]]:
+    def decorator(func: Callable[..., Awaitable[Response[T]]]) -> Callable[..., Awaitable[Response[T]]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            budget = get_retry_budget(kwargs.get("client"))
+            state = _RetryState(max_tries, soft_max_time, hard_max_time, backoff_strategy, budget)
+
+            while True:
+                response = None
+                try:
+                    response = await func(*args, **kwargs)
+
+                    if 200 <= response.status_code.value < 300:
+                        return response
+                except exceptions.NeptuneError:
+                    raise  # give up immediately on NeptuneError
+                except Exception as e:
+                    state.last_exc = e
+
+                sleep_time = state.next_sleep_time(response)
+                if sleep_time is None:
+                    state.raise_retry_error()
+                await asyncio.sleep(sleep_time)
+
+        return wrapper
+
+    return decorator
+
+
+class _RetryState:
+    """
+    Bookkeeping of a single retried call, shared by the sync and async variants of retry_backoff.
+    """
+
+    def __init__(
+        self,
+        max_tries: Optional[int],
+        soft_max_time: Optional[float],
+        hard_max_time: Optional[float],
+        backoff_strategy: Callable[[int], float],
+        budget: Optional[RetryBudget] = None,
+    ):
+        self._max_tries = max_tries
+        self._soft_max_time = soft_max_time
+        self._hard_max_time = hard_max_time
+        self._backoff_strategy = backoff_strategy
+        self._budget = budget
+        if budget is not None:
+            budget.record_request()
+
+        self.total_tries = 0
+        self._backoff_tries = 0
+        self._start_time = time.monotonic()
+        self._rate_limit_time_extension = 0.0
+        self.last_exc: Optional[Exception] = None
+        self.last_response: Optional[Response] = None
+
+    def next_sleep_time(self, response: Optional[Response]) -> Optional[float]:
+        """
+        Record a failed attempt and return how long to sleep before the next one, or None if there are no more retries
+        left.
+        """
+        if response is not None:
+            self.last_response = response
+
+        self.total_tries += 1
+        self._backoff_tries += 1
+        if self._max_tries is not None and self.total_tries >= self._max_tries:
+            return None
+
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        rate_limited = retry_after is not None
+        if retry_after is not None:
+            sleep_time = float(retry_after)
+            self._rate_limit_time_extension += sleep_time
+            self._backoff_tries = 0  # reset backoff tries counter when using a different strategy
+        else:
+            sleep_time = self._backoff_strategy(self._backoff_tries)
+
+        elapsed_time = time.monotonic() - self._start_time
+
+        remaining_time = float("inf")
+        if self._hard_max_time is not None:
+            remaining_time = min(remaining_time, self._hard_max_time - elapsed_time)
+        if self._soft_max_time is not None:
+            remaining_time = min(remaining_time, self._soft_max_time + self._rate_limit_time_extension - elapsed_time)
+        if remaining_time <= 0:
+            return None
+
+        # Retries requested by the server are spaced out by the rate limiter, so they don't use the budget
+        if not rate_limited and self._budget is not None and not self._budget.try_acquire_retry():
+            return None
+        return min(remaining_time, sleep_time)
+
+    def raise_retry_error(self) -> NoReturn:
+        # No more retries left
+        elapsed_time = time.monotonic() - self._start_time
+        if self.last_response:
+            error = exceptions.NeptuneRetryError(
+                self.total_tries, elapsed_time, self.last_response.status_code.value, self.last_response.content
+            )
+        else:
+            error = exceptions.NeptuneRetryError(self.total_tries, elapsed_time)
+        if self.last_exc:
+            raise error from self.last_exc
+        else:
+            raise error
+
+
+def break_circuit(func: Callable[..., Response[T]]) -> Callable[..., Response[T]]:
+    """
+    Fail the call without sending the request if the circuit breaker of the `client` passed to the call is open,
+    and report the outcome of the request to the breaker.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        breaker = get_circuit_breaker(kwargs.get("client"))
+        if breaker is None:
+            return func(*args, **kwargs)
+
+        probe = breaker.acquire()
+        if probe is None:
+            raise exceptions.NeptuneServiceUnavailableError(breaker.consecutive_failures, breaker.reset_timeout)
+
+        failed = None
+        try:
+            response = func(*args, **kwargs)
+            failed = _is_server_failure(response.status_code.value)
+            return response
+        except (exceptions.NeptuneError, cancellation.FetchCancelledError):
+            raise
+        except Exception:
+            failed = True
+            raise
+        finally:
+            breaker.release(probe, failed)
+
+    return wrapper
+
+
+def break_circuit_async(func: Callable[..., Awaitable[Response[T]]]) -> Callable[..., Awaitable[Response[T]]]:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        breaker = get_circuit_breaker(kwargs.get("client"))
+        if breaker is None:
+            return await func(*args, **kwargs)
+
+        probe = breaker.acquire()
+        if probe is None:
+            raise exceptions.NeptuneServiceUnavailableError(breaker.consecutive_failures, breaker.reset_timeout)
+
+        failed = None
+        try:
+            response = await func(*args, **kwargs)
+            failed = _is_server_failure(response.status_code.value)
+            return response
+        except exceptions.NeptuneError:
+            raise
+        except Exception:
+            failed = True
+            raise
+        finally:
+            breaker.release(probe, failed)
+
+    return wrapper
+
+
+def _is_server_failure(status_code: int) -> bool:
+    return 500 <= status_code < 600
+
+
+def limit_rate(func: Callable[..., Response[T]]) -> Callable[..., Response[T]]:
+    """
+    Wait until the rate limiter of the `client` passed to the call allows sending the request, and report the response
+    to the limiter.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        limiter = get_rate_limiter(kwargs.get("client"))
+        if limiter is None:
+            return func(*args, **kwargs)
+
+        delay = limiter.reserve()
+        if delay > 0:
+            cancellation.sleep(delay)
+
+        response = func(*args, **kwargs)
+        limiter.record_response(*_rate_limit_feedback(response))
+        return response
+
+    return wrapper
+
+
+def limit_rate_async(func: Callable[..., Awaitable[Response[T]]]) -> Callable[..., Awaitable[Response[T]]]:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        limiter = get_rate_limiter(kwargs.get("client"))
+        if limiter is None:
+            return await func(*args, **kwargs)
+
+        delay = limiter.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        response = await func(*args, **kwargs)
+        limiter.record_response(*_rate_limit_feedback(response))
+        return response
+
+    return wrapper
+
+
+def _rate_limit_feedback(response: Response) -> tuple[int, Optional[float], int]:
+    retry_after = None
+    if "retry-after" in response.headers:
+        try:
+            retry_after = float(response.headers["retry-after"])
+        except ValueError:
+            pass
+    size_bytes = len(response.content) if isinstance(response.content, bytes) else 0
+    return response.status_code.value, retry_after, size_bytes
+
+
+def limit_concurrency(func: Callable[..., Response[T]]) -> Callable[..., Response[T]]:
+    """
+    Hold a slot of the adaptive concurrency limiter of the `client` passed to the call for the duration of the request.
+    """
+
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        # In general, exceptions - subtypes of NeptuneError won't be retried - raising them makes the error final.
-        # Other exceptions may be retried with a backoff - if persistent, they will eventually cause NeptuneRetryError.
+        limiter = get_concurrency_limiter(kwargs.get("client"))
+        if limiter is None:
+            return func(*args, **kwargs)
+
+        limiter.acquire()
+        started_at = time.monotonic()
+        overloaded = None
+        try:
+            response = func(*args, **kwargs)
+            overloaded = _is_overloaded(response.status_code.value)
+            return response
+        except httpx.TransportError:
+            overloaded = True
+            raise
+        finally:
+            limiter.release(started_at, overloaded)
+
+    return wrapper
 
+
+def limit_concurrency_async(func: Callable[..., Awaitable[Response[T]]]) -> Callable[..., Awaitable[Response[T]]]:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        limiter = get_concurrency_limiter(kwargs.get("client"))
+        if limiter is None:
+            return await func(*args, **kwargs)
+
+        await limiter.acquire_async()
+        started_at = time.monotonic()
+        overloaded = None
         try:
+            response = await func(*args, **kwargs)
+            overloaded = _is_overloaded(response.status_code.value)
+            return response
+        except httpx.TransportError:
+            overloaded = True
+            raise
+        finally:
+            limiter.release(started_at, overloaded)
+
+    return wrapper
+
+
+def _is_overloaded(status_code: int) -> bool:
+    return status_code == 429 or 500 <= status_code < 600
+
+
+def handle_api_errors(func: Callable[..., Response[T]]) -> Callable[..., Response[T]]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with _translate_api_errors():
             response = func(*args, **kwargs)
 
             _raise_for_error_code(response.status_code.value, response.content)
             return response
-        except neptune_fetcher.generated.neptune_api.errors.ApiKeyRejectedError as e:
-            # The API token is explicitly rejected by the backend -- don't retry anymore.
-            raise exceptions.NeptuneInvalidCredentialsError() from e
-        except neptune_fetcher.generated.neptune_api.errors.UnableToParseResponse as e:
-            # Allow invalid 5xx errors to be retried - _raise_for_error_code will filter them out
-            # reraise the original error (to retry it) otherwise
-            if 500 <= e.response.status_code < 600:
-                raise
-            else:
-                raise exceptions.NeptuneUnexpectedResponseError(
-                    status_code=e.response.status_code,
-                    content=e.response.content,
-                )
-        except httpx.TimeoutException as e:
-            logger.warning(
-                "Neptune API request timed out. Retrying...\n"
-                "Check your network connection or increase the timeout by setting the "
-                f"{env.NEPTUNE_HTTP_REQUEST_TIMEOUT_SECONDS.name} environment variable "
-                f"(currently: {env.NEPTUNE_HTTP_REQUEST_TIMEOUT_SECONDS.get()} seconds)."
-            )
-            raise e
-        except Exception as e:
-            raise e
 
     return wrapper
 
 
+def handle_api_errors_async(func: Callable[..., Awaitable[Response[T]]]) -> Callable[..., Awaitable[Response[T]]]:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with _translate_api_errors():
+            response = await func(*args, **kwargs)
+
+            _raise_for_error_code(response.status_code.value, response.content)
+            return response
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def _translate_api_errors() -> Generator[None, None, None]:
+    # In general, exceptions - subtypes of NeptuneError won't be retried - raising them makes the error final.
+    # Other exceptions may be retried with a backoff - if persistent, they will eventually cause NeptuneRetryError.
+
+    try:
+        yield
+    except neptune_fetcher.generated.neptune_api.errors.ApiKeyRejectedError as e:
+        # The API token is explicitly rejected by the backend -- don't retry anymore.
+        raise exceptions.NeptuneInvalidCredentialsError() from e
+    except neptune_fetcher.generated.neptune_api.errors.UnableToParseResponse as e:
+        # Allow invalid 5xx errors to be retried - _raise_for_error_code will filter them out
+        # reraise the original error (to retry it) otherwise
+        if 500 <= e.response.status_code < 600:
+            raise
+        else:
+            raise exceptions.NeptuneUnexpectedResponseError(
+                status_code=e.response.status_code,
+                content=e.response.content,
+            )
+    except httpx.TimeoutException as e:
+        logger.warning(
+            "Neptune API request timed out. Retrying...\n"
+            "Check your network connection or increase the timeout by setting the "
+            f"{env.NEPTUNE_HTTP_REQUEST_TIMEOUT_SECONDS.name} environment variable "
+            f"(currently: {env.NEPTUNE_HTTP_REQUEST_TIMEOUT_SECONDS.get()} seconds)."
+        )
+        raise e
+
+
 def _raise_for_error_code(status_code: int, content: bytes) -> None:
     """
     Raise an exception for the given response status code and content if it indicates a permanent error.
@@ -12,11 +12,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import collections
 import functools as ft
+import logging
 from dataclasses import dataclass
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
 from enum import Enum
 from typing import (
     Any,
+    AsyncGenerator,
+    Awaitable,
     Callable,
     Generator,
     List,
@@ -24,21 +34,31 @@ from typing import (
     Optional,
     Protocol,
     TypeVar,
+    Union,
 )
 
-from neptune_fetcher.generated.neptune_api.api.retrieval import search_leaderboard_entries_proto
+from neptune_fetcher.generated.neptune_api.api.retrieval import (
+    search_global_leaderboard_entries_proto,
+    search_leaderboard_entries_proto,
+)
 from neptune_fetcher.generated.neptune_api.client import AuthenticatedClient
-from neptune_fetcher.generated.neptune_api.models import SearchLeaderboardEntriesParamsDTO
+from neptune_fetcher.generated.neptune_api.models import (
+    GlobalSearchParamsDTO,
+    SearchLeaderboardEntriesParamsDTO,
+)
 from neptune_fetcher.generated.neptune_api.proto.neptune_pb.api.v1.model.leaderboard_entries_pb2 import (
+    ProtoAttributesDTO,
     ProtoLeaderboardEntriesSearchResultDTO,
 )
 
 from .. import (
+    cancellation,
     env,
     identifiers,
 )
 from ..filters import (
     _Attribute,
+    _AttributeValuePredicate,
     _Filter,
 )
 from ..retrieval import (
@@ -46,6 +66,9 @@ from ..retrieval import (
     util,
 )
 from ..retrieval.attribute_types import map_attribute_type_python_to_backend
+from ..run_set import RunSet
+
+logger = logging.getLogger(__name__)
 
 _DIRECTION_PYTHON_TO_BACKEND_MAP: dict[str, str] = {
     "asc": "ascending",
@@ -136,6 +159,21 @@ class FetchSysAttrs(Protocol[T]):
         ...
 
 
+class FetchSysAttrsAsync(Protocol[T]):
+    def __call__(
+        self,
+        client: AuthenticatedClient,
+        project_identifier: identifiers.ProjectIdentifier,
+        filter_: Optional[_Filter] = None,
+        sort_by: _Attribute = _Attribute("sys/creation_time", type="datetime"),
+        sort_direction: Literal["asc", "desc"] = "desc",
+        limit: Optional[int] = None,
+        batch_size: int = env.NEPTUNE_FETCHER_SYS_ATTRS_BATCH_SIZE.get(),
+        container_type: ContainerType = ContainerType.EXPERIMENT,
+    ) -> AsyncGenerator[util.Page[T], None]:
+        ...
+
+
 def _create_fetch_sys_attrs(
     attribute_names: List[str],
     make_record: Callable[[dict[str, Any]], T],
@@ -151,33 +189,77 @@ def _create_fetch_sys_attrs(
         batch_size: int = env.NEPTUNE_FETCHER_SYS_ATTRS_BATCH_SIZE.get(),
         container_type: ContainerType = default_container_type,
     ) -> Generator[util.Page[T], None, None]:
-        params: dict[str, Any] = {
-            "attributeFilters": [{"path": attribute_name} for attribute_name in attribute_names],
-            "pagination": {"limit": batch_size},
-            "experimentLeader": container_type == ContainerType.EXPERIMENT,
-            "sorting": {
-                "dir": _map_direction(sort_direction),
-                "sortBy": {"name": sort_by.name},
-            },
-        }
-        if filter_ is not None:
-            params["query"] = {"query": str(filter_)}
-        if sort_by.aggregation is not None:
-            params["sorting"]["aggregationMode"] = sort_by.aggregation
-        if sort_by.type is not None:
-            params["sorting"]["sortBy"]["type"] = map_attribute_type_python_to_backend(sort_by.type)
-
-        return util.fetch_pages(
+        return _fetch_sys_attrs_pages(
             client=client,
             fetch_page=ft.partial(_fetch_sys_attrs_page, project_identifier=project_identifier),
             process_page=ft.partial(_process_sys_attrs_page, make_record=make_record),
-            make_new_page_params=ft.partial(_make_new_sys_attrs_page_params, batch_size=batch_size, limit=limit),
-            params=params,
+            params=_make_sys_attrs_params(
+                attribute_names, filter_, sort_by, sort_direction, batch_size, container_type
+            ),
+            batch_size=batch_size,
+            limit=limit,
+            keyset=_KeysetPagination.create(filter_, sort_by, sort_direction, batch_size, limit),
         )
 
     return fetch_sys_attrs
 
 
+def _create_fetch_sys_attrs_async(
+    attribute_names: List[str],
+    make_record: Callable[[dict[str, Any]], T],
+    default_container_type: ContainerType,
+) -> FetchSysAttrsAsync[T]:
+    def fetch_sys_attrs_async(
+        client: AuthenticatedClient,
+        project_identifier: identifiers.ProjectIdentifier,
+        filter_: Optional[_Filter] = None,
+        sort_by: _Attribute = _Attribute("sys/creation_time", type="datetime"),
+        sort_direction: Literal["asc", "desc"] = "desc",
+        limit: Optional[int] = None,
+        batch_size: int = env.NEPTUNE_FETCHER_SYS_ATTRS_BATCH_SIZE.get(),
+        container_type: ContainerType = default_container_type,
+    ) -> AsyncGenerator[util.Page[T], None]:
+        return _fetch_sys_attrs_pages_async(
+            client=client,
+            fetch_page=ft.partial(_fetch_sys_attrs_page_async, project_identifier=project_identifier),
+            process_page=ft.partial(_process_sys_attrs_page, make_record=make_record),
+            params=_make_sys_attrs_params(
+                attribute_names, filter_, sort_by, sort_direction, batch_size, container_type
+            ),
+            batch_size=batch_size,
+            limit=limit,
+            keyset=_KeysetPagination.create(filter_, sort_by, sort_direction, batch_size, limit),
+        )
+
+    return fetch_sys_attrs_async
+
+
+def _make_sys_attrs_params(
+    attribute_names: List[str],
+    filter_: Optional[_Filter],
+    sort_by: _Attribute,
+    sort_direction: Literal["asc", "desc"],
+    batch_size: int,
+    container_type: ContainerType,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {
+        "attributeFilters": [{"path": attribute_name} for attribute_name in attribute_names],
+        "pagination": {"limit": batch_size},
+        "experimentLeader": container_type == ContainerType.EXPERIMENT,
+        "sorting": {
+            "dir": _map_direction(sort_direction),
+            "sortBy": {"name": sort_by.name},
+        },
+    }
+    if filter_ is not None:
+        params["query"] = {"query": str(filter_)}
+    if sort_by.aggregation is not None:
+        params["sorting"]["aggregationMode"] = sort_by.aggregation
+    if sort_by.type is not None:
+        params["sorting"]["sortBy"]["type"] = map_attribute_type_python_to_backend(sort_by.type)
+    return params
+
+
 fetch_experiment_sys_attrs = _create_fetch_sys_attrs(
     attribute_names=ExperimentSysAttrs.attribute_names(),
     make_record=ExperimentSysAttrs.from_dict,
@@ -191,6 +273,18 @@ fetch_run_sys_attrs = _create_fetch_sys_attrs(
     default_container_type=ContainerType.RUN,
 )
 
+fetch_experiment_sys_attrs_async = _create_fetch_sys_attrs_async(
+    attribute_names=ExperimentSysAttrs.attribute_names(),
+    make_record=ExperimentSysAttrs.from_dict,
+    default_container_type=ContainerType.EXPERIMENT,
+)
+
+fetch_run_sys_attrs_async = _create_fetch_sys_attrs_async(
+    attribute_names=RunSysAttrs.attribute_names(),
+    make_record=RunSysAttrs.from_dict,
+    default_container_type=ContainerType.RUN,
+)
+
 
 def fetch_sys_id_labels(container_type: ContainerType) -> FetchSysAttrs[SysIdLabel]:
     if container_type == ContainerType.EXPERIMENT:
@@ -201,6 +295,42 @@ def fetch_sys_id_labels(container_type: ContainerType) -> FetchSysAttrs[SysIdLab
         raise RuntimeError(f"Unexpected container type: {container_type}")
 
 
+def fetch_sys_id_labels_async(container_type: ContainerType) -> FetchSysAttrsAsync[SysIdLabel]:
+    if container_type == ContainerType.EXPERIMENT:
+        return fetch_experiment_sys_attrs_async  # type: ignore
+    elif container_type == ContainerType.RUN:
+        return fetch_run_sys_attrs_async  # type: ignore
+    else:
+        raise RuntimeError(f"Unexpected container type: {container_type}")
+
+
+def fetch_run_set_sys_id_labels(
+    run_set: RunSet, batch_size: int = env.NEPTUNE_FETCHER_SYS_ATTRS_BATCH_SIZE.get()
+) -> Generator[util.Page[SysIdLabel], None, None]:
+    """
+    Yield the runs of a RunSet in the pages a search for them would yield, without sending any requests.
+    """
+    yield from _run_set_pages(run_set, batch_size)
+
+
+async def fetch_run_set_sys_id_labels_async(
+    run_set: RunSet, batch_size: int = env.NEPTUNE_FETCHER_SYS_ATTRS_BATCH_SIZE.get()
+) -> AsyncGenerator[util.Page[SysIdLabel], None]:
+    for page in _run_set_pages(run_set, batch_size):
+        yield page
+
+
+def _run_set_pages(run_set: RunSet, batch_size: int) -> Generator[util.Page[SysIdLabel], None, None]:
+    items: list[SysIdLabel] = []
+    for sys_id, label in zip(run_set.sys_ids, run_set.labels):
+        if run_set.container_type == ContainerType.EXPERIMENT:
+            items.append(ExperimentSysAttrs(sys_id=sys_id, sys_name=identifiers.SysName(label)))
+        else:
+            items.append(RunSysAttrs(sys_id=sys_id, sys_custom_run_id=identifiers.CustomRunId(label)))
+    for start in range(0, len(items), batch_size):
+        yield util.Page(items=items[start : start + batch_size])
+
+
 fetch_experiment_sys_ids = _create_fetch_sys_attrs(
     attribute_names=["sys/id"], make_record=_sys_id_from_dict, default_container_type=ContainerType.EXPERIMENT
 )
@@ -213,6 +343,478 @@ fetch_run_sys_ids = _create_fetch_sys_attrs(
 
 fetch_sys_ids = fetch_experiment_sys_ids
 
+fetch_sys_ids_async = _create_fetch_sys_attrs_async(
+    attribute_names=["sys/id"], make_record=_sys_id_from_dict, default_container_type=ContainerType.EXPERIMENT
+)
+
+
+@dataclass(frozen=True)
+class ProjectSysIdLabel:
+    project_identifier: identifiers.ProjectIdentifier
+    sys_id: identifiers.SysId
+    label: str
+
+    @property
+    def run_identifier(self) -> identifiers.RunIdentifier:
+        return identifiers.RunIdentifier(self.project_identifier, self.sys_id)
+
+
+def group_sys_ids_by_project(
+    items: List[ProjectSysIdLabel],
+) -> dict[identifiers.ProjectIdentifier, List[identifiers.SysId]]:
+    sys_ids_by_project: dict[identifiers.ProjectIdentifier, List[identifiers.SysId]] = collections.defaultdict(list)
+    for item in items:
+        sys_ids_by_project[item.project_identifier].append(item.sys_id)
+    return sys_ids_by_project
+
+
+_LABEL_ATTRIBUTES: dict[ContainerType, str] = {
+    ContainerType.EXPERIMENT: "sys/name",
+    ContainerType.RUN: "sys/custom_run_id",
+}
+
+
+def fetch_sys_id_labels_across_projects(
+    client: AuthenticatedClient,
+    projects: List[identifiers.ProjectIdentifier],
+    filter_: Optional[_Filter] = None,
+    sort_by: _Attribute = _Attribute("sys/creation_time", type="datetime"),
+    sort_direction: Literal["asc", "desc"] = "desc",
+    limit: Optional[int] = None,
+    batch_size: int = env.NEPTUNE_FETCHER_SYS_ATTRS_BATCH_SIZE.get(),
+    container_type: ContainerType = ContainerType.EXPERIMENT,
+) -> Generator[util.Page[ProjectSysIdLabel], None, None]:
+    """
+    Search all the given projects at once, with the global search endpoint, in a single sort order.
+
+    `projects` holds "workspace/project" identifiers, or "workspace" ones, which stand for all projects of a workspace.
+
+    The search can't be restricted to the given projects: the endpoint takes no project scope, and NQL has no attribute
+    naming the project of a run. So the endpoint searches all projects available to the user, and pages of entries of
+    other projects are fetched only to be skipped, with the limit applied to the remaining ones. A search matching
+    many entries in other projects is therefore slow, and a warning is logged when most of the fetched entries were
+    skipped. A narrower filter reduces that cost.
+    """
+    label_attribute = _LABEL_ATTRIBUTES[container_type]
+    counts = _GlobalSearchCounts()
+    fetched = 0
+    for page in util.fetch_pages(
+        client=client,
+        fetch_page=_fetch_global_sys_attrs_page,
+        process_page=ft.partial(
+            _process_global_sys_attrs_page,
+            label_attribute=label_attribute,
+            projects=frozenset(projects),
+            counts=counts,
+        ),
+        make_new_page_params=ft.partial(_make_new_sys_attrs_page_params, batch_size=batch_size, limit=None),
+        params=_make_sys_attrs_params(
+            [label_attribute, "sys/id"], filter_, sort_by, sort_direction, batch_size, container_type
+        ),
+    ):
+        items = page.items if limit is None else page.items[: limit - fetched]
+        fetched += len(items)
+        if items:
+            yield util.Page(items=items)
+        if limit is not None and fetched >= limit:
+            break
+    counts.warn_if_mostly_skipped()
+
+
+async def fetch_sys_id_labels_across_projects_async(
+    client: AuthenticatedClient,
+    projects: List[identifiers.ProjectIdentifier],
+    filter_: Optional[_Filter] = None,
+    sort_by: _Attribute = _Attribute("sys/creation_time", type="datetime"),
+    sort_direction: Literal["asc", "desc"] = "desc",
+    limit: Optional[int] = None,
+    batch_size: int = env.NEPTUNE_FETCHER_SYS_ATTRS_BATCH_SIZE.get(),
+    container_type: ContainerType = ContainerType.EXPERIMENT,
+) -> AsyncGenerator[util.Page[ProjectSysIdLabel], None]:
+    """
+    See `fetch_sys_id_labels_across_projects`.
+    """
+    label_attribute = _LABEL_ATTRIBUTES[container_type]
+    counts = _GlobalSearchCounts()
+    fetched = 0
+    async for page in util.fetch_pages_async(
+        client=client,
+        fetch_page=_fetch_global_sys_attrs_page_async,
+        process_page=ft.partial(
+            _process_global_sys_attrs_page,
+            label_attribute=label_attribute,
+            projects=frozenset(projects),
+            counts=counts,
+        ),
+        make_new_page_params=ft.partial(_make_new_sys_attrs_page_params, batch_size=batch_size, limit=None),
+        params=_make_sys_attrs_params(
+            [label_attribute, "sys/id"], filter_, sort_by, sort_direction, batch_size, container_type
+        ),
+    ):
+        items = page.items if limit is None else page.items[: limit - fetched]
+        fetched += len(items)
+        if items:
+            yield util.Page(items=items)
+        if limit is not None and fetched >= limit:
+            break
+    counts.warn_if_mostly_skipped()
+
+
+def _fetch_global_sys_attrs_page(
+    client: AuthenticatedClient, params: dict[str, Any]
+) -> ProtoLeaderboardEntriesSearchResultDTO:
+    body = GlobalSearchParamsDTO.from_dict(params)
+
+    response = retry.handle_errors_default(search_global_leaderboard_entries_proto.sync_detailed)(
+        client=client,
+        body=body,
+    )
+
+    dto: ProtoLeaderboardEntriesSearchResultDTO = ProtoLeaderboardEntriesSearchResultDTO.FromString(response.content)
+    return dto
+
+
+async def _fetch_global_sys_attrs_page_async(
+    client: AuthenticatedClient, params: dict[str, Any]
+) -> ProtoLeaderboardEntriesSearchResultDTO:
+    body = GlobalSearchParamsDTO.from_dict(params)
+
+    response = await retry.handle_errors_default_async(search_global_leaderboard_entries_proto.asyncio_detailed)(
+        client=client,
+        body=body,
+    )
+
+    dto: ProtoLeaderboardEntriesSearchResultDTO = ProtoLeaderboardEntriesSearchResultDTO.FromString(response.content)
+    return dto
+
+
+@dataclass
+class _GlobalSearchCounts:
+    matched: int = 0
+    skipped: int = 0
+
+    def warn_if_mostly_skipped(self) -> None:
+        if self.skipped > self.matched:
+            logger.warning(
+                "The search across projects fetched %d entries of other projects to find %d entries of the requested "
+                "ones, as the search can't be restricted to projects. A narrower filter makes it faster.",
+                self.skipped,
+                self.matched,
+            )
+
+
+def _process_global_sys_attrs_page(
+    data: ProtoLeaderboardEntriesSearchResultDTO,
+    label_attribute: str,
+    projects: frozenset[identifiers.ProjectIdentifier],
+    counts: _GlobalSearchCounts,
+) -> util.Page[ProjectSysIdLabel]:
+    items = []
+    for entry in data.entries:
+        project_identifier = identifiers.ProjectIdentifier(f"{entry.organization_name}/{entry.project_name}")
+        if project_identifier not in projects and entry.organization_name not in projects:
+            counts.skipped += 1
+            continue
+        counts.matched += 1
+        attributes = {attr.name: attr.string_properties.value for attr in entry.attributes}
+        items.append(
+            ProjectSysIdLabel(
+                project_identifier=project_identifier,
+                sys_id=identifiers.SysId(attributes["sys/id"]),
+                label=attributes[label_attribute],
+            )
+        )
+    return util.Page(items=items)
+
+
+class _KeysetPagination:
+    """
+    Makes the params of the pages of a search sorted by an immutable attribute that all runs have, so that each page
+    continues after the last entry of the previous one, instead of skipping the previous entries with an offset.
+    The backend skips the offset row by row, so deep pages of large searches take long.
+
+    Each page is filtered to the entries sorted at or after the sort value of the last seen entry, and skips only the
+    seen entries that have this value. Runs created during the search don't shift the pages.
+    """
+
+    # The sortable attributes that never change and that all runs have, with their types
+    SORT_ATTRIBUTES: dict[str, Literal["string", "datetime"]] = {"sys/creation_time": "datetime", "sys/id": "string"}
+
+    def __init__(
+        self,
+        filter_: Optional[_Filter],
+        sort_by: _Attribute,
+        sort_direction: Literal["asc", "desc"],
+        batch_size: int,
+        limit: Optional[int],
+    ):
+        self._filter = filter_
+        self._sort_attribute = _Attribute(sort_by.name, type=self.SORT_ATTRIBUTES[sort_by.name])
+        self._operator: Literal["<=", ">="] = "<=" if sort_direction == "desc" else ">="
+        self._batch_size = batch_size
+        self._limit = limit
+
+        self._fetched = 0
+        self._last_value: Union[str, datetime, None] = None
+        self._seen_with_last_value = 0
+
+    @classmethod
+    def create(
+        cls,
+        filter_: Optional[_Filter],
+        sort_by: _Attribute,
+        sort_direction: Literal["asc", "desc"],
+        batch_size: int,
+        limit: Optional[int],
+    ) -> Optional["_KeysetPagination"]:
+        """
+        Return the pagination if it's enabled with `NEPTUNE_FETCHER_KEYSET_PAGINATION` and supports the sorting.
+        """
+        if not env.NEPTUNE_FETCHER_KEYSET_PAGINATION.get():
+            return None
+        sort_type = cls.SORT_ATTRIBUTES.get(sort_by.name)
+        if sort_type is None or sort_by.aggregation is not None or sort_by.type not in (None, sort_type):
+            return None
+        return cls(filter_, sort_by, sort_direction, batch_size, limit)
+
+    def add_sort_attribute(self, params: dict[str, Any]) -> dict[str, Any]:
+        if {"path": self._sort_attribute.name} not in params["attributeFilters"]:
+            params["attributeFilters"].append({"path": self._sort_attribute.name})
+        return params
+
+    def __call__(
+        self, params: dict[str, Any], data: Optional[ProtoLeaderboardEntriesSearchResultDTO]
+    ) -> Optional[dict[str, Any]]:
+        offset = 0
+        if data is not None:
+            self._fetched += len(data.entries)
+            if len(data.entries) < self._batch_size:
+                return None
+            if self._limit is not None and self._fetched >= self._limit:
+                return None
+
+            for entry in data.entries:
+                self._advance(self._sort_value(entry))
+            assert self._last_value is not None
+            after_last = _AttributeValuePredicate(self._operator, self._sort_attribute, self._last_value)
+            query = after_last if self._filter is None else _Filter.all([self._filter, after_last])
+            params["query"] = {"query": str(query)}
+            offset = self._seen_with_last_value
+
+        page_limit = self._batch_size if self._limit is None else min(self._limit - self._fetched, self._batch_size)
+        params["pagination"] = {"offset": offset, "limit": page_limit}
+        return params
+
+    def _advance(self, value: Union[str, datetime]) -> None:
+        if value == self._last_value:
+            self._seen_with_last_value += 1
+        else:
+            self._last_value = value
+            self._seen_with_last_value = 1
+
+    def _sort_value(self, entry: ProtoAttributesDTO) -> Union[str, datetime]:
+        for attr in entry.attributes:
+            if attr.name == self._sort_attribute.name:
+                if self._sort_attribute.type == "datetime":
+                    return _EPOCH + timedelta(milliseconds=attr.datetime_properties.value)
+                return str(attr.string_properties.value)
+        raise ValueError(f"Entry {entry.experiment_id} has no {self._sort_attribute.name} attribute to paginate by")
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _fetch_sys_attrs_pages(
+    client: AuthenticatedClient,
+    fetch_page: Callable[[AuthenticatedClient, dict[str, Any]], ProtoLeaderboardEntriesSearchResultDTO],
+    process_page: Callable[[ProtoLeaderboardEntriesSearchResultDTO], util.Page[T]],
+    params: dict[str, Any],
+    batch_size: int,
+    limit: Optional[int],
+    keyset: Optional[_KeysetPagination] = None,
+) -> Generator[util.Page[T], None, None]:
+    """
+    Fetch the pages of a search, in order.
+
+    With keyset pagination, the pages are fetched one by one, each continuing after the last entry of the previous one.
+
+    Otherwise, the first page is fetched alone, and its count of matching items tells how many pages follow. These are
+    fetched concurrently at their offsets, up to `NEPTUNE_FETCHER_SYS_ATTRS_MAX_PARALLEL_PAGES` at a time. If the last
+    of them is full, because items were added in the meantime, the rest is fetched page by page. The requests
+    run in the shared pool of background threads, and those still in flight are cancelled once the search ends early.
+    """
+    if keyset is not None:
+        yield from util.fetch_pages(
+            client=client,
+            fetch_page=fetch_page,
+            process_page=process_page,
+            make_new_page_params=keyset,
+            params=keyset.add_sort_attribute(params),
+        )
+        return
+
+    max_parallel_pages = env.NEPTUNE_FETCHER_SYS_ATTRS_MAX_PARALLEL_PAGES.get()
+    if max_parallel_pages <= 1:
+        yield from util.fetch_pages(
+            client=client,
+            fetch_page=fetch_page,
+            process_page=process_page,
+            make_new_page_params=ft.partial(_make_new_sys_attrs_page_params, batch_size=batch_size, limit=limit),
+            params=params,
+        )
+        return
+
+    cancellation.raise_if_cancelled()
+    data = fetch_page(client, _sys_attrs_page_params_at(params, 0, batch_size, limit))
+    yield process_page(data)
+    if len(data.entries) < batch_size:
+        return
+
+    offsets = iter(_next_page_offsets(data, batch_size, limit))
+    in_flight: collections.deque[
+        tuple[int, util.BackgroundPage[ProtoLeaderboardEntriesSearchResultDTO]]
+    ] = collections.deque()
+
+    def fetch_next() -> None:
+        offset = next(offsets, None)
+        if offset is not None:
+            page_params = _sys_attrs_page_params_at(params, offset, batch_size, limit)
+            in_flight.append((offset, util.fetch_page_in_background(client, fetch_page, page_params)))
+
+    next_offset = batch_size
+    try:
+        for _ in range(max_parallel_pages):
+            fetch_next()
+
+        while in_flight:
+            offset, page = in_flight.popleft()
+            data = util.wait_for_page(page)
+            fetch_next()
+
+            yield process_page(data)
+            if len(data.entries) < batch_size:
+                return
+            next_offset = offset + batch_size
+    finally:
+        for _, page in in_flight:
+            page.cancel()
+
+    if limit is not None and next_offset >= limit:
+        return
+    yield from util.fetch_pages(
+        client=client,
+        fetch_page=fetch_page,
+        process_page=process_page,
+        make_new_page_params=ft.partial(
+            _make_new_sys_attrs_page_params, batch_size=batch_size, limit=limit, initial_offset=next_offset
+        ),
+        params=params,
+    )
+
+
+async def _fetch_sys_attrs_pages_async(
+    client: AuthenticatedClient,
+    fetch_page: Callable[[AuthenticatedClient, dict[str, Any]], Awaitable[ProtoLeaderboardEntriesSearchResultDTO]],
+    process_page: Callable[[ProtoLeaderboardEntriesSearchResultDTO], util.Page[T]],
+    params: dict[str, Any],
+    batch_size: int,
+    limit: Optional[int],
+    keyset: Optional[_KeysetPagination] = None,
+) -> AsyncGenerator[util.Page[T], None]:
+    """
+    See `_fetch_sys_attrs_pages`. The following pages are fetched in tasks of the running event loop.
+    """
+
+    async def fetch(page_params: dict[str, Any]) -> ProtoLeaderboardEntriesSearchResultDTO:
+        async with util.request_slots():
+            return await fetch_page(client, page_params)
+
+    if keyset is not None:
+        async for page in util.fetch_pages_async(
+            client=client,
+            fetch_page=fetch_page,
+            process_page=process_page,
+            make_new_page_params=keyset,
+            params=keyset.add_sort_attribute(params),
+        ):
+            yield page
+        return
+
+    max_parallel_pages = env.NEPTUNE_FETCHER_SYS_ATTRS_MAX_PARALLEL_PAGES.get()
+    if max_parallel_pages <= 1:
+        async for page in util.fetch_pages_async(
+            client=client,
+            fetch_page=fetch_page,
+            process_page=process_page,
+            make_new_page_params=ft.partial(_make_new_sys_attrs_page_params, batch_size=batch_size, limit=limit),
+            params=params,
+        ):
+            yield page
+        return
+
+    data = await fetch(_sys_attrs_page_params_at(params, 0, batch_size, limit))
+    yield process_page(data)
+    if len(data.entries) < batch_size:
+        return
+
+    offsets = iter(_next_page_offsets(data, batch_size, limit))
+    in_flight: collections.deque[
+        tuple[int, asyncio.Future[ProtoLeaderboardEntriesSearchResultDTO]]
+    ] = collections.deque()
+
+    def fetch_next() -> None:
+        offset = next(offsets, None)
+        if offset is not None:
+            page_params = _sys_attrs_page_params_at(params, offset, batch_size, limit)
+            in_flight.append((offset, asyncio.ensure_future(fetch(page_params))))
+
+    next_offset = batch_size
+    try:
+        for _ in range(max_parallel_pages):
+            fetch_next()
+
+        while in_flight:
+            offset, task = in_flight.popleft()
+            data = await task
+            fetch_next()
+
+            yield process_page(data)
+            if len(data.entries) < batch_size:
+                return
+            next_offset = offset + batch_size
+    finally:
+        for _, task in in_flight:
+            task.cancel()
+
+    if limit is not None and next_offset >= limit:
+        return
+    async for page in util.fetch_pages_async(
+        client=client,
+        fetch_page=fetch_page,
+        process_page=process_page,
+        make_new_page_params=ft.partial(
+            _make_new_sys_attrs_page_params, batch_size=batch_size, limit=limit, initial_offset=next_offset
+        ),
+        params=params,
+    ):
+        yield page
+
+
+def _next_page_offsets(
+    first_page: ProtoLeaderboardEntriesSearchResultDTO, batch_size: int, limit: Optional[int]
+) -> range:
+    total = first_page.matching_item_count
+    if limit is not None:
+        total = min(total, limit)
+    return range(batch_size, total, batch_size)
+
+
+def _sys_attrs_page_params_at(
+    params: dict[str, Any], offset: int, batch_size: int, limit: Optional[int]
+) -> dict[str, Any]:
+    page_limit = batch_size if limit is None else min(limit - offset, batch_size)
+    return {**params, "pagination": {"offset": offset, "limit": page_limit}}
+
 
 def _fetch_sys_attrs_page(
     client: AuthenticatedClient,
@@ -232,6 +834,24 @@ def _fetch_sys_attrs_page(
     return dto
 
 
+async def _fetch_sys_attrs_page_async(
+    client: AuthenticatedClient,
+    params: dict[str, Any],
+    project_identifier: identifiers.ProjectIdentifier,
+) -> ProtoLeaderboardEntriesSearchResultDTO:
+    body = SearchLeaderboardEntriesParamsDTO.from_dict(params)
+
+    response = await retry.handle_errors_default_async(search_leaderboard_entries_proto.asyncio_detailed)(
+        client=client,
+        project_identifier=project_identifier,
+        type=["run"],
+        body=body,
+    )
+
+    dto: ProtoLeaderboardEntriesSearchResultDTO = ProtoLeaderboardEntriesSearchResultDTO.FromString(response.content)
+    return dto
+
+
 def _process_sys_attrs_page(
     data: ProtoLeaderboardEntriesSearchResultDTO,
     make_record: Callable[[dict[str, Any]], T],
@@ -249,12 +869,13 @@ def _make_new_sys_attrs_page_params(
     data: Optional[ProtoLeaderboardEntriesSearchResultDTO],
     batch_size: int,
     limit: Optional[int],
+    initial_offset: int = 0,
 ) -> Optional[dict[str, Any]]:
 
     if data is None:
-        params["pagination"]["offset"] = 0
+        params["pagination"]["offset"] = initial_offset
         if limit is not None:
-            params["pagination"]["limit"] = min(limit, batch_size)
+            params["pagination"]["limit"] = min(limit - initial_offset, batch_size)
         return params
 
     if len(data.entries) < batch_size:
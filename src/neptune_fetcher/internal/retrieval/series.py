@@ -15,6 +15,7 @@
 import functools as ft
 from typing import (
     Any,
+    AsyncGenerator,
     Generator,
     Iterable,
     NamedTuple,
@@ -25,12 +26,10 @@ from typing import (
 
 from neptune_fetcher.generated.neptune_api.api.retrieval import get_series_values_proto
 from neptune_fetcher.generated.neptune_api.client import AuthenticatedClient
-from neptune_fetcher.generated.neptune_api.models import SeriesValuesRequest
 from neptune_fetcher.generated.neptune_api.proto.neptune_pb.api.v1.model.series_values_pb2 import (
     ProtoPointValueDTO,
     ProtoSeriesValuesResponseDTO,
 )
-from neptune_fetcher.generated.neptune_api.types import UNSET
 
 from ..identifiers import RunAttributeDefinition
 from ..retrieval import (
@@ -56,6 +55,53 @@ def fetch_series_values(
         yield from []
         return
 
+    request_id_to_run_attr_definition, params = _make_series_params(
+        run_attribute_definitions, include_inherited, step_range, tail_limit
+    )
+
+    yield from util.fetch_pages(
+        client=client,
+        fetch_page=_fetch_series_page,
+        process_page=ft.partial(
+            _process_series_page, request_id_to_run_attr_definition=request_id_to_run_attr_definition
+        ),
+        make_new_page_params=_make_new_series_page_params,
+        params=params,
+    )
+
+
+async def fetch_series_values_async(
+    client: AuthenticatedClient,
+    run_attribute_definitions: Iterable[RunAttributeDefinition],
+    include_inherited: bool,
+    step_range: Tuple[Union[float, None], Union[float, None]] = (None, None),
+    tail_limit: Optional[int] = None,
+) -> AsyncGenerator[util.Page[tuple[RunAttributeDefinition, list[SeriesValue]]], None]:
+    if not run_attribute_definitions:
+        return
+
+    request_id_to_run_attr_definition, params = _make_series_params(
+        run_attribute_definitions, include_inherited, step_range, tail_limit
+    )
+
+    async for page in util.fetch_pages_async(
+        client=client,
+        fetch_page=_fetch_series_page_async,
+        process_page=ft.partial(
+            _process_series_page, request_id_to_run_attr_definition=request_id_to_run_attr_definition
+        ),
+        make_new_page_params=_make_new_series_page_params,
+        params=params,
+    ):
+        yield page
+
+
+def _make_series_params(
+    run_attribute_definitions: Iterable[RunAttributeDefinition],
+    include_inherited: bool,
+    step_range: Tuple[Union[float, None], Union[float, None]],
+    tail_limit: Optional[int],
+) -> tuple[dict[str, RunAttributeDefinition], dict[str, Any]]:
     run_attribute_definitions = list(run_attribute_definitions)
     width = len(str(len(run_attribute_definitions) - 1))
     request_id_to_run_attr_definition: dict[str, RunAttributeDefinition] = {
@@ -83,26 +129,26 @@ def fetch_series_values(
     if tail_limit is not None:
         params["perSeriesPointsLimit"] = tail_limit
 
-    yield from util.fetch_pages(
-        client=client,
-        fetch_page=_fetch_series_page,
-        process_page=ft.partial(
-            _process_series_page, request_id_to_run_attr_definition=request_id_to_run_attr_definition
-        ),
-        make_new_page_params=_make_new_series_page_params,
-        params=params,
-    )
+    return request_id_to_run_attr_definition, params
 
 
 def _fetch_series_page(
     client: AuthenticatedClient,
     params: dict[str, Any],
 ) -> ProtoSeriesValuesResponseDTO:
-    body = SeriesValuesRequest.from_dict(params)
+    fetch = util.accepting_json_body(retry.handle_errors_default(get_series_values_proto.sync_detailed))
+    response = fetch(client=client, body=util.JsonBody(params), use_deprecated_string_fields=False)
+
+    dto: ProtoSeriesValuesResponseDTO = ProtoSeriesValuesResponseDTO.FromString(response.content)
+    return dto
 
-    response = retry.handle_errors_default(get_series_values_proto.sync_detailed)(
-        client=client, body=body, use_deprecated_string_fields=False
-    )
+
+async def _fetch_series_page_async(
+    client: AuthenticatedClient,
+    params: dict[str, Any],
+) -> ProtoSeriesValuesResponseDTO:
+    fetch = util.accepting_json_body(retry.handle_errors_default_async(get_series_values_proto.asyncio_detailed))
+    response = await fetch(client=client, body=util.JsonBody(params), use_deprecated_string_fields=False)
 
     dto: ProtoSeriesValuesResponseDTO = ProtoSeriesValuesResponseDTO.FromString(response.content)
     return dto
@@ -177,10 +223,14 @@ def _make_new_series_page_params(
         return None
 
     new_requests = [
-        request | updated_request_tokens.get(request["requestId"], {"searchAfter": UNSET})
+        _without_search_after(request) | updated_request_tokens.get(request["requestId"], {})
         for request in params["requests"]
         if request["requestId"] in existing_series and request["requestId"] not in finished_requests
     ]
 
     params["requests"] = new_requests
     return params
+
+
+def _without_search_after(request: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in request.items() if key != "searchAfter"}
@@ -15,31 +15,130 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import logging
+import os
+import threading
+import weakref
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
 from dataclasses import dataclass
 from typing import (
     Any,
+    AsyncGenerator,
+    Awaitable,
     Callable,
     Generator,
     Generic,
     Optional,
+    Protocol,
     TypeVar,
+    cast,
 )
 
 from neptune_fetcher.generated.neptune_api import AuthenticatedClient
 
+from .. import (
+    cancellation,
+    env,
+)
+from .adaptive_concurrency import max_concurrent_requests
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 R = TypeVar("R")
+R_co = TypeVar("R_co", covariant=True)
 _Params = dict[str, Any]
 
+# How often a generator waiting for a prefetched page checks whether its work was cancelled
+_CANCELLATION_POLL_SECONDS = 0.1
+
 
 @dataclass
 class Page(Generic[T]):
     items: list[T]
 
 
+class JsonBody:
+    """
+    A request body given as the JSON-ready dict expected by an endpoint, sent as is.
+
+    The generated endpoints serialize their body with `to_dict()`, so passing params wrapped in `JsonBody` instead of
+    a model built with `from_dict()` skips converting them to attrs models and back. The params must already be in
+    the form that `to_dict()` of the model would produce.
+    """
+
+    __slots__ = ("_params",)
+
+    def __init__(self, params: _Params):
+        self._params = params
+
+    def to_dict(self) -> _Params:
+        return self._params
+
+
+class SerializableBody(Protocol):
+    """Anything a generated endpoint can send as its body: it only ever calls `to_dict()` on it."""
+
+    def to_dict(self) -> _Params:
+        ...
+
+
+class JsonBodyEndpoint(Protocol[R_co]):
+    def __call__(self, *, client: AuthenticatedClient, body: SerializableBody, **kwargs: Any) -> R_co:
+        ...
+
+
+def accepting_json_body(endpoint: Callable[..., R_co]) -> JsonBodyEndpoint[R_co]:
+    """
+    Types an endpoint, possibly already wrapped in error handling, as accepting any body with `to_dict()`, so that
+    a `JsonBody` can be passed where the generated signature names the attrs model. Returns the endpoint unchanged.
+    """
+    return cast(JsonBodyEndpoint[R_co], endpoint)
+
+
+class SharedExecutor:
+    """
+    A process-wide pool of threads sending requests in the background, created on first use with as many threads
+    as `max_workers()` returns at that time. Each task runs with the given cancellation token.
+    """
+
+    def __init__(self, thread_name_prefix: str, max_workers: Callable[[], int]):
+        self._thread_name_prefix = thread_name_prefix
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def submit(
+        self, token: Optional[cancellation.CancellationToken], fn: Callable[..., T], /, *args: Any, **kwargs: Any
+    ) -> Future[T]:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers(), thread_name_prefix=self._thread_name_prefix
+                )
+            executor = self._executor
+        return executor.submit(_call_with_token, token, fn, *args, **kwargs)
+
+    def _reset_after_fork(self) -> None:
+        # Threads are not copied to the child process, so the executor inherited from the parent is unusable
+        self._lock = threading.Lock()
+        self._executor = None
+
+
+def _call_with_token(
+    token: Optional[cancellation.CancellationToken], fn: Callable[..., T], /, *args: Any, **kwargs: Any
+) -> T:
+    with cancellation.use_token(token):
+        return fn(*args, **kwargs)
+
+
 def fetch_pages(
     client: AuthenticatedClient,
     fetch_page: Callable[[AuthenticatedClient, _Params], R],
@@ -47,9 +146,159 @@ def fetch_pages(
     make_new_page_params: Callable[[_Params, Optional[R]], Optional[_Params]],
     params: _Params,
 ) -> Generator[Page[T], None, None]:
+    """
+    Fetch consecutive pages, and yield each of them processed.
+
+    With `NEPTUNE_FETCHER_PREFETCH_PAGES` enabled, the next page is requested in a background thread as soon as
+    its params are known, so that processing a page and the work of the caller overlap with fetching the next one.
+    Pages are still fetched one at a time, in order, so `make_new_page_params` may update the params in place.
+    It's called before the previous page is yielded, so it must not depend on what the caller does with the pages.
+    If the generator is closed early, the request for the next page is cancelled.
+    """
+    if not env.NEPTUNE_FETCHER_PREFETCH_PAGES.get():
+        page_params = make_new_page_params(params, None)
+        while page_params is not None:
+            cancellation.raise_if_cancelled()
+            data = fetch_page(client, page_params)
+            page = process_page(data)
+            yield page
+            page_params = make_new_page_params(page_params, data)
+        return
+
     page_params = make_new_page_params(params, None)
-    while page_params is not None:
-        data = fetch_page(client, page_params)
-        page = process_page(data)
-        yield page
-        page_params = make_new_page_params(page_params, data)
+    if page_params is None:
+        return
+
+    cancellation.raise_if_cancelled()
+    data = fetch_page(client, page_params)
+    next_data: Optional[BackgroundPage[R]] = None
+    try:
+        while True:
+            next_params = make_new_page_params(page_params, data)
+            if next_params is None:
+                yield process_page(data)
+                return
+
+            next_data = fetch_page_in_background(client, fetch_page, next_params)
+            yield process_page(data)
+            page_params, data = next_params, wait_for_page(next_data)
+    finally:
+        if next_data is not None:
+            next_data.cancel()
+
+
+@dataclass
+class BackgroundPage(Generic[R]):
+    """
+    A page being fetched by `fetch_page_in_background`.
+    """
+
+    future: Future[R]
+    token: cancellation.CancellationToken
+
+    def cancel(self) -> None:
+        """
+        Drop the request if it hasn't started yet, otherwise stop it at its next checkpoint. No-op once it's done.
+        """
+        if not self.future.cancel():
+            self.token.cancel()
+
+
+def fetch_page_in_background(
+    client: AuthenticatedClient, fetch_page: Callable[[AuthenticatedClient, _Params], R], page_params: _Params
+) -> BackgroundPage[R]:
+    """
+    Start fetching a page in the shared pool of background threads. The request is cancelled together with the work
+    of the calling thread, and can also be cancelled alone when the page is no longer needed.
+    """
+    token = cancellation.CancellationToken(parent=cancellation.current_token())
+    future = _background_executor.submit(token, _fetch_page, client, fetch_page, page_params)
+    return BackgroundPage(future=future, token=token)
+
+
+def _fetch_page(
+    client: AuthenticatedClient, fetch_page: Callable[[AuthenticatedClient, _Params], R], page_params: _Params
+) -> R:
+    cancellation.raise_if_cancelled()
+    return fetch_page(client, page_params)
+
+
+def wait_for_page(page: BackgroundPage[R]) -> R:
+    """
+    Wait for a page fetched with `fetch_page_in_background`, checking for cancellation in the meantime.
+    """
+    while True:
+        cancellation.raise_if_cancelled()
+        try:
+            return page.future.result(timeout=_CANCELLATION_POLL_SECONDS)
+        except concurrent.futures.TimeoutError:
+            continue
+
+
+# Prefetched pages never wait for each other, so a request per slot of the concurrency limiter is enough
+_background_executor = SharedExecutor("neptune-fetch-page", max_concurrent_requests)
+
+
+async def fetch_pages_async(
+    client: AuthenticatedClient,
+    fetch_page: Callable[[AuthenticatedClient, _Params], Awaitable[R]],
+    process_page: Callable[[R], Page[T]],
+    make_new_page_params: Callable[[_Params, Optional[R]], Optional[_Params]],
+    params: _Params,
+) -> AsyncGenerator[Page[T], None]:
+    """
+    See `fetch_pages`. The next page is requested in a task of the running event loop.
+    """
+
+    async def fetch(page_params: _Params) -> R:
+        async with request_slots():
+            return await fetch_page(client, page_params)
+
+    if not env.NEPTUNE_FETCHER_PREFETCH_PAGES.get():
+        page_params = make_new_page_params(params, None)
+        while page_params is not None:
+            data = await fetch(page_params)
+            page = process_page(data)
+            yield page
+            page_params = make_new_page_params(page_params, data)
+        return
+
+    page_params = make_new_page_params(params, None)
+    if page_params is None:
+        return
+
+    data = await fetch(page_params)
+    next_data: Optional[asyncio.Future[R]] = None
+    try:
+        while True:
+            next_params = make_new_page_params(page_params, data)
+            if next_params is None:
+                yield process_page(data)
+                return
+
+            next_data = asyncio.ensure_future(fetch(next_params))
+            # Let the task send the request before the page is processed
+            await asyncio.sleep(0)
+            yield process_page(data)
+            page_params, data = next_params, await next_data
+    finally:
+        if next_data is not None and not next_data.done():
+            next_data.cancel()
+
+
+_request_slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+_request_slots_lock = threading.Lock()
+
+
+def request_slots() -> asyncio.Semaphore:
+    """
+    Return the semaphore limiting the number of concurrent requests sent from the running event loop
+    to `NEPTUNE_FETCHER_ASYNC_MAX_CONCURRENCY`.
+    """
+    loop = asyncio.get_running_loop()
+    with _request_slots_lock:
+        semaphore = _request_slots.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(env.NEPTUNE_FETCHER_ASYNC_MAX_CONCURRENCY.get())
+            _request_slots[loop] = semaphore
+        return semaphore
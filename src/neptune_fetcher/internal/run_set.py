@@ -0,0 +1,51 @@
+#
+# Copyright (c) 2025, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .identifiers import (
+    ProjectIdentifier,
+    SysId,
+)
+
+# The retrieval modules import the generated API models, so this module only refers to them in annotations
+if TYPE_CHECKING:
+    from .retrieval.search import ContainerType
+
+__all__ = ("RunSet",)
+
+
+@dataclass(frozen=True)
+class RunSet:
+    """
+    Experiments or runs of a project that were searched for once, in the order of the search.
+
+    Fetching with a RunSet instead of a filter skips the type inference of the filter and the search, and starts
+    directly at fetching the attribute definitions and values of its runs.
+    """
+
+    project_identifier: ProjectIdentifier
+    container_type: ContainerType
+    sys_ids: tuple[SysId, ...]
+    labels: tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.sys_ids)
+
+    def __repr__(self) -> str:
+        return f"RunSet(project={self.project_identifier!r}, {self.container_type.value}s={len(self)})"
@@ -0,0 +1,295 @@
+#
+# Copyright (c) 2025, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Optional,
+)
+
+import httpx
+
+from . import env
+from .retrieval.adaptive_concurrency import max_concurrent_requests
+
+__all__ = (
+    "TransportSettings",
+    "TransportStats",
+)
+
+
+@dataclass(frozen=True)
+class TransportSettings:
+    """
+    Settings of the HTTP transport of the clients sending requests to Neptune.
+
+    `max_connections` limits the connections of the client used by worker threads, and `async_max_connections`
+    the connections of each client used by the async fetching functions. All connections are kept alive for
+    `keepalive_expiry` seconds, so that they're reused instead of reopened by the next requests.
+
+    In HTTP/2 mode, requests are multiplexed as streams over the connections,
+    with at most `max_concurrent_streams` requests in flight per connection.
+    """
+
+    http2: bool
+    max_connections: int
+    async_max_connections: int
+    keepalive_expiry: Optional[float] = None
+    max_concurrent_streams: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> TransportSettings:
+        keepalive_expiry = env.NEPTUNE_FETCHER_KEEPALIVE_EXPIRY.get()
+
+        if env.NEPTUNE_FETCHER_HTTP2.get():
+            max_connections = env.NEPTUNE_FETCHER_HTTP2_MAX_CONNECTIONS.get()
+            return cls(
+                http2=True,
+                max_connections=max_connections,
+                async_max_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+                max_concurrent_streams=env.NEPTUNE_FETCHER_HTTP2_MAX_CONCURRENT_STREAMS.get(),
+            )
+
+        # A connection per request that can be in flight at the same time: the requests of the worker threads are
+        # limited per client, and the requests of the async functions per event loop
+        configured_max_connections = env.NEPTUNE_FETCHER_MAX_CONNECTIONS.get()
+        return cls(
+            http2=False,
+            max_connections=configured_max_connections or max_concurrent_requests(),
+            async_max_connections=configured_max_connections or env.NEPTUNE_FETCHER_ASYNC_MAX_CONCURRENCY.get(),
+            keepalive_expiry=keepalive_expiry,
+        )
+
+    def _max_requests(self, max_connections: int) -> Optional[int]:
+        if self.max_concurrent_streams is None:
+            return None
+        return max_connections * self.max_concurrent_streams
+
+    def _limits(self, max_connections: int) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def create_transport(self, verify_ssl: bool, proxy: Optional[str] = None) -> InstrumentedTransport:
+        transport = httpx.HTTPTransport(
+            verify=verify_ssl, http2=self.http2, limits=self._limits(self.max_connections), **_proxy_args(proxy)
+        )
+        return InstrumentedTransport(transport, self.max_connections, self._max_requests(self.max_connections))
+
+    def create_async_transport(self, verify_ssl: bool, proxy: Optional[str] = None) -> AsyncInstrumentedTransport:
+        transport = httpx.AsyncHTTPTransport(
+            verify=verify_ssl, http2=self.http2, limits=self._limits(self.async_max_connections), **_proxy_args(proxy)
+        )
+        return AsyncInstrumentedTransport(
+            transport, self.async_max_connections, self._max_requests(self.async_max_connections)
+        )
+
+
+def _proxy_args(proxy: Optional[str]) -> dict[str, Any]:
+    return {"proxy": httpx.Proxy(proxy)} if proxy is not None else {}
+
+
+@dataclass(frozen=True)
+class TransportStats:
+    """
+    A snapshot of the utilization of the connection pool of a client.
+
+    `requests_in_flight` includes the requests whose response body is still being read. Connections are reported
+    only for transports whose pool can be inspected.
+    """
+
+    max_connections: int
+    open_connections: int
+    idle_connections: int
+    requests_in_flight: int
+    peak_requests_in_flight: int
+    requests_total: int
+
+    @property
+    def utilization(self) -> float:
+        return self.requests_in_flight / self.max_connections if self.max_connections else 0.0
+
+    def __add__(self, other: TransportStats) -> TransportStats:
+        return TransportStats(
+            max_connections=self.max_connections + other.max_connections,
+            open_connections=self.open_connections + other.open_connections,
+            idle_connections=self.idle_connections + other.idle_connections,
+            requests_in_flight=self.requests_in_flight + other.requests_in_flight,
+            peak_requests_in_flight=self.peak_requests_in_flight + other.peak_requests_in_flight,
+            requests_total=self.requests_total + other.requests_total,
+        )
+
+
+class _RequestCounter:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.total = 0
+
+    def start(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.total += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def finish(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def stats(self, max_connections: int, pool: Any) -> TransportStats:
+        # The connection pool of httpcore is not a public API of httpx, so it's inspected defensively
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for connection in connections if _is_idle(connection))
+        with self._lock:
+            return TransportStats(
+                max_connections=max_connections,
+                open_connections=len(connections),
+                idle_connections=idle,
+                requests_in_flight=self.in_flight,
+                peak_requests_in_flight=self.peak_in_flight,
+                requests_total=self.total,
+            )
+
+
+def _is_idle(connection: Any) -> bool:
+    try:
+        return bool(connection.is_idle())
+    except Exception:
+        return False
+
+
+class InstrumentedTransport(httpx.BaseTransport):
+    """
+    Counts the requests in flight, including the ones whose response body is still being read,
+    and optionally limits their number.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, max_connections: int, max_requests: Optional[int] = None):
+        self._transport = transport
+        self._max_connections = max_connections
+        self._slots = threading.BoundedSemaphore(max_requests) if max_requests is not None else None
+        self._counter = _RequestCounter()
+
+    def stats(self) -> TransportStats:
+        return self._counter.stats(self._max_connections, getattr(self._transport, "_pool", None))
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._slots is not None:
+            self._slots.acquire()
+        self._counter.start()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            self._finish()
+            raise
+
+        if response.is_closed:  # the body has already been read
+            self._finish()
+            return response
+
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        response.stream = _ReleasingByteStream(response.stream, self._finish)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+    def _finish(self) -> None:
+        self._counter.finish()
+        if self._slots is not None:
+            self._slots.release()
+
+
+class AsyncInstrumentedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_connections: int, max_requests: Optional[int] = None):
+        self._transport = transport
+        self._max_connections = max_connections
+        self._slots = asyncio.BoundedSemaphore(max_requests) if max_requests is not None else None
+        self._counter = _RequestCounter()
+
+    def stats(self) -> TransportStats:
+        return self._counter.stats(self._max_connections, getattr(self._transport, "_pool", None))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._slots is not None:
+            await self._slots.acquire()
+        self._counter.start()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._finish()
+            raise
+
+        if response.is_closed:
+            self._finish()
+            return response
+
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _AsyncReleasingByteStream(response.stream, self._finish)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def _finish(self) -> None:
+        self._counter.finish()
+        if self._slots is not None:
+            self._slots.release()
+
+
+class _ReleasingByteStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            release, self._release = self._release, None
+            if release is not None:
+                release()
+
+
+class _AsyncReleasingByteStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            release, self._release = self._release, None
+            if release is not None:
+                release()
@@ -49,6 +49,7 @@ from neptune_fetcher.generated.neptune_api.models import (
 from neptune_fetcher.generated.neptune_api.proto.neptune_pb.api.v1.model.leaderboard_entries_pb2 import (
     ProtoAttributeDTO,
 )
+from neptune_fetcher.internal import env
 from neptune_fetcher.nql import (
     NQLAggregator,
     NQLAttributeOperator,
@@ -993,16 +994,25 @@ def list_objects_from_project(
 ) -> Generator[_AttributeContainer, None, None]:
     offset = 0
     batch_size = 10_000
+    sort_name, sort_type, sort_direction = sort_by
+    columns = list(columns)
+
+    # With keyset pagination, each page continues after the last sys/id of the previous one, instead of skipping
+    # the previous entries with an offset, which the backend does row by row
+    keyset = env.NEPTUNE_FETCHER_KEYSET_PAGINATION.get() and sort_name == SYS_ID
+    if keyset and SYS_ID not in columns:
+        columns.append(SYS_ID)
+    page_query = query
+
     while True:
 
         page_limit = min(batch_size, limit - offset) if limit else batch_size
-        sort_name, sort_type, sort_direction = sort_by
         body = SearchLeaderboardEntriesParamsDTO.from_dict(
             {
                 "attributeFilters": [{"path": name} for name in columns],
-                "pagination": {"limit": page_limit, "offset": offset},
+                "pagination": {"limit": page_limit, "offset": 0 if keyset else offset},
                 "experimentLeader": object_type == "experiment",
-                "query": {"query": query},
+                "query": {"query": page_query},
                 "sorting": {
                     "aggregationMode": "none",
                     "dir": sort_direction,
@@ -1028,6 +1038,26 @@ def list_objects_from_project(
         if limit and offset >= limit:
             break
 
+        if keyset:
+            page_query = str(
+                NQLQueryAggregate(
+                    items=[
+                        RawNQLQuery(f"({query})" if query else ""),
+                        NQLQueryAttribute(
+                            name=SYS_ID,
+                            type=NQLAttributeType.STRING,
+                            operator=(
+                                NQLAttributeOperator.LESS_THAN
+                                if sort_direction == "descending"
+                                else NQLAttributeOperator.GREATER_THAN
+                            ),
+                            value=escape_nql_criterion(runs[-1].attributes[SYS_ID]),
+                        ),
+                    ],
+                    aggregator=NQLAggregator.AND,
+                )
+            )
+
 
 def _verify_name_regex(collection_name: str, name_or_list: Optional[Union[str, Iterable[str]]]) -> None:
     if name_or_list is None:
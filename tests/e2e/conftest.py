@@ -49,7 +49,7 @@ def context(project):
 
 @pytest.fixture(scope="module")
 def executor() -> Executor:
-    return concurrency.create_thread_pool_executor()
+    return concurrency.create_executor()
 
 
 @pytest.fixture(scope="module")
@@ -0,0 +1,50 @@
+import os
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from neptune_fetcher.generated.neptune_api.credentials import Credentials
+from neptune_fetcher.internal import identifiers
+from neptune_fetcher.internal.api_utils import (
+    create_auth_api_client,
+    get_config_and_token_urls,
+)
+
+API_TOKEN_ENV_NAME: str = "NEPTUNE_API_TOKEN"
+
+
+@pytest.fixture(scope="session")
+def credentials() -> Credentials:
+    api_token = os.getenv(API_TOKEN_ENV_NAME)
+    if not api_token:
+        pytest.skip(f"{API_TOKEN_ENV_NAME} is not set")
+    return Credentials.from_api_key(api_key=api_token)
+
+
+@pytest.fixture(scope="session")
+def project_identifier() -> identifiers.ProjectIdentifier:
+    project = os.getenv("NEPTUNE_PROJECT")
+    if not project:
+        pytest.skip("NEPTUNE_PROJECT is not set")
+    return identifiers.ProjectIdentifier(project)
+
+
+@pytest.fixture(scope="session")
+def make_client(credentials):
+    config, token_urls = get_config_and_token_urls(credentials=credentials, proxies=None)
+
+    def make(**kwargs):
+        return create_auth_api_client(
+            credentials=credentials, config=config, token_refreshing_urls=token_urls, proxies=None, **kwargs
+        )
+
+    return make
+
+
+@contextmanager
+def measure(name: str, operations: int):
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    print(f"\n{name}: {elapsed:.3f}s total, {operations / elapsed:.1f} ops/s")
@@ -0,0 +1,28 @@
+import pytest
+
+from neptune_fetcher.internal import filters
+from neptune_fetcher.internal.retrieval import attribute_definitions
+from tests.performance.conftest import measure
+
+ALTERNATIVES = 30
+REPEATS = 5
+
+
+@pytest.mark.parametrize("merge", [False, True])
+def test_fetch_definitions_of_filter_alternatives(make_client, project_identifier, merge):
+    client = make_client()
+    attribute_filters = [
+        filters._AttributeFilter(must_match_any=[filters._AttributeNameFilter(must_match_regexes=[f"^.*{i}$"])])
+        for i in range(ALTERNATIVES)
+    ]
+    if merge:
+        attribute_filters = attribute_definitions.merge_attribute_filters(attribute_filters)
+
+    name = f"{ALTERNATIVES} alternatives, {'merged' if merge else 'split'} into {len(attribute_filters)} requests"
+    with measure(name, REPEATS):
+        for _ in range(REPEATS):
+            for attribute_filter in attribute_filters:
+                for _ in attribute_definitions.fetch_attribute_definitions_single_filter(
+                    client, [project_identifier], None, attribute_filter
+                ):
+                    pass
@@ -0,0 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from neptune_fetcher.internal.retrieval import search
+from neptune_fetcher.internal.transport import TransportSettings
+from tests.performance.conftest import measure
+
+REQUESTS = 1000
+WORKERS = 32
+
+
+@pytest.mark.parametrize(
+    "name, transport_settings",
+    [
+        ("http/1.1, default pool", TransportSettings(http2=False, max_connections=100, async_max_connections=100)),
+        (
+            "http/1.1, pool sized to workers",
+            TransportSettings(http2=False, max_connections=WORKERS, async_max_connections=WORKERS, keepalive_expiry=30),
+        ),
+        (
+            "http/2, 1 connection",
+            TransportSettings(http2=True, max_connections=1, async_max_connections=1, max_concurrent_streams=64),
+        ),
+        (
+            "http/2, 4 connections",
+            TransportSettings(http2=True, max_connections=4, async_max_connections=4, max_concurrent_streams=16),
+        ),
+    ],
+)
+def test_many_small_requests(make_client, project_identifier, name, transport_settings):
+    client = make_client(transport_settings=transport_settings)
+
+    def fetch_one(_):
+        return next(search.fetch_experiment_sys_attrs(client, project_identifier, limit=1, batch_size=1), None)
+
+    # Establish the connections and the access token outside the measurement
+    with ThreadPoolExecutor(WORKERS) as executor:
+        list(executor.map(fetch_one, range(WORKERS)))
+
+        with measure(name, REQUESTS):
+            list(executor.map(fetch_one, range(REQUESTS)))
+
+    print(client.get_transport_stats())
@@ -0,0 +1,43 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from tests.performance.conftest import measure
+
+REPEATS = 5
+
+HEAVY_MODULES = [
+    "pandas",
+    "numpy",
+    "azure.storage.blob",
+    "tqdm",
+    "httpx",
+    "neptune_fetcher.generated.neptune_api.models",
+    "google.protobuf",
+]
+
+
+def import_in_fresh_interpreter(module: str) -> list[str]:
+    code = (
+        "import json, sys, warnings; warnings.simplefilter('ignore'); "
+        f"import {module}; print(json.dumps(list(sys.modules)))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    return json.loads(result.stdout)
+
+
+@pytest.mark.parametrize("module", ["neptune_fetcher", "neptune_fetcher.alpha", "neptune_fetcher.alpha.runs"])
+def test_import_doesnt_load_heavy_modules(module):
+    with measure(f"import {module}, fresh interpreter", REPEATS):
+        for _ in range(REPEATS):
+            loaded = import_in_fresh_interpreter(module)
+
+    assert [heavy for heavy in HEAVY_MODULES if heavy in loaded] == []
+
+
+def test_interpreter_start_up_baseline():
+    with measure("interpreter start-up", REPEATS):
+        for _ in range(REPEATS):
+            import_in_fresh_interpreter("json")
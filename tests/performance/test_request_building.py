@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from neptune_fetcher.generated.neptune_api.models import (
+    FloatTimeSeriesValuesRequest,
+    SeriesValuesRequest,
+)
+from neptune_fetcher.internal import identifiers
+from neptune_fetcher.internal.retrieval import (
+    metrics,
+    series,
+    util,
+)
+from tests.performance.conftest import measure
+
+SERIES = 10_000
+REPEATS = 10
+
+PROJECT = identifiers.ProjectIdentifier("workspace/project")
+RUN_ATTRIBUTES = [
+    identifiers.RunAttributeDefinition(
+        run_identifier=identifiers.RunIdentifier(PROJECT, identifiers.SysId(f"RUN-{i // 100}")),
+        attribute_definition=identifiers.AttributeDefinition(f"metrics/m{i % 100}", "float_series"),
+    )
+    for i in range(SERIES)
+]
+
+
+@pytest.mark.parametrize(
+    "name, make_body",
+    [
+        ("metrics, attrs model", FloatTimeSeriesValuesRequest.from_dict),
+        ("metrics, json body", util.JsonBody),
+    ],
+)
+def test_build_metrics_request(name, make_body):
+    _, params = metrics._make_metrics_params(
+        RUN_ATTRIBUTES, include_inherited=True, include_preview=False, step_range=(None, None), tail_limit=None
+    )
+    params["perSeriesPointsLimit"] = metrics.TOTAL_POINT_LIMIT // SERIES
+
+    with measure(f"{name}, {SERIES} series", REPEATS):
+        for _ in range(REPEATS):
+            json.dumps(make_body(params).to_dict())
+
+
+@pytest.mark.parametrize(
+    "name, make_body",
+    [
+        ("series, attrs model", SeriesValuesRequest.from_dict),
+        ("series, json body", util.JsonBody),
+    ],
+)
+def test_build_series_request(name, make_body):
+    _, params = series._make_series_params(
+        RUN_ATTRIBUTES, include_inherited=True, step_range=(None, None), tail_limit=None
+    )
+
+    with measure(f"{name}, {SERIES} series", REPEATS):
+        for _ in range(REPEATS):
+            json.dumps(make_body(params).to_dict())
@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+import pytest
+
+import neptune_fetcher.alpha as npt
+from neptune_fetcher.alpha import runs
+from neptune_fetcher.internal.identifiers import (
+    ProjectIdentifier,
+    SysId,
+)
+from neptune_fetcher.internal.retrieval.search import ContainerType
+from neptune_fetcher.internal.run_set import RunSet
+
+EXPERIMENTS = RunSet(
+    project_identifier=ProjectIdentifier("workspace/other-project"),
+    container_type=ContainerType.EXPERIMENT,
+    sys_ids=(SysId("ABC-1"), SysId("ABC-2")),
+    labels=("exp-1", "exp-2"),
+)
+
+
+def test_fetch_with_run_set_skips_the_filter():
+    with patch("neptune_fetcher.internal.composition.fetch_metrics.fetch_metrics") as fetch_metrics:
+        npt.fetch_metrics(EXPERIMENTS, "loss", context=npt.Context(api_token="token", project="workspace/project"))
+
+    kwargs = fetch_metrics.call_args.kwargs
+    assert kwargs["run_set"] is EXPERIMENTS
+    assert kwargs["filter_"] is None
+    assert kwargs["project_identifier"] == "workspace/other-project"
+
+
+def test_fetch_with_run_set_of_other_container_type():
+    with pytest.raises(ValueError, match="Expected a RunSet of runs"):
+        runs.fetch_runs_table(EXPERIMENTS)
+
+
+def test_fetch_across_projects_with_run_set():
+    with pytest.raises(ValueError, match="`projects`"):
+        npt.fetch_experiments_table(EXPERIMENTS, projects=["workspace"])
@@ -0,0 +1,118 @@
+from unittest.mock import patch
+
+import pytest
+
+from neptune_fetcher.internal import filters
+from neptune_fetcher.internal.composition import concurrency
+from neptune_fetcher.internal.composition.attributes import (
+    AttributeDefinitionAggregation,
+    fetch_attribute_definition_aggregations,
+    fetch_attribute_definitions,
+)
+from neptune_fetcher.internal.identifiers import (
+    AttributeDefinition,
+    ProjectIdentifier,
+)
+from neptune_fetcher.internal.retrieval import util
+
+PROJECT = ProjectIdentifier("workspace/project")
+FLOAT_SERIES = AttributeDefinition("metrics/loss", "float_series")
+STRING = AttributeDefinition("config/name", "string")
+
+
+@pytest.fixture
+def executor():
+    with concurrency.create_executor("definitions") as executor:
+        yield executor
+
+
+def _pages_by_filter(pages):
+    def fetch_single_filter(attribute_filter, **kwargs):
+        return iter(pages[attribute_filter.name_eq])
+
+    return fetch_single_filter
+
+
+@patch("neptune_fetcher.internal.retrieval.attribute_definitions.fetch_attribute_definitions_single_filter")
+def test_fetch_attribute_definitions_deduplicates_alternatives(fetch_single_filter, executor):
+    fetch_single_filter.side_effect = _pages_by_filter(
+        {
+            "a": [util.Page(items=[FLOAT_SERIES]), util.Page(items=[STRING])],
+            "b": [util.Page(items=[STRING, FLOAT_SERIES])],
+        }
+    )
+    # Different types keep the filters from being merged into a single request
+    attribute_filter = filters._BaseAttributeFilter.any(
+        [
+            filters._AttributeFilter(name_eq="a"),
+            filters._AttributeFilter(name_eq="b", type_in=["string", "float_series"]),
+        ]
+    )
+
+    pages = list(
+        fetch_attribute_definitions(
+            client=None,
+            project_identifiers=[PROJECT],
+            run_identifiers=None,
+            attribute_filter=attribute_filter,
+            executor=executor,
+        )
+    )
+
+    items = [item for page in pages for item in page.items]
+    assert sorted(items, key=lambda d: d.name) == [STRING, FLOAT_SERIES]
+
+
+@patch("neptune_fetcher.internal.retrieval.attribute_definitions.fetch_attribute_definitions_single_filter")
+def test_fetch_attribute_definition_aggregations_per_filter(fetch_single_filter, executor):
+    fetch_single_filter.side_effect = _pages_by_filter(
+        {
+            "a": [util.Page(items=[FLOAT_SERIES])],
+            "b": [util.Page(items=[FLOAT_SERIES, STRING])],
+        }
+    )
+    attribute_filter = filters._BaseAttributeFilter.any(
+        [
+            filters._AttributeFilter(name_eq="a", aggregations=["last", "min"]),
+            filters._AttributeFilter(name_eq="b", aggregations=["last", "max"]),
+        ]
+    )
+
+    pages = list(
+        fetch_attribute_definition_aggregations(
+            client=None,
+            project_identifiers=[PROJECT],
+            run_identifiers=[],
+            attribute_filter=attribute_filter,
+            executor=executor,
+        )
+    )
+
+    definitions = [item for page, _ in pages for item in page.items]
+    aggregations = {item for _, page in pages for item in page.items}
+    assert sorted(definitions, key=lambda d: d.name) == [STRING, FLOAT_SERIES]
+    assert aggregations == {
+        AttributeDefinitionAggregation(FLOAT_SERIES, aggregation) for aggregation in ("last", "min", "max")
+    }
+
+
+@patch("neptune_fetcher.internal.retrieval.attribute_definitions.fetch_attribute_definitions_single_filter")
+def test_fetch_attribute_definitions_sends_single_request_for_alternatives(fetch_single_filter, executor):
+    fetch_single_filter.side_effect = lambda **kwargs: iter([util.Page(items=[FLOAT_SERIES])])
+    attribute_filter = filters._BaseAttributeFilter.any(
+        [filters._AttributeFilter(name_eq=f"metrics/m{i}") for i in range(30)]
+    )
+
+    pages = list(
+        fetch_attribute_definitions(
+            client=None,
+            project_identifiers=[PROJECT],
+            run_identifiers=None,
+            attribute_filter=attribute_filter,
+            executor=executor,
+        )
+    )
+
+    assert [item for page in pages for item in page.items] == [FLOAT_SERIES]
+    assert fetch_single_filter.call_count == 1
+    assert len(fetch_single_filter.call_args.kwargs["attribute_filter"].must_match_any) == 30
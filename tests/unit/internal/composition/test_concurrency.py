@@ -0,0 +1,333 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from neptune_fetcher.internal import cancellation
+from neptune_fetcher.internal.composition import concurrency
+from neptune_fetcher.internal.composition.concurrency import (
+    Priority,
+    WorkerPool,
+)
+from neptune_fetcher.internal.retrieval.metrics_decoding import POINT_DTYPE
+
+
+@pytest.fixture(autouse=True)
+def fresh_worker_pool():
+    concurrency.shutdown_worker_pool()
+    yield
+    concurrency.shutdown_worker_pool()
+
+
+def test_executors_share_worker_pool():
+    with concurrency.create_executor() as executor:
+        first_thread = executor.submit(threading.current_thread).result()
+
+    with concurrency.create_executor() as executor:
+        second_thread = executor.submit(threading.current_thread).result()
+
+    assert first_thread is second_thread
+    assert first_thread.name.startswith("neptune-fetcher-general")
+
+
+def test_queues_are_served_by_separate_workers():
+    with (
+        concurrency.create_executor() as executor,
+        concurrency.create_executor("definitions") as definitions_executor,
+    ):
+        general_thread = executor.submit(threading.current_thread).result()
+        definitions_thread = definitions_executor.submit(threading.current_thread).result()
+
+    assert general_thread is not definitions_thread
+    assert definitions_thread.name.startswith("neptune-fetcher-definitions")
+
+
+def test_work_waiting_on_other_queue_does_not_starve():
+    pool = WorkerPool(max_workers=1)
+    try:
+        inner = pool.submit("general", lambda: pool.submit("definitions", lambda: 42).result())
+        assert inner.result(timeout=5) == 42
+    finally:
+        pool.shutdown()
+
+
+def test_shutdown_of_executor_waits_only_for_own_work():
+    release = threading.Event()
+
+    with concurrency.create_executor() as other_executor:
+        blocked = other_executor.submit(release.wait)
+
+        with concurrency.create_executor() as executor:
+            done = executor.submit(lambda: 1)
+
+        assert done.done()
+        assert not blocked.done()
+        release.set()
+
+
+def test_resize_limits_number_of_workers():
+    pool = WorkerPool(max_workers=1)
+    try:
+        barrier = threading.Barrier(3, timeout=5)
+        pool.resize(3)
+        futures = [pool.submit("general", barrier.wait) for _ in range(3)]
+        assert sorted(f.result(timeout=5) for f in futures) == [0, 1, 2]
+    finally:
+        pool.shutdown()
+
+
+def test_shutdown_cancels_pending_work():
+    pool = WorkerPool(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    running = pool.submit("general", lambda: started.set() or release.wait())
+    pending = pool.submit("general", lambda: None)
+    started.wait(timeout=5)
+    pool.shutdown()
+    release.set()
+
+    assert running.result(timeout=5) is True
+    assert pending.cancelled()
+    with pytest.raises(RuntimeError):
+        pool.submit("general", lambda: None)
+
+
+def test_more_urgent_work_is_started_first():
+    pool = WorkerPool(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    try:
+        pool.submit("general", lambda: started.set() or release.wait())
+        started.wait(timeout=5)
+        futures = [
+            pool.submit_with_priority("general", Priority.DOWNLOADS, order.append, "downloads"),
+            pool.submit_with_priority("general", Priority.VALUES, order.append, "values-1"),
+            pool.submit_with_priority("general", Priority.DISCOVERY, order.append, "discovery"),
+            pool.submit_with_priority("general", Priority.VALUES, order.append, "values-2"),
+            pool.submit_with_priority("general", Priority.DEFINITIONS, order.append, "definitions"),
+        ]
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+    finally:
+        pool.shutdown()
+
+    assert order == ["discovery", "definitions", "values-1", "values-2", "downloads"]
+
+
+def test_worker_pool_is_recreated_after_shutdown():
+    pool = concurrency.get_worker_pool()
+    concurrency.shutdown_worker_pool()
+
+    assert concurrency.get_worker_pool() is not pool
+
+
+def test_generate_concurrently_gathers_all_results():
+    with concurrency.create_executor() as executor:
+        output = concurrency.generate_concurrently(
+            items=(i for i in range(100)),
+            executor=executor,
+            downstream=concurrency.return_value,
+        )
+        results = list(concurrency.gather_results(output))
+
+    assert sorted(results) == list(range(100))
+
+
+def test_generate_concurrently_bounds_pending_items(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_STAGE_QUEUE_SIZE", "3")
+    release = threading.Event()
+    pulled = []
+    results = []
+
+    def items():
+        for i in range(10):
+            pulled.append(i)
+            yield i
+
+    def downstream(item):
+        release.wait()
+        return concurrency.return_value(item)
+
+    with concurrency.create_executor() as executor:
+        output = concurrency.generate_concurrently(items=items(), executor=executor, downstream=downstream)
+        consumer = threading.Thread(target=lambda: results.extend(concurrency.gather_results(output)))
+        consumer.start()
+        time.sleep(0.2)
+        assert len(pulled) == 3
+
+        release.set()
+        consumer.join(timeout=5)
+
+    assert sorted(results) == list(range(10))
+
+
+def test_generate_concurrently_does_not_pull_before_gathering():
+    pulled = []
+
+    def items():
+        for i in range(3):
+            pulled.append(i)
+            yield i
+
+    with concurrency.create_executor() as executor:
+        output = concurrency.generate_concurrently(
+            items=items(), executor=executor, downstream=concurrency.return_value
+        )
+        time.sleep(0.1)
+        assert pulled == []
+
+        assert sorted(concurrency.gather_results(output)) == [0, 1, 2]
+
+
+def test_gather_results_pauses_producers_when_consumer_falls_behind(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_MAX_INFLIGHT_BYTES", "1000")
+    monkeypatch.setenv("NEPTUNE_FETCHER_STAGE_QUEUE_SIZE", "100")
+    pulled = []
+
+    def items():
+        for i in range(20):
+            pulled.append(i)
+            yield i
+
+    with concurrency.create_executor() as executor:
+        output = concurrency.generate_concurrently(
+            items=items(),
+            executor=executor,
+            downstream=lambda i: concurrency.return_value([i] * 10),
+        )
+        results = concurrency.gather_results(output)
+        first = next(results)
+        time.sleep(0.1)
+        pulled_while_paused = len(pulled)
+        time.sleep(0.1)
+
+        assert len(pulled) == pulled_while_paused
+        assert pulled_while_paused < 20
+
+        rest = list(results)
+
+    assert sorted(values[0] for values in [first] + rest) == list(range(20))
+
+
+def test_estimated_size_of_point_arrays_is_their_size_in_bytes():
+    points = np.zeros(1000, dtype=POINT_DTYPE)
+
+    assert concurrency._estimate_size_bytes({"a": points}) == points.nbytes
+    assert concurrency._estimate_size_bytes([("a", points)]) < points.nbytes
+
+
+def test_gather_results_without_inflight_limit(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_MAX_INFLIGHT_BYTES", "")
+
+    with concurrency.create_executor() as executor:
+        output = concurrency.generate_concurrently(
+            items=(i for i in range(50)), executor=executor, downstream=concurrency.return_value
+        )
+        results = list(concurrency.gather_results(output))
+
+    assert sorted(results) == list(range(50))
+
+
+def test_nested_stages_complete_with_single_worker():
+    concurrency.set_max_workers(1)
+
+    with concurrency.create_executor() as executor:
+        output = concurrency.generate_concurrently(
+            items=(i for i in range(5)),
+            executor=executor,
+            downstream=lambda i: concurrency.generate_concurrently(
+                items=(i * 10 + j for j in range(5)),
+                executor=executor,
+                downstream=concurrency.return_value,
+            ),
+        )
+        results = list(concurrency.gather_results(output))
+
+    assert sorted(results) == [i * 10 + j for i in range(5) for j in range(5)]
+
+
+def test_gather_results_raises_downstream_error():
+    def downstream(item):
+        if item == 3:
+            raise ValueError("failed")
+        return concurrency.return_value(item)
+
+    with concurrency.create_executor() as executor:
+        output = concurrency.generate_concurrently(
+            items=(i for i in range(5)), executor=executor, downstream=downstream
+        )
+        with pytest.raises(ValueError, match="failed"):
+            list(concurrency.gather_results(output))
+
+
+def test_gather_results_cancels_pending_work_on_error():
+    concurrency.set_max_workers(1)
+    started = []
+
+    def downstream(item):
+        started.append(item)
+        if len(started) == 1:
+            raise ValueError("failed")
+        time.sleep(0.01)
+        return concurrency.return_value(item)
+
+    with pytest.raises(ValueError, match="failed"):
+        with concurrency.create_executor() as executor:
+            output = concurrency.fork_concurrently(
+                executor=executor,
+                downstreams=[lambda i=i: downstream(i) for i in range(100)],
+            )
+            list(concurrency.gather_results(output))
+
+    assert len(started) < 100
+
+
+def test_executor_exited_with_error_does_not_wait_for_running_work():
+    started = threading.Event()
+    stopped = threading.Event()
+
+    def work():
+        started.set()
+        try:
+            cancellation.sleep(60)
+        finally:
+            stopped.set()
+
+    start_time = time.monotonic()
+    with pytest.raises(KeyboardInterrupt):
+        with concurrency.create_executor() as executor:
+            future = executor.submit(work)
+            started.wait(timeout=5)
+            raise KeyboardInterrupt()
+
+    assert stopped.wait(timeout=5)
+    assert time.monotonic() - start_time < 5
+    with pytest.raises(cancellation.FetchCancelledError):
+        future.result(timeout=5)
+
+
+def test_cancelled_stage_stops_pulling():
+    pulled = []
+
+    def items():
+        for i in range(100):
+            pulled.append(i)
+            yield i
+
+    with concurrency.create_executor() as executor:
+        output = concurrency.generate_concurrently(
+            items=items(), executor=executor, downstream=concurrency.return_value
+        )
+        results = concurrency.gather_results(output)
+        next(results)
+        executor.cancellation_token.cancel()
+
+        with pytest.raises(cancellation.FetchCancelledError):
+            list(results)
+
+    assert len(pulled) < 100
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from neptune_fetcher.internal.composition.concurrency_async import (
+    TaskGroup,
+    collect,
+    merge,
+)
+
+
+async def produce(items, delay=0.0):
+    for item in items:
+        await asyncio.sleep(delay)
+        yield item
+
+
+async def fail_after(items, error):
+    for item in items:
+        yield item
+    raise error
+
+
+def test_merge_yields_items_of_all_iterables():
+    async def run():
+        return await collect(merge([produce(range(0, 5)), produce(range(5, 10), delay=0.001), produce([])]))
+
+    assert sorted(asyncio.run(run())) == list(range(10))
+
+
+def test_merge_raises_error_and_cancels_other_iterables():
+    async def run():
+        finished = []
+
+        async def slow():
+            await asyncio.sleep(10)
+            finished.append(True)
+            yield 0
+
+        with pytest.raises(ValueError, match="failed"):
+            await collect(merge([slow(), fail_after([1, 2], ValueError("failed"))]))
+        return finished
+
+    assert asyncio.run(run()) == []
+
+
+def test_task_group_waits_for_tasks_created_by_other_tasks():
+    async def run():
+        results = []
+
+        async with TaskGroup() as group:
+
+            async def child(i):
+                await asyncio.sleep(0.001)
+                results.append(i)
+
+            async def parent():
+                for i in range(3):
+                    group.create_task(child(i))
+
+            group.create_task(parent())
+
+        return results
+
+    assert sorted(asyncio.run(run())) == [0, 1, 2]
+
+
+def test_task_group_cancels_remaining_tasks_on_error():
+    async def run():
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def failing():
+            raise ValueError("failed")
+
+        with pytest.raises(ValueError, match="failed"):
+            async with TaskGroup() as group:
+                group.create_task(slow())
+                group.create_task(failing())
+
+        return cancelled
+
+    assert asyncio.run(run()) == [True]
+
+
+def test_task_group_bounds_tasks_created_in_slots():
+    async def run():
+        slots = asyncio.Semaphore(2)
+        running, max_running = 0, 0
+
+        async def child():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        async with TaskGroup() as group:
+            for _ in range(10):
+                await group.create_task_in_slot(child(), slots)
+
+        return max_running, slots.locked()
+
+    assert asyncio.run(run()) == (2, False)
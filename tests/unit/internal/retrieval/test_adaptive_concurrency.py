@@ -0,0 +1,245 @@
+import asyncio
+import gc
+import threading
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from neptune_fetcher.generated.neptune_api.credentials import Credentials
+from neptune_fetcher.generated.neptune_api.types import Response
+from neptune_fetcher.internal import cancellation
+from neptune_fetcher.internal.api_utils import (
+    TokenRefreshingURLs,
+    create_auth_api_client,
+)
+from neptune_fetcher.internal.retrieval import adaptive_concurrency
+from neptune_fetcher.internal.retrieval.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from neptune_fetcher.internal.retrieval.retry import limit_concurrency
+
+
+def response(status_code):
+    return Response(status_code=httpx.codes(status_code), content=b"", headers={}, parsed=None)
+
+
+def complete(limiter, overloaded, latency=0.01):
+    limiter.acquire()
+    limiter.release(time.monotonic() - latency, overloaded)
+
+
+def test_limit_is_halved_on_overload():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=16)
+
+    complete(limiter, overloaded=True)
+
+    assert limiter.limit == 4
+
+
+def test_limit_is_decreased_once_per_round_trip():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=16)
+    started_at = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+
+    for _ in range(3):
+        limiter.release(started_at, overloaded=True)
+
+    assert limiter.limit == 4
+
+
+def test_limit_does_not_drop_below_minimum():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=1)
+
+    for _ in range(5):
+        complete(limiter, overloaded=True)
+
+    assert limiter.limit == 1
+
+
+def test_limit_grows_while_healthy_up_to_maximum():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+
+    for _ in range(3):
+        complete(limiter, overloaded=False)
+    assert limiter.limit == 3
+
+    for _ in range(100):
+        complete(limiter, overloaded=False)
+    assert limiter.limit == 4
+
+
+def test_neutral_outcome_does_not_change_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8)
+
+    complete(limiter, overloaded=None)
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+def test_slow_response_is_not_treated_as_overload():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8)
+    for _ in range(5):
+        complete(limiter, overloaded=False, latency=0.01)
+
+    complete(limiter, overloaded=False, latency=1.0)
+
+    assert limiter.limit == 8
+
+
+def test_acquire_blocks_beyond_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    thread = threading.Thread(target=lambda: limiter.acquire() or acquired.set())
+    thread.start()
+    assert not acquired.wait(timeout=0.1)
+
+    limiter.release(time.monotonic(), overloaded=None)
+    assert acquired.wait(timeout=5)
+    thread.join()
+
+
+def test_cancelled_waiter_stops_waiting_and_does_not_hold_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    limiter.acquire()
+    token = cancellation.CancellationToken()
+    errors = []
+
+    def acquire():
+        with cancellation.use_token(token):
+            try:
+                limiter.acquire()
+            except cancellation.FetchCancelledError as e:
+                errors.append(e)
+
+    thread = threading.Thread(target=acquire)
+    thread.start()
+    token.cancel()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert len(errors) == 1
+    limiter.release(time.monotonic(), overloaded=None)
+    assert limiter.in_flight == 0
+
+
+def test_acquire_async_waits_for_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+
+    async def run():
+        await limiter.acquire_async()
+        waiting = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+
+        limiter.release(time.monotonic(), overloaded=None)
+        await asyncio.wait_for(waiting, timeout=5)
+
+    asyncio.run(run())
+    assert limiter.in_flight == 1
+
+
+def test_cancelled_async_waiter_does_not_hold_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+
+    async def run():
+        await limiter.acquire_async()
+        waiting = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+        limiter.release(time.monotonic(), overloaded=None)
+
+    asyncio.run(run())
+    assert limiter.in_flight == 0
+
+
+def test_limit_concurrency_shrinks_limit_of_client_on_rate_limit(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_MAX_WORKERS", "8")
+    client = Mock()
+    func = limit_concurrency(Mock(return_value=response(429)))
+
+    func(client=client)
+
+    limiter = adaptive_concurrency.get_concurrency_limiter(client)
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+def test_limit_concurrency_shrinks_limit_on_transport_error(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_MAX_WORKERS", "8")
+    client = Mock()
+    func = limit_concurrency(Mock(side_effect=httpx.ConnectError("failed")))
+
+    with pytest.raises(httpx.ConnectError):
+        func(client=client)
+
+    assert adaptive_concurrency.get_concurrency_limiter(client).limit == 4
+
+
+def test_limit_concurrency_shrinks_limit_on_timeout(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_MAX_WORKERS", "8")
+    client = Mock()
+    func = limit_concurrency(Mock(side_effect=httpx.ReadTimeout("timed out")))
+
+    with pytest.raises(httpx.ReadTimeout):
+        func(client=client)
+
+    assert adaptive_concurrency.get_concurrency_limiter(client).limit == 4
+
+
+def test_limit_concurrency_keeps_limit_on_other_errors(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_MAX_WORKERS", "8")
+    client = Mock()
+    func = limit_concurrency(Mock(side_effect=cancellation.FetchCancelledError()))
+
+    with pytest.raises(cancellation.FetchCancelledError):
+        func(client=client)
+
+    limiter = adaptive_concurrency.get_concurrency_limiter(client)
+    assert limiter.limit == 8
+    assert limiter.in_flight == 0
+
+
+def test_limiters_are_separate_per_client():
+    first, second = Mock(), Mock()
+
+    assert adaptive_concurrency.get_concurrency_limiter(first) is adaptive_concurrency.get_concurrency_limiter(first)
+    assert adaptive_concurrency.get_concurrency_limiter(first) is not adaptive_concurrency.get_concurrency_limiter(
+        second
+    )
+
+
+def test_adaptive_concurrency_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_ADAPTIVE_CONCURRENCY", "false")
+
+    assert adaptive_concurrency.get_concurrency_limiter(Mock()) is None
+
+
+def test_limit_concurrency_with_real_client():
+    client = create_auth_api_client(
+        credentials=Credentials(api_key="api-key", base_url="https://example.neptune.ai"),
+        config=Mock(),
+        token_refreshing_urls=TokenRefreshingURLs(
+            "https://example.neptune.ai/auth", "https://example.neptune.ai/token"
+        ),
+    )
+    func = limit_concurrency(Mock(return_value=response(200)))
+
+    assert func(client=client).status_code == 200
+    assert adaptive_concurrency.get_concurrency_limiter(client).in_flight == 0
+
+
+def test_limiter_is_discarded_with_its_client():
+    client = Mock()
+    limiter = adaptive_concurrency.get_concurrency_limiter(client)
+
+    del client
+    gc.collect()
+
+    assert all(item is not limiter for item in adaptive_concurrency._limiters._items.values())
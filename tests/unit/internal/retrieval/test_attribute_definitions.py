@@ -0,0 +1,93 @@
+import pytest
+
+from neptune_fetcher.internal import filters
+from neptune_fetcher.internal.env import NEPTUNE_FETCHER_QUERY_SIZE_LIMIT
+from neptune_fetcher.internal.identifiers import ProjectIdentifier
+from neptune_fetcher.internal.retrieval.attribute_definitions import (
+    _make_attribute_definitions_params,
+    merge_attribute_filters,
+)
+
+PROJECT = ProjectIdentifier("workspace/project")
+
+
+def _params(attribute_filter):
+    return _make_attribute_definitions_params([PROJECT], None, attribute_filter, batch_size=100)
+
+
+def _name_alternatives(attribute_filters):
+    return [
+        alternative
+        for attribute_filter in attribute_filters
+        for alternative in _params(attribute_filter)["attributeNameFilter"].get("mustMatchAny", [None])
+    ]
+
+
+def test_merged_filter_matches_the_alternatives_of_its_filters():
+    attribute_filters = [
+        filters._AttributeFilter(name_eq="a"),
+        filters._AttributeFilter(name_eq=["b", "c"]),
+        filters._AttributeFilter(
+            name_eq="d",
+            must_match_any=[
+                filters._AttributeNameFilter(must_match_regexes=["^d"], must_not_match_regexes=["x$"]),
+                filters._AttributeNameFilter(must_not_match_regexes=["y$"]),
+            ],
+        ),
+        filters._AttributeFilter(must_match_any=[filters._AttributeNameFilter(must_match_regexes=["^e/"])]),
+    ]
+
+    (merged,) = merge_attribute_filters(attribute_filters)
+
+    assert _name_alternatives([merged]) == _name_alternatives(attribute_filters)
+    assert _params(merged)["attributeFilter"] == _params(attribute_filters[0])["attributeFilter"]
+
+
+def test_filters_with_different_types_or_aggregations_are_not_merged():
+    attribute_filters = [
+        filters._AttributeFilter(name_eq="a", type_in=["float_series"]),
+        filters._AttributeFilter(name_eq="b", type_in=["float_series"], aggregations=["min"]),
+        filters._AttributeFilter(name_eq="c", type_in=["float"]),
+        filters._AttributeFilter(name_eq="d", type_in=["float_series"]),
+    ]
+
+    merged = merge_attribute_filters(attribute_filters)
+
+    assert [_name_alternatives([attribute_filter]) for attribute_filter in merged] == [
+        _name_alternatives([attribute_filters[0], attribute_filters[3]]),
+        _name_alternatives([attribute_filters[1]]),
+        _name_alternatives([attribute_filters[2]]),
+    ]
+    assert merged[1] is attribute_filters[1]
+    assert merged[2] is attribute_filters[2]
+
+
+def test_filters_with_aggregations_in_different_order_are_merged():
+    attribute_filters = [
+        filters._AttributeFilter(name_eq="a", type_in=["float_series"], aggregations=["min", "max"]),
+        filters._AttributeFilter(name_eq="b", type_in=["float_series"], aggregations=["max", "min"]),
+    ]
+
+    (merged,) = merge_attribute_filters(attribute_filters)
+
+    assert _name_alternatives([merged]) == _name_alternatives(attribute_filters)
+
+
+def test_filter_matching_all_names_absorbs_the_others():
+    attribute_filters = [filters._AttributeFilter(name_eq="a"), filters._AttributeFilter()]
+
+    (merged,) = merge_attribute_filters(attribute_filters)
+
+    assert _params(merged)["attributeNameFilter"] == {}
+
+
+@pytest.mark.parametrize("query_size_limit, expected_sizes", [(1000, [10]), (10, [2, 2, 2, 2, 2]), (1, [1] * 10)])
+def test_merged_filters_stay_within_query_size_limit(monkeypatch, query_size_limit, expected_sizes):
+    monkeypatch.setenv(NEPTUNE_FETCHER_QUERY_SIZE_LIMIT.name, str(query_size_limit))
+    # Each name is escaped into a regex of 5 characters, like ^a00$
+    attribute_filters = [filters._AttributeFilter(name_eq=f"a{i:02}") for i in range(10)]
+
+    merged = merge_attribute_filters(attribute_filters)
+
+    assert [len(_name_alternatives([attribute_filter])) for attribute_filter in merged] == expected_sizes
+    assert _name_alternatives(merged) == _name_alternatives(attribute_filters)
@@ -0,0 +1,183 @@
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+import httpx
+import pytest
+
+from neptune_fetcher.exceptions import (
+    NeptuneRetryError,
+    NeptuneServiceUnavailableError,
+)
+from neptune_fetcher.generated.neptune_api import Client
+from neptune_fetcher.generated.neptune_api.api.backend import get_client_config
+from neptune_fetcher.generated.neptune_api.credentials import Credentials
+from neptune_fetcher.generated.neptune_api.models import ClientConfig
+from neptune_fetcher.internal.api_utils import (
+    TokenRefreshingURLs,
+    create_auth_api_client,
+)
+from neptune_fetcher.internal.retrieval.circuit_breaker import (
+    CircuitBreaker,
+    RetryBudget,
+    get_circuit_breaker,
+    get_retry_budget,
+)
+from neptune_fetcher.internal.retrieval.retry import (
+    break_circuit,
+    handle_errors_default,
+    retry_backoff,
+)
+
+
+@pytest.fixture
+def clock():
+    now = [1000.0]
+    with patch("time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+@pytest.fixture(autouse=True)
+def sleep():
+    with patch("time.sleep") as p:
+        yield p
+
+
+def _response(status_code):
+    return Mock(status_code=Mock(value=status_code), content=b"", headers={})
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+
+    for _ in range(2):
+        breaker.release(breaker.acquire(), failed=True)
+    breaker.release(breaker.acquire(), failed=False)
+    for _ in range(2):
+        breaker.release(breaker.acquire(), failed=True)
+    assert not breaker.is_open
+
+    breaker.release(breaker.acquire(), failed=True)
+    assert breaker.is_open
+    assert breaker.acquire() is None
+
+
+def test_breaker_lets_single_probe_through_after_reset_timeout(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.release(breaker.acquire(), failed=True)
+
+    clock[0] += 10
+    assert breaker.acquire() is True
+    assert breaker.acquire() is None
+
+    breaker.release(True, failed=False)
+    assert not breaker.is_open
+    assert breaker.acquire() is False
+
+
+def test_failed_probe_opens_breaker_again(clock):
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=10)
+    for _ in range(5):
+        breaker.release(breaker.acquire(), failed=True)
+
+    clock[0] += 10
+    breaker.release(breaker.acquire(), failed=True)
+
+    assert breaker.acquire() is None
+    clock[0] += 10
+    assert breaker.acquire() is True
+
+
+def test_abandoned_probe_lets_another_probe_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.release(breaker.acquire(), failed=True)
+    clock[0] += 10
+
+    breaker.release(breaker.acquire(), failed=None)
+
+    assert breaker.is_open
+    assert breaker.acquire() is True
+
+
+def test_retry_budget_is_replenished_by_requests_and_time(clock):
+    budget = RetryBudget(ratio=0.5, min_retries_per_second=1)
+    while budget.try_acquire_retry():
+        pass
+
+    for _ in range(4):
+        budget.record_request()
+    assert [budget.try_acquire_retry() for _ in range(3)] == [True, True, False]
+
+    clock[0] += 1
+    assert budget.try_acquire_retry()
+    assert not budget.try_acquire_retry()
+
+
+def test_open_breaker_fails_calls_without_retrying(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_CIRCUIT_BREAKER_THRESHOLD", "3")
+    func = Mock(return_value=_response(500), __module__=__name__)
+    decorated = retry_backoff(max_tries=10)(break_circuit(func))
+
+    with pytest.raises(NeptuneServiceUnavailableError):
+        decorated(client=Mock())
+
+    assert func.call_count == 3
+
+
+def test_breaker_is_disabled_with_empty_threshold(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_CIRCUIT_BREAKER_THRESHOLD", "")
+    func = Mock(return_value=_response(500), __module__=__name__)
+
+    with pytest.raises(NeptuneRetryError):
+        retry_backoff(max_tries=10)(break_circuit(func))(client=Mock())
+
+    assert func.call_count == 10
+
+
+def test_retries_stop_when_budget_is_used_up(monkeypatch, clock):
+    monkeypatch.setenv("NEPTUNE_FETCHER_RETRY_BUDGET_RATIO", "0.2")
+    client = Mock()
+    func = Mock(return_value=_response(500))
+
+    with pytest.raises(NeptuneRetryError):
+        retry_backoff(max_tries=1000)(func)(client=client)
+
+    # The first attempt and the retries saved up in a full budget
+    assert func.call_count == 101
+
+
+@pytest.fixture
+def short_retries(monkeypatch):
+    # A request failing inside the retry layer is retried until the timeout, so the tests fail fast instead
+    monkeypatch.setenv("NEPTUNE_FETCHER_RETRY_SOFT_TIMEOUT", "1")
+    monkeypatch.setenv("NEPTUNE_FETCHER_RETRY_HARD_TIMEOUT", "1")
+
+
+def test_retry_layer_with_real_authenticated_client(short_retries):
+    client = create_auth_api_client(
+        credentials=Credentials(api_key="api-key", base_url="https://example.neptune.ai"),
+        config=Mock(),
+        token_refreshing_urls=TokenRefreshingURLs(
+            "https://example.neptune.ai/auth", "https://example.neptune.ai/token"
+        ),
+    )
+    response = Mock(status_code=httpx.codes(200), content=b"", headers={})
+
+    assert handle_errors_default(Mock(return_value=response))(client=client) is response
+    assert get_circuit_breaker(client) is get_circuit_breaker(client)
+    assert get_retry_budget(client) is get_retry_budget(client)
+
+
+def test_retry_layer_with_real_unauthenticated_client(short_retries):
+    config = {
+        "apiUrl": "https://example.neptune.ai",
+        "pyLibVersions": {},
+        "security": {"clientId": "client-id", "openIdDiscovery": "https://example.neptune.ai/discovery"},
+    }
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=config))
+
+    with Client(base_url="https://example.neptune.ai", httpx_args={"transport": transport}) as client:
+        response = handle_errors_default(get_client_config.sync_detailed)(client=client)
+
+    assert isinstance(response.parsed, ClientConfig)
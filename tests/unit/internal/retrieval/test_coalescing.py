@@ -0,0 +1,161 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from neptune_fetcher.generated.neptune_api.api.retrieval import (
+    get_multiple_float_series_values_proto,
+    get_series_values_proto,
+)
+from neptune_fetcher.internal import cancellation
+from neptune_fetcher.internal.retrieval import util
+from neptune_fetcher.internal.retrieval.coalescing import (
+    coalesce_requests,
+    coalesce_requests_async,
+)
+
+CLIENT = Mock()
+
+
+def endpoint(**kwargs):
+    pass
+
+
+def blocking_call(release: threading.Event, calls: list):
+    def call(**kwargs):
+        calls.append(kwargs)
+        assert release.wait(timeout=5)
+        return Mock(content=b"OK")
+
+    return call
+
+
+def call_concurrently(func, kwargs_list, started_calls: list, expected_started: int, release: threading.Event):
+    with ThreadPoolExecutor(len(kwargs_list)) as executor:
+        futures = [executor.submit(func, **kwargs) for kwargs in kwargs_list]
+        while len(started_calls) < expected_started:
+            pass
+        # Give the other calls time to join the calls in flight
+        threading.Event().wait(0.2)
+        release.set()
+        return [future.result(timeout=5) for future in futures]
+
+
+def test_identical_concurrent_calls_share_response():
+    release, calls = threading.Event(), []
+    func = coalesce_requests(endpoint)(blocking_call(release, calls))
+
+    body = {"requests": [{"requestId": "0"}]}
+    results = call_concurrently(
+        func, [dict(client=CLIENT, body=util.JsonBody(dict(body))) for _ in range(4)], calls, 1, release
+    )
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_calls_with_different_arguments_or_clients_are_not_coalesced():
+    release, calls = threading.Event(), []
+    func = coalesce_requests(endpoint)(blocking_call(release, calls))
+
+    kwargs_list = [
+        dict(client=CLIENT, body=util.JsonBody({"a": 1})),
+        dict(client=CLIENT, body=util.JsonBody({"a": 2})),
+        dict(client=Mock(), body=util.JsonBody({"a": 1})),
+    ]
+    results = call_concurrently(func, kwargs_list, calls, 3, release)
+
+    assert len(calls) == 3
+    assert len({id(result) for result in results}) == 3
+
+
+def test_error_is_shared():
+    release, started = threading.Event(), []
+
+    def failing(**kwargs):
+        started.append(kwargs)
+        assert release.wait(timeout=5)
+        raise ValueError("failed")
+
+    func = coalesce_requests(endpoint)(failing)
+
+    with ThreadPoolExecutor(2) as executor:
+        futures = [executor.submit(func, client=CLIENT, body=util.JsonBody({})) for _ in range(2)]
+        while not started:
+            pass
+        threading.Event().wait(0.2)
+        release.set()
+
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result(timeout=5)
+    assert len(started) == 1
+
+
+def test_call_is_repeated_if_shared_call_was_cancelled():
+    release, calls = threading.Event(), []
+    token = cancellation.CancellationToken()
+
+    def call(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            assert release.wait(timeout=5)
+            token.cancel()
+            token.raise_if_cancelled()
+        return "OK"
+
+    func = coalesce_requests(endpoint)(call)
+
+    def cancelled_call():
+        with cancellation.use_token(token):
+            return func(client=CLIENT, body=util.JsonBody({}))
+
+    with ThreadPoolExecutor(2) as executor:
+        cancelled = executor.submit(cancelled_call)
+        while not calls:
+            pass
+        follower = executor.submit(func, client=CLIENT, body=util.JsonBody({}))
+        threading.Event().wait(0.2)
+        release.set()
+
+        with pytest.raises(cancellation.FetchCancelledError):
+            cancelled.result(timeout=5)
+        assert follower.result(timeout=5) == "OK"
+    assert len(calls) == 2
+
+
+def test_calls_are_not_coalesced_when_disabled(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_COALESCE_REQUESTS", "false")
+    release, calls = threading.Event(), []
+    func = coalesce_requests(endpoint)(blocking_call(release, calls))
+
+    call_concurrently(func, [dict(client=CLIENT, body=util.JsonBody({})) for _ in range(2)], calls, 2, release)
+
+    assert len(calls) == 2
+
+
+def test_series_values_endpoints_are_not_coalesced():
+    for module in (get_multiple_float_series_values_proto, get_series_values_proto):
+        assert coalesce_requests(module.sync_detailed)(module.sync_detailed) is module.sync_detailed
+        assert coalesce_requests_async(module.asyncio_detailed)(module.asyncio_detailed) is module.asyncio_detailed
+
+
+def test_identical_concurrent_async_calls_share_response():
+    calls = []
+
+    async def call(**kwargs):
+        calls.append(kwargs)
+        await asyncio.sleep(0.05)
+        return Mock(content=b"OK")
+
+    func = coalesce_requests_async(endpoint)(call)
+
+    async def run():
+        return await asyncio.gather(*[func(client=CLIENT, body=util.JsonBody({"a": 1})) for _ in range(4)])
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
@@ -0,0 +1,177 @@
+import datetime
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+import pytest
+
+from neptune_fetcher.internal import filters
+from neptune_fetcher.internal.identifiers import (
+    AttributeDefinition,
+    ProjectIdentifier,
+    RunIdentifier,
+    SysId,
+)
+from neptune_fetcher.internal.retrieval import (
+    attribute_definitions,
+    definitions_cache,
+    util,
+)
+from neptune_fetcher.internal.retrieval.attribute_values import AttributeValue
+
+PROJECT = ProjectIdentifier("workspace/project")
+RUNS = [RunIdentifier(PROJECT, SysId("ABC-1")), RunIdentifier(PROJECT, SysId("ABC-2"))]
+DEFINITIONS = [AttributeDefinition("loss", "float_series"), AttributeDefinition("lr", "float")]
+TIMES = {"workspace/project/ABC-1": "2025-01-01T00:00:00+00:00", "workspace/project/ABC-2": "2025-01-02T00:00:00+00:00"}
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_DEFINITIONS_CACHE_SIZE", "2")
+    monkeypatch.delenv("NEPTUNE_FETCHER_DEFINITIONS_CACHE_DIR", raising=False)
+    definitions_cache.clear()
+    yield
+    definitions_cache.clear()
+
+
+def test_cache_is_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("NEPTUNE_FETCHER_DEFINITIONS_CACHE_SIZE")
+
+    assert not definitions_cache.is_enabled()
+    definitions_cache.store("key", TIMES, DEFINITIONS)
+    assert definitions_cache.load("key", TIMES) is None
+
+
+def test_entry_reports_modified_runs():
+    definitions_cache.store("key", TIMES, DEFINITIONS)
+
+    assert definitions_cache.load("key", TIMES) == definitions_cache.CachedDefinitions(DEFINITIONS, modified_runs=[])
+    assert definitions_cache.load(
+        "key", {**TIMES, "workspace/project/ABC-2": "2025-01-03T00:00:00+00:00"}
+    ) == definitions_cache.CachedDefinitions(DEFINITIONS, modified_runs=["workspace/project/ABC-2"])
+    assert definitions_cache.load("key", {"workspace/project/ABC-1": TIMES["workspace/project/ABC-1"]}) is None
+    assert definitions_cache.load("other", TIMES) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    definitions_cache.store("a", TIMES, DEFINITIONS)
+    definitions_cache.store("b", TIMES, DEFINITIONS)
+    definitions_cache.load("a", TIMES)
+    definitions_cache.store("c", TIMES, DEFINITIONS)
+
+    assert definitions_cache.load("a", TIMES).definitions == DEFINITIONS
+    assert definitions_cache.load("b", TIMES) is None
+    assert definitions_cache.load("c", TIMES).definitions == DEFINITIONS
+
+
+def test_entries_on_disk_outlive_the_memory(monkeypatch, tmp_path):
+    monkeypatch.delenv("NEPTUNE_FETCHER_DEFINITIONS_CACHE_SIZE")
+    monkeypatch.setenv("NEPTUNE_FETCHER_DEFINITIONS_CACHE_DIR", str(tmp_path))
+    definitions_cache.store("key", TIMES, DEFINITIONS)
+    definitions_cache.clear()
+
+    assert definitions_cache.load("key", TIMES).definitions == DEFINITIONS
+
+    (entry,) = tmp_path.iterdir()
+    entry.write_text('{"version": 1, "key"')
+    assert definitions_cache.load("key", TIMES) is None
+
+
+def test_key_ignores_page_and_order_of_runs():
+    params = {"attributeNameFilter": {}, "nextPage": {"limit": 10}}
+
+    key = definitions_cache.make_key("https://example.neptune.ai", RUNS, params)
+
+    assert key == definitions_cache.make_key(
+        "https://example.neptune.ai", RUNS[::-1], {**params, "nextPage": {"limit": 10, "nextPageToken": "token"}}
+    )
+    assert key != definitions_cache.make_key("https://other.neptune.ai", RUNS, params)
+    assert key != definitions_cache.make_key("https://example.neptune.ai", RUNS[:1], params)
+
+
+def _modification_times(modified_at, last_modified_at=None):
+    return [
+        util.Page(
+            items=[
+                AttributeValue(definitions_cache.MODIFICATION_TIME, modified_at, run_identifier)
+                for run_identifier in RUNS[:-1]
+            ]
+            + [AttributeValue(definitions_cache.MODIFICATION_TIME, last_modified_at or modified_at, RUNS[-1])]
+        )
+    ]
+
+
+@pytest.mark.parametrize("project_identifiers", [[PROJECT, ProjectIdentifier("workspace/other")], [PROJECT]])
+def test_fetch_attribute_definitions_revalidates_cached_definitions(project_identifiers):
+    client = Mock(_base_url="https://example.neptune.ai")
+    modified_at = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def fetch():
+        pages = attribute_definitions.fetch_attribute_definitions_single_filter(
+            client, project_identifiers, iter(RUNS), filters._AttributeFilter(name_eq="loss")
+        )
+        return [item for page in pages for item in page.items]
+
+    with (
+        patch.object(
+            attribute_definitions,
+            "_fetch_attribute_definitions_pages",
+            side_effect=lambda *args: iter([util.Page(items=DEFINITIONS)]),
+        ) as fetch_pages,
+        patch.object(
+            attribute_definitions.attribute_values,
+            "fetch_attribute_values",
+            side_effect=lambda *args: _modification_times(modified_at),
+        ),
+    ):
+        assert fetch() == DEFINITIONS
+        assert fetch() == DEFINITIONS
+        cached_calls = fetch_pages.call_count
+
+        modified_at += datetime.timedelta(seconds=1)
+        assert fetch() == DEFINITIONS
+
+    if len(project_identifiers) == 1:
+        assert (cached_calls, fetch_pages.call_count) == (1, 2)
+    else:
+        assert (cached_calls, fetch_pages.call_count) == (2, 3)
+
+
+def test_fetch_attribute_definitions_refetches_only_modified_runs():
+    client = Mock(_base_url="https://example.neptune.ai")
+    modified_at = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    last_modified_at = modified_at
+    added = AttributeDefinition("accuracy", "float_series")
+
+    def fetch_pages(client, params, batch_size):
+        if params["experimentIdsFilter"] == ["workspace/project/ABC-2"]:
+            return iter([util.Page(items=[DEFINITIONS[0], added])])
+        return iter([util.Page(items=DEFINITIONS)])
+
+    def fetch():
+        pages = attribute_definitions.fetch_attribute_definitions_single_filter(
+            client, [PROJECT], RUNS, filters._AttributeFilter(type_in=["float", "float_series"])
+        )
+        return [item for page in pages for item in page.items]
+
+    with (
+        patch.object(
+            attribute_definitions, "_fetch_attribute_definitions_pages", side_effect=fetch_pages
+        ) as fetch_pages_mock,
+        patch.object(
+            attribute_definitions.attribute_values,
+            "fetch_attribute_values",
+            side_effect=lambda *args: _modification_times(modified_at, last_modified_at),
+        ),
+    ):
+        assert fetch() == DEFINITIONS
+
+        last_modified_at += datetime.timedelta(seconds=1)
+        assert fetch() == DEFINITIONS + [added]
+        assert fetch() == DEFINITIONS + [added]
+
+    assert [call.args[1]["experimentIdsFilter"] for call in fetch_pages_mock.call_args_list] == [
+        ["workspace/project/ABC-1", "workspace/project/ABC-2"],
+        ["workspace/project/ABC-2"],
+    ]
@@ -0,0 +1,228 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from neptune_fetcher.generated.neptune_api.api.retrieval import get_series_values_proto
+from neptune_fetcher.generated.neptune_api.api.storage import signed_url
+from neptune_fetcher.internal import cancellation
+from neptune_fetcher.internal.retrieval import hedging
+from neptune_fetcher.internal.retrieval.adaptive_concurrency import get_concurrency_limiter
+from neptune_fetcher.internal.retrieval.hedging import (
+    LatencyHistogram,
+    get_latency_histogram,
+    hedge_requests,
+    hedge_requests_async,
+)
+from neptune_fetcher.internal.retrieval.retry import handle_errors_default
+
+_HEDGED_ENDPOINTS = hedging.HEDGED_ENDPOINTS
+
+
+@pytest.fixture(autouse=True)
+def enable_hedging(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_HEDGE_REQUESTS", "True")
+    monkeypatch.setattr(hedging, "_histograms", {})
+    monkeypatch.setattr(hedging, "HEDGED_ENDPOINTS", frozenset({__name__}))
+
+
+def _response(status_code=200):
+    return Mock(status_code=Mock(value=status_code))
+
+
+def _warm_up(latency=0.01):
+    histogram = get_latency_histogram(__name__)
+    for _ in range(100):
+        histogram.record(latency)
+        histogram.record_request()
+    return histogram
+
+
+def test_percentile_requires_enough_samples():
+    histogram = LatencyHistogram()
+    for _ in range(19):
+        histogram.record(0.1)
+    assert histogram.percentile(95) is None
+
+    histogram.record(0.1)
+    assert histogram.percentile(95) == pytest.approx(0.1, rel=0.2)
+
+
+def test_percentile_of_mixed_latencies():
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(0.01)
+    for _ in range(10):
+        histogram.record(1.0)
+
+    assert histogram.percentile(50) == pytest.approx(0.01, rel=0.2)
+    assert histogram.percentile(95) == pytest.approx(1.0, rel=0.2)
+
+
+def test_hedges_are_limited_to_a_fraction_of_requests():
+    histogram = LatencyHistogram()
+    for _ in range(100):
+        histogram.record_request()
+
+    assert sum(histogram.acquire_hedge() for _ in range(100)) == 10
+
+
+def test_slow_request_is_hedged():
+    _warm_up()
+    release_first = threading.Event()
+    calls = []
+
+    def endpoint(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            release_first.wait(5)
+            return _response(500)
+        return _response(200)
+
+    try:
+        response = hedge_requests(endpoint)(client="client", body="body")
+    finally:
+        release_first.set()
+
+    assert response.status_code.value == 200
+    assert calls == [{"client": "client", "body": "body"}] * 2
+
+
+def test_losing_attempt_is_cancelled():
+    _warm_up()
+    first_cancelled = threading.Event()
+    calls = []
+
+    def endpoint():
+        calls.append(None)
+        if len(calls) == 1:
+            token = cancellation.current_token()
+            while not token.cancelled:
+                time.sleep(0.01)
+            first_cancelled.set()
+            return _response(500)
+        return _response(200)
+
+    response = hedge_requests(endpoint)()
+
+    assert response.status_code.value == 200
+    assert first_cancelled.wait(5)
+
+
+def test_attempts_are_cancelled_with_the_fetch():
+    _warm_up()
+    token = cancellation.CancellationToken()
+    attempt_tokens = []
+
+    def endpoint():
+        attempt_tokens.append(cancellation.current_token())
+        token.cancel()
+        return _response(500)
+
+    with cancellation.use_token(token), pytest.raises(cancellation.FetchCancelledError):
+        hedge_requests(endpoint)()
+
+    assert attempt_tokens[0] is not token
+    assert attempt_tokens[0].cancelled
+
+
+def test_request_runs_in_calling_thread_until_latencies_are_known():
+    threads = []
+
+    def endpoint():
+        threads.append(threading.current_thread())
+        return _response(200)
+
+    hedge_requests(endpoint)()
+
+    assert threads == [threading.current_thread()]
+
+
+def test_only_allowlisted_endpoints_are_hedged(monkeypatch):
+    monkeypatch.setattr(hedging, "HEDGED_ENDPOINTS", _HEDGED_ENDPOINTS)
+
+    assert hedge_requests(get_series_values_proto.sync_detailed) is not get_series_values_proto.sync_detailed
+    assert hedge_requests(signed_url.sync_detailed) is signed_url.sync_detailed
+    assert hedge_requests_async(signed_url.asyncio_detailed) is signed_url.asyncio_detailed
+
+
+def test_latency_excludes_waiting_for_concurrency_limit(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_MAX_WORKERS", "1")
+    client = Mock()
+    limiter = get_concurrency_limiter(client)
+    latencies = []
+    monkeypatch.setattr(get_latency_histogram(__name__), "record", latencies.append)
+
+    def endpoint(client):
+        return Mock(status_code=Mock(value=200), content=b"", headers={})
+
+    limiter.acquire()
+    timer = threading.Timer(0.3, limiter.release, args=(time.monotonic(), None))
+    timer.start()
+    try:
+        handle_errors_default(endpoint)(client=client)
+    finally:
+        timer.join()
+
+    assert len(latencies) == 1
+    assert latencies[0] < 0.2
+
+
+def test_fast_request_is_not_hedged():
+    _warm_up(latency=1.0)
+    endpoint = Mock(return_value=_response(200), __module__=__name__)
+
+    hedge_requests(endpoint)()
+
+    endpoint.assert_called_once()
+
+
+def test_first_attempt_outcome_is_returned_if_both_fail():
+    _warm_up()
+    calls = []
+
+    def endpoint():
+        calls.append(None)
+        if len(calls) == 1:
+            time.sleep(0.2)
+            return _response(500)
+        return _response(503)
+
+    response = hedge_requests(endpoint)()
+
+    assert response.status_code.value == 500
+    assert len(calls) == 2
+
+
+def test_not_hedged_when_disabled(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_HEDGE_REQUESTS", "False")
+    _warm_up(latency=0.001)
+    release = threading.Event()
+    threading.Timer(0.1, release.set).start()
+    endpoint = Mock(side_effect=lambda: release.wait(5) and _response(200), __module__=__name__)
+
+    hedge_requests(endpoint)()
+
+    endpoint.assert_called_once()
+
+
+def test_slow_request_is_hedged_async():
+    _warm_up()
+    cancelled = []
+
+    async def endpoint(attempt):
+        attempt[0] += 1
+        if attempt[0] == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+        return _response(200)
+
+    response = asyncio.run(hedge_requests_async(endpoint)(attempt=[0]))
+
+    assert response.status_code.value == 200
+    assert cancelled == [True]
@@ -0,0 +1,187 @@
+import asyncio
+from unittest.mock import (
+    AsyncMock,
+    Mock,
+    patch,
+)
+
+import numpy as np
+
+from neptune_fetcher.generated.neptune_api.models import FloatTimeSeriesValuesRequest
+from neptune_fetcher.generated.neptune_api.proto.neptune_pb.api.v1.model.series_values_pb2 import (
+    ProtoFloatPointValueDTO,
+    ProtoFloatSeriesValuesDTO,
+    ProtoFloatSeriesValuesResponseDTO,
+    ProtoFloatSeriesValuesSingleSeriesResponseDTO,
+)
+from neptune_fetcher.internal import identifiers
+from neptune_fetcher.internal.retrieval import metrics_decoding
+from neptune_fetcher.internal.retrieval.metrics import (
+    fetch_multiple_series_values,
+    fetch_multiple_series_values_async,
+    join_points,
+)
+
+PROJECT = identifiers.ProjectIdentifier("workspace/project")
+RUN_ATTRIBUTE = identifiers.RunAttributeDefinition(
+    run_identifier=identifiers.RunIdentifier(PROJECT, identifiers.SysId("RUN-1")),
+    attribute_definition=identifiers.AttributeDefinition("metrics/loss", "float_series"),
+)
+
+
+def response(steps):
+    dto = ProtoFloatSeriesValuesResponseDTO(
+        series=[
+            ProtoFloatSeriesValuesSingleSeriesResponseDTO(
+                requestId="0",
+                series=ProtoFloatSeriesValuesDTO(
+                    values=[
+                        ProtoFloatPointValueDTO(timestamp_millis=int(step), step=step, value=step) for step in steps
+                    ]
+                ),
+            )
+        ]
+    )
+    return Mock(status_code=Mock(value=200), content=dto.SerializeToString(), headers={})
+
+
+def test_fetch_multiple_series_values_async_matches_sync():
+    pages = [[1.0, 2.0], [3.0]]
+    endpoint = "neptune_fetcher.generated.neptune_api.api.retrieval.get_multiple_float_series_values_proto"
+
+    with (
+        patch("neptune_fetcher.internal.retrieval.metrics.TOTAL_POINT_LIMIT", 2),
+        patch(f"{endpoint}.sync_detailed", side_effect=[response(steps) for steps in pages]),
+        patch(f"{endpoint}.asyncio_detailed", new_callable=AsyncMock) as asyncio_detailed,
+    ):
+        asyncio_detailed.side_effect = [response(steps) for steps in pages]
+
+        expected = fetch_multiple_series_values(
+            client=Mock(), run_attribute_definitions=[RUN_ATTRIBUTE], include_inherited=False, include_preview=False
+        )
+        result = asyncio.run(
+            fetch_multiple_series_values_async(
+                client=Mock(),
+                run_attribute_definitions=[RUN_ATTRIBUTE],
+                include_inherited=False,
+                include_preview=False,
+            )
+        )
+
+    assert result == expected
+    assert sorted(point[1] for point in result[RUN_ATTRIBUTE]) == [1.0, 2.0, 3.0]
+    assert asyncio_detailed.call_count == 2
+
+
+def test_fetch_multiple_series_values_decoded_in_processes_matches_inline(monkeypatch):
+    pages = [[1.0, 2.0], [3.0]]
+    endpoint = "neptune_fetcher.generated.neptune_api.api.retrieval.get_multiple_float_series_values_proto"
+
+    with (
+        patch("neptune_fetcher.internal.retrieval.metrics.TOTAL_POINT_LIMIT", 2),
+        patch(f"{endpoint}.sync_detailed", side_effect=[response(steps) for steps in pages * 2]),
+    ):
+        expected = fetch_multiple_series_values(
+            client=Mock(), run_attribute_definitions=[RUN_ATTRIBUTE], include_inherited=False, include_preview=False
+        )
+
+        monkeypatch.setenv("NEPTUNE_FETCHER_DECODING_PROCESSES", "1")
+        monkeypatch.setattr(metrics_decoding, "_MIN_OFFLOADED_RESPONSE_BYTES", 0)
+        try:
+            result = fetch_multiple_series_values(
+                client=Mock(),
+                run_attribute_definitions=[RUN_ATTRIBUTE],
+                include_inherited=False,
+                include_preview=False,
+            )
+        finally:
+            metrics_decoding.shutdown_decoding_pool()
+
+    assert isinstance(result[RUN_ATTRIBUTE], np.ndarray)
+    assert result[RUN_ATTRIBUTE].tolist() == expected[RUN_ATTRIBUTE]
+
+
+def test_fetch_multiple_series_values_sends_body_matching_model():
+    pages = [[1.0, 2.0], [3.0]]
+    endpoint = "neptune_fetcher.generated.neptune_api.api.retrieval.get_multiple_float_series_values_proto"
+
+    with (
+        patch("neptune_fetcher.internal.retrieval.metrics.TOTAL_POINT_LIMIT", 2),
+        patch(f"{endpoint}.sync_detailed", side_effect=[response(steps) for steps in pages]) as sync_detailed,
+    ):
+        fetch_multiple_series_values(
+            client=Mock(),
+            run_attribute_definitions=[RUN_ATTRIBUTE],
+            include_inherited=True,
+            include_preview=False,
+            step_range=(1.0, None),
+        )
+
+    bodies = [call.kwargs["body"].to_dict() for call in sync_detailed.call_args_list]
+    assert bodies == [FloatTimeSeriesValuesRequest.from_dict(body).to_dict() for body in bodies]
+    assert bodies[1]["requests"][0]["afterStep"] == 2.0
+
+
+def test_fetch_multiple_series_values_with_tail_limit_and_prefetch(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_PREFETCH_PAGES", "True")
+    pages = iter([[4.0, 3.0], [2.0], [1.0]])
+    limits = []
+    endpoint = "neptune_fetcher.generated.neptune_api.api.retrieval.get_multiple_float_series_values_proto"
+
+    def sync_detailed(client, body):
+        # The params are updated in place for the next page, so the limit is read when the request is sent
+        limits.append(body.to_dict()["perSeriesPointsLimit"])
+        return response(next(pages))
+
+    with (
+        patch("neptune_fetcher.internal.retrieval.metrics.TOTAL_POINT_LIMIT", 2),
+        patch(f"{endpoint}.sync_detailed", side_effect=sync_detailed),
+    ):
+        result = fetch_multiple_series_values(
+            client=Mock(),
+            run_attribute_definitions=[RUN_ATTRIBUTE],
+            include_inherited=False,
+            include_preview=False,
+            tail_limit=3,
+        )
+
+    assert [point[1] for point in result[RUN_ATTRIBUTE]] == [4.0, 3.0, 2.0]
+    assert limits == [2, 1]
+
+
+def test_fetch_multiple_series_values_async_with_tail_limit_and_prefetch(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_PREFETCH_PAGES", "True")
+    pages = iter([[4.0, 3.0], [2.0], [1.0]])
+    limits = []
+    endpoint = "neptune_fetcher.generated.neptune_api.api.retrieval.get_multiple_float_series_values_proto"
+
+    async def asyncio_detailed(client, body):
+        limits.append(body.to_dict()["perSeriesPointsLimit"])
+        return response(next(pages))
+
+    with (
+        patch("neptune_fetcher.internal.retrieval.metrics.TOTAL_POINT_LIMIT", 2),
+        patch(f"{endpoint}.asyncio_detailed", side_effect=asyncio_detailed),
+    ):
+        result = asyncio.run(
+            fetch_multiple_series_values_async(
+                client=Mock(),
+                run_attribute_definitions=[RUN_ATTRIBUTE],
+                include_inherited=False,
+                include_preview=False,
+                tail_limit=3,
+            )
+        )
+
+    assert [point[1] for point in result[RUN_ATTRIBUTE]] == [4.0, 3.0, 2.0]
+    assert limits == [2, 1]
+
+
+def test_join_points():
+    lists = [[(1.0, 1.0, 1.0, False, 1.0)], [], [(2.0, 2.0, 2.0, False, 1.0)]]
+    arrays = [np.array(chunk, dtype=metrics_decoding.POINT_DTYPE) for chunk in lists]
+
+    assert join_points([]) == []
+    assert join_points(lists) == lists[0] + lists[2]
+    assert join_points(arrays).tolist() == lists[0] + lists[2]
+    assert join_points([lists[0], arrays[2]]).tolist() == lists[0] + lists[2]
@@ -0,0 +1,104 @@
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+import pytest
+
+from neptune_fetcher.generated.neptune_api.credentials import Credentials
+from neptune_fetcher.internal.api_utils import (
+    TokenRefreshingURLs,
+    create_auth_api_client,
+)
+from neptune_fetcher.internal.retrieval.rate_limit import (
+    RateLimiter,
+    get_rate_limiter,
+)
+from neptune_fetcher.internal.retrieval.retry import limit_rate
+
+
+@pytest.fixture
+def clock():
+    now = [1000.0]
+    with patch("time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+def test_unlimited_by_default(clock):
+    limiter = RateLimiter()
+
+    assert [limiter.reserve() for _ in range(100)] == [0.0] * 100
+
+
+def test_requests_are_spaced_out_after_a_burst(clock):
+    limiter = RateLimiter(requests_per_second=10)
+
+    delays = [limiter.reserve() for _ in range(15)]
+
+    assert delays == pytest.approx([0.0] * 11 + [0.1, 0.2, 0.3, 0.4])
+
+
+def test_retry_after_pauses_all_requests(clock):
+    limiter = RateLimiter()
+
+    limiter.record_response(429, retry_after=2.0, size_bytes=0)
+
+    assert limiter.reserve() == 2.0
+    clock[0] += 2.0
+    assert limiter.reserve() == 0.0
+
+
+def test_rate_limited_response_halves_observed_rate_once_per_pause(clock):
+    limiter = RateLimiter()
+    for _ in range(11):
+        limiter.reserve()
+        clock[0] += 0.05  # 20 requests per second
+
+    limiter.record_response(429, retry_after=1.0, size_bytes=0)
+    limiter.record_response(429, retry_after=1.0, size_bytes=0)
+
+    assert limiter.requests_per_second == pytest.approx(10)
+
+
+def test_rate_recovers_up_to_configured_rate(clock):
+    limiter = RateLimiter(requests_per_second=4)
+    limiter.record_response(429, retry_after=None, size_bytes=0)
+    assert limiter.requests_per_second == 2
+
+    for _ in range(100):
+        limiter.record_response(200, retry_after=None, size_bytes=0)
+
+    assert limiter.requests_per_second == 4
+
+
+def test_large_responses_delay_following_requests(clock):
+    limiter = RateLimiter(bytes_per_second=1000)
+
+    limiter.record_response(200, retry_after=None, size_bytes=3000)
+
+    assert limiter.reserve() == pytest.approx(2.0)
+
+
+def test_limit_rate_reports_responses_of_the_client(clock):
+    client = Mock()
+    response = Mock(status_code=Mock(value=429), content=b"", headers={"retry-after": "5"})
+
+    with patch("neptune_fetcher.internal.cancellation.sleep") as sleep:
+        limit_rate(Mock(return_value=response))(client=client)
+        limit_rate(Mock(return_value=response))(client=client)
+
+    sleep.assert_called_once_with(5.0)
+
+
+def test_limit_rate_with_real_client():
+    client = create_auth_api_client(
+        credentials=Credentials(api_key="api-key", base_url="https://example.neptune.ai"),
+        config=Mock(),
+        token_refreshing_urls=TokenRefreshingURLs(
+            "https://example.neptune.ai/auth", "https://example.neptune.ai/token"
+        ),
+    )
+    response = Mock(status_code=Mock(value=200), content=b"", headers={})
+
+    assert limit_rate(Mock(return_value=response))(client=client) is response
+    assert get_rate_limiter(client) is get_rate_limiter(client)
@@ -1,5 +1,7 @@
+import asyncio
 import re
 from unittest.mock import (
+    AsyncMock,
     Mock,
     call,
     patch,
@@ -17,10 +19,13 @@ from neptune_fetcher.generated.neptune_api.errors import (
     ApiKeyRejectedError,
     UnableToParseResponse,
 )
+from neptune_fetcher.internal import cancellation
 from neptune_fetcher.internal.retrieval.retry import (
     exponential_backoff,
     handle_api_errors,
+    handle_api_errors_async,
     retry_backoff,
+    retry_backoff_async,
 )
 
 
@@ -221,3 +226,50 @@ def test_retry_timeout_hard(sleep, time):
     exc.match("after 2 retries, 6.00 seconds")
     exc.match("Last response status: 429")
     exc.match("Last response content: Error 429")
+
+
+def test_retry_backoff_async():
+    """The async variant should retry the same way, sleeping without blocking the event loop"""
+    func = AsyncMock(side_effect=[Exception, response_500(), response_200()])
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as async_sleep:
+        decorated = retry_backoff_async(backoff_strategy=exponential_backoff(backoff_base=0.5))(
+            handle_api_errors_async(func)
+        )
+        result = asyncio.run(decorated(1, kw=2))
+
+    assert result.status_code.value == 200
+    func.assert_has_calls([call(1, kw=2)] * 3)
+    async_sleep.assert_has_calls([call(0.5), call(1)])
+
+
+def test_handle_api_errors_async_raises_final_errors():
+    func = AsyncMock(return_value=response(404, content=b"Not found"))
+
+    with pytest.raises(NeptuneUnexpectedResponseError):
+        asyncio.run(retry_backoff_async(max_tries=3)(handle_api_errors_async(func))())
+
+    assert func.call_count == 1
+
+
+def test_retry_backoff_stops_when_cancelled(sleep):
+    token = cancellation.CancellationToken()
+    func = Mock(side_effect=lambda: token.cancel() or response_500())
+    decorated = retry_backoff(max_tries=5, backoff_strategy=lambda _: 60.0)(func)
+
+    with cancellation.use_token(token), pytest.raises(cancellation.FetchCancelledError):
+        decorated()
+
+    assert func.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_retry_backoff_does_not_start_when_cancelled():
+    token = cancellation.CancellationToken()
+    token.cancel()
+    func = Mock(return_value=response_200())
+
+    with cancellation.use_token(token), pytest.raises(cancellation.FetchCancelledError):
+        retry_backoff()(func)()
+
+    func.assert_not_called()
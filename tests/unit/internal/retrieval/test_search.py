@@ -0,0 +1,416 @@
+import asyncio
+import json
+import re
+import threading
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from neptune_fetcher.generated.neptune_api.client import Client
+from neptune_fetcher.generated.neptune_api.proto.neptune_pb.api.v1.model.leaderboard_entries_pb2 import (
+    ProtoAttributeDTO,
+    ProtoAttributesDTO,
+    ProtoDatetimeAttributeDTO,
+    ProtoLeaderboardEntriesSearchResultDTO,
+    ProtoStringAttributeDTO,
+)
+from neptune_fetcher.internal import (
+    cancellation,
+    identifiers,
+)
+from neptune_fetcher.internal.filters import (
+    _Attribute,
+    _Filter,
+)
+from neptune_fetcher.internal.retrieval import search
+from neptune_fetcher.internal.run_set import RunSet
+
+
+class FakeBackend:
+    def __init__(self, sys_ids, added_sys_ids=()):
+        self.sys_ids = list(sys_ids)
+        self.added_sys_ids = list(added_sys_ids)
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def fetch_page(self, client, params, project_identifier):
+        with self._lock:
+            pagination = dict(params["pagination"])
+            self.requests.append(pagination)
+            matching = self.sys_ids
+            # Items added after the first request aren't included in its count
+            if len(self.requests) > 1:
+                matching = self.sys_ids + self.added_sys_ids
+
+        offset, limit = pagination["offset"], pagination["limit"]
+        entries = [
+            ProtoAttributesDTO(
+                attributes=[
+                    ProtoAttributeDTO(
+                        name="sys/id", type="string", string_properties=ProtoStringAttributeDTO(value=sys_id)
+                    )
+                ]
+            )
+            for sys_id in matching[offset : offset + limit]
+        ]
+        return ProtoLeaderboardEntriesSearchResultDTO(matching_item_count=len(matching), entries=entries)
+
+    async def fetch_page_async(self, client, params, project_identifier):
+        return self.fetch_page(client, params, project_identifier)
+
+
+def _sys_ids(count):
+    return [f"RUN-{i}" for i in range(count)]
+
+
+def _fetch_sys_ids(backend, **kwargs):
+    with patch.object(search, "_fetch_sys_attrs_page", backend.fetch_page):
+        pages = search.fetch_sys_ids(client=None, project_identifier=identifiers.ProjectIdentifier("a/b"), **kwargs)
+        return [sys_id for page in pages for sys_id in page.items]
+
+
+def _fetch_sys_ids_async(backend, **kwargs):
+    async def collect():
+        pages = search.fetch_sys_ids_async(
+            client=None, project_identifier=identifiers.ProjectIdentifier("a/b"), **kwargs
+        )
+        return [sys_id async for page in pages for sys_id in page.items]
+
+    with patch.object(search, "_fetch_sys_attrs_page_async", backend.fetch_page_async):
+        return asyncio.run(collect())
+
+
+@pytest.fixture(params=[_fetch_sys_ids, _fetch_sys_ids_async], ids=["sync", "async"])
+def fetch_sys_ids(request):
+    return request.param
+
+
+@pytest.mark.parametrize("parallel_pages", ["1", "3"])
+@pytest.mark.parametrize(
+    "count, limit",
+    [(0, None), (5, None), (10, None), (11, None), (47, None), (47, 25), (47, 30), (47, 100), (47, 0)],
+)
+def test_fetch_sys_ids_returns_items_in_order(monkeypatch, fetch_sys_ids, parallel_pages, count, limit):
+    monkeypatch.setenv("NEPTUNE_FETCHER_SYS_ATTRS_MAX_PARALLEL_PAGES", parallel_pages)
+    backend = FakeBackend(_sys_ids(count))
+
+    result = fetch_sys_ids(backend, batch_size=10, limit=limit)
+
+    assert result == _sys_ids(count)[:limit]
+
+
+def test_fetch_sys_ids_requests_pages_at_their_offsets(monkeypatch, fetch_sys_ids):
+    monkeypatch.setenv("NEPTUNE_FETCHER_SYS_ATTRS_MAX_PARALLEL_PAGES", "3")
+    backend = FakeBackend(_sys_ids(47))
+
+    fetch_sys_ids(backend, batch_size=10, limit=45)
+
+    assert backend.requests[0] == {"offset": 0, "limit": 10}
+    assert sorted(backend.requests[1:], key=lambda r: r["offset"]) == [
+        {"offset": 10, "limit": 10},
+        {"offset": 20, "limit": 10},
+        {"offset": 30, "limit": 10},
+        {"offset": 40, "limit": 5},
+    ]
+
+
+def test_fetch_sys_ids_picks_up_items_added_during_fetching(monkeypatch, fetch_sys_ids):
+    monkeypatch.setenv("NEPTUNE_FETCHER_SYS_ATTRS_MAX_PARALLEL_PAGES", "3")
+    backend = FakeBackend(_sys_ids(30), added_sys_ids=["RUN-30", "RUN-31"])
+
+    result = fetch_sys_ids(backend, batch_size=10)
+
+    assert result == _sys_ids(32)
+
+
+def _wait_until_cancelled(timeout=5):
+    deadline = time.monotonic() + timeout
+    while not cancellation.current_token().cancelled and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return cancellation.current_token().cancelled
+
+
+def test_fetch_sys_ids_cancels_pages_in_flight_when_closed(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_SYS_ATTRS_MAX_PARALLEL_PAGES", "3")
+    backend = FakeBackend(_sys_ids(47))
+    started, cancelled = [], []
+
+    def fetch_page(client, params, project_identifier):
+        if params["pagination"]["offset"] > 10:
+            started.append(params["pagination"]["offset"])
+            if _wait_until_cancelled():
+                cancelled.append(params["pagination"]["offset"])
+                cancellation.raise_if_cancelled()
+        return backend.fetch_page(client, params, project_identifier)
+
+    with patch.object(search, "_fetch_sys_attrs_page", fetch_page):
+        pages = search.fetch_sys_ids(
+            client=None, project_identifier=identifiers.ProjectIdentifier("a/b"), batch_size=10
+        )
+        assert next(pages).items == _sys_ids(10)
+        assert next(pages).items == _sys_ids(20)[10:]
+        pages.close()
+
+    # Pages that haven't started yet are dropped, the others stop at their next checkpoint
+    deadline = time.monotonic() + 5
+    while sorted(cancelled) != sorted(started) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sorted(cancelled) == sorted(started)
+    assert len(backend.requests) == 2
+
+
+class FakeSortedBackend:
+    """Sorts the runs by creation time, descending, and applies the creation time filter of keyset pagination"""
+
+    _AFTER_LAST = re.compile(r'`sys/creation_time`:datetime <= "([^"]+)"')
+
+    def __init__(self, runs, created_during_search=()):
+        self.runs = list(runs)
+        self.created_during_search = list(created_during_search)
+        self.requests = []
+
+    def fetch_page(self, client, params, project_identifier):
+        self.requests.append({"query": params.get("query", {}).get("query"), **params["pagination"]})
+        assert {"path": "sys/creation_time"} in params["attributeFilters"]
+
+        runs = sorted(self.runs, key=lambda run: -run[1])
+        if self.requests[1:]:
+            self.runs += self.created_during_search
+            self.created_during_search = []
+        if match := self._AFTER_LAST.search(self.requests[-1]["query"] or ""):
+            last_millis = int(datetime.fromisoformat(match.group(1)).timestamp() * 1000)
+            runs = [run for run in runs if run[1] <= last_millis]
+
+        offset, limit = params["pagination"]["offset"], params["pagination"]["limit"]
+        entries = [
+            ProtoAttributesDTO(
+                attributes=[
+                    ProtoAttributeDTO(
+                        name="sys/id", type="string", string_properties=ProtoStringAttributeDTO(value=sys_id)
+                    ),
+                    ProtoAttributeDTO(
+                        name="sys/creation_time",
+                        type="datetime",
+                        datetime_properties=ProtoDatetimeAttributeDTO(value=created_at),
+                    ),
+                ]
+            )
+            for sys_id, created_at in runs[offset : offset + limit]
+        ]
+        return ProtoLeaderboardEntriesSearchResultDTO(matching_item_count=len(runs), entries=entries)
+
+
+def _runs(count, ties=1):
+    # Runs created in the same millisecond come in groups of `ties`
+    return [(f"RUN-{i}", 1_700_000_000_000 - i // ties) for i in range(count)]
+
+
+@pytest.mark.parametrize("ties", [1, 3, 25])
+@pytest.mark.parametrize("count, limit", [(0, None), (10, None), (47, None), (47, 25), (47, 30)])
+def test_keyset_pagination_returns_items_in_order(monkeypatch, ties, count, limit):
+    monkeypatch.setenv("NEPTUNE_FETCHER_KEYSET_PAGINATION", "True")
+    runs = _runs(count, ties)
+    backend = FakeSortedBackend(runs)
+
+    result = _fetch_sys_ids(backend, batch_size=10, limit=limit)
+
+    assert result == [sys_id for sys_id, _ in runs][:limit]
+
+
+def test_keyset_pagination_filters_instead_of_skipping(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_KEYSET_PAGINATION", "True")
+    backend = FakeSortedBackend(_runs(25))
+
+    _fetch_sys_ids(backend, batch_size=10, filter_=_Filter.eq("sys/trashed", False))
+
+    assert [request["offset"] for request in backend.requests] == [0, 1, 1]
+    assert backend.requests[0]["query"] == '`sys/trashed` == "False"'
+    assert backend.requests[1]["query"].startswith('(`sys/trashed` == "False") AND (`sys/creation_time`:datetime <= ')
+
+
+def test_keyset_pagination_is_not_shifted_by_created_runs(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_KEYSET_PAGINATION", "True")
+    runs = _runs(25)
+    backend = FakeSortedBackend(runs, created_during_search=[("RUN-NEW", 1_800_000_000_000)])
+
+    result = _fetch_sys_ids(backend, batch_size=10)
+
+    assert result == [sys_id for sys_id, _ in runs]
+
+
+def test_keyset_pagination_falls_back_to_offsets_for_other_sorting(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_KEYSET_PAGINATION", "True")
+    monkeypatch.setenv("NEPTUNE_FETCHER_SYS_ATTRS_MAX_PARALLEL_PAGES", "1")
+    backend = FakeBackend(_sys_ids(25))
+
+    result = _fetch_sys_ids(backend, batch_size=10, sort_by=_Attribute("sys/name", type="string"))
+
+    assert result == _sys_ids(25)
+    assert [request["offset"] for request in backend.requests] == [0, 10, 20]
+
+
+class FakeGlobalBackend:
+    def __init__(self, entries):
+        # (workspace, project, sys_id, name) in the sort order of the backend
+        self.entries = entries
+        self.requests = []
+
+    def fetch_page(self, client, params):
+        self.requests.append(params["pagination"])
+        offset, limit = params["pagination"]["offset"], params["pagination"]["limit"]
+        entries = [
+            ProtoAttributesDTO(
+                organization_name=workspace,
+                project_name=project,
+                attributes=[
+                    ProtoAttributeDTO(name="sys/id", type="string", string_properties=ProtoStringAttributeDTO(value=i)),
+                    ProtoAttributeDTO(
+                        name="sys/name", type="string", string_properties=ProtoStringAttributeDTO(value=name)
+                    ),
+                ],
+            )
+            for workspace, project, i, name in self.entries[offset : offset + limit]
+        ]
+        return ProtoLeaderboardEntriesSearchResultDTO(matching_item_count=len(self.entries), entries=entries)
+
+
+_GLOBAL_ENTRIES = [
+    ("ws", "a", "A-1", "exp"),
+    ("other", "a", "O-1", "exp"),
+    ("ws", "b", "B-1", "exp"),
+    ("ws", "c", "C-1", "exp-c"),
+    ("ws", "a", "A-2", "exp-2"),
+]
+
+
+@pytest.mark.parametrize(
+    "projects, limit, expected",
+    [
+        (["ws/a", "ws/b"], None, [("ws/a", "A-1", "exp"), ("ws/b", "B-1", "exp"), ("ws/a", "A-2", "exp-2")]),
+        (["ws/a", "ws/b"], 2, [("ws/a", "A-1", "exp"), ("ws/b", "B-1", "exp")]),
+        (
+            ["ws"],
+            None,
+            [("ws/a", "A-1", "exp"), ("ws/b", "B-1", "exp"), ("ws/c", "C-1", "exp-c"), ("ws/a", "A-2", "exp-2")],
+        ),
+        (["other/a", "ws/c"], None, [("other/a", "O-1", "exp"), ("ws/c", "C-1", "exp-c")]),
+    ],
+)
+def test_fetch_sys_id_labels_across_projects(projects, limit, expected):
+    backend = FakeGlobalBackend(_GLOBAL_ENTRIES)
+
+    with patch.object(search, "_fetch_global_sys_attrs_page", backend.fetch_page):
+        pages = list(
+            search.fetch_sys_id_labels_across_projects(
+                client=None,
+                projects=[identifiers.ProjectIdentifier(p) for p in projects],
+                limit=limit,
+                batch_size=2,
+            )
+        )
+
+    assert [(item.project_identifier, item.sys_id, item.label) for page in pages for item in page.items] == expected
+    assert all(page.items for page in pages)
+    # The limit applies to the entries of the requested projects, so it isn't sent to the backend
+    assert all(request["limit"] == 2 for request in backend.requests)
+
+
+def test_fetch_sys_id_labels_across_projects_warns_when_most_entries_are_skipped(caplog):
+    backend = FakeGlobalBackend(_GLOBAL_ENTRIES)
+
+    with patch.object(search, "_fetch_global_sys_attrs_page", backend.fetch_page):
+        list(search.fetch_sys_id_labels_across_projects(client=None, projects=[identifiers.ProjectIdentifier("ws")]))
+        assert not caplog.records
+
+        list(search.fetch_sys_id_labels_across_projects(client=None, projects=[identifiers.ProjectIdentifier("ws/c")]))
+        assert "fetched 4 entries of other projects to find 1 entries" in caplog.text
+
+
+def test_global_search_request_body():
+    requests = []
+
+    def handle(request):
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, content=ProtoLeaderboardEntriesSearchResultDTO().SerializeToString())
+
+    transport = httpx.MockTransport(handle)
+    with Client(base_url="https://example.neptune.ai", httpx_args={"transport": transport}) as client:
+        list(
+            search.fetch_sys_id_labels_across_projects(
+                client=client,
+                projects=[identifiers.ProjectIdentifier("ws/a")],
+                filter_=_Filter.eq(_Attribute("sys/tags", type="string_set"), "best"),
+                batch_size=10,
+                container_type=search.ContainerType.RUN,
+            )
+        )
+
+    # attributeFilters and experimentLeader aren't fields of GlobalSearchParamsDTO, and are sent as its additional
+    # properties
+    assert requests == [
+        {
+            "attributeFilters": [{"path": "sys/custom_run_id"}, {"path": "sys/id"}],
+            "experimentLeader": False,
+            "pagination": {"limit": 10, "offset": 0},
+            "query": {"query": '`sys/tags`:stringSet == "best"'},
+            "sorting": {"dir": "descending", "sortBy": {"name": "sys/creation_time", "type": "datetime"}},
+        }
+    ]
+
+
+def test_fetch_sys_id_labels_across_projects_async():
+    backend = FakeGlobalBackend(_GLOBAL_ENTRIES)
+
+    async def fetch_page(client, params):
+        return backend.fetch_page(client, params)
+
+    async def fetch():
+        return [
+            (item.project_identifier, item.sys_id)
+            async for page in search.fetch_sys_id_labels_across_projects_async(
+                client=None, projects=[identifiers.ProjectIdentifier("ws/a")], batch_size=2
+            )
+            for item in page.items
+        ]
+
+    with patch.object(search, "_fetch_global_sys_attrs_page_async", fetch_page):
+        assert asyncio.run(fetch()) == [("ws/a", "A-1"), ("ws/a", "A-2")]
+
+
+@pytest.mark.parametrize(
+    "container_type, record_type",
+    [(search.ContainerType.EXPERIMENT, search.ExperimentSysAttrs), (search.ContainerType.RUN, search.RunSysAttrs)],
+)
+def test_fetch_run_set_sys_id_labels(container_type, record_type):
+    run_set = RunSet(
+        project_identifier=identifiers.ProjectIdentifier("ws/project"),
+        container_type=container_type,
+        sys_ids=tuple(identifiers.SysId(f"RUN-{i}") for i in range(5)),
+        labels=tuple(f"label-{i}" for i in range(5)),
+    )
+
+    with patch.object(search, "_fetch_sys_attrs_page", side_effect=AssertionError("no requests expected")):
+        pages = list(search.fetch_run_set_sys_id_labels(run_set, batch_size=2))
+
+    assert [len(page.items) for page in pages] == [2, 2, 1]
+    items = [item for page in pages for item in page.items]
+    assert all(isinstance(item, record_type) for item in items)
+    assert [(item.sys_id, item.label) for item in items] == [(f"RUN-{i}", f"label-{i}") for i in range(5)]
+
+
+def test_fetch_run_set_sys_id_labels_async():
+    run_set = RunSet(
+        project_identifier=identifiers.ProjectIdentifier("ws/project"),
+        container_type=search.ContainerType.EXPERIMENT,
+        sys_ids=(identifiers.SysId("RUN-1"),),
+        labels=("exp",),
+    )
+
+    async def fetch():
+        return [item.label async for page in search.fetch_run_set_sys_id_labels_async(run_set) for item in page.items]
+
+    assert asyncio.run(fetch()) == ["exp"]
+    assert repr(run_set) == "RunSet(project='ws/project', experiments=1)"
@@ -0,0 +1,188 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from neptune_fetcher.internal import cancellation
+from neptune_fetcher.internal.retrieval import util
+
+
+def _make_new_page_params(params, data):
+    if data is None:
+        return {"page": 0}
+    if data == 2:
+        return None
+    params["page"] = data + 1
+    return params
+
+
+@pytest.fixture(params=[True, False], ids=["prefetch", "sequential"])
+def prefetch(request, monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_PREFETCH_PAGES", str(request.param))
+    return request.param
+
+
+def test_fetch_pages_yields_pages_in_order(prefetch):
+    fetched = []
+
+    def fetch_page(client, params):
+        fetched.append(params["page"])
+        return params["page"]
+
+    pages = util.fetch_pages(
+        client=None,
+        fetch_page=fetch_page,
+        process_page=lambda data: util.Page(items=[data]),
+        make_new_page_params=_make_new_page_params,
+        params={},
+    )
+
+    assert [page.items for page in pages] == [[0], [1], [2]]
+    assert fetched == [0, 1, 2]
+
+
+def test_fetch_pages_fetches_next_page_while_caller_processes_current_one():
+    fetched = {0: threading.Event(), 1: threading.Event(), 2: threading.Event()}
+
+    def fetch_page(client, params):
+        fetched[params["page"]].set()
+        return params["page"]
+
+    pages = util.fetch_pages(
+        client=None,
+        fetch_page=fetch_page,
+        process_page=lambda data: util.Page(items=[data]),
+        make_new_page_params=_make_new_page_params,
+        params={},
+    )
+
+    for expected, page in enumerate(pages):
+        assert page.items == [expected]
+        if expected < 2:
+            assert fetched[expected + 1].wait(5)
+
+
+def test_fetch_pages_raises_errors_of_prefetched_pages():
+    def fetch_page(client, params):
+        if params["page"] == 1:
+            raise ValueError("page 1")
+        return params["page"]
+
+    pages = util.fetch_pages(
+        client=None,
+        fetch_page=fetch_page,
+        process_page=lambda data: util.Page(items=[data]),
+        make_new_page_params=_make_new_page_params,
+        params={},
+    )
+
+    assert next(pages).items == [0]
+    with pytest.raises(ValueError, match="page 1"):
+        next(pages)
+
+
+def test_fetch_pages_does_not_prefetch_when_cancelled():
+    token = cancellation.CancellationToken()
+    fetched = []
+
+    def fetch_page(client, params):
+        fetched.append(params["page"])
+        token.cancel()
+        return params["page"]
+
+    with cancellation.use_token(token):
+        pages = util.fetch_pages(
+            client=None,
+            fetch_page=fetch_page,
+            process_page=lambda data: util.Page(items=[data]),
+            make_new_page_params=_make_new_page_params,
+            params={},
+        )
+        assert next(pages).items == [0]
+        with pytest.raises(cancellation.FetchCancelledError):
+            next(pages)
+
+    assert fetched == [0]
+
+
+def test_fetch_pages_cancels_prefetched_page_when_closed():
+    started = threading.Event()
+    cancelled = threading.Event()
+
+    def fetch_page(client, params):
+        if params["page"] == 1:
+            started.set()
+            deadline = time.monotonic() + 5
+            while not cancellation.current_token().cancelled and time.monotonic() < deadline:
+                time.sleep(0.01)
+            if cancellation.current_token().cancelled:
+                cancelled.set()
+        return params["page"]
+
+    pages = util.fetch_pages(
+        client=None,
+        fetch_page=fetch_page,
+        process_page=lambda data: util.Page(items=[data]),
+        make_new_page_params=_make_new_page_params,
+        params={},
+    )
+    assert next(pages).items == [0]
+    assert started.wait(5)
+
+    pages.close()
+
+    assert cancelled.wait(5)
+
+
+def test_fetch_pages_reuses_background_threads():
+    threads = set()
+
+    def fetch_page(client, params):
+        threads.add(threading.current_thread())
+        return params["page"]
+
+    for _ in range(20):
+        pages = util.fetch_pages(
+            client=None,
+            fetch_page=fetch_page,
+            process_page=lambda data: util.Page(items=[data]),
+            make_new_page_params=_make_new_page_params,
+            params={},
+        )
+        assert [page.items for page in pages] == [[0], [1], [2]]
+
+    assert len(threads) <= 1 + util._background_executor._max_workers()
+
+
+def test_accepting_json_body_returns_endpoint_unchanged():
+    def endpoint(*, client, body, **kwargs):
+        return body.to_dict(), kwargs
+
+    fetch = util.accepting_json_body(endpoint)
+
+    assert fetch is endpoint
+    assert fetch(client=None, body=util.JsonBody({"a": 1}), flag=False) == ({"a": 1}, {"flag": False})
+
+
+def test_fetch_pages_async_yields_pages_in_order(prefetch):
+    fetched = []
+
+    async def fetch_page(client, params):
+        fetched.append(params["page"])
+        return params["page"]
+
+    async def collect():
+        return [
+            page.items
+            async for page in util.fetch_pages_async(
+                client=None,
+                fetch_page=fetch_page,
+                process_page=lambda data: util.Page(items=[data]),
+                make_new_page_params=_make_new_page_params,
+                params={},
+            )
+        ]
+
+    assert asyncio.run(collect()) == [[0], [1], [2]]
+    assert fetched == [0, 1, 2]
@@ -14,16 +14,23 @@
 #
 import base64
 import json
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import (
     Mock,
     patch,
 )
 
-from pytest import fixture
+from pytest import (
+    fixture,
+    raises,
+)
 
+from neptune_fetcher.internal import client as client_module
 from neptune_fetcher.internal.client import clear_cache
 from neptune_fetcher.internal.client import get_client as _get_client
+from neptune_fetcher.internal.client import prewarm_clients
 from neptune_fetcher.internal.context import Context
 
 
@@ -76,7 +83,7 @@ def mock_networking():
         get_config_and_token_urls.return_value = (Mock(), Mock())
         # create_auth_api_client() needs to return a different "client" each time
         create_auth_api_client.side_effect = lambda *args, **kwargs: Mock()
-        yield
+        yield get_config_and_token_urls
 
 
 def test_same_token(context):
@@ -124,3 +131,60 @@ def test_same_proxies_different_token(context):
 
     client = get_client(context, proxies=proxies)
     assert get_client(context.with_api_token(make_token()), proxies=proxies) is not client
+
+
+def test_clients_for_different_tokens_are_created_in_parallel(context, mock_networking):
+    """Should not wait for the networking of another token while creating a client"""
+    both_fetching = threading.Barrier(2, timeout=5)
+
+    def fetch_config(*args, **kwargs):
+        both_fetching.wait()
+        return Mock(), Mock()
+
+    mock_networking.side_effect = fetch_config
+
+    with ThreadPoolExecutor(2) as executor:
+        clients = list(executor.map(get_client, [context, context.with_api_token(make_token())]))
+
+    assert clients[0] is not clients[1]
+
+
+def test_client_for_same_token_is_created_once_by_concurrent_calls(context, mock_networking):
+    """Should return a single instance of the client, even if requested concurrently"""
+
+    with ThreadPoolExecutor(8) as executor:
+        clients = list(executor.map(get_client, [context] * 32))
+
+    assert all(client is clients[0] for client in clients)
+    assert mock_networking.call_count == 1
+
+
+def test_prewarm_clients(context):
+    """Should create a client per distinct token in the background and share it with get_client"""
+    other_context = context.with_api_token(make_token())
+
+    futures = prewarm_clients([context, context.with_project("foo"), other_context])
+
+    assert len(futures) == 2
+    assert [future.result(timeout=5) for future in futures] == [get_client(context), get_client(other_context)]
+    assert prewarm_clients([context])[0].result(timeout=0) is get_client(context)
+
+
+def test_prewarm_clients_reports_errors(context, mock_networking):
+    """Should set the error preventing the creation of the client on the future"""
+    mock_networking.side_effect = RuntimeError("config")
+
+    (future,) = prewarm_clients([context])
+
+    assert isinstance(future.exception(timeout=5), RuntimeError)
+
+
+def test_creation_lock_is_released_when_creation_fails(context, mock_networking):
+    """Should not keep a lock per token for which creating the client failed"""
+    mock_networking.side_effect = RuntimeError("config")
+
+    for _ in range(3):
+        with raises(RuntimeError):
+            get_client(context.with_api_token(make_token()))
+
+    assert client_module._creation_locks == {}
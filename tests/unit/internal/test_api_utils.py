@@ -0,0 +1,144 @@
+import asyncio
+import gc
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import httpx
+
+from neptune_fetcher.internal.api_utils import AsyncCapableAuthenticatedClient
+from neptune_fetcher.internal.transport import (
+    AsyncInstrumentedTransport,
+    InstrumentedTransport,
+    TransportSettings,
+)
+
+
+def create_client():
+    return AsyncCapableAuthenticatedClient(
+        base_url="https://example.neptune.ai",
+        credentials=Mock(),
+        client_id="client-id",
+        token_refreshing_endpoint="https://example.neptune.ai/token",
+        api_key_exchange_callback=Mock(),
+    )
+
+
+def test_async_httpx_client_is_reused_within_event_loop():
+    client = create_client()
+
+    async def get_twice():
+        return client.get_async_httpx_client(), client.get_async_httpx_client()
+
+    first, second = asyncio.run(get_twice())
+
+    assert first is second
+
+
+def test_async_httpx_client_is_created_per_event_loop():
+    client = create_client()
+
+    async def get():
+        return client.get_async_httpx_client()
+
+    assert asyncio.run(get()) is not asyncio.run(get())
+
+
+def test_async_httpx_client_is_closed_when_event_loop_shuts_down():
+    client = create_client()
+
+    async def get():
+        return client.get_async_httpx_client()
+
+    async_client = asyncio.run(get())
+
+    assert async_client.is_closed
+    assert not client._async_clients
+
+
+def test_async_httpx_client_is_closed_on_exit():
+    client = create_client()
+
+    async def use():
+        async with client:
+            async_client = client.get_async_httpx_client()
+        assert async_client.is_closed
+        assert not client._async_clients and not client._async_closers
+
+    asyncio.run(use())
+
+
+def test_event_loop_closed_without_asyncio_run_is_released():
+    client = create_client()
+
+    async def get():
+        return client.get_async_httpx_client()
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(get())
+    loop.close()
+    loop_ref = weakref.ref(loop)
+
+    del loop
+    gc.collect()
+
+    assert loop_ref() is None
+    assert not client._async_clients and not client._async_closers
+
+
+def test_exchange_api_token_exchanges_once():
+    client = create_client()
+    token = Mock(is_expired=False)
+    client.api_key_exchange_callback.return_value = token
+
+    client.exchange_api_token()
+    client.exchange_api_token()
+
+    client.api_key_exchange_callback.assert_called_once()
+    assert client.get_httpx_client().auth._token is token
+
+
+def create_client_with_transport():
+    return AsyncCapableAuthenticatedClient(
+        base_url="https://example.neptune.ai",
+        credentials=Mock(),
+        client_id="client-id",
+        token_refreshing_endpoint="https://example.neptune.ai/token",
+        api_key_exchange_callback=Mock(),
+        transport_settings=TransportSettings(http2=False, max_connections=4, async_max_connections=4),
+    )
+
+
+def test_proxies_from_environment_are_used_with_custom_transport(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:8080")
+    monkeypatch.setenv("NO_PROXY", "internal.example.com")
+    client = create_client_with_transport()
+
+    async def get_async_transports():
+        async_client = client.get_async_httpx_client()
+        return [
+            async_client._transport_for_url(httpx.URL(url))
+            for url in ("https://example.neptune.ai/api", "https://internal.example.com/api")
+        ]
+
+    for neptune_transport, internal_transport in [
+        [
+            client.get_httpx_client()._transport_for_url(httpx.URL(url))
+            for url in ("https://example.neptune.ai/api", "https://internal.example.com/api")
+        ],
+        asyncio.run(get_async_transports()),
+    ]:
+        assert isinstance(neptune_transport, (InstrumentedTransport, AsyncInstrumentedTransport))
+        assert isinstance(internal_transport, (InstrumentedTransport, AsyncInstrumentedTransport))
+        assert neptune_transport is not internal_transport
+        assert neptune_transport._transport._pool._proxy_url.host == b"proxy.example.com"
+
+
+def test_httpx_client_is_created_once_under_concurrent_first_use():
+    client = create_client_with_transport()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        httpx_clients = list(executor.map(lambda _: client.get_httpx_client(), range(32)))
+
+    assert all(httpx_client is httpx_clients[0] for httpx_client in httpx_clients)
+    assert len(client._transports) == 1
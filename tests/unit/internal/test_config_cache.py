@@ -0,0 +1,80 @@
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+import pytest
+
+from neptune_fetcher.generated.neptune_api.models import ClientConfig
+from neptune_fetcher.internal import config_cache
+from neptune_fetcher.internal.api_utils import (
+    TokenRefreshingURLs,
+    get_config_and_token_urls,
+)
+
+BASE_URL = "https://example.neptune.ai"
+CONFIG = {
+    "apiUrl": BASE_URL,
+    "pyLibVersions": {},
+    "security": {"clientId": "client-id", "openIdDiscovery": f"{BASE_URL}/.well-known/openid-configuration"},
+}
+TOKEN_URLS = {"authorization_endpoint": f"{BASE_URL}/auth", "token_endpoint": f"{BASE_URL}/token"}
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("NEPTUNE_FETCHER_CONFIG_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_cache_is_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("NEPTUNE_FETCHER_CONFIG_CACHE_DIR", raising=False)
+
+    config_cache.store(BASE_URL, CONFIG, TOKEN_URLS)
+
+    assert config_cache.load(BASE_URL) is None
+
+
+def test_stored_entry_is_loaded_per_base_url(cache_dir):
+    config_cache.store(BASE_URL, CONFIG, TOKEN_URLS)
+
+    assert config_cache.load(BASE_URL) == (CONFIG, TOKEN_URLS)
+    assert config_cache.load("https://other.neptune.ai") is None
+    assert [path.suffix for path in cache_dir.iterdir()] == [".json"]
+
+
+def test_expired_entry_is_ignored(cache_dir, monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_CONFIG_CACHE_TTL", "60")
+    config_cache.store(BASE_URL, CONFIG, TOKEN_URLS)
+
+    with patch("time.time", return_value=10**12):
+        assert config_cache.load(BASE_URL) is None
+
+
+def test_unreadable_entry_is_ignored(cache_dir):
+    config_cache.store(BASE_URL, CONFIG, TOKEN_URLS)
+    (entry,) = cache_dir.iterdir()
+    entry.write_text('{"version": 1, "base_url"')
+
+    assert config_cache.load(BASE_URL) is None
+
+
+def test_invalidated_entry_is_removed(cache_dir):
+    config_cache.store(BASE_URL, CONFIG, TOKEN_URLS)
+
+    config_cache.invalidate(BASE_URL)
+    config_cache.invalidate(BASE_URL)
+
+    assert config_cache.load(BASE_URL) is None
+
+
+def test_config_and_token_urls_are_fetched_once(cache_dir):
+    fetched = (ClientConfig.from_dict(CONFIG), TokenRefreshingURLs.from_dict(TOKEN_URLS))
+    credentials = Mock(base_url=BASE_URL)
+
+    with patch("neptune_fetcher.internal.api_utils._fetch_config_and_token_urls", return_value=fetched) as fetch:
+        first = get_config_and_token_urls(credentials=credentials)
+        second = get_config_and_token_urls(credentials=credentials)
+
+    assert fetch.call_count == 1
+    assert first == second == fetched
@@ -36,6 +36,7 @@ from neptune_fetcher.internal.retrieval.attribute_types import (
 )
 from neptune_fetcher.internal.retrieval.attribute_values import AttributeValue
 from neptune_fetcher.internal.retrieval.metrics import FloatPointValue
+from neptune_fetcher.internal.retrieval.metrics_decoding import POINT_DTYPE
 from neptune_fetcher.internal.retrieval.series import SeriesValue
 
 EXPERIMENT_IDENTIFIER = identifiers.RunIdentifier(
@@ -615,6 +616,35 @@ def test_create_metrics_dataframe_with_absolute_timestamp(type_suffix_in_column_
     pd.testing.assert_frame_equal(df, expected_df)
 
 
+@pytest.mark.parametrize("timestamp_column_name", [None, "absolute_time"])
+@pytest.mark.parametrize("include_preview", [True, False])
+def test_create_metrics_dataframe_from_point_arrays(timestamp_column_name, include_preview):
+    data = {
+        _run_definition("sysid1", "path1", "float_series"): [
+            (_make_timestamp(2023, 1, 1), 1.0, 10.0, False, 1.0),
+            (_make_timestamp(2023, 1, 2), 2.0, 11.0, True, 0.5),
+        ],
+        _run_definition("sysid1", "path2", "float_series"): [(_make_timestamp(2023, 1, 3), 2.0, 20.0, False, 1.0)],
+        _run_definition("sysid2", "path1", "float_series"): [(_make_timestamp(2023, 1, 2), 1.0, 30.0, True, 0.5)],
+    }
+    # Points decoded in the process pool come as structured arrays, possibly mixed with lists of tuples
+    arrays = {
+        attribute: np.array(points, dtype=POINT_DTYPE) if attribute.attribute_definition.name == "path1" else points
+        for attribute, points in data.items()
+    }
+    kwargs = dict(
+        sys_id_label_mapping={SysId("sysid1"): "exp1", SysId("sysid2"): "exp2"},
+        timestamp_column_name=timestamp_column_name,
+        type_suffix_in_column_names=False,
+        include_point_previews=include_preview,
+        index_column_name="experiment",
+    )
+
+    pd.testing.assert_frame_equal(
+        create_metrics_dataframe(metrics_data=arrays, **kwargs), create_metrics_dataframe(metrics_data=data, **kwargs)
+    )
+
+
 def _run_definition(run_id: str, attribute_path: str, attribute_type: str = "string_series") -> RunAttributeDefinition:
     return RunAttributeDefinition(
         RunIdentifier(ProjectIdentifier("foo/bar"), SysId(run_id)), AttributeDefinition(attribute_path, attribute_type)
@@ -1085,3 +1115,39 @@ def test_create_files_dataframe_index_name_attribute_conflict():
     expected_df.index.name = index_column_name
 
     assert_frame_equal(dataframe, expected_df)
+
+
+def test_convert_table_to_dataframe_with_project_level():
+    # given
+    table_data = {
+        ("ws/a", "exp"): [
+            AttributeValue(
+                AttributeDefinition("attr1", "int"), 1, RunIdentifier(ProjectIdentifier("ws/a"), SysId("A-1"))
+            )
+        ],
+        ("ws/b", "exp"): [
+            AttributeValue(
+                AttributeDefinition("attr1", "int"), 2, RunIdentifier(ProjectIdentifier("ws/b"), SysId("B-1"))
+            )
+        ],
+    }
+
+    # when
+    dataframe = convert_table_to_dataframe(
+        table_data, selected_aggregations={}, type_suffix_in_column_names=False, project_column_name="project"
+    )
+
+    # then
+    assert dataframe.index.names == ["project", "experiment"]
+    assert dataframe.to_dict() == {("attr1", ""): {("ws/a", "exp"): 1, ("ws/b", "exp"): 2}}
+
+
+def test_convert_table_to_dataframe_with_project_level_empty():
+    # when
+    dataframe = convert_table_to_dataframe(
+        {}, selected_aggregations={}, type_suffix_in_column_names=False, project_column_name="project"
+    )
+
+    # then
+    assert dataframe.empty
+    assert dataframe.index.names == ["project", "experiment"]
@@ -0,0 +1,128 @@
+import asyncio
+import threading
+
+import httpx
+
+from neptune_fetcher.internal.transport import (
+    AsyncInstrumentedTransport,
+    InstrumentedTransport,
+    TransportSettings,
+    TransportStats,
+)
+
+
+class Body(httpx.SyncByteStream):
+    def __iter__(self):
+        yield b"OK"
+
+
+def ok(request):
+    return httpx.Response(200, content=b"OK")
+
+
+def streamed_ok(request):
+    return httpx.Response(200, stream=Body())
+
+
+def test_settings_from_env_size_http1_pools_from_concurrency_limit(monkeypatch):
+    monkeypatch.delenv("NEPTUNE_FETCHER_HTTP2", raising=False)
+    monkeypatch.delenv("NEPTUNE_FETCHER_MAX_CONNECTIONS", raising=False)
+    monkeypatch.delenv("NEPTUNE_FETCHER_ADAPTIVE_CONCURRENCY", raising=False)
+    monkeypatch.setenv("NEPTUNE_FETCHER_MAX_CONCURRENT_REQUESTS", "24")
+    monkeypatch.setenv("NEPTUNE_FETCHER_ASYNC_MAX_CONCURRENCY", "7")
+    monkeypatch.setenv("NEPTUNE_FETCHER_KEEPALIVE_EXPIRY", "15")
+
+    settings = TransportSettings.from_env()
+
+    assert settings == TransportSettings(
+        http2=False, max_connections=24, async_max_connections=7, keepalive_expiry=15.0
+    )
+    assert settings.create_transport(verify_ssl=True).stats().max_connections == 24
+    assert settings.create_async_transport(verify_ssl=True).stats().max_connections == 7
+
+
+def test_settings_from_env_size_http1_pool_from_workers_without_adaptive_concurrency(monkeypatch):
+    monkeypatch.delenv("NEPTUNE_FETCHER_HTTP2", raising=False)
+    monkeypatch.delenv("NEPTUNE_FETCHER_MAX_CONNECTIONS", raising=False)
+    monkeypatch.setenv("NEPTUNE_FETCHER_ADAPTIVE_CONCURRENCY", "false")
+    monkeypatch.setenv("NEPTUNE_FETCHER_MAX_WORKERS", "12")
+
+    assert TransportSettings.from_env().max_connections == 24
+
+
+def test_settings_from_env_with_explicit_max_connections(monkeypatch):
+    monkeypatch.delenv("NEPTUNE_FETCHER_HTTP2", raising=False)
+    monkeypatch.setenv("NEPTUNE_FETCHER_MAX_CONNECTIONS", "5")
+
+    settings = TransportSettings.from_env()
+
+    assert settings.max_connections == 5
+    assert settings.async_max_connections == 5
+
+
+def test_settings_from_env_in_http2_mode(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_FETCHER_HTTP2", "true")
+    monkeypatch.setenv("NEPTUNE_FETCHER_HTTP2_MAX_CONNECTIONS", "3")
+    monkeypatch.setenv("NEPTUNE_FETCHER_HTTP2_MAX_CONCURRENT_STREAMS", "10")
+    monkeypatch.setenv("NEPTUNE_FETCHER_KEEPALIVE_EXPIRY", "")
+
+    settings = TransportSettings.from_env()
+
+    assert settings == TransportSettings(
+        http2=True, max_connections=3, async_max_connections=3, max_concurrent_streams=10
+    )
+
+
+def test_transport_holds_slot_until_response_is_closed():
+    transport = InstrumentedTransport(httpx.MockTransport(streamed_ok), max_connections=1, max_requests=1)
+    sent = threading.Event()
+
+    with httpx.Client(transport=transport) as client:
+        with client.stream("GET", "https://example.neptune.ai") as response:
+            thread = threading.Thread(target=lambda: client.get("https://example.neptune.ai") and sent.set())
+            thread.start()
+            assert not sent.wait(timeout=0.1)
+            assert transport.stats().requests_in_flight == 1
+            assert response.read() == b"OK"
+
+        assert sent.wait(timeout=5)
+        thread.join()
+
+    assert transport.stats() == TransportStats(
+        max_connections=1,
+        open_connections=0,
+        idle_connections=0,
+        requests_in_flight=0,
+        peak_requests_in_flight=1,
+        requests_total=2,
+    )
+
+
+def test_async_transport_releases_slots():
+    transport = AsyncInstrumentedTransport(httpx.MockTransport(ok), max_connections=2, max_requests=2)
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            responses = await asyncio.gather(*(client.get("https://example.neptune.ai") for _ in range(10)))
+        return [response.content for response in responses]
+
+    assert asyncio.run(run()) == [b"OK"] * 10
+    assert transport.stats().requests_in_flight == 0
+    assert transport.stats().requests_total == 10
+
+
+def test_stats_are_summed_over_transports():
+    stats = TransportStats(
+        max_connections=4,
+        open_connections=2,
+        idle_connections=1,
+        requests_in_flight=1,
+        peak_requests_in_flight=3,
+        requests_total=10,
+    )
+
+    total = stats + stats
+
+    assert total.max_connections == 8
+    assert total.requests_total == 20
+    assert total.utilization == 0.25